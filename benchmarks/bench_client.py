@@ -0,0 +1,211 @@
+"""
+Benchmark the client end to end against an in-process fake Scheduler0 server.
+
+Measures:
+  overhead  per-call cost of Client.get_job without network I/O, and over
+            loopback next to a bare requests.Session GET
+  batch     serializing and sending a large batch_create_jobs payload
+  decode    decoding a list_jobs page, as dicts and as typed models, with
+            each available JSON codec
+  threads   get_job requests per second with 1, 4 and 16 threads sharing a client
+
+Results can be saved as JSON and compared with an earlier run to catch
+regressions between releases; the script then exits with status 1 when a
+metric got worse by more than --tolerance.
+
+Usage:
+    python benchmarks/bench_client.py [--only overhead,decode] [--output results/1.0.0.json]
+                                      [--baseline results/0.9.0.json] [--tolerance 0.1]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import scheduler0  # noqa: E402
+from scheduler0 import Client  # noqa: E402
+from scheduler0.codec import JSONCodec, get_codec  # noqa: E402
+
+from bench_serialization import make_jobs  # noqa: E402
+from fake_server import FakeScheduler0, make_job  # noqa: E402
+
+BENCHMARKS = ("overhead", "batch", "decode", "threads")
+
+
+class Results:
+    """Named measurements, with the direction in which each one improves."""
+
+    def __init__(self):
+        self.metrics = {}
+
+    def add(self, name, value, unit, better="lower"):
+        self.metrics[name] = {"value": value, "unit": unit, "better": better}
+        print(f"  {name:42} {value:14,.2f} {unit}")
+
+
+def make_client(base_url, **kwargs):
+    return Client(base_url, api_key="bench-key", api_secret="bench-secret", account_id="1", **kwargs)
+
+
+def canned_response(body, status=200):
+    """Build a requests.Response holding body, as if read from the network."""
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers["Content-Type"] = "application/json"
+    response.encoding = "utf-8"
+    return response
+
+
+def best_per_call(fn, calls, repeat):
+    """Return the fastest per-call time of repeat rounds of calls calls, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
+
+
+def bench_overhead(server, results, args):
+    print("Per-call overhead of get_job")
+    client = make_client(server.base_url)
+    response = canned_response(json.dumps({"success": True, "data": make_job(1)}).encode())
+    client.session.request = lambda *a, **kw: response
+    no_io = best_per_call(lambda: client.get_job("1"), args.calls, args.repeat)
+    results.add("overhead.get_job_no_io", no_io * 1e6, "us/call")
+
+    with make_client(server.base_url) as client, requests.Session() as session:
+        url = f"{server.base_url}/api/v1/jobs/1"
+        raw = best_per_call(lambda: session.get(url).json(), args.calls, args.repeat)
+        full = best_per_call(lambda: client.get_job("1"), args.calls, args.repeat)
+    results.add("overhead.raw_session_loopback", raw * 1e6, "us/call")
+    results.add("overhead.get_job_loopback", full * 1e6, "us/call")
+
+
+def bench_batch(server, results, args):
+    print(f"batch_create_jobs with {args.jobs:,} jobs")
+    jobs = make_jobs(args.jobs)
+    with make_client(server.base_url) as client:
+        encode = best_per_call(lambda: client._encode_body(jobs), 1, args.repeat)
+        before = server.bytes_received
+        send = best_per_call(lambda: client.batch_create_jobs(jobs), 1, args.repeat)
+        size = (server.bytes_received - before) / args.repeat
+    results.add("batch.encode", encode * 1000, "ms")
+    results.add("batch.encode_rate", args.jobs / encode, "jobs/s", better="higher")
+    results.add("batch.send", send * 1000, "ms")
+    results.add("batch.payload", size / 1024, "KiB")
+
+
+def bench_decode(server, results, args):
+    print(f"Decoding a list_jobs page of {args.page_size:,} jobs")
+    body = server.page(0, args.page_size)
+    response = canned_response(body)
+    codecs = [JSONCodec()]
+    auto = get_codec("auto")
+    if type(auto) is not JSONCodec:
+        codecs.append(auto)
+    for codec in codecs:
+        for typed in (False, True):
+            client = make_client(server.base_url, json_codec=codec, typed=typed)
+            client.session.request = lambda *a, **kw: response
+            seconds = best_per_call(lambda: client.list_jobs(limit=args.page_size), 1, args.repeat * 3)
+            kind = "typed" if typed else "dicts"
+            results.add(f"decode.{codec.name}.{kind}", seconds * 1000, "ms/page")
+            results.add(f"decode.{codec.name}.{kind}_rate", args.page_size / seconds, "jobs/s", better="higher")
+
+
+def bench_threads(server, results, args):
+    print(f"get_job throughput, {args.calls:,} calls per thread")
+    for threads in (1, 4, 16):
+        with make_client(server.base_url, pool_maxsize=threads) as client:
+            barrier = threading.Barrier(threads + 1)
+
+            def worker():
+                barrier.wait()
+                for _ in range(args.calls):
+                    client.get_job("1")
+
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                futures = [executor.submit(worker) for _ in range(threads)]
+                barrier.wait()
+                start = time.perf_counter()
+                for future in futures:
+                    future.result()
+                elapsed = time.perf_counter() - start
+        results.add(f"threads.{threads}", threads * args.calls / elapsed, "req/s", better="higher")
+
+
+def compare(metrics, baseline, tolerance):
+    """Print the change of every metric against a baseline; return the names that regressed."""
+    print(f"Compared with {baseline.get('version')} ({baseline.get('date')}), tolerance {tolerance:.0%}")
+    regressions = []
+    for name, metric in metrics.items():
+        previous = baseline["results"].get(name)
+        if not previous or not previous["value"]:
+            continue
+        change = metric["value"] / previous["value"] - 1
+        worse = change > tolerance if metric["better"] == "lower" else change < -tolerance
+        if worse:
+            regressions.append(name)
+        print(f"  {name:42} {change:+8.1%}{'  REGRESSION' if worse else ''}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--only", default=",".join(BENCHMARKS), help=f"Comma-separated subset of {', '.join(BENCHMARKS)}")
+    parser.add_argument("--calls", type=int, default=2000, help="Calls per round (overhead) and per thread (threads)")
+    parser.add_argument("--jobs", type=int, default=10000, help="Jobs in the batch_create_jobs payload")
+    parser.add_argument("--page-size", type=int, default=1000, help="Jobs per decoded list page")
+    parser.add_argument("--repeat", type=int, default=5, help="Rounds per measurement (best is reported)")
+    parser.add_argument("--output", help="Write the results as JSON to this path")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Relative change reported as a regression")
+    args = parser.parse_args()
+
+    selected = [name.strip() for name in args.only.split(",") if name.strip()]
+    unknown = set(selected) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    results = Results()
+    with FakeScheduler0(jobs=max(args.page_size, 1000)) as server:
+        for name in selected:
+            globals()[f"bench_{name}"](server, results, args)
+
+    report = {
+        "version": scheduler0.__version__,
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results.metrics,
+    }
+    if args.output:
+        directory = os.path.dirname(args.output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.output, "w") as handle:
+            json.dump(report, handle, indent=2)
+        print(f"Results written to {args.output}")
+    if args.baseline:
+        with open(args.baseline) as handle:
+            regressions = compare(results.metrics, json.load(handle), args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark memory use of the slotted models against the types.py dataclasses.
+
+Builds the same number of Execution, Job and Executor records with each
+implementation and reports the bytes allocated per instance, as measured by
+tracemalloc (the record itself, its __dict__ if any, and its field values).
+
+Usage:
+    python benchmarks/bench_memory.py [--count 100000]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from scheduler0 import models, types  # noqa: E402
+
+
+def execution_fields(i):
+    return dict(
+        id=i,
+        account_id=123,
+        unique_id=f"exec-{i:08d}",
+        state=i % 4,
+        node_id=1 + i % 3,
+        job_id=1000 + i % 500,
+        last_execution_datetime="2025-01-01T09:00:00Z",
+        next_execution_datetime="2025-01-02T09:00:00Z",
+        job_queue_version=7,
+        execution_version=i % 10,
+        date_created="2025-01-01T09:00:01Z",
+    )
+
+
+def job_fields(i):
+    return dict(
+        id=i,
+        account_id=123,
+        project_id=1 + i % 50,
+        executor_id=7,
+        spec="0 0 9 * * *",
+        timezone="America/New_York",
+        timezone_offset=-300,
+        retry_max=3,
+        status="active",
+        date_created="2025-01-01T00:00:00Z",
+    )
+
+
+def executor_fields(i):
+    return dict(
+        id=i,
+        account_id=123,
+        name=f"executor-{i}",
+        type="webhook_url",
+        region="us-east-1",
+        webhook_url="https://example.com/hook",
+        webhook_method="POST",
+        date_created="2025-01-01T00:00:00Z",
+    )
+
+
+RECORDS = [
+    ("Execution", types.Execution, models.Execution, execution_fields),
+    ("Job", types.Job, models.Job, job_fields),
+    ("Executor", types.Executor, models.Executor, executor_fields),
+]
+
+
+def bytes_per_instance(cls, make_fields, count):
+    """Return the bytes allocated per instance when building count records."""
+    # Build the field dicts first so only the records themselves are measured
+    inputs = [make_fields(i) for i in range(count)]
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    records = [cls(**fields) for fields in inputs]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del records
+    return (after - before) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100000, help="Records built per type")
+    args = parser.parse_args()
+
+    print(f"Bytes per instance over {args.count} records")
+    print(f"  {'type':10} {'dataclass':>10} {'slotted':>10} {'saved':>7}")
+    for name, dataclass_type, model_type, make_fields in RECORDS:
+        plain = bytes_per_instance(dataclass_type, make_fields, args.count)
+        slotted = bytes_per_instance(model_type, make_fields, args.count)
+        print(f"  {name:10} {plain:10.0f} {slotted:10.0f} {1 - slotted / plain:7.0%}")
+
+
+if __name__ == "__main__":
+    main()
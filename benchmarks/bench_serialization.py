@@ -0,0 +1,129 @@
+"""
+Benchmark request body serialization for large batch_create_jobs payloads.
+
+Compares the compiled per-dataclass serializers in scheduler0.serialization
+with the reflective implementation they replaced, then times encoding the
+serialized payload to bytes with each available JSON codec.
+
+Usage:
+    python benchmarks/bench_serialization.py [--jobs 10000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from scheduler0.codec import JSONCodec, get_codec  # noqa: E402
+from scheduler0.serialization import serialize_body  # noqa: E402
+from scheduler0.types import JobRequestBody  # noqa: E402
+
+
+def legacy_to_camel_case(snake_str):
+    components = snake_str.split("_")
+    return components[0] + "".join(x.title() for x in components[1:])
+
+
+def legacy_serialize_body(body):
+    """The reflective serializer previously used by Client._serialize_body."""
+    if body is None:
+        return None
+    if hasattr(body, "__dataclass_fields__"):
+        result = {}
+        for key, value in body.__dict__.items():
+            if key != "account_id" and value is not None:
+                result[legacy_to_camel_case(key)] = legacy_serialize_value(value)
+        return result
+    if hasattr(body, "__dict__"):
+        result = {}
+        for key, value in body.__dict__.items():
+            if key != "account_id" and value is not None:
+                result[legacy_to_camel_case(key)] = legacy_serialize_value(value)
+        return result
+    if isinstance(body, dict):
+        result = {}
+        for key, value in body.items():
+            if key != "account_id" and value is not None:
+                camel_key = legacy_to_camel_case(key) if isinstance(key, str) else key
+                result[camel_key] = legacy_serialize_value(value)
+        return result
+    if isinstance(body, list):
+        return [legacy_serialize_body(item) for item in body]
+    return body
+
+
+def legacy_serialize_value(value):
+    if value is None:
+        return None
+    if hasattr(value, "__dataclass_fields__"):
+        return legacy_serialize_body(value)
+    if isinstance(value, list):
+        return [legacy_serialize_value(item) for item in value]
+    if isinstance(value, dict):
+        return {k: legacy_serialize_value(v) for k, v in value.items()}
+    return value
+
+
+def make_jobs(count):
+    """Build a realistic batch of job request bodies."""
+    return [
+        JobRequestBody(
+            project_id=1 + i % 50,
+            timezone="America/New_York",
+            executor_id=7,
+            data=f'{{"report": "daily", "index": {i}}}',
+            spec="0 0 9 * * *",
+            start_date="2025-01-01T00:00:00Z",
+            timezone_offset=-300,
+            retry_max=3,
+            status="active",
+            created_by="bench@example.com",
+            account_id=123,
+        )
+        for i in range(count)
+    ]
+
+
+def best_of(fn, payload, repeat):
+    """Return the fastest of repeat runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(payload)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=10000, help="Number of JobRequestBody objects")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per implementation (best is reported)")
+    args = parser.parse_args()
+
+    jobs = make_jobs(args.jobs)
+    assert serialize_body(jobs) == legacy_serialize_body(jobs)
+
+    legacy = best_of(legacy_serialize_body, jobs, args.repeat)
+    compiled = best_of(serialize_body, jobs, args.repeat)
+
+    print(f"Serializing {args.jobs} JobRequestBody objects (best of {args.repeat})")
+    print(f"  reflective: {legacy * 1000:8.2f} ms  ({args.jobs / legacy:,.0f} jobs/s)")
+    print(f"  compiled:   {compiled * 1000:8.2f} ms  ({args.jobs / compiled:,.0f} jobs/s)")
+    print(f"  speedup:    {legacy / compiled:8.2f}x")
+
+    payload = serialize_body(jobs)
+    codecs = [JSONCodec()]
+    auto = get_codec("auto")
+    if type(auto) is not JSONCodec:
+        codecs.append(auto)
+    print(f"Encoding the serialized payload to bytes (best of {args.repeat})")
+    for codec in codecs:
+        elapsed = best_of(codec.dumps, payload, args.repeat)
+        size = len(codec.dumps(payload))
+        print(f"  {codec.name + ':':11} {elapsed * 1000:8.2f} ms  ({size / 1024:,.0f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
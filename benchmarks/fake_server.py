@@ -0,0 +1,174 @@
+"""
+In-process stand-in for the Scheduler0 /api/v1 endpoints used by the benchmarks.
+
+Serves canned, precomputed JSON over HTTP/1.1 keep-alive from a thread per
+connection, so benchmarks measure the client rather than a real cluster:
+
+    with FakeScheduler0(jobs=10000) as server:
+        client = Client(server.base_url, api_key="k", api_secret="s", account_id="1")
+        client.get_job("7")
+
+Routes:
+    GET    /api/v1/healthcheck
+    GET    /api/v1/jobs?limit=&offset=     page of ``jobs`` synthetic jobs
+    GET    /api/v1/jobs/{id}
+    POST   /api/v1/jobs                    202 with a request ID; the body is read, not parsed
+    PUT    /api/v1/jobs/{id}
+    DELETE /api/v1/jobs/{id}               204
+    GET    /api/v1/projects/{id}
+
+Anything else answers 404. ``delay`` adds a fixed server-side latency to
+every response.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+
+API_PREFIX = "/api/v1"
+
+
+def make_job(i: int) -> Dict[str, Any]:
+    """Return a job as the API encodes it (camelCase keys)."""
+    return {
+        "id": i,
+        "accountId": 1,
+        "projectId": 1 + i % 50,
+        "executorId": 7,
+        "data": f'{{"report": "daily", "index": {i}}}',
+        "spec": "0 0 9 * * *",
+        "startDate": "2025-01-01T00:00:00Z",
+        "timezone": "America/New_York",
+        "timezoneOffset": -300,
+        "retryMax": 3,
+        "status": "active",
+        "dateCreated": "2025-01-01T00:00:00Z",
+        "createdBy": "bench@example.com",
+    }
+
+
+def _encode(payload: Any) -> bytes:
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+class FakeScheduler0:
+    """
+    Threaded HTTP server answering the benchmarked endpoints.
+
+    Args:
+        jobs: Number of jobs listed by GET /jobs
+        delay: Seconds added to every response
+        host: Interface to bind; the port is picked by the OS
+    """
+
+    def __init__(self, jobs: int = 1000, delay: float = 0.0, host: str = "127.0.0.1"):
+        self.jobs = jobs
+        self.delay = delay
+        self.requests = 0
+        self.bytes_received = 0
+        self._count_lock = threading.Lock()
+        self._job = _encode({"success": True, "data": make_job(1)})
+        self._project = _encode({"success": True, "data": {"id": 1, "name": "bench", "description": "bench"}})
+        self._health = _encode({"success": True, "data": {"leaderAddress": f"http://{host}", "raftStats": {}}})
+        self._accepted = _encode({"success": True, "data": "bench-request-id"})
+        self._all_jobs = [make_job(i) for i in range(jobs)]
+        self._pages: Dict[Tuple[int, int], bytes] = {}
+        self._pages_lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def page(self, offset: int, limit: int) -> bytes:
+        """Return the encoded GET /jobs page, cached so repeated pages cost no encoding."""
+        key = (offset, limit)
+        body = self._pages.get(key)
+        if body is None:
+            jobs = self._all_jobs[offset:offset + limit]
+            body = _encode({"success": True, "data": {"jobs": jobs, "total": self.jobs, "offset": offset, "limit": limit}})
+            with self._pages_lock:
+                self._pages[key] = body
+        return body
+
+    def route(self, method: str, path: str, query: Dict[str, Any]) -> Tuple[int, bytes]:
+        """Return the status and body answering a request."""
+        if not path.startswith(API_PREFIX):
+            return 404, b""
+        path = path[len(API_PREFIX):].rstrip("/")
+        parts = path.strip("/").split("/")
+        if method == "GET" and path == "/healthcheck":
+            return 200, self._health
+        if parts[0] == "jobs":
+            if len(parts) == 1:
+                if method == "GET":
+                    limit = int(query.get("limit", ["10"])[0])
+                    offset = int(query.get("offset", ["0"])[0])
+                    return 200, self.page(offset, limit)
+                if method == "POST":
+                    return 202, self._accepted
+            elif len(parts) == 2:
+                if method in ("GET", "PUT"):
+                    return 200, self._job
+                if method == "DELETE":
+                    return 204, b""
+        if parts[0] == "projects" and len(parts) == 2 and method == "GET":
+            return 200, self._project
+        return 404, _encode({"success": False, "data": f"No route for {method} {path}"})
+
+    def _handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Send headers and body in one segment, without waiting for delayed ACKs
+            wbufsize = 64 * 1024
+            disable_nagle_algorithm = True
+
+            def _serve(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                url = urlsplit(self.path)
+                status, body = server.route(self.command, url.path, parse_qs(url.query))
+                with server._count_lock:
+                    server.requests += 1
+                    server.bytes_received += length
+                if server.delay:
+                    time.sleep(server.delay)
+                self.send_response(status)
+                if status != 204:
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if status != 204:
+                    self.wfile.write(body)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _serve
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        return Handler
+
+    def start(self) -> "FakeScheduler0":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-scheduler0", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeScheduler0":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
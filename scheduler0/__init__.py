@@ -4,9 +4,32 @@ Scheduler0 Python Client
 A Python client library for interacting with the Scheduler0 API.
 """
 
-from .client import Client, NewClient, NewAPIClient, NewAPIClientWithAccount, NewBasicAuthClient
+from .client import (
+    Client,
+    NewClient,
+    NewAPIClient,
+    NewAPIClientWithAccount,
+    NewBasicAuthClient,
+    NewClusterClient,
+)
+from .async_client import AsyncClient, NewAsyncClient
+from .retry import RetryPolicy, RetryBudget
+from .ratelimit import RateLimit, RateLimiter
+from .circuit import BreakerPolicy, CircuitBreaker, CircuitOpenError, CircuitState
+from .metrics import RequestMetrics
+from .routing import LeaderRouter
+from .codec import JSONCodec, OrjsonCodec
+from .cache import CachePolicy, ResponseCache
+from .batching import JobBatching
+from .pagination import KeysetCursor
+from .export import ExportReport
+from .analytics import AnalyticsSeries
+from .analytics_cache import AnalyticsCache
+from .async_tasks import AsyncTaskState, AsyncTaskTracker
+from .bulk import BulkReport, ImportReport
+from .reconcile import JobPlan, ReconcileReport
 
-# Import all modules to attach methods to Client class
+# Import all modules to attach methods to Client and AsyncClient classes
 from . import accounts
 from . import credentials
 from . import jobs
@@ -57,6 +80,34 @@ __all__ = [
     "NewAPIClient",
     "NewAPIClientWithAccount",
     "NewBasicAuthClient",
+    "NewClusterClient",
+    "AsyncClient",
+    "NewAsyncClient",
+    "RetryPolicy",
+    "RetryBudget",
+    "RateLimit",
+    "RateLimiter",
+    "BreakerPolicy",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "CircuitState",
+    "RequestMetrics",
+    "LeaderRouter",
+    "JSONCodec",
+    "OrjsonCodec",
+    "CachePolicy",
+    "JobBatching",
+    "ResponseCache",
+    "KeysetCursor",
+    "ExportReport",
+    "AnalyticsSeries",
+    "AnalyticsCache",
+    "AsyncTaskState",
+    "AsyncTaskTracker",
+    "ImportReport",
+    "BulkReport",
+    "JobPlan",
+    "ReconcileReport",
     # Types
     "Account",
     "AccountCreateRequestBody",
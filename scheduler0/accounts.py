@@ -4,6 +4,7 @@ Account management methods for Scheduler0 client.
 
 from typing import Optional
 from .client import Client
+from .async_client import AsyncClient
 from .types import AccountCreateRequestBody, FeatureRequest
 
 
@@ -24,7 +25,7 @@ def add_feature_to_account(self: Client, account_id: str, body: FeatureRequest)
 
 def remove_feature_from_account(self: Client, account_id: str, body: FeatureRequest) -> None:
     """Remove a feature from an account."""
-    self._delete(f"/accounts/{account_id}/feature", body, account_id_override=account_id)
+    return self._delete(f"/accounts/{account_id}/feature", body, account_id_override=account_id)
 
 
 def add_all_features_to_account(self: Client, account_id: str) -> None:
@@ -37,6 +38,16 @@ def remove_all_features_from_account(self: Client, account_id: str) -> None:
     self._request("DELETE", f"/accounts/{account_id}/features/all", None, params=None, account_id_override=account_id)
 
 
+async def add_all_features_to_account_async(self: AsyncClient, account_id: str) -> None:
+    """Add all features to an account (AsyncClient variant)."""
+    await self._request("PUT", f"/accounts/{account_id}/features/all", None, params=None, account_id_override=account_id)
+
+
+async def remove_all_features_from_account_async(self: AsyncClient, account_id: str) -> None:
+    """Remove all features from an account (AsyncClient variant)."""
+    await self._request("DELETE", f"/accounts/{account_id}/features/all", None, params=None, account_id_override=account_id)
+
+
 # Attach methods to Client class
 Client.create_account = create_account
 Client.get_account = get_account
@@ -45,3 +56,11 @@ Client.remove_feature_from_account = remove_feature_from_account
 Client.add_all_features_to_account = add_all_features_to_account
 Client.remove_all_features_from_account = remove_all_features_from_account
 
+
+# Attach methods to AsyncClient class
+AsyncClient.create_account = create_account
+AsyncClient.get_account = get_account
+AsyncClient.add_feature_to_account = add_feature_to_account
+AsyncClient.remove_feature_from_account = remove_feature_from_account
+AsyncClient.add_all_features_to_account = add_all_features_to_account_async
+AsyncClient.remove_all_features_from_account = remove_all_features_from_account_async
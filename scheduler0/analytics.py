@@ -0,0 +1,391 @@
+"""
+NumPy time series of execution analytics for Scheduler0 client.
+
+``get_date_range_analytics`` returns per-minute buckets for one window
+starting at a given date and time. ``get_analytics_series`` splits a longer
+range into windows, fetches them concurrently, and stitches the buckets into
+contiguous NumPy arrays, one element per minute:
+
+    series = client.get_analytics_series("2025-01-01T00:00", "2025-02-01T00:00")
+    daily = series.rollup("day")
+    print(daily.failure_rate(), series.percentile(99, "failed"))
+
+Pass an AnalyticsCache to keep closed minutes on disk between calls.
+
+Requires the optional ``numpy`` dependency:
+
+    pip install "scheduler0-python-client[analytics]"
+"""
+
+import asyncio
+import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .client import Client
+from .async_client import AsyncClient
+from .pagination import item_field
+from .analytics_cache import AnalyticsCache
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+
+# Minutes requested per analytics call unless the server reports a shorter window
+DEFAULT_WINDOW_MINUTES = 24 * 60
+
+# Default number of concurrent analytics calls
+DEFAULT_ANALYTICS_WORKERS = 8
+
+# Counters of each analytics point
+SERIES_FIELDS = ("scheduled", "success", "failed")
+
+# Rollup units accepted by AnalyticsSeries.rollup
+ROLLUP_UNITS = {"minute": "m", "hour": "h", "day": "D"}
+
+TimeLike = Union[str, datetime.datetime, "np.datetime64"]
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("Analytics series require numpy; install it with: pip install 'scheduler0-python-client[analytics]'")
+
+
+def to_minute(value: TimeLike) -> "np.datetime64":
+    """Convert a datetime, ISO string or datetime64 to a minute-resolution datetime64."""
+    _require_numpy()
+    if isinstance(value, datetime.datetime) and value.tzinfo is not None:
+        # Analytics buckets are in the account's local time; drop the offset
+        value = value.replace(tzinfo=None)
+    return np.datetime64(value, "m")
+
+
+class AnalyticsSeries:
+    """
+    Execution counts as contiguous NumPy arrays, one element per time step.
+
+    Attributes:
+        start: Timestamp of the first element (datetime64)
+        step: Unit of one element: "minute", "hour" or "day"
+        scheduled: int64 array of scheduled executions per step
+        success: int64 array of successful executions per step
+        failed: int64 array of failed executions per step
+        timezone: Timezone the server reported the buckets in, if known
+    """
+
+    def __init__(
+        self,
+        start: "np.datetime64",
+        scheduled: "np.ndarray",
+        success: "np.ndarray",
+        failed: "np.ndarray",
+        step: str = "minute",
+        timezone: Optional[str] = None,
+    ):
+        self.start = start
+        self.step = step
+        self.scheduled = scheduled
+        self.success = success
+        self.failed = failed
+        self.timezone = timezone
+
+    def __len__(self) -> int:
+        return len(self.scheduled)
+
+    def __repr__(self) -> str:
+        return f"AnalyticsSeries(start={self.start}, step={self.step!r}, length={len(self)})"
+
+    @property
+    def timestamps(self) -> "np.ndarray":
+        """datetime64 timestamp of each element."""
+        unit = ROLLUP_UNITS[self.step]
+        return self.start.astype(f"datetime64[{unit}]") + np.arange(len(self), dtype=np.int64).astype(f"timedelta64[{unit}]")
+
+    def rollup(self, unit: str) -> "AnalyticsSeries":
+        """
+        Sum the counters into calendar hours or days.
+
+        Args:
+            unit: "hour" or "day" (or "minute" for the same resolution)
+
+        Returns:
+            A new AnalyticsSeries with one element per hour or day
+        """
+        if unit not in ROLLUP_UNITS:
+            raise ValueError(f"unit must be one of {', '.join(ROLLUP_UNITS)}, got {unit!r}")
+        code = ROLLUP_UNITS[unit]
+        buckets = self.timestamps.astype(f"datetime64[{code}]")
+        if len(buckets) == 0:
+            return AnalyticsSeries(self.start.astype(f"datetime64[{code}]"), self.scheduled, self.success, self.failed, unit, self.timezone)
+        index = (buckets - buckets[0]).astype(np.int64)
+        size = int(index[-1]) + 1
+        scheduled, success, failed = (
+            np.bincount(index, weights=values, minlength=size).astype(np.int64)
+            for values in (self.scheduled, self.success, self.failed)
+        )
+        return AnalyticsSeries(buckets[0], scheduled, success, failed, unit, self.timezone)
+
+    def failure_rate(self) -> "np.ndarray":
+        """Failed / (success + failed) per step; NaN where nothing finished."""
+        finished = self.success + self.failed
+        rate = np.full(len(self), np.nan)
+        np.divide(self.failed, finished, out=rate, where=finished > 0)
+        return rate
+
+    def percentile(self, q: Any, field: str = "scheduled") -> Any:
+        """
+        Return percentile(s) of a counter over the steps.
+
+        Args:
+            q: Percentile or sequence of percentiles, between 0 and 100
+            field: "scheduled", "success", "failed" or "failure_rate"
+        """
+        if field == "failure_rate":
+            return np.nanpercentile(self.failure_rate(), q)
+        if field not in SERIES_FIELDS:
+            raise ValueError(f"field must be one of {', '.join(SERIES_FIELDS)} or 'failure_rate', got {field!r}")
+        return np.percentile(getattr(self, field), q)
+
+    def totals(self) -> Dict[str, int]:
+        """Sum of each counter over the series."""
+        return {field: int(getattr(self, field).sum()) for field in SERIES_FIELDS}
+
+
+class AnalyticsCollector:
+    """
+    Stitches analytics windows into one minute-resolution series.
+
+    Windows may arrive in any order and may overlap; each point is written to
+    the array slot of its minute, and points outside [start, end) are ignored.
+
+    Args:
+        start: First minute of the series (inclusive)
+        end: End of the series (exclusive)
+        window_minutes: Minutes requested per analytics call
+    """
+
+    def __init__(self, start: TimeLike, end: TimeLike, window_minutes: int = DEFAULT_WINDOW_MINUTES):
+        _require_numpy()
+        if window_minutes < 1:
+            raise ValueError("window_minutes must be at least 1")
+        self.start = to_minute(start)
+        self.end = to_minute(end)
+        if self.end <= self.start:
+            raise ValueError("end must be after start")
+        self.window = np.timedelta64(window_minutes, "m")
+        size = int((self.end - self.start).astype(np.int64))
+        self.counters = {field: np.zeros(size, dtype=np.int64) for field in SERIES_FIELDS}
+        # Minutes already filled from a cache, which need not be fetched
+        self.known = np.zeros(size, dtype=bool)
+        # (start, end) minute ranges the server's responses covered
+        self.fetched: List[Tuple["np.datetime64", "np.datetime64"]] = []
+        self.timezone: Optional[str] = None
+
+    def windows(self) -> List[Tuple["np.datetime64", "np.datetime64"]]:
+        """Return the (start, end) minute range of each window to fetch, skipping known minutes."""
+        edges = np.diff(np.concatenate(([0], (~self.known).astype(np.int8), [0])))
+        windows = []
+        for run_start, run_end in zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)):
+            first, last = self.start + np.timedelta64(int(run_start), "m"), self.start + np.timedelta64(int(run_end), "m")
+            windows.extend((ws, min(ws + self.window, last)) for ws in np.arange(first, last, self.window))
+        return windows
+
+    def fill(self, minutes: "np.ndarray", values: Dict[str, "np.ndarray"]) -> None:
+        """
+        Store known counters, for example from a cache.
+
+        Args:
+            minutes: datetime64[m] array of the minutes
+            values: Counter arrays aligned with minutes, keyed by field
+        """
+        index = (minutes.astype("datetime64[m]") - self.start).astype(np.int64)
+        inside = (index >= 0) & (index < len(self.known))
+        for field in SERIES_FIELDS:
+            self.counters[field][index[inside]] = values[field][inside]
+        self.known[index[inside]] = True
+
+    def rows(self, start: "np.datetime64", end: "np.datetime64") -> Tuple["np.ndarray", Dict[str, "np.ndarray"]]:
+        """Return the minutes in [start, end) within the series and their counters."""
+        first = max(int((start - self.start).astype(np.int64)), 0)
+        last = min(int((end - self.start).astype(np.int64)), len(self.known))
+        if last <= first:
+            return np.array([], dtype="datetime64[m]"), {field: np.array([], dtype=np.int64) for field in SERIES_FIELDS}
+        minutes = self.start + np.arange(first, last).astype("timedelta64[m]")
+        return minutes, {field: self.counters[field][first:last] for field in SERIES_FIELDS}
+
+    def add(self, response: Any) -> Optional["np.datetime64"]:
+        """
+        Store the points of one analytics response.
+
+        Args:
+            response: A get_date_range_analytics result (raw payload or typed model)
+
+        Returns:
+            The minute the response covers up to (exclusive), from its reported end, if any
+        """
+        data = response.get("data", response) if isinstance(response, dict) else response
+        if data is None:
+            return None
+        self.timezone = self.timezone or item_field(data, "timezone")
+        points = item_field(data, "points") or []
+        if points:
+            stamps = np.array(
+                [f"{item_field(p, 'date')}T{item_field(p, 'time')}" for p in points], dtype="datetime64[s]"
+            ).astype("datetime64[m]")
+            index = (stamps - self.start).astype(np.int64)
+            inside = (index >= 0) & (index < len(self.counters["scheduled"]))
+            for field in SERIES_FIELDS:
+                values = np.fromiter((item_field(p, field) or 0 for p in points), dtype=np.int64, count=len(points))
+                self.counters[field][index[inside]] = values[inside]
+        end_date, end_time = item_field(data, "end_date"), item_field(data, "end_time")
+        if end_date and end_time:
+            return np.datetime64(f"{end_date}T{end_time}", "s").astype("datetime64[m]") + np.timedelta64(1, "m")
+        return None
+
+    def continuation(self, window: Tuple["np.datetime64", "np.datetime64"], covered: Optional["np.datetime64"]) -> Optional[Tuple["np.datetime64", "np.datetime64"]]:
+        """Return the rest of a window the server did not cover, or None."""
+        start, end = window
+        if covered is None or covered >= end or covered <= start:
+            return None
+        return (covered, end)
+
+    def receive(self, window: Tuple["np.datetime64", "np.datetime64"], response: Any) -> Optional[Tuple["np.datetime64", "np.datetime64"]]:
+        """Store the response to a window; return the rest of the window still to fetch, or None."""
+        covered = self.add(response)
+        if covered is not None and covered > window[0]:
+            self.fetched.append((window[0], min(covered, window[1])))
+        return self.continuation(window, covered)
+
+    def series(self) -> AnalyticsSeries:
+        """Return the stitched series."""
+        return AnalyticsSeries(self.start, self.counters["scheduled"], self.counters["success"], self.counters["failed"], timezone=self.timezone)
+
+
+def _window_params(start: "np.datetime64") -> Tuple[str, str]:
+    """Return the (start_date, start_time) parameters of a window."""
+    text = str(start.astype("datetime64[m]"))
+    return text[:10], text[11:16] + ":00"
+
+
+def _cache_key(self: Any, account_id: Optional[int], account_id_override: Optional[str]) -> str:
+    """Return the cache key of the account an analytics call is made for."""
+    account = account_id_override or (str(account_id) if account_id else None) or self.account_id
+    return f"{self.base_url}|{account or ''}"
+
+
+def _load_cached(collector: AnalyticsCollector, cache: "AnalyticsCache", account: str) -> None:
+    """Fill the collector with the cached closed minutes of the range."""
+    timezone = cache.timezone(account)
+    if timezone is None:
+        return
+    closed = min(cache.closed_before(timezone), collector.end)
+    if closed > collector.start:
+        collector.fill(*cache.load(account, timezone, collector.start, closed))
+        collector.timezone = timezone
+
+
+def _store_fetched(collector: AnalyticsCollector, cache: "AnalyticsCache", account: str) -> None:
+    """Cache the closed minutes the server's responses covered."""
+    if collector.timezone is None:
+        return
+    cache.set_timezone(account, collector.timezone)
+    for start, end in collector.fetched:
+        cache.store(account, collector.timezone, *collector.rows(start, end))
+
+
+def get_analytics_series(
+    self: Client,
+    start: TimeLike,
+    end: TimeLike,
+    window_minutes: int = DEFAULT_WINDOW_MINUTES,
+    max_workers: int = DEFAULT_ANALYTICS_WORKERS,
+    account_id: Optional[int] = None,
+    account_id_override: Optional[str] = None,
+    cache: Optional["AnalyticsCache"] = None,
+) -> AnalyticsSeries:
+    """
+    Fetch per-minute execution analytics for a time range as NumPy arrays.
+
+    The range is split into windows of window_minutes, fetched concurrently with
+    get_date_range_analytics. If the server answers a window with a shorter
+    range, the remainder is requested in a follow-up call. With a cache, closed
+    minutes seen before are read from it and only the rest is fetched.
+
+    Args:
+        start: First minute (datetime or "YYYY-MM-DDTHH:MM"), in the account's timezone
+        end: End of the range, exclusive
+        window_minutes: Minutes requested per call
+        max_workers: Maximum number of concurrent calls
+        account_id: Account ID (optional, can also use account_id_override)
+        account_id_override: Optional account ID override
+        cache: AnalyticsCache for closed minutes (optional)
+
+    Returns:
+        AnalyticsSeries with one element per minute
+    """
+    collector = AnalyticsCollector(start, end, window_minutes)
+    account = _cache_key(self, account_id, account_id_override)
+    if cache is not None:
+        _load_cached(collector, cache, account)
+
+    def fetch(window: Tuple[Any, Any]) -> Any:
+        start_date, start_time = _window_params(window[0])
+        return self.get_date_range_analytics(
+            start_date, start_time, account_id=account_id, account_id_override=account_id_override
+        )
+
+    pending = collector.windows()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scheduler0-analytics") as executor:
+        while pending:
+            futures = {executor.submit(fetch, window): window for window in pending}
+            pending = []
+            for future in as_completed(futures):
+                rest = collector.receive(futures[future], future.result())
+                if rest is not None:
+                    pending.append(rest)
+    if cache is not None:
+        _store_fetched(collector, cache, account)
+    return collector.series()
+
+
+async def get_analytics_series_async(
+    self: AsyncClient,
+    start: TimeLike,
+    end: TimeLike,
+    window_minutes: int = DEFAULT_WINDOW_MINUTES,
+    max_workers: int = DEFAULT_ANALYTICS_WORKERS,
+    account_id: Optional[int] = None,
+    account_id_override: Optional[str] = None,
+    cache: Optional["AnalyticsCache"] = None,
+) -> AnalyticsSeries:
+    """Fetch per-minute execution analytics for a time range as NumPy arrays (async version)."""
+    collector = AnalyticsCollector(start, end, window_minutes)
+    account = _cache_key(self, account_id, account_id_override)
+    if cache is not None:
+        _load_cached(collector, cache, account)
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def fetch(window: Tuple[Any, Any]) -> Optional[Tuple[Any, Any]]:
+        start_date, start_time = _window_params(window[0])
+        async with semaphore:
+            response = await self.get_date_range_analytics(
+                start_date, start_time, account_id=account_id, account_id_override=account_id_override
+            )
+        return collector.receive(window, response)
+
+    pending = collector.windows()
+    while pending:
+        pending = [rest for rest in await asyncio.gather(*(fetch(window) for window in pending)) if rest is not None]
+    if cache is not None:
+        _store_fetched(collector, cache, account)
+    return collector.series()
+
+
+# Attach methods to Client class
+Client.get_analytics_series = get_analytics_series
+
+
+# Attach methods to AsyncClient class
+AsyncClient.get_analytics_series = get_analytics_series_async
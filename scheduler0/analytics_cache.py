@@ -0,0 +1,259 @@
+"""
+Persistent cache of closed analytics minutes for Scheduler0 client.
+
+Per-minute analytics buckets stop changing once the minute is over and its
+executions have finished. AnalyticsCache keeps those closed minutes in a
+SQLite file, keyed by account, timezone and minute, so
+``get_analytics_series(..., cache=cache)`` only asks the server for minutes
+it has not seen yet and for the still-changing tail:
+
+    cache = AnalyticsCache("~/.cache/scheduler0/analytics.db", max_bytes=256 * 1024 * 1024)
+    series = client.get_analytics_series(start, end, cache=cache)
+    print(cache.stats())
+
+``get_execution_totals`` returns all-time counters with no time buckets, so
+it cannot be split into closed and open parts and is not cached.
+"""
+
+import datetime
+import os
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # pragma: no cover - Python 3.8
+    ZoneInfo = None
+
+
+# Seconds after a minute ends before its bucket is considered final
+DEFAULT_SETTLE_SECONDS = 300
+
+# Largest UTC offset of any timezone, used when the account's timezone cannot be resolved
+_MAX_UTC_OFFSET = datetime.timedelta(hours=14)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS minutes (
+        account TEXT NOT NULL,
+        timezone TEXT NOT NULL,
+        minute INTEGER NOT NULL,
+        scheduled INTEGER NOT NULL,
+        success INTEGER NOT NULL,
+        failed INTEGER NOT NULL,
+        accessed INTEGER NOT NULL,
+        PRIMARY KEY (account, timezone, minute)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS minutes_accessed ON minutes (accessed)",
+    """
+    CREATE TABLE IF NOT EXISTS accounts (
+        account TEXT PRIMARY KEY,
+        timezone TEXT NOT NULL
+    )
+    """,
+)
+
+
+class AnalyticsCache:
+    """
+    SQLite-backed cache of closed per-minute analytics buckets.
+
+    Minutes are stored as minutes since the epoch in the account's local
+    time. When the database grows past max_bytes, the least recently used
+    minutes are evicted. The cache is safe to share between threads and
+    clients.
+
+    Args:
+        path: Database file, or ":memory:" for a process-local cache
+        max_bytes: Size above which least recently used minutes are evicted
+        settle_seconds: Seconds after a minute ends before it is cached
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        max_bytes: int = 64 * 1024 * 1024,
+        settle_seconds: int = DEFAULT_SETTLE_SECONDS,
+    ):
+        if np is None:
+            raise ImportError("AnalyticsCache requires numpy; install it with: pip install 'scheduler0-python-client[analytics]'")
+        if path != ":memory:":
+            path = os.path.expanduser(path)
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.settle_seconds = settle_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._clock = 0
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL" if path != ":memory:" else "PRAGMA journal_mode=MEMORY")
+        for statement in _SCHEMA:
+            self._db.execute(statement)
+        row = self._db.execute("SELECT MAX(accessed) FROM minutes").fetchone()
+        self._clock = row[0] or 0
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> "AnalyticsCache":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _tick(self) -> int:
+        # Logical clock for LRU ordering; monotonic across processes is not required
+        self._clock += 1
+        return self._clock
+
+    def timezone(self, account: str) -> Optional[str]:
+        """Return the last timezone the server reported for an account."""
+        with self._lock:
+            row = self._db.execute("SELECT timezone FROM accounts WHERE account = ?", (account,)).fetchone()
+        return row[0] if row else None
+
+    def set_timezone(self, account: str, timezone: str) -> None:
+        """Record the timezone an account's buckets are reported in."""
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO accounts (account, timezone) VALUES (?, ?)", (account, timezone))
+
+    def closed_before(self, timezone: Optional[str]) -> "np.datetime64":
+        """
+        Return the first minute, in the given timezone's local time, that may still change.
+
+        Falls back to a bound that is safe for every timezone when the zone
+        is unknown or cannot be resolved.
+        """
+        now = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(seconds=self.settle_seconds)
+        local = None
+        if timezone and ZoneInfo is not None:
+            try:
+                local = now.astimezone(ZoneInfo(timezone)).replace(tzinfo=None)
+            except (KeyError, ValueError):
+                local = None
+        if local is None:
+            local = now.replace(tzinfo=None) - _MAX_UTC_OFFSET
+        # The minute containing `local` is still open
+        return np.datetime64(local, "m")
+
+    def load(
+        self, account: str, timezone: str, start: "np.datetime64", end: "np.datetime64"
+    ) -> Tuple["np.ndarray", Dict[str, "np.ndarray"]]:
+        """
+        Return the cached minutes in [start, end) and their counters.
+
+        Args:
+            account: Account key
+            timezone: Timezone the minutes are in
+            start: First minute (datetime64)
+            end: End minute, exclusive (datetime64)
+
+        Returns:
+            Tuple of (datetime64[m] minutes, {"scheduled": ..., "success": ..., "failed": ...})
+        """
+        first, last = int(start.astype("datetime64[m]").astype(np.int64)), int(end.astype("datetime64[m]").astype(np.int64))
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT minute, scheduled, success, failed FROM minutes"
+                " WHERE account = ? AND timezone = ? AND minute >= ? AND minute < ? ORDER BY minute",
+                (account, timezone, first, last),
+            ).fetchall()
+            if rows:
+                self._db.execute(
+                    "UPDATE minutes SET accessed = ? WHERE account = ? AND timezone = ? AND minute >= ? AND minute < ?",
+                    (self._tick(), account, timezone, first, last),
+                )
+            self.hits += len(rows)
+            self.misses += max(last - first - len(rows), 0)
+        table = np.array(rows, dtype=np.int64).reshape(-1, 4)
+        minutes = table[:, 0].astype("datetime64[m]")
+        return minutes, {"scheduled": table[:, 1], "success": table[:, 2], "failed": table[:, 3]}
+
+    def store(self, account: str, timezone: str, minutes: "np.ndarray", values: Dict[str, "np.ndarray"]) -> int:
+        """
+        Cache the closed minutes among the given ones.
+
+        Args:
+            account: Account key
+            timezone: Timezone the minutes are in
+            minutes: datetime64[m] array of the minutes
+            values: Counter arrays aligned with minutes
+
+        Returns:
+            Number of minutes stored
+        """
+        closed = minutes < self.closed_before(timezone)
+        if not closed.any():
+            return 0
+        keys = minutes[closed].astype("datetime64[m]").astype(np.int64)
+        columns = [values[field][closed] for field in ("scheduled", "success", "failed")]
+        with self._lock:
+            tick = self._tick()
+            rows: List[Tuple[Any, ...]] = [
+                (account, timezone, int(minute), int(scheduled), int(success), int(failed), tick)
+                for minute, scheduled, success, failed in zip(keys, *columns)
+            ]
+            self._db.executemany("INSERT OR REPLACE INTO minutes VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            self._evict()
+        return len(rows)
+
+    def _used_bytes(self) -> int:
+        page_size = self._db.execute("PRAGMA page_size").fetchone()[0]
+        pages = self._db.execute("PRAGMA page_count").fetchone()[0]
+        free = self._db.execute("PRAGMA freelist_count").fetchone()[0]
+        return (pages - free) * page_size
+
+    def _evict(self) -> None:
+        """Delete least recently used minutes until the database fits max_bytes."""
+        while self._used_bytes() > self.max_bytes:
+            count = self._db.execute("SELECT COUNT(*) FROM minutes").fetchone()[0]
+            if count == 0:
+                return
+            batch = max(count // 10, 1)
+            self._db.execute(
+                "DELETE FROM minutes WHERE (account, timezone, minute) IN"
+                " (SELECT account, timezone, minute FROM minutes ORDER BY accessed LIMIT ?)",
+                (batch,),
+            )
+            self.evictions += batch
+
+    def clear(self) -> None:
+        """Remove every cached minute and reset the counters."""
+        with self._lock:
+            self._db.execute("DELETE FROM minutes")
+            self._db.execute("DELETE FROM accounts")
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return cache statistics.
+
+        Returns:
+            Dict with hits and misses (in minutes), hit_rate, rows, size_bytes and evictions
+        """
+        with self._lock:
+            rows = self._db.execute("SELECT COUNT(*) FROM minutes").fetchone()[0]
+            size = self._used_bytes()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "rows": rows,
+            "size_bytes": size,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,449 @@
+"""
+Asyncio client implementation for Scheduler0 Python client.
+
+Requires the optional ``httpx`` dependency:
+
+    pip install "scheduler0-python-client[async]"
+
+The resource modules (jobs, projects, ...) attach the same functions to both
+Client and AsyncClient. Those functions return the result of ``_get``/``_post``/
+``_put``/``_delete`` directly, which on AsyncClient is an awaitable; the few
+methods that post-process a raw response have dedicated ``*_async`` variants.
+Likewise the ``iter_*`` and ``scan_*`` methods return ``_paginate(...)``,
+``_scan(...)`` or ``_keyset(...)``, which are generators on Client and async
+generators on AsyncClient.
+"""
+
+import asyncio
+import time
+from typing import Optional, Dict, Any, AsyncIterator, Awaitable, Callable, List, Union
+
+import requests
+
+from .client import BaseClient, MAX_LEADER_REDIRECTS
+from .routing import REDIRECT_STATUSES
+from .retry import RetryPolicy
+from .cache import ResponseCache
+from .singleflight import AsyncSingleFlight
+from .batching import AsyncJobBatcher, JobBatching
+from .ratelimit import RateLimiter
+from .circuit import CircuitBreaker
+from .metrics import RequestMetrics
+from .codec import JSONCodec
+from .pagination import DEFAULT_PAGE_SIZE, DEFAULT_SCAN_WORKERS, KeysetCursor, aiter_items, aiter_keyset, ascan_items
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the extra
+    httpx = None
+
+
+class AsyncClient(BaseClient):
+    """
+    Scheduler0 API client for asyncio applications.
+
+    Exposes the same methods as Client, but every API call is a coroutine
+    running on a shared ``httpx.AsyncClient``, so many requests can be in
+    flight on a single event loop. Authentication, account ID resolution and
+    serialization are shared with the synchronous client.
+
+    Use it as an async context manager, or call ``aclose()`` when done:
+
+        async with AsyncClient("http://localhost:7070", api_key=..., api_secret=...) as client:
+            jobs = await client.list_jobs(limit=10)
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        version: str = "v1",
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        account_id: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        pool_maxsize: int = 100,
+        keep_alive: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        node_urls: Optional[List[str]] = None,
+        json_codec: Union[str, JSONCodec, None] = None,
+        typed: bool = False,
+        coalesce_gets: bool = False,
+        job_batching: Optional[JobBatching] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        metrics: Optional[RequestMetrics] = None,
+        cache: Optional[ResponseCache] = None,
+        http_client: Optional["httpx.AsyncClient"] = None,
+    ):
+        """
+        Initialize a new asyncio Scheduler0 client.
+
+        Args:
+            base_url: Base URL of the Scheduler0 API (e.g., "http://localhost:7070")
+            version: API version (default: "v1")
+            api_key: API key for authentication
+            api_secret: API secret for authentication
+            account_id: Account ID for requests
+            username: Username for basic authentication
+            password: Password for basic authentication
+            pool_maxsize: Maximum concurrent connections; further requests wait for
+                a free connection (default: 100)
+            keep_alive: Reuse connections between requests (default: True)
+            retry_policy: Retry failed requests with backoff; None disables retries
+            node_urls: Base URLs of all cluster nodes; when given, writes (POST/PUT/DELETE)
+                are sent straight to the raft leader discovered via /healthcheck
+            json_codec: JSON backend: "json" (stdlib, default), "orjson", "auto"
+                (orjson when installed) or a JSONCodec instance
+            typed: Decode responses into slotted models from scheduler0.models
+                instead of returning dicts (default: False)
+            coalesce_gets: Share one in-flight request between identical concurrent GETs (default: False)
+            job_batching: JobBatching window in which concurrent create_job calls are sent as one
+                batch_create_jobs request (optional)
+            rate_limiter: RateLimiter spacing out requests per account and endpoint class (optional)
+            circuit_breaker: CircuitBreaker failing requests fast while their endpoint is degraded (optional)
+            metrics: RequestMetrics recording latency, bytes and status of every attempt (optional)
+            cache: ResponseCache serving repeated single-resource GETs from memory (optional)
+            http_client: Optional preconfigured httpx.AsyncClient to send requests with;
+                pool_maxsize and keep_alive are ignored when it is given
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncClient requires httpx; install it with "
+                "'pip install \"scheduler0-python-client[async]\"'"
+            )
+        super().__init__(
+            base_url=base_url,
+            version=version,
+            api_key=api_key,
+            api_secret=api_secret,
+            account_id=account_id,
+            username=username,
+            password=password,
+            retry_policy=retry_policy,
+            node_urls=node_urls,
+            json_codec=json_codec,
+            typed=typed,
+            coalesce_gets=coalesce_gets,
+            job_batching=job_batching,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            metrics=metrics,
+            cache=cache,
+        )
+        self._leader_refresh_lock: Optional[asyncio.Lock] = None
+        self._singleflight = AsyncSingleFlight()
+        self._job_batcher = AsyncJobBatcher(self, job_batching) if job_batching is not None else None
+        if http_client is None:
+            limits = httpx.Limits(
+                max_connections=pool_maxsize,
+                max_keepalive_connections=pool_maxsize if keep_alive else 0,
+            )
+            http_client = httpx.AsyncClient(limits=limits)
+        self.session = http_client
+
+    async def aclose(self) -> None:
+        """Send any collected create_job batch, then close the underlying HTTP connection pool."""
+        if self._job_batcher is not None:
+            await self._job_batcher.aclose()
+        await self.session.aclose()
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        body: Optional[Any] = None,
+        params: Optional[Dict[str, Any]] = None,
+        account_id_override: Optional[str] = None,
+    ) -> "httpx.Response":
+        """
+        Make an HTTP request to the API.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint (e.g., "/jobs", "/projects/123")
+            body: Request body (serialized and encoded to JSON bytes by json_codec, unless already bytes)
+            params: Query parameters
+            account_id_override: Optional account ID override
+
+        Returns:
+            Response object
+
+        Raises:
+            requests.HTTPError: If the request fails after any configured retries
+        """
+        url = self._build_url(endpoint)
+        account_id = self._resolve_account_id(body, account_id_override)
+        headers = self._prepare_headers(account_id)
+
+        # Encode the body once; retries and redirects resend the same bytes
+        data = self._encode_body(body)
+
+        routed = self._routes_to_leader(method)
+        self._record_request_start()
+        attempt = 0
+        redirects = 0
+        while True:
+            if routed:
+                url = self._build_url(endpoint, await self._leader_base_url())
+            wait = await self._rate_limiter_call(self._rate_limit_delay, method, endpoint, account_id)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            ticket = self._breaker_acquire(endpoint)
+            started = time.perf_counter()
+            try:
+                response = await self.session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    content=data,
+                    params=params,
+                    auth=self._basic_auth(),
+                    # Follow redirects like the requests Session of Client; routed writes handle them
+                    follow_redirects=not routed,
+                )
+            except httpx.TransportError:
+                self._breaker_release(ticket, failed=True)
+                self._record_attempt(method, endpoint, started, data)
+                if routed:
+                    self.leader_router.invalidate()
+                delay = self._retry_delay(method, attempt)
+                if delay is None:
+                    raise
+            except BaseException:
+                self._breaker_release(ticket, failed=None)
+                raise
+            else:
+                self._breaker_release(ticket, failed=response.status_code >= 500)
+                self._record_attempt(method, endpoint, started, data, response)
+                if routed and response.status_code in REDIRECT_STATUSES:
+                    if redirects < MAX_LEADER_REDIRECTS and self._follow_leader_redirect(response):
+                        redirects += 1
+                        continue
+                    # The write was not applied: too many redirects, or one back to the same leader
+                    self.leader_router.invalidate()
+                    raise requests.HTTPError(self._error_message(response), response=response)
+                if response.status_code < 400:
+                    return response
+                await self._rate_limiter_call(self._rate_limit_feedback, method, endpoint, account_id, response)
+                if routed and response.status_code >= 500:
+                    self.leader_router.invalidate()
+                delay = self._retry_delay(method, attempt, response)
+                if delay is None:
+                    # Raise the same exception type as the sync client
+                    raise requests.HTTPError(self._error_message(response), response=response)
+
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _rate_limiter_call(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Call a rate limiter hook, on the default executor when the limiter blocks on its state file."""
+        if self.rate_limiter is not None and self.rate_limiter.blocking:
+            return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+        return fn(*args)
+
+    async def _leader_base_url(self) -> str:
+        """Return the leader's base URL, discovering it first if needed."""
+        router = self.leader_router
+        if router.needs_refresh():
+            if self._leader_refresh_lock is None:
+                self._leader_refresh_lock = asyncio.Lock()
+            async with self._leader_refresh_lock:
+                # Another task may have refreshed while we waited
+                if router.needs_refresh():
+                    await self._refresh_leader()
+        return router.write_base_url()
+
+    async def _refresh_leader(self) -> None:
+        """Ask the cluster nodes' /healthcheck endpoint for the current leader."""
+        router = self.leader_router
+        for node_url in router.refresh_order():
+            try:
+                response = await self.session.get(
+                    self._build_url("/healthcheck", node_url),
+                    headers=self._prepare_headers(self.account_id),
+                    auth=self._basic_auth(),
+                    timeout=5,
+                )
+                if response.status_code < 400 and router.update_from_healthcheck(self._decode_response(response)):
+                    return
+            except (httpx.HTTPError, ValueError):
+                continue
+        router.mark_unresolved()
+
+    async def _get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        account_id_override: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Make a GET request, served from the response cache or a concurrent identical GET when possible."""
+        found, cached = self._cache_lookup(endpoint, params, account_id_override)
+        if found:
+            return cached
+
+        async def fetch() -> Any:
+            generation = self._cache_generation(endpoint)
+            response = await self._request("GET", endpoint, body=None, params=params, account_id_override=account_id_override)
+            result = self._decode_typed("GET", endpoint, self._decode_response(response))
+            self._cache_store(endpoint, params, account_id_override, result, generation)
+            return result
+
+        if not self.coalesce_gets:
+            return await fetch()
+        return await self._singleflight.do(self._coalesce_key(endpoint, params, account_id_override), fetch)
+
+    async def _post(
+        self,
+        endpoint: str,
+        body: Optional[Any] = None,
+        params: Optional[Dict[str, Any]] = None,
+        account_id_override: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Make a POST request."""
+        try:
+            response = await self._request("POST", endpoint, body=body, params=params, account_id_override=account_id_override)
+        finally:
+            self._cache_invalidate(endpoint)
+        if response.status_code == 204:
+            return {}
+        return self._decode_typed("POST", endpoint, self._decode_response(response))
+
+    async def _put(
+        self,
+        endpoint: str,
+        body: Optional[Any] = None,
+        params: Optional[Dict[str, Any]] = None,
+        account_id_override: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Make a PUT request."""
+        try:
+            response = await self._request("PUT", endpoint, body=body, params=params, account_id_override=account_id_override)
+        finally:
+            self._cache_invalidate(endpoint)
+        if response.status_code == 204:
+            return {}
+        return self._decode_typed("PUT", endpoint, self._decode_response(response))
+
+    async def _delete(
+        self,
+        endpoint: str,
+        body: Optional[Any] = None,
+        params: Optional[Dict[str, Any]] = None,
+        account_id_override: Optional[str] = None,
+    ) -> None:
+        """Make a DELETE request."""
+        try:
+            await self._request("DELETE", endpoint, body=body, params=params, account_id_override=account_id_override)
+        finally:
+            self._cache_invalidate(endpoint)
+
+    def _paginate(
+        self,
+        fetch: Callable[[int, int], Awaitable[Any]],
+        key: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Any]:
+        """Stream the items of a list endpoint, prefetching the next page in a task."""
+        return aiter_items(fetch, key, page_size=page_size, prefetch=prefetch)
+
+    def _scan(
+        self,
+        fetch: Callable[[int, int], Awaitable[Any]],
+        key: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_workers: int = DEFAULT_SCAN_WORKERS,
+        ordered: bool = True,
+    ) -> AsyncIterator[Any]:
+        """Stream the items of a list endpoint, fetching pages in concurrent tasks."""
+        return ascan_items(fetch, key, page_size=page_size, max_workers=max_workers, ordered=ordered)
+
+    def _keyset(
+        self,
+        fetch: Callable[[Optional[str], int, int], Awaitable[Any]],
+        key: str,
+        cursor: KeysetCursor,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[Any]:
+        """Stream the items of a list endpoint by keyset pagination."""
+        return aiter_keyset(fetch, key, cursor, page_size=page_size)
+
+
+# Convenience factory function
+
+def NewAsyncClient(
+    base_url: str,
+    version: str = "v1",
+    api_key: Optional[str] = None,
+    api_secret: Optional[str] = None,
+    account_id: Optional[str] = None,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    pool_maxsize: int = 100,
+    keep_alive: bool = True,
+    retry_policy: Optional[RetryPolicy] = None,
+    node_urls: Optional[List[str]] = None,
+    json_codec: Union[str, JSONCodec, None] = None,
+    typed: bool = False,
+    coalesce_gets: bool = False,
+    job_batching: Optional[JobBatching] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    circuit_breaker: Optional[CircuitBreaker] = None,
+    metrics: Optional[RequestMetrics] = None,
+    cache: Optional[ResponseCache] = None,
+) -> AsyncClient:
+    """
+    Create a new asyncio Scheduler0 client with flexible options.
+
+    Args:
+        base_url: Base URL of the Scheduler0 API
+        version: API version (default: "v1")
+        api_key: API key for authentication
+        api_secret: API secret for authentication
+        account_id: Account ID for requests
+        username: Username for basic authentication
+        password: Password for basic authentication
+        pool_maxsize: Maximum concurrent connections
+        keep_alive: Reuse connections between requests
+        retry_policy: Retry failed requests with backoff; None disables retries
+        node_urls: Base URLs of all cluster nodes, to send writes straight to the leader
+        json_codec: JSON backend: "json" (default), "orjson", "auto" or a JSONCodec instance
+        typed: Decode responses into slotted models instead of dicts
+        coalesce_gets: Share one in-flight request between identical concurrent GETs
+        job_batching: JobBatching window for sending concurrent create_job calls as one batch (optional)
+        rate_limiter: RateLimiter spacing out requests per account and endpoint class (optional)
+        circuit_breaker: CircuitBreaker failing requests fast while their endpoint is degraded (optional)
+        metrics: RequestMetrics recording latency, bytes and status of every attempt (optional)
+        cache: ResponseCache for single-resource GETs (optional)
+
+    Returns:
+        AsyncClient instance
+    """
+    return AsyncClient(
+        base_url=base_url,
+        version=version,
+        api_key=api_key,
+        api_secret=api_secret,
+        account_id=account_id,
+        username=username,
+        password=password,
+        pool_maxsize=pool_maxsize,
+        keep_alive=keep_alive,
+        retry_policy=retry_policy,
+        node_urls=node_urls,
+        json_codec=json_codec,
+        typed=typed,
+        coalesce_gets=coalesce_gets,
+        job_batching=job_batching,
+        rate_limiter=rate_limiter,
+        circuit_breaker=circuit_breaker,
+        metrics=metrics,
+        cache=cache,
+    )
@@ -1,9 +1,42 @@
 """
 Async task management methods for Scheduler0 client.
+
+``batch_create_jobs`` answers 202 with a request ID, and the outcome is only
+known by polling ``/async-tasks/{requestId}``. AsyncTaskTracker watches any
+number of request IDs from a single polling loop, backing off per task while
+its state does not change, and never has more than ``max_in_flight`` polls
+outstanding:
+
+    with AsyncTaskTracker(client, max_in_flight=16) as tracker:
+        futures = tracker.track_many(request_ids)
+    for request_id, future in futures.items():
+        print(request_id, AsyncTaskState(future.result()["state"]).name)
 """
 
-from typing import Optional
+import asyncio
+import heapq
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import IntEnum
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
 from .client import Client
+from .async_client import AsyncClient
+from .pagination import item_field
+
+
+class AsyncTaskState(IntEnum):
+    """State of an async task."""
+    NOT_STARTED = 0
+    IN_PROGRESS = 1
+    SUCCESS = 2
+    FAIL = 3
+
+
+TERMINAL_STATES = frozenset({AsyncTaskState.SUCCESS, AsyncTaskState.FAIL})
+
+DEFAULT_MAX_IN_FLIGHT = 8
 
 
 def get_async_task(
@@ -15,6 +48,455 @@ def get_async_task(
     return self._get(f"/async-tasks/{request_id}", params=None, account_id_override=account_id_override)
 
 
+def task_state(task: Any) -> AsyncTaskState:
+    """Return the state of an async task (a raw dict or a typed model)."""
+    return AsyncTaskState(item_field(task, "state") or 0)
+
+
+class PollSchedule:
+    """
+    Next poll time of every tracked task.
+
+    A task is polled again after its interval, which starts at min_interval,
+    is multiplied by backoff after each poll that finds the state unchanged,
+    and is capped at max_interval. A state change resets it: a task that just
+    started is likely to finish soon.
+    """
+
+    def __init__(self, min_interval: float, max_interval: float, backoff: float):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self._heap: List[Tuple[float, int, str]] = []
+        self._counter = 0
+        # request ID -> (last seen state, current interval)
+        self._tasks: Dict[str, Tuple[Optional[AsyncTaskState], float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def _push(self, request_id: str, when: float) -> None:
+        self._counter += 1
+        heapq.heappush(self._heap, (when, self._counter, request_id))
+
+    def add(self, request_id: str, now: float) -> None:
+        """Schedule a new task for an immediate first poll."""
+        self._tasks[request_id] = (None, self.min_interval)
+        self._push(request_id, now)
+
+    def due(self, now: float, limit: int) -> List[str]:
+        """Remove and return up to limit tasks whose poll time has come."""
+        due = []
+        while self._heap and len(due) < limit and self._heap[0][0] <= now:
+            due.append(heapq.heappop(self._heap)[2])
+        return due
+
+    def next_time(self) -> Optional[float]:
+        """Return the earliest scheduled poll time, if any."""
+        return self._heap[0][0] if self._heap else None
+
+    def polled(self, request_id: str, state: AsyncTaskState, now: float) -> None:
+        """Reschedule a task after a poll found it in a non-terminal state."""
+        last, interval = self._tasks[request_id]
+        interval = self.min_interval if state != last else min(interval * self.backoff, self.max_interval)
+        self._tasks[request_id] = (state, interval)
+        self._push(request_id, now + interval)
+
+    def discard(self, request_id: str) -> bool:
+        """Forget a finished task; return whether it was still scheduled."""
+        return self._tasks.pop(request_id, None) is not None
+
+    def __contains__(self, request_id: str) -> bool:
+        return request_id in self._tasks
+
+
+class AsyncTaskTracker:
+    """
+    Watches async tasks until they succeed or fail.
+
+    A single loop polls ``get_async_task`` for the tasks that are due, at most
+    max_in_flight at a time. With a Client the loop runs in a background
+    thread and ``track`` returns ``concurrent.futures.Future`` objects; with
+    an AsyncClient it runs as an asyncio task and ``track`` must be called
+    from a coroutine, returning ``asyncio.Future`` objects.
+
+    A future resolves to the task (a dict, or an AsyncTask model on typed
+    clients) once its state is SUCCESS or FAIL. It is failed with the
+    exception if a poll raises, and with TimeoutError if the task is not
+    finished within timeout seconds of being tracked.
+
+    Args:
+        client: Client or AsyncClient to poll with
+        max_in_flight: Maximum number of polls outstanding at once
+        min_interval: Seconds between polls of a task whose state just changed
+        max_interval: Maximum seconds between polls of a task
+        backoff: Factor the interval grows by while a task's state is unchanged
+        timeout: Seconds after which an unfinished task is given up (optional)
+        account_id_override: Optional account ID override
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        min_interval: float = 0.5,
+        max_interval: float = 30.0,
+        backoff: float = 1.5,
+        timeout: Optional[float] = None,
+        account_id_override: Optional[str] = None,
+    ):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.client = client
+        self.max_in_flight = max_in_flight
+        self.timeout = timeout
+        self.account_id_override = account_id_override
+        self.polls = 0
+        self._schedule = PollSchedule(min_interval, max_interval, backoff)
+        self._futures: Dict[str, Any] = {}
+        self._callbacks: Dict[str, Callable[[str, Any], None]] = {}
+        # Callbacks of finished tasks, run once the condition is released
+        self._ready: List[Tuple[Callable[[str, Any], None], str, Any]] = []
+        # (deadline, request ID) heap; entries of finished tasks are skipped when popped
+        self._deadlines: List[Tuple[float, str]] = []
+        self._pending = 0
+        self._accounts: Dict[str, str] = {}
+        self._in_flight = 0
+        self._closed = False
+        self._async = isinstance(client, AsyncClient)
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop_task: Optional["asyncio.Task[None]"] = None
+
+    def track(
+        self,
+        request_id: str,
+        callback: Optional[Callable[[str, Any], None]] = None,
+        account_id_override: Optional[str] = None,
+    ) -> Any:
+        """
+        Start watching a request ID.
+
+        Args:
+            request_id: Request ID returned by batch_create_jobs or create_job
+            callback: Called as callback(request_id, future) once the future is done (optional)
+            account_id_override: Account the task belongs to, if not the tracker's (optional)
+
+        Returns:
+            Future resolving to the finished task; tracking an ID twice returns the same future
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("AsyncTaskTracker is closed")
+            if request_id in self._futures:
+                return self._futures[request_id]
+            future = asyncio.get_running_loop().create_future() if self._async else Future()
+            self._futures[request_id] = future
+            if callback is not None:
+                self._callbacks[request_id] = callback
+            if account_id_override is not None:
+                self._accounts[request_id] = account_id_override
+            now = time.monotonic()
+            if self.timeout is not None:
+                heapq.heappush(self._deadlines, (now + self.timeout, request_id))
+            self._schedule.add(request_id, now)
+            self._pending += 1
+            self._start()
+            self._condition.notify_all()
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return future
+
+    def track_many(
+        self,
+        request_ids: Iterable[str],
+        callback: Optional[Callable[[str, Any], None]] = None,
+        account_id_override: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Start watching several request IDs; return their futures by request ID."""
+        return {request_id: self.track(request_id, callback, account_id_override) for request_id in request_ids}
+
+    def pending(self) -> int:
+        """Return the number of tracked tasks that are not finished."""
+        with self._condition:
+            return self._pending
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return tracker statistics.
+
+        Returns:
+            Dict with tracked, pending, in_flight, polls, succeeded and failed counts
+        """
+        with self._condition:
+            done = [future for future in self._futures.values() if future.done()]
+            succeeded = sum(
+                1 for future in done
+                if not future.cancelled() and future.exception() is None
+                and task_state(future.result()) == AsyncTaskState.SUCCESS
+            )
+            return {
+                "tracked": len(self._futures),
+                "pending": len(self._futures) - len(done),
+                "in_flight": self._in_flight,
+                "polls": self.polls,
+                "succeeded": succeeded,
+                "failed": len(done) - succeeded,
+            }
+
+    # -- shared bookkeeping, called with the condition held --
+
+    def _start(self) -> None:
+        if self._async:
+            if self._loop_task is None or self._loop_task.done():
+                self._wakeup = self._wakeup or asyncio.Event()
+                self._loop_task = asyncio.get_running_loop().create_task(self._run_async())
+        elif self._thread is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="scheduler0-async-task")
+            self._thread = threading.Thread(target=self._run, name="scheduler0-async-task-tracker", daemon=True)
+            self._thread.start()
+
+    def _take_due(self) -> Tuple[List[str], Optional[float]]:
+        """Expire overdue tasks; return the tasks to poll now and the time to wake up at."""
+        now = time.monotonic()
+        while self._deadlines and (self._deadlines[0][0] <= now or self._deadlines[0][1] not in self._schedule):
+            _, request_id = heapq.heappop(self._deadlines)
+            if request_id in self._schedule:
+                self._finish(request_id, error=TimeoutError(f"Async task {request_id} not finished after {self.timeout}s"))
+        due = []
+        for request_id in self._schedule.due(now, self.max_in_flight - self._in_flight):
+            if self._futures[request_id].done():
+                # Cancelled by its owner
+                self._finish(request_id)
+            else:
+                due.append(request_id)
+        self._in_flight += len(due)
+        # With every slot taken the next poll waits for one to free up, which
+        # _polled signals; waking for an overdue schedule would only spin
+        wake = self._schedule.next_time() if self._in_flight < self.max_in_flight else None
+        if self._deadlines:
+            deadline = self._deadlines[0][0]
+            wake = deadline if wake is None else min(wake, deadline)
+        return due, wake
+
+    def _polled(self, request_id: str, task: Any = None, error: Optional[BaseException] = None) -> None:
+        self._in_flight -= 1
+        self.polls += 1
+        future = self._futures.get(request_id)
+        if future is None or future.done():
+            return
+        if error is not None:
+            self._finish(request_id, error=error)
+            return
+        state = task_state(task)
+        if state in TERMINAL_STATES:
+            self._finish(request_id, task=task)
+        else:
+            self._schedule.polled(request_id, state, time.monotonic())
+
+    def _finish(self, request_id: str, task: Any = None, error: Optional[BaseException] = None) -> None:
+        future = self._futures[request_id]
+        self._accounts.pop(request_id, None)
+        if self._schedule.discard(request_id):
+            self._pending -= 1
+        if not future.done():
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(task)
+        self._condition.notify_all()
+        callback = self._callbacks.pop(request_id, None)
+        if callback is not None:
+            self._ready.append((callback, request_id, future))
+
+    def _take_callbacks(self) -> List[Tuple[Callable[[str, Any], None], str, Any]]:
+        ready, self._ready = self._ready, []
+        return ready
+
+    @staticmethod
+    def _run_callbacks(ready: List[Tuple[Callable[[str, Any], None], str, Any]]) -> None:
+        # Called without the condition held, so callbacks may use the tracker
+        for callback, request_id, future in ready:
+            callback(request_id, future)
+
+    def _account(self, request_id: str) -> Optional[str]:
+        with self._condition:
+            return self._accounts.get(request_id, self.account_id_override)
+
+    @staticmethod
+    def _task(response: Any) -> Any:
+        return response.get("data", response) if isinstance(response, dict) else response
+
+    # -- thread loop (Client) --
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if self._closed:
+                    return
+                due, wake = self._take_due()
+                for request_id in due:
+                    self._executor.submit(self._poll, request_id)
+                ready = self._take_callbacks()
+                if not due and not ready:
+                    self._condition.wait(None if wake is None else max(wake - time.monotonic(), 0))
+            self._run_callbacks(ready)
+
+    def _poll(self, request_id: str) -> None:
+        try:
+            response = self.client.get_async_task(request_id, account_id_override=self._account(request_id))
+        except Exception as error:
+            result: Dict[str, Any] = {"error": error}
+        else:
+            result = {"task": self._task(response)}
+        with self._condition:
+            self._polled(request_id, **result)
+            ready = self._take_callbacks()
+            self._condition.notify_all()
+        self._run_callbacks(ready)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every tracked task is finished (Client only).
+
+        Returns:
+            True if all tasks finished, False if timeout expired first
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: self._pending == 0,
+                None if deadline is None else max(deadline - time.monotonic(), 0),
+            )
+
+    def close(self) -> None:
+        """Stop polling and cancel the futures of unfinished tasks (Client only)."""
+        with self._condition:
+            self._closed = True
+            for future in self._futures.values():
+                future.cancel()
+            self._pending = 0
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "AsyncTaskTracker":
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        if exc_type is None:
+            self.wait()
+        self.close()
+
+    # -- asyncio loop (AsyncClient) --
+
+    async def _run_async(self) -> None:
+        polls = set()
+        while not self._closed:
+            self._wakeup.clear()
+            with self._condition:
+                due, wake = self._take_due()
+                ready = self._take_callbacks()
+            self._run_callbacks(ready)
+            for request_id in due:
+                poll = asyncio.ensure_future(self._poll_async(request_id))
+                polls.add(poll)
+                poll.add_done_callback(polls.discard)
+            if due:
+                continue
+            if wake is None and not polls:
+                return
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), None if wake is None else max(wake - time.monotonic(), 0))
+            except asyncio.TimeoutError:
+                pass
+
+    async def _poll_async(self, request_id: str) -> None:
+        try:
+            response = await self.client.get_async_task(request_id, account_id_override=self._account(request_id))
+        except Exception as error:
+            result: Dict[str, Any] = {"error": error}
+        else:
+            result = {"task": self._task(response)}
+        with self._condition:
+            self._polled(request_id, **result)
+            ready = self._take_callbacks()
+        self._run_callbacks(ready)
+        self._wakeup.set()
+
+    async def wait_async(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every tracked task is finished (AsyncClient only)."""
+        futures = [future for future in self._futures.values() if not future.done()]
+        if not futures:
+            return True
+        _, pending = await asyncio.wait(futures, timeout=timeout)
+        return not pending
+
+    async def aclose(self) -> None:
+        """Stop polling and cancel the futures of unfinished tasks (AsyncClient only)."""
+        with self._condition:
+            self._closed = True
+            for future in self._futures.values():
+                future.cancel()
+            self._pending = 0
+        if self._loop_task is not None:
+            self._wakeup.set()
+            await self._loop_task
+
+    async def __aenter__(self) -> "AsyncTaskTracker":
+        return self
+
+    async def __aexit__(self, exc_type: Any, *exc_info: Any) -> None:
+        if exc_type is None:
+            await self.wait_async()
+        await self.aclose()
+
+
+def wait_for_async_tasks(
+    self: Client,
+    request_ids: Iterable[str],
+    timeout: Optional[float] = None,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    account_id_override: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Poll async tasks until they all succeed or fail.
+
+    Args:
+        request_ids: Request IDs returned by batch_create_jobs or create_job
+        timeout: Seconds after which unfinished tasks raise TimeoutError (optional)
+        max_in_flight: Maximum number of polls outstanding at once
+        account_id_override: Optional account ID override
+
+    Returns:
+        Dict of finished tasks by request ID
+    """
+    with AsyncTaskTracker(self, max_in_flight=max_in_flight, timeout=timeout, account_id_override=account_id_override) as tracker:
+        futures = tracker.track_many(request_ids)
+    return {request_id: future.result() for request_id, future in futures.items()}
+
+
+async def wait_for_async_tasks_async(
+    self: AsyncClient,
+    request_ids: Iterable[str],
+    timeout: Optional[float] = None,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    account_id_override: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Poll async tasks until they all succeed or fail (async version)."""
+    async with AsyncTaskTracker(self, max_in_flight=max_in_flight, timeout=timeout, account_id_override=account_id_override) as tracker:
+        futures = tracker.track_many(request_ids)
+    return {request_id: future.result() for request_id, future in futures.items()}
+
+
 # Attach methods to Client class
 Client.get_async_task = get_async_task
+Client.wait_for_async_tasks = wait_for_async_tasks
+
 
+# Attach methods to AsyncClient class
+AsyncClient.get_async_task = get_async_task
+AsyncClient.wait_for_async_tasks = wait_for_async_tasks_async
@@ -0,0 +1,225 @@
+"""
+Micro-batching of concurrent create_job calls for Scheduler0 client.
+
+``create_job`` sends a one-job ``batch_create_jobs`` request per call. A
+client created with ``job_batching=JobBatching(...)`` instead collects the
+jobs that threads or coroutines create at about the same time and sends
+them together: a batch is sent when it holds ``max_jobs`` jobs or
+``max_delay`` seconds after its first job arrived, whichever comes first.
+Jobs are batched per account:
+
+    client = Client(..., job_batching=JobBatching(max_jobs=100, max_delay=0.005))
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        results = list(executor.map(client.create_job, jobs))
+
+Every caller gets the response of the request that carried its job (the
+batch's request ID), or that request's error. A batch rejected with a 4xx
+status other than 429 was not accepted, so its jobs are resent one per
+request and each caller gets the outcome of its own job; other errors may
+follow a partially applied request and are raised to every caller.
+"""
+
+import asyncio
+import copy
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set
+
+import requests
+
+
+@dataclass(frozen=True)
+class JobBatching:
+    """Window in which concurrent create_job calls are sent as one batch."""
+    max_jobs: int = 100
+    max_delay: float = 0.005
+
+
+class _Batch:
+    __slots__ = ("jobs", "futures", "full")
+
+    def __init__(self, full: Any):
+        self.jobs: List[Any] = []
+        self.futures: List[Any] = []
+        self.full = full
+
+
+def _rejected(error: Exception) -> bool:
+    """Whether a batch was refused before any of its jobs was accepted."""
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    return isinstance(error, requests.HTTPError) and status is not None and 400 <= status < 500 and status != 429
+
+
+def _share(value: Any) -> Any:
+    # Each caller gets its own copy of a plain response
+    return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+
+class _BatcherBase:
+    def __init__(self, client: Any, batching: JobBatching):
+        if batching.max_jobs < 1 or batching.max_delay < 0:
+            raise ValueError("max_jobs must be at least 1 and max_delay not negative")
+        self.client = client
+        self.batching = batching
+        self._open: Dict[Optional[str], _Batch] = {}
+        self.jobs = 0
+        self.batches = 0
+        self.fallbacks = 0
+
+    def _add(self, account: Optional[str], job: Any, future: Any, new_event: Any) -> Optional[_Batch]:
+        """Add a job to the account's open batch; return the batch if it was opened by this job."""
+        batch = self._open.get(account)
+        opened = batch is None
+        if opened:
+            batch = self._open[account] = _Batch(new_event())
+        batch.jobs.append(job)
+        batch.futures.append(future)
+        self.jobs += 1
+        if len(batch.jobs) >= self.batching.max_jobs:
+            # Later jobs start a new batch while this one is sent
+            del self._open[account]
+            batch.full.set()
+        return batch if opened else None
+
+    def _close(self, account: Optional[str], batch: _Batch) -> None:
+        if self._open.get(account) is batch:
+            del self._open[account]
+        self.batches += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return batching counters.
+
+        Returns:
+            Dict with jobs submitted, batches sent, average batch size and
+            batches resent one job per request ("fallbacks")
+        """
+        return {
+            "jobs": self.jobs,
+            "batches": self.batches,
+            "average_batch": self.jobs / self.batches if self.batches else 0.0,
+            "fallbacks": self.fallbacks,
+        }
+
+
+class JobBatcher(_BatcherBase):
+    """Collects create_job calls from many threads into batch_create_jobs requests."""
+
+    def __init__(self, client: Any, batching: JobBatching):
+        super().__init__(client, batching)
+        self._lock = threading.Lock()
+
+    def submit(self, job: Any, account_id_override: Optional[str] = None) -> Any:
+        """
+        Create a job as part of the next batch and wait for the outcome.
+
+        The thread whose job opens a batch waits for the window to close and
+        sends it; the others wait for its result.
+
+        Returns:
+            Response of the request that carried the job
+
+        Raises:
+            The error of that request
+        """
+        account = self.client._resolve_account_id(job, account_id_override)
+        future: "Future[Any]" = Future()
+        with self._lock:
+            batch = self._add(account, job, future, threading.Event)
+        if batch is not None:
+            batch.full.wait(self.batching.max_delay)
+            with self._lock:
+                self._close(account, batch)
+            self._send(account, batch)
+        return future.result()
+
+    def _send(self, account: Optional[str], batch: _Batch) -> None:
+        try:
+            self._send_batch(account, batch)
+        except BaseException as error:
+            # e.g. KeyboardInterrupt in the sending thread; the threads waiting on the batch must not hang
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(error)
+            raise
+
+    def _send_batch(self, account: Optional[str], batch: _Batch) -> None:
+        try:
+            result = self.client.batch_create_jobs(batch.jobs, account_id_override=account)
+        except Exception as error:
+            if not (_rejected(error) and len(batch.jobs) > 1):
+                for future in batch.futures:
+                    future.set_exception(error)
+                return
+            with self._lock:
+                self.fallbacks += 1
+            for job, future in zip(batch.jobs, batch.futures):
+                try:
+                    future.set_result(self.client.batch_create_jobs([job], account_id_override=account))
+                except Exception as job_error:
+                    future.set_exception(job_error)
+            return
+        for future in batch.futures:
+            future.set_result(_share(result))
+
+
+class AsyncJobBatcher(_BatcherBase):
+    """Collects create_job calls from many coroutines into batch_create_jobs requests."""
+
+    def __init__(self, client: Any, batching: JobBatching):
+        super().__init__(client, batching)
+        # Flush tasks being run; the event loop only keeps weak references to tasks
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def submit(self, job: Any, account_id_override: Optional[str] = None) -> Any:
+        """
+        Create a job as part of the next batch and await the outcome.
+
+        Batches are sent by their own task, so cancelling a caller does not
+        hold back the other jobs (a cancelled caller's job may still be created).
+        """
+        account = self.client._resolve_account_id(job, account_id_override)
+        future = asyncio.get_running_loop().create_future()
+        batch = self._add(account, job, future, asyncio.Event)
+        if batch is not None:
+            task = asyncio.ensure_future(self._flush(account, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return await future
+
+    async def aclose(self) -> None:
+        """Wait until the batches already collected have been sent."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _flush(self, account: Optional[str], batch: _Batch) -> None:
+        try:
+            await asyncio.wait_for(batch.full.wait(), self.batching.max_delay)
+        except asyncio.TimeoutError:
+            pass
+        self._close(account, batch)
+        try:
+            result = await self.client.batch_create_jobs(batch.jobs, account_id_override=account)
+        except Exception as error:
+            if not (_rejected(error) and len(batch.jobs) > 1):
+                for future in batch.futures:
+                    if not future.done():
+                        future.set_exception(error)
+                return
+            self.fallbacks += 1
+            outcomes = await asyncio.gather(
+                *(self.client.batch_create_jobs([job], account_id_override=account) for job in batch.jobs),
+                return_exceptions=True,
+            )
+            for future, outcome in zip(batch.futures, outcomes):
+                if future.done():
+                    continue
+                if isinstance(outcome, BaseException):
+                    future.set_exception(outcome)
+                else:
+                    future.set_result(outcome)
+            return
+        for future in batch.futures:
+            if not future.done():
+                future.set_result(_share(result))
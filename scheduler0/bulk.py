@@ -0,0 +1,596 @@
+"""
+Bulk operations for Scheduler0 client.
+
+``update_jobs``, ``delete_jobs`` and their project, executor and credential
+counterparts call the single-item endpoint for every ID with at most
+``max_in_flight`` calls outstanding on the client's connection pool, and
+report every failure instead of stopping at the first:
+
+    report = client.update_jobs({job_id: pause for job_id in job_ids}, max_in_flight=8)
+    for failure in report.failures:
+        print(failure.id, failure.status_code, failure.error)
+
+``import_jobs`` creates any number of jobs without sending one enormous
+request. Jobs are split into chunks bounded by job count and encoded size,
+chunks are submitted through ``batch_create_jobs`` with at most
+``max_in_flight`` requests outstanding, and the async task of every accepted
+chunk is watched by an AsyncTaskTracker:
+
+    report = client.import_jobs(jobs, max_in_flight=8)
+    print(f"{report.succeeded}/{report.jobs} jobs at {report.jobs_per_second:,.0f} jobs/s")
+    for chunk in report.failures:
+        print(chunk.positions, chunk.error)
+"""
+
+import asyncio
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+import requests
+
+from .client import Client
+from .async_client import AsyncClient
+from .async_tasks import AsyncTaskState, AsyncTaskTracker, task_state
+from .serialization import serialize_body
+from .types import (
+    CredentialDeleteRequestBody,
+    CredentialUpdateRequestBody,
+    ExecutorDeleteRequestBody,
+    ExecutorUpdateRequestBody,
+    JobDeleteRequestBody,
+    JobRequestBody,
+    JobUpdateRequestBody,
+    ProjectDeleteRequestBody,
+    ProjectUpdateRequestBody,
+)
+
+
+# Chunk limits: the server accepts much larger batches, but these keep each
+# request well under typical proxy body limits and timeouts
+DEFAULT_CHUNK_JOBS = 500
+DEFAULT_CHUNK_BYTES = 512 * 1024
+
+DEFAULT_BULK_WORKERS = 4
+
+# Concurrent single-item calls; below the client's default pool size of 10
+DEFAULT_BULK_CALLS = 8
+
+Updates = Union[Mapping[str, Any], Iterable[Tuple[str, Any]]]
+
+
+@dataclass
+class JobChunk:
+    """Jobs sent in one batch_create_jobs request, with their positions in the input and their encoded JSON."""
+    positions: List[int]
+    jobs: List[Any]
+    account_id: Optional[str] = None
+    encoded: List[bytes] = field(default_factory=list)
+
+    def body(self) -> bytes:
+        """Return the request body: the JSON array of the encoded jobs."""
+        return b"[" + b",".join(self.encoded) + b"]"
+
+    def split(self) -> List["JobChunk"]:
+        """Return the two halves of the chunk."""
+        middle = len(self.jobs) // 2
+        return [
+            JobChunk(self.positions[:middle], self.jobs[:middle], self.account_id, self.encoded[:middle]),
+            JobChunk(self.positions[middle:], self.jobs[middle:], self.account_id, self.encoded[middle:]),
+        ]
+
+
+@dataclass
+class ChunkResult:
+    """Outcome of one chunk; positions are the input indices of its jobs."""
+    positions: List[int]
+    account_id: Optional[str] = None
+    request_id: Optional[str] = None
+    state: Optional[AsyncTaskState] = None
+    error: Optional[str] = None
+
+    @property
+    def first(self) -> int:
+        """Input index of the chunk's first job."""
+        return self.positions[0]
+
+    @property
+    def count(self) -> int:
+        """Number of jobs in the chunk."""
+        return len(self.positions)
+
+    @property
+    def ok(self) -> bool:
+        """Whether the chunk was accepted and, if tracked, its task succeeded."""
+        return self.error is None and self.state != AsyncTaskState.FAIL
+
+
+@dataclass
+class ImportReport:
+    """Summary of a finished bulk job import."""
+    jobs: int
+    chunks: List[ChunkResult] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def failures(self) -> List[ChunkResult]:
+        """Chunks that were rejected, failed, or whose task failed."""
+        return [chunk for chunk in self.chunks if not chunk.ok]
+
+    @property
+    def succeeded(self) -> int:
+        """Number of jobs in successful chunks."""
+        return sum(chunk.count for chunk in self.chunks if chunk.ok)
+
+    @property
+    def jobs_per_second(self) -> float:
+        """Import throughput, counting successful jobs."""
+        return self.succeeded / self.seconds if self.seconds > 0 else 0.0
+
+
+@dataclass
+class BulkFailure:
+    """A single-item call that raised."""
+    id: str
+    error: str
+    status_code: Optional[int] = None
+
+
+@dataclass
+class BulkReport:
+    """Summary of a finished bulk update or delete."""
+    operation: str
+    results: Dict[str, Any] = field(default_factory=dict)
+    failures: List[BulkFailure] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def total(self) -> int:
+        """Number of IDs processed."""
+        return len(self.results) + len(self.failures)
+
+    @property
+    def succeeded(self) -> List[str]:
+        """IDs whose call succeeded."""
+        return list(self.results)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every call succeeded."""
+        return not self.failures
+
+    @property
+    def calls_per_second(self) -> float:
+        """Bulk throughput."""
+        return self.total / self.seconds if self.seconds > 0 else 0.0
+
+
+def _failure(item_id: str, error: Exception) -> BulkFailure:
+    response = getattr(error, "response", None)
+    return BulkFailure(str(item_id), f"{type(error).__name__}: {error}", getattr(response, "status_code", None))
+
+
+def run_bulk(operation: str, calls: Iterable[Tuple[str, Callable[[], Any]]], max_in_flight: int) -> BulkReport:
+    """
+    Run (id, call) pairs on a thread pool, at most max_in_flight at once.
+
+    The calls iterable is consumed as slots free up, so it may be lazy and
+    arbitrarily long.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+    start = time.perf_counter()
+    report = BulkReport(operation)
+    calls = iter(calls)
+    with ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="scheduler0-bulk") as pool:
+        in_flight: Dict[Any, str] = {}
+        for item_id, call in calls:
+            in_flight[pool.submit(call)] = item_id
+            if len(in_flight) < max_in_flight:
+                continue
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                _record(report, in_flight.pop(future), future)
+        for future in list(in_flight):
+            future.exception()
+            _record(report, in_flight.pop(future), future)
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+async def arun_bulk(operation: str, calls: Iterable[Tuple[str, Callable[[], Any]]], max_in_flight: int) -> BulkReport:
+    """Run (id, coroutine function) pairs, at most max_in_flight at once."""
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+    start = time.perf_counter()
+    report = BulkReport(operation)
+    in_flight: Dict["asyncio.Future[Any]", str] = {}
+    for item_id, call in calls:
+        in_flight[asyncio.ensure_future(call())] = item_id
+        if len(in_flight) < max_in_flight:
+            continue
+        done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+        for future in done:
+            _record(report, in_flight.pop(future), future)
+    if in_flight:
+        await asyncio.wait(in_flight)
+        for future, item_id in in_flight.items():
+            _record(report, item_id, future)
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def _record(report: BulkReport, item_id: str, future: Any) -> None:
+    error = future.exception()
+    if error is not None:
+        if not isinstance(error, Exception):
+            raise error
+        report.failures.append(_failure(item_id, error))
+    else:
+        report.results[str(item_id)] = future.result()
+
+
+def _bulk(self: Any, operation: str, calls: Iterable[Tuple[str, Callable[[], Any]]], max_in_flight: int) -> Any:
+    """Run the calls with the runner of the client's kind; awaitable on AsyncClient."""
+    if isinstance(self, AsyncClient):
+        return arun_bulk(operation, calls, max_in_flight)
+    return run_bulk(operation, calls, max_in_flight)
+
+
+def _pairs(updates: Updates) -> Iterable[Tuple[str, Any]]:
+    return updates.items() if isinstance(updates, Mapping) else updates
+
+
+def _bulk_update(self: Any, method: str, updates: Updates, max_in_flight: int, account_id_override: Optional[str]) -> Any:
+    update = getattr(self, method)
+    calls = (
+        (item_id, lambda item_id=item_id, body=body: update(item_id, body, account_id_override=account_id_override))
+        for item_id, body in _pairs(updates)
+    )
+    return _bulk(self, method, calls, max_in_flight)
+
+
+def _bulk_delete(self: Any, method: str, ids: Iterable[str], body: Any, max_in_flight: int, account_id_override: Optional[str]) -> Any:
+    delete = getattr(self, method)
+    calls = (
+        (item_id, lambda item_id=item_id: delete(item_id, body, account_id_override=account_id_override))
+        for item_id in ids
+    )
+    return _bulk(self, method, calls, max_in_flight)
+
+
+def update_jobs(
+    self: Client,
+    updates: Union[Mapping[str, JobUpdateRequestBody], Iterable[Tuple[str, JobUpdateRequestBody]]],
+    max_in_flight: int = DEFAULT_BULK_CALLS,
+    account_id_override: Optional[str] = None,
+) -> BulkReport:
+    """
+    Update many jobs concurrently.
+
+    Args:
+        updates: JobUpdateRequestBody by job ID (a mapping or (id, body) pairs)
+        max_in_flight: Maximum number of concurrent requests
+        account_id_override: Optional account ID override
+
+    Returns:
+        BulkReport with the updated jobs by ID and the failed calls
+    """
+    return _bulk_update(self, "update_job", updates, max_in_flight, account_id_override)
+
+
+def delete_jobs(
+    self: Client,
+    job_ids: Iterable[str],
+    body: JobDeleteRequestBody,
+    max_in_flight: int = DEFAULT_BULK_CALLS,
+    account_id_override: Optional[str] = None,
+) -> BulkReport:
+    """
+    Delete many jobs concurrently.
+
+    Args:
+        job_ids: IDs of the jobs to delete
+        body: Delete request body sent for every job
+        max_in_flight: Maximum number of concurrent requests
+        account_id_override: Optional account ID override
+
+    Returns:
+        BulkReport with the deleted IDs and the failed calls
+    """
+    return _bulk_delete(self, "delete_job", job_ids, body, max_in_flight, account_id_override)
+
+
+def update_projects(
+    self: Client,
+    updates: Union[Mapping[str, ProjectUpdateRequestBody], Iterable[Tuple[str, ProjectUpdateRequestBody]]],
+    max_in_flight: int = DEFAULT_BULK_CALLS,
+    account_id_override: Optional[str] = None,
+) -> BulkReport:
+    """Update many projects concurrently (see update_jobs)."""
+    return _bulk_update(self, "update_project", updates, max_in_flight, account_id_override)
+
+
+def delete_projects(
+    self: Client,
+    project_ids: Iterable[str],
+    body: ProjectDeleteRequestBody,
+    max_in_flight: int = DEFAULT_BULK_CALLS,
+    account_id_override: Optional[str] = None,
+) -> BulkReport:
+    """Delete many projects concurrently (see delete_jobs)."""
+    return _bulk_delete(self, "delete_project", project_ids, body, max_in_flight, account_id_override)
+
+
+def update_executors(
+    self: Client,
+    updates: Union[Mapping[str, ExecutorUpdateRequestBody], Iterable[Tuple[str, ExecutorUpdateRequestBody]]],
+    max_in_flight: int = DEFAULT_BULK_CALLS,
+    account_id_override: Optional[str] = None,
+) -> BulkReport:
+    """Update many executors concurrently (see update_jobs)."""
+    return _bulk_update(self, "update_executor", updates, max_in_flight, account_id_override)
+
+
+def delete_executors(
+    self: Client,
+    executor_ids: Iterable[str],
+    body: ExecutorDeleteRequestBody,
+    max_in_flight: int = DEFAULT_BULK_CALLS,
+    account_id_override: Optional[str] = None,
+) -> BulkReport:
+    """Delete many executors concurrently (see delete_jobs)."""
+    return _bulk_delete(self, "delete_executor", executor_ids, body, max_in_flight, account_id_override)
+
+
+def update_credentials(
+    self: Client,
+    updates: Union[Mapping[str, CredentialUpdateRequestBody], Iterable[Tuple[str, CredentialUpdateRequestBody]]],
+    max_in_flight: int = DEFAULT_BULK_CALLS,
+    account_id_override: Optional[str] = None,
+) -> BulkReport:
+    """Update many credentials concurrently (see update_jobs)."""
+    return _bulk_update(self, "update_credential", updates, max_in_flight, account_id_override)
+
+
+def delete_credentials(
+    self: Client,
+    credential_ids: Iterable[str],
+    body: CredentialDeleteRequestBody,
+    max_in_flight: int = DEFAULT_BULK_CALLS,
+    account_id_override: Optional[str] = None,
+) -> BulkReport:
+    """Delete many credentials concurrently (see delete_jobs)."""
+    return _bulk_delete(self, "delete_credential", credential_ids, body, max_in_flight, account_id_override)
+
+
+def plan_chunks(
+    jobs: Iterable[Any],
+    max_jobs: int,
+    max_bytes: int,
+    encode: Callable[[Any], bytes],
+    account_id_override: Optional[str] = None,
+) -> Iterator[JobChunk]:
+    """
+    Split jobs into chunks of at most max_jobs jobs and about max_bytes encoded bytes.
+
+    Jobs naming different accounts (``account_id``) go to different chunks,
+    since a request is sent for one account. A single job larger than
+    max_bytes gets a chunk of its own. Every job is encoded once; the chunk
+    keeps the encoded jobs, so its request body is joined from them rather
+    than encoded again.
+
+    Args:
+        jobs: Jobs in input order
+        max_jobs: Maximum jobs per chunk
+        max_bytes: Maximum encoded size of a chunk
+        encode: Function returning the encoded JSON of one job
+        account_id_override: Account of every job, overriding their account_id (optional)
+
+    Returns:
+        Iterator over the chunks, in the order they fill up
+    """
+    if max_jobs < 1:
+        raise ValueError("max_jobs must be at least 1")
+    # account -> (chunk being filled, its encoded size)
+    open_chunks: Dict[Optional[str], List[Any]] = {}
+    for index, job in enumerate(jobs):
+        account = account_id_override
+        if account is None and getattr(job, "account_id", None) is not None:
+            account = str(job.account_id)
+        encoded = encode(job)
+        job_bytes = len(encoded) + 1
+        current = open_chunks.get(account)
+        if current is not None and (len(current[0].jobs) >= max_jobs or current[1] + job_bytes > max_bytes):
+            yield current[0]
+            current = None
+        if current is None:
+            current = open_chunks[account] = [JobChunk([], [], account), 2]
+        current[0].positions.append(index)
+        current[0].jobs.append(job)
+        current[0].encoded.append(encoded)
+        current[1] += job_bytes
+    for chunk, _ in sorted(open_chunks.values(), key=lambda pair: pair[0].positions[0]):
+        yield chunk
+
+
+def _job_encoder(self: Any) -> Callable[[Any], bytes]:
+    """Return a function encoding a job as the client sends it."""
+    dumps = self.json_codec.dumps
+    return lambda job: dumps(serialize_body(job))
+
+
+def _too_large(error: Exception) -> bool:
+    """Whether a chunk was rejected for its size and can be retried in halves."""
+    response = getattr(error, "response", None)
+    return isinstance(error, requests.HTTPError) and getattr(response, "status_code", None) == 413
+
+
+def _request_id(response: Any) -> Optional[str]:
+    data = response.get("data") if isinstance(response, dict) else response
+    return data if isinstance(data, str) else None
+
+
+def _accepted(chunk: JobChunk, response: Any) -> ChunkResult:
+    request_id = _request_id(response)
+    if request_id is None:
+        return ChunkResult(chunk.positions, chunk.account_id, error=f"Unexpected response: {response!r}")
+    return ChunkResult(chunk.positions, chunk.account_id, request_id=request_id)
+
+
+def _finish_report(report: ImportReport, tasks: Dict[int, Any], start: float) -> ImportReport:
+    """Record the task outcome of every tracked chunk and the elapsed time."""
+    for index, future in tasks.items():
+        chunk = report.chunks[index]
+        try:
+            task = future.result()
+        except Exception as error:
+            chunk.error = f"{type(error).__name__}: {error}"
+        else:
+            chunk.state = task_state(task)
+    report.chunks.sort(key=lambda chunk: chunk.first)
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def import_jobs(
+    self: Client,
+    jobs: Iterable[JobRequestBody],
+    max_chunk_jobs: int = DEFAULT_CHUNK_JOBS,
+    max_chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    max_in_flight: int = DEFAULT_BULK_WORKERS,
+    track: bool = True,
+    task_timeout: Optional[float] = None,
+    account_id_override: Optional[str] = None,
+) -> ImportReport:
+    """
+    Create many jobs in concurrent, size-bounded batch_create_jobs requests.
+
+    A chunk rejected with 413 Payload Too Large is split in half and
+    resubmitted. Other errors are recorded in the report, and the remaining
+    chunks are still sent.
+
+    Args:
+        jobs: Jobs to create (an iterable; it is consumed as chunks are sent)
+        max_chunk_jobs: Maximum jobs per request
+        max_chunk_bytes: Maximum encoded size of a request body
+        max_in_flight: Maximum number of concurrent requests
+        track: Wait for each chunk's async task and record its outcome (default True)
+        task_timeout: Seconds to wait for each chunk's task (optional)
+        account_id_override: Optional account ID override
+
+    Returns:
+        ImportReport with per-chunk results and throughput
+    """
+    start = time.perf_counter()
+    report = ImportReport(jobs=0)
+    tasks: Dict[int, Any] = {}
+    queued: List[JobChunk] = []
+    chunks = plan_chunks(jobs, max_chunk_jobs, max_chunk_bytes, _job_encoder(self), account_id_override)
+    tracker = AsyncTaskTracker(self, max_in_flight=max_in_flight, timeout=task_timeout)
+    with ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="scheduler0-import") as pool, tracker:
+        in_flight: Dict[Any, JobChunk] = {}
+        exhausted = False
+        while True:
+            while len(in_flight) < max_in_flight and (queued or not exhausted):
+                if queued:
+                    chunk = queued.pop()
+                else:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        exhausted = True
+                        break
+                    report.jobs += len(chunk.jobs)
+                # Same request as batch_create_jobs, with the body joined from the already encoded jobs
+                future = pool.submit(self._post, "/jobs", chunk.body(), account_id_override=chunk.account_id)
+                in_flight[future] = chunk
+            if not in_flight:
+                break
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk = in_flight.pop(future)
+                try:
+                    result = _accepted(chunk, future.result())
+                except Exception as error:
+                    if _too_large(error) and len(chunk.jobs) > 1:
+                        queued.extend(reversed(chunk.split()))
+                        continue
+                    result = ChunkResult(chunk.positions, chunk.account_id, error=f"{type(error).__name__}: {error}")
+                report.chunks.append(result)
+                if track and result.request_id is not None:
+                    tasks[len(report.chunks) - 1] = tracker.track(result.request_id, account_id_override=chunk.account_id)
+    return _finish_report(report, tasks, start)
+
+
+async def import_jobs_async(
+    self: AsyncClient,
+    jobs: Iterable[JobRequestBody],
+    max_chunk_jobs: int = DEFAULT_CHUNK_JOBS,
+    max_chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    max_in_flight: int = DEFAULT_BULK_WORKERS,
+    track: bool = True,
+    task_timeout: Optional[float] = None,
+    account_id_override: Optional[str] = None,
+) -> ImportReport:
+    """Create many jobs in concurrent, size-bounded batch_create_jobs requests (async version)."""
+    start = time.perf_counter()
+    report = ImportReport(jobs=0)
+    tasks: Dict[int, Any] = {}
+    queued: List[JobChunk] = []
+    chunks = plan_chunks(jobs, max_chunk_jobs, max_chunk_bytes, _job_encoder(self), account_id_override)
+    async with AsyncTaskTracker(self, max_in_flight=max_in_flight, timeout=task_timeout) as tracker:
+        in_flight: Dict["asyncio.Task[Any]", JobChunk] = {}
+        exhausted = False
+        while True:
+            while len(in_flight) < max_in_flight and (queued or not exhausted):
+                if queued:
+                    chunk = queued.pop()
+                else:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        exhausted = True
+                        break
+                    report.jobs += len(chunk.jobs)
+                task = asyncio.ensure_future(self._post("/jobs", chunk.body(), account_id_override=chunk.account_id))
+                in_flight[task] = chunk
+            if not in_flight:
+                break
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                chunk = in_flight.pop(task)
+                try:
+                    result = _accepted(chunk, task.result())
+                except Exception as error:
+                    if _too_large(error) and len(chunk.jobs) > 1:
+                        queued.extend(reversed(chunk.split()))
+                        continue
+                    result = ChunkResult(chunk.positions, chunk.account_id, error=f"{type(error).__name__}: {error}")
+                report.chunks.append(result)
+                if track and result.request_id is not None:
+                    tasks[len(report.chunks) - 1] = tracker.track(result.request_id, account_id_override=chunk.account_id)
+    return _finish_report(report, tasks, start)
+
+
+# Attach methods to Client class
+Client.import_jobs = import_jobs
+Client.update_jobs = update_jobs
+Client.delete_jobs = delete_jobs
+Client.update_projects = update_projects
+Client.delete_projects = delete_projects
+Client.update_executors = update_executors
+Client.delete_executors = delete_executors
+Client.update_credentials = update_credentials
+Client.delete_credentials = delete_credentials
+
+
+# Attach methods to AsyncClient class
+AsyncClient.import_jobs = import_jobs_async
+AsyncClient.update_jobs = update_jobs
+AsyncClient.delete_jobs = delete_jobs
+AsyncClient.update_projects = update_projects
+AsyncClient.delete_projects = delete_projects
+AsyncClient.update_executors = update_executors
+AsyncClient.delete_executors = delete_executors
+AsyncClient.update_credentials = update_credentials
+AsyncClient.delete_credentials = delete_credentials
@@ -0,0 +1,277 @@
+"""
+Read-through response cache for Scheduler0 client.
+
+A ResponseCache given to a client as ``cache=`` keeps the decoded responses
+of single-resource GETs (``get_job``, ``get_project``, ``get_executor`` and
+``get_credential``) in memory. Each endpoint template has its own policy:
+how long entries stay fresh and how many are kept, least recently used
+first out. The client's own writes (``update_*``, ``delete_*``,
+``archive_credential``) invalidate the entries for the resource they change:
+
+    cache = ResponseCache(policies={"/projects/{id}": CachePolicy(ttl=300, max_entries=1000)})
+    client = Client("http://localhost:7070", api_key=..., api_secret=..., cache=cache)
+    client.get_project("42")  # sent
+    client.get_project("42")  # served from the cache
+    print(cache.stats()["hit_rate"])
+
+A GET racing one of the client's writes to the same path is not cached:
+the client reads the path's generation when the GET starts, invalidation
+bumps it, and ``put`` drops a response whose generation changed meanwhile.
+
+Writes made by other clients are only seen once an entry expires, so pick
+TTLs the application can tolerate as staleness.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Set, Tuple
+
+from .endpoints import endpoint_template, request_key
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Freshness and size bound of the cached responses of one endpoint template."""
+    ttl: float = 60.0
+    max_entries: int = 1024
+
+
+# Endpoints cached by default, with their policies
+DEFAULT_POLICIES: Dict[str, CachePolicy] = {
+    "/jobs/{id}": CachePolicy(ttl=30.0, max_entries=4096),
+    "/projects/{id}": CachePolicy(ttl=300.0, max_entries=1024),
+    "/executors/{id}": CachePolicy(ttl=300.0, max_entries=1024),
+    "/credentials/{id}": CachePolicy(ttl=300.0, max_entries=256),
+}
+
+# Written paths whose generation is remembered; past this, they are all forgotten at once
+MAX_GENERATIONS = 10000
+
+
+class _Region:
+    """LRU entries and counters of one endpoint template."""
+
+    __slots__ = ("policy", "entries", "paths", "hits", "misses", "evictions", "expirations", "invalidations", "stale")
+
+    def __init__(self, policy: CachePolicy):
+        self.policy = policy
+        # key -> (expiry time, value); most recently used last
+        self.entries: "OrderedDict[Tuple[Any, ...], Tuple[float, Any]]" = OrderedDict()
+        # path -> keys of its entries, for invalidation without a scan
+        self.paths: Dict[str, Set[Tuple[Any, ...]]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        # Responses not stored because a write to their path raced the GET
+        self.stale = 0
+
+    def remove(self, key: Tuple[Any, ...]) -> None:
+        del self.entries[key]
+        keys = self.paths[key[0]]
+        keys.discard(key)
+        if not keys:
+            del self.paths[key[0]]
+
+
+class ResponseCache:
+    """
+    In-memory TTL/LRU cache of GET responses, keyed by path, query and account.
+
+    Only endpoint templates with a policy are cached. Values are decoded
+    responses; dicts are copied on the way in and out so callers may modify
+    what they get, typed models are immutable and shared.
+
+    Args:
+        policies: CachePolicy by endpoint template; defaults to DEFAULT_POLICIES.
+            Map a template to None to disable caching it.
+        clock: Function returning the current time in seconds (for tests)
+    """
+
+    def __init__(
+        self,
+        policies: Optional[Mapping[str, Optional[CachePolicy]]] = None,
+        clock: Any = time.monotonic,
+    ):
+        merged: Dict[str, Optional[CachePolicy]] = dict(DEFAULT_POLICIES)
+        merged.update(policies or {})
+        self._regions: Dict[str, _Region] = {
+            template: _Region(policy) for template, policy in merged.items() if policy is not None
+        }
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Path -> generation of its last invalidation; paths not in it are at _floor
+        self._generations: Dict[str, int] = {}
+        self._counter = 0
+        self._floor = 0
+
+    def caches(self, endpoint: str) -> bool:
+        """Whether GET responses of this path are cached."""
+        return endpoint_template(endpoint) in self._regions
+
+    @staticmethod
+    def key(endpoint: str, params: Optional[Dict[str, Any]], account_id: Optional[str]) -> Tuple[Any, ...]:
+        """Return the cache key of a request."""
+        return request_key(endpoint, params, account_id)
+
+    def generation(self, endpoint: str) -> int:
+        """
+        Return the generation of a path, to pass to ``put`` once its GET completes.
+
+        It changes whenever the path, or a path below it, is invalidated.
+        """
+        with self._lock:
+            return self._generations.get(_path(endpoint), self._floor)
+
+    def get(self, endpoint: str, params: Optional[Dict[str, Any]], account_id: Optional[str]) -> Tuple[bool, Any]:
+        """
+        Look up the response of a request.
+
+        Returns:
+            Tuple of (found, value); found is False for uncached endpoints,
+            missing entries and expired entries
+        """
+        region = self._regions.get(endpoint_template(endpoint))
+        if region is None:
+            return False, None
+        key = self.key(endpoint, params, account_id)
+        with self._lock:
+            entry = region.entries.get(key)
+            if entry is None:
+                region.misses += 1
+                return False, None
+            if entry[0] <= self._clock():
+                region.remove(key)
+                region.expirations += 1
+                region.misses += 1
+                return False, None
+            region.entries.move_to_end(key)
+            region.hits += 1
+        return True, _copy(entry[1])
+
+    def put(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        account_id: Optional[str],
+        value: Any,
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Cache the response of a request, evicting least recently used entries past the size bound.
+
+        Args:
+            endpoint: Request path
+            params: Query parameters
+            account_id: Account the request was sent for
+            value: Decoded response
+            generation: Generation of the path read when the request started; the
+                response is dropped if the path was invalidated since (optional)
+        """
+        region = self._regions.get(endpoint_template(endpoint))
+        if region is None:
+            return
+        key = self.key(endpoint, params, account_id)
+        entry = (self._clock() + region.policy.ttl, _copy(value))
+        with self._lock:
+            if generation is not None and self._generations.get(_path(endpoint), self._floor) != generation:
+                region.stale += 1
+                return
+            region.entries[key] = entry
+            region.entries.move_to_end(key)
+            region.paths.setdefault(key[0], set()).add(key)
+            while len(region.entries) > region.policy.max_entries:
+                region.remove(next(iter(region.entries)))
+                region.evictions += 1
+
+    def invalidate(self, endpoint: str) -> int:
+        """
+        Drop the cached responses a write to this path may have changed.
+
+        That is every entry, for any query or account, whose path is the
+        written path or one of its parents (a write to
+        ``/credentials/7/archive`` invalidates ``/credentials/7``).
+
+        Returns:
+            Number of entries dropped
+        """
+        path = _path(endpoint)
+        paths = set()
+        while path:
+            paths.add(path)
+            path = path.rsplit("/", 1)[0]
+        dropped = 0
+        with self._lock:
+            if len(self._generations) + len(paths) > MAX_GENERATIONS:
+                # Forgotten paths read as the new floor, so GETs started before this still see a change
+                self._generations.clear()
+                self._floor = self._counter + 1
+            self._counter += 1
+            for path in paths:
+                self._generations[path] = self._counter
+            for region in self._regions.values():
+                stale = [key for path in paths for key in region.paths.get(path, ())]
+                for key in stale:
+                    region.remove(key)
+                region.invalidations += len(stale)
+                dropped += len(stale)
+        return dropped
+
+    def clear(self) -> None:
+        """Drop every entry; counters are kept."""
+        with self._lock:
+            for region in self._regions.values():
+                region.entries.clear()
+                region.paths.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return cache statistics.
+
+        Returns:
+            Dict with total hits, misses, hit_rate and entries, and the same
+            counters plus evictions, expirations, invalidations and stale
+            (responses dropped for racing a write) per endpoint template
+            under "endpoints"
+        """
+        with self._lock:
+            endpoints = {
+                template: {
+                    "hits": region.hits,
+                    "misses": region.misses,
+                    "hit_rate": _rate(region.hits, region.misses),
+                    "entries": len(region.entries),
+                    "evictions": region.evictions,
+                    "expirations": region.expirations,
+                    "invalidations": region.invalidations,
+                    "stale": region.stale,
+                }
+                for template, region in self._regions.items()
+            }
+        hits = sum(stats["hits"] for stats in endpoints.values())
+        misses = sum(stats["misses"] for stats in endpoints.values())
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": _rate(hits, misses),
+            "entries": sum(stats["entries"] for stats in endpoints.values()),
+            "endpoints": endpoints,
+        }
+
+
+def _path(endpoint: str) -> str:
+    """Return the normalized path of an endpoint, without its query."""
+    return "/" + endpoint.split("?", 1)[0].strip("/")
+
+
+def _rate(hits: int, misses: int) -> float:
+    return hits / (hits + misses) if hits + misses else 0.0
+
+
+def _copy(value: Any) -> Any:
+    # Typed models are immutable; only plain containers need copying
+    return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
@@ -0,0 +1,265 @@
+"""
+Circuit breaking for Scheduler0 client.
+
+A CircuitBreaker given to a client as ``circuit_breaker=`` watches every
+request attempt per endpoint template (``/jobs/{id}``, ``/prompt``, ...).
+When too many recent attempts of a template failed (connection errors,
+timeouts and 5xx responses) or were slow, its circuit opens: further
+requests to that template raise CircuitOpenError at once, without network
+I/O, instead of piling up behind a degraded endpoint. After ``open_seconds``
+the circuit is half-open and lets ``probes`` requests through; if they all
+succeed it closes, if one fails it opens again:
+
+    breaker = CircuitBreaker(policies={"/prompt": BreakerPolicy(slow_call_seconds=10)})
+    client = Client("http://localhost:7070", api_key=..., api_secret=..., circuit_breaker=breaker)
+    try:
+        client.create_job_from_prompt(request)
+    except CircuitOpenError as error:
+        print(f"{error.endpoint} unavailable, retry in {error.retry_in:.0f}s")
+
+Other endpoints are unaffected. A breaker is thread-safe and may be shared
+between clients talking to the same cluster.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+import requests
+
+from .endpoints import endpoint_template
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of sending a request to an endpoint whose circuit is open."""
+
+    def __init__(self, endpoint: str, retry_in: float):
+        super().__init__(f"Circuit open for {endpoint}; retry in {retry_in:.1f}s")
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+
+
+class CircuitState(str, Enum):
+    """State of one endpoint template's circuit."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class BreakerPolicy:
+    """
+    When the circuit of an endpoint template opens, and for how long.
+
+    Attributes:
+        failure_rate: Fraction of failed attempts in the window that opens the circuit
+        slow_call_seconds: Attempts taking longer count as slow (None: latency is ignored)
+        slow_call_rate: Fraction of slow attempts in the window that opens the circuit
+        min_calls: Attempts needed in the window before either rate is considered
+        window: Length of the rolling window, in seconds
+        open_seconds: Time the circuit stays open before probing
+        probes: Concurrent probe requests allowed while half-open, all of
+            which must succeed to close the circuit
+    """
+    failure_rate: float = 0.5
+    slow_call_seconds: Optional[float] = None
+    slow_call_rate: float = 0.5
+    min_calls: int = 20
+    window: float = 30.0
+    open_seconds: float = 30.0
+    probes: int = 3
+
+
+# Rolling window resolution: counts are kept in this many buckets
+_WINDOW_BUCKETS = 10
+
+
+class _Circuit:
+    """State and rolling counts of one endpoint template."""
+
+    __slots__ = ("policy", "state", "opened_at", "buckets", "probing", "probe_successes", "rejected", "opened")
+
+    def __init__(self, policy: BreakerPolicy):
+        self.policy = policy
+        self.state = CircuitState.CLOSED
+        self.opened_at = 0.0
+        # [bucket start, calls, failures, slow calls], oldest first
+        self.buckets: List[List[float]] = []
+        self.probing = 0
+        self.probe_successes = 0
+        self.rejected = 0
+        self.opened = 0
+
+    def totals(self, now: float) -> List[float]:
+        horizon = now - self.policy.window
+        while self.buckets and self.buckets[0][0] <= horizon:
+            self.buckets.pop(0)
+        return [sum(bucket[i] for bucket in self.buckets) for i in (1, 2, 3)]
+
+    def count(self, now: float, failed: bool, slow: bool) -> None:
+        width = self.policy.window / _WINDOW_BUCKETS
+        if not self.buckets or now - self.buckets[-1][0] >= width:
+            self.buckets.append([now, 0, 0, 0])
+        bucket = self.buckets[-1]
+        bucket[1] += 1
+        bucket[2] += failed
+        bucket[3] += slow
+
+    def trip(self, now: float) -> None:
+        self.state = CircuitState.OPEN
+        self.opened_at = now
+        self.probe_successes = 0
+        self.opened += 1
+
+
+class _Ticket:
+    """One admitted attempt."""
+
+    __slots__ = ("circuit", "probe", "started")
+
+    def __init__(self, circuit: _Circuit, probe: bool, started: float):
+        self.circuit = circuit
+        self.probe = probe
+        self.started = started
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint-template circuits that fail fast while an endpoint is degraded.
+
+    Args:
+        policy: BreakerPolicy of templates without their own entry in policies
+        policies: BreakerPolicy by endpoint template; map a template to None
+            to never break its circuit
+        clock: Function returning the current time in seconds (for tests)
+    """
+
+    def __init__(
+        self,
+        policy: BreakerPolicy = BreakerPolicy(),
+        policies: Optional[Mapping[str, Optional[BreakerPolicy]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.policy = policy
+        self.policies = dict(policies or {})
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._circuits: Dict[str, _Circuit] = {}
+
+    def _circuit(self, template: str) -> Optional[_Circuit]:
+        circuit = self._circuits.get(template)
+        if circuit is None:
+            policy = self.policies.get(template, self.policy)
+            if policy is None:
+                return None
+            circuit = self._circuits[template] = _Circuit(policy)
+        return circuit
+
+    def acquire(self, endpoint: str) -> Optional[_Ticket]:
+        """
+        Admit a request attempt to an endpoint.
+
+        Returns:
+            Ticket to pass to release once the attempt completed, or None
+            for templates without a circuit
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all
+                probes already in flight
+        """
+        template = endpoint_template(endpoint.split("?", 1)[0])
+        now = self._clock()
+        with self._lock:
+            circuit = self._circuit(template)
+            if circuit is None:
+                return None
+            if circuit.state is CircuitState.OPEN:
+                remaining = circuit.opened_at + circuit.policy.open_seconds - now
+                if remaining > 0:
+                    circuit.rejected += 1
+                    raise CircuitOpenError(template, remaining)
+                circuit.state = CircuitState.HALF_OPEN
+            if circuit.state is CircuitState.HALF_OPEN:
+                if circuit.probing + circuit.probe_successes >= circuit.policy.probes:
+                    circuit.rejected += 1
+                    raise CircuitOpenError(template, 0.0)
+                circuit.probing += 1
+                return _Ticket(circuit, True, now)
+        return _Ticket(circuit, False, now)
+
+    def release(self, ticket: Optional[_Ticket], failed: Optional[bool]) -> None:
+        """
+        Record the outcome of an admitted attempt.
+
+        Args:
+            ticket: Ticket returned by acquire
+            failed: Whether the attempt failed, or None if it ended without an
+                outcome (for example when cancelled) and should not be counted
+        """
+        if ticket is None:
+            return
+        now = self._clock()
+        circuit = ticket.circuit
+        policy = circuit.policy
+        slow = policy.slow_call_seconds is not None and now - ticket.started > policy.slow_call_seconds
+        with self._lock:
+            if ticket.probe:
+                circuit.probing -= 1
+                if circuit.state is not CircuitState.HALF_OPEN or failed is None:
+                    return
+                if failed or slow:
+                    circuit.trip(now)
+                    return
+                circuit.probe_successes += 1
+                if circuit.probe_successes >= policy.probes:
+                    circuit.state = CircuitState.CLOSED
+                    circuit.buckets.clear()
+                return
+            if failed is None:
+                return
+            circuit.count(now, failed, slow)
+            if circuit.state is not CircuitState.CLOSED:
+                return
+            calls, failures, slow_calls = circuit.totals(now)
+            if calls < policy.min_calls:
+                return
+            if failures / calls >= policy.failure_rate or (
+                policy.slow_call_seconds is not None and slow_calls / calls >= policy.slow_call_rate
+            ):
+                circuit.trip(now)
+
+    def state(self, endpoint: str) -> CircuitState:
+        """Return the state of the circuit of an endpoint or template."""
+        with self._lock:
+            circuit = self._circuits.get(endpoint_template(endpoint.split("?", 1)[0]))
+            return circuit.state if circuit is not None else CircuitState.CLOSED
+
+    def reset(self) -> None:
+        """Close every circuit and forget its counts."""
+        with self._lock:
+            self._circuits.clear()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the circuits that have seen requests.
+
+        Returns:
+            Dict by endpoint template with state, calls, failures and slow
+            calls in the window, requests rejected and times opened
+        """
+        now = self._clock()
+        with self._lock:
+            stats = {}
+            for template, circuit in self._circuits.items():
+                calls, failures, slow_calls = circuit.totals(now)
+                stats[template] = {
+                    "state": circuit.state.value,
+                    "calls": int(calls),
+                    "failures": int(failures),
+                    "slow_calls": int(slow_calls),
+                    "rejected": circuit.rejected,
+                    "opened": circuit.opened,
+                }
+            return stats
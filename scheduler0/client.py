@@ -2,19 +2,39 @@
 Core client implementation for Scheduler0 Python client.
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Callable, Iterator, List, Tuple, Union
 from urllib.parse import urljoin, urlparse
 
-import requests
+import time
 
+import requests
 
-class Client:
+from .pool import PoolingAdapter, build_session
+from .retry import RetryPolicy
+from .routing import LeaderRouter, WRITE_METHODS, REDIRECT_STATUSES
+from .serialization import to_camel_case, serialize_body, serialize_value
+from .codec import JSONCodec, get_codec
+from .endpoints import endpoint_template, request_key
+from .models import decode_typed
+from .cache import ResponseCache
+from .singleflight import SingleFlight
+from .batching import JobBatcher, JobBatching
+from .ratelimit import RateLimiter
+from .circuit import CircuitBreaker
+from .metrics import RequestMetrics
+from .pagination import DEFAULT_PAGE_SIZE, DEFAULT_SCAN_WORKERS, KeysetCursor, iter_items, iter_keyset, scan_items
+
+# Upper bound on leader redirects followed for a single write
+MAX_LEADER_REDIRECTS = 3
+
+
+class BaseClient:
     """
-    Scheduler0 API client.
+    Transport-independent state shared by Client and AsyncClient.
 
-    Supports multiple authentication methods:
-    - API Key + Secret authentication (default)
-    - Basic authentication (for peer communication)
+    Holds the connection settings and implements authentication headers,
+    account ID resolution, URL building and request body serialization, so
+    the sync and async clients behave identically on the wire.
     """
 
     def __init__(
@@ -26,19 +46,17 @@ class Client:
         account_id: Optional[str] = None,
         username: Optional[str] = None,
         password: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        node_urls: Optional[List[str]] = None,
+        json_codec: Union[str, JSONCodec, None] = None,
+        typed: bool = False,
+        coalesce_gets: bool = False,
+        job_batching: Optional[JobBatching] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        metrics: Optional[RequestMetrics] = None,
+        cache: Optional[ResponseCache] = None,
     ):
-        """
-        Initialize a new Scheduler0 client.
-
-        Args:
-            base_url: Base URL of the Scheduler0 API (e.g., "http://localhost:7070")
-            version: API version (default: "v1")
-            api_key: API key for authentication
-            api_secret: API secret for authentication
-            account_id: Account ID for requests
-            username: Username for basic authentication
-            password: Password for basic authentication
-        """
         parsed_url = urlparse(base_url)
         if not parsed_url.scheme or parsed_url.scheme not in ('http', 'https'):
             raise ValueError("base_url must include a scheme (http:// or https://)")
@@ -50,7 +68,16 @@ class Client:
         self.account_id = account_id
         self.username = username
         self.password = password
-        self.session = requests.Session()
+        self.retry_policy = retry_policy
+        self.leader_router = LeaderRouter(node_urls, self.base_url) if node_urls else None
+        self.json_codec = get_codec(json_codec)
+        self.typed = typed
+        self.coalesce_gets = coalesce_gets
+        self.job_batching = job_batching
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.metrics = metrics
+        self.cache = cache
 
     def _resolve_account_id(
         self, body: Optional[Any] = None, account_id_override: Optional[str] = None
@@ -64,11 +91,21 @@ class Client:
 
         return self.account_id
 
-    def _build_url(self, endpoint: str) -> str:
-        """Build full URL from endpoint."""
+    def _build_url(self, endpoint: str, base_url: Optional[str] = None) -> str:
+        """Build full URL from endpoint, against base_url or the client default."""
         endpoint = endpoint.lstrip("/")
         version_prefix = f"/api/{self.version}/"
-        return urljoin(self.base_url + version_prefix, endpoint)
+        return urljoin((base_url or self.base_url) + version_prefix, endpoint)
+
+    def _routes_to_leader(self, method: str) -> bool:
+        """Return True if the request should be sent to the raft leader."""
+        return self.leader_router is not None and method.upper() in WRITE_METHODS
+
+    def _follow_leader_redirect(self, response: Any) -> bool:
+        """Update the leader from a redirected write; True if it should be re-sent."""
+        if response.status_code not in REDIRECT_STATUSES:
+            return False
+        return self.leader_router.update_from_redirect(response.headers.get("Location"))
 
     def _prepare_headers(
         self,
@@ -92,6 +129,285 @@ class Client:
 
         return headers
 
+    def _basic_auth(self) -> Optional[Tuple[str, str]]:
+        """Return the basic auth credentials, if configured."""
+        if self.username and self.password:
+            return (self.username, self.password)
+        return None
+
+    def _error_message(self, response: Any) -> str:
+        """Build the HTTPError message for a failed response."""
+        error_msg = f"API error: {response.status_code}"
+        try:
+            error_body = response.json()
+            if isinstance(error_body, dict) and "message" in error_body:
+                error_msg = error_body["message"]
+            else:
+                error_msg = response.text
+        except (ValueError, KeyError):
+            error_msg = response.text
+        return f"{error_msg} - {response.text}"
+
+    def _record_request_start(self) -> None:
+        """Credit the retry budget for a new request."""
+        if self.retry_policy is not None and self.retry_policy.budget is not None:
+            self.retry_policy.budget.record_request()
+
+    def _retry_delay(self, method: str, attempt: int, response: Optional[Any] = None) -> Optional[float]:
+        """Return the delay before retrying a failed attempt, or None to give up."""
+        if self.retry_policy is None:
+            return None
+        if response is None:
+            return self.retry_policy.next_delay(method, attempt)
+        return self.retry_policy.next_delay(
+            method,
+            attempt,
+            status_code=response.status_code,
+            retry_after=response.headers.get("Retry-After"),
+        )
+
+    def _rate_limit_delay(self, method: str, endpoint: str, account_id: Optional[str]) -> float:
+        """Take a rate limiter token for an attempt; return the seconds to wait before sending it."""
+        if self.rate_limiter is None:
+            return 0.0
+        return self.rate_limiter.reserve(account_id, method, endpoint)
+
+    def _rate_limit_feedback(self, method: str, endpoint: str, account_id: Optional[str], response: Any) -> None:
+        """Slow the rate limiter down after a 429 response."""
+        if self.rate_limiter is not None and response.status_code == 429:
+            self.rate_limiter.throttle(account_id, method, endpoint, response.headers.get("Retry-After"))
+
+    def _breaker_acquire(self, endpoint: str) -> Any:
+        """Admit an attempt through the circuit breaker; raises CircuitOpenError while its circuit is open."""
+        if self.circuit_breaker is None:
+            return None
+        return self.circuit_breaker.acquire(endpoint)
+
+    def _breaker_release(self, ticket: Any, failed: Optional[bool]) -> None:
+        """Record an attempt's outcome with the circuit breaker (None: not counted)."""
+        if ticket is not None:
+            self.circuit_breaker.release(ticket, failed)
+
+    def _record_attempt(
+        self, method: str, endpoint: str, started: float, data: Optional[bytes], response: Optional[Any] = None
+    ) -> None:
+        """Record a completed attempt in the request metrics (None response: connection error)."""
+        if self.metrics is None:
+            return
+        content = getattr(response, "content", None)
+        self.metrics.record(
+            method,
+            endpoint,
+            response.status_code if response is not None else None,
+            time.perf_counter() - started,
+            len(data) if data else 0,
+            len(content) if isinstance(content, bytes) else 0,
+        )
+
+    def _to_camel_case(self, snake_str: str) -> str:
+        """Convert snake_case to camelCase."""
+        return to_camel_case(snake_str)
+
+    def _serialize_body(self, body: Any) -> Any:
+        """Serialize request body to JSON-serializable format."""
+        return serialize_body(body)
+
+    def _serialize_value(self, value: Any) -> Any:
+        """Recursively serialize a value."""
+        return serialize_value(value)
+
+    def _encode_body(self, body: Any) -> Optional[bytes]:
+        """Serialize and encode a request body once, to JSON bytes; bytes are sent as they are."""
+        if body is None or isinstance(body, bytes):
+            return body
+        return self.json_codec.dumps(self._serialize_body(body))
+
+    def _decode_response(self, response: Any) -> Any:
+        """Decode a JSON response body with the configured codec."""
+        return self.json_codec.decode_response(response)
+
+    def _decode_typed(self, method: str, endpoint: str, payload: Any) -> Any:
+        """Convert a decoded payload into models when the client is typed."""
+        if not self.typed:
+            return payload
+        return decode_typed(method, endpoint_template(endpoint), payload)
+
+    def _cache_lookup(
+        self, endpoint: str, params: Optional[Dict[str, Any]], account_id_override: Optional[str]
+    ) -> Tuple[bool, Any]:
+        """Return (found, value) for a GET from the response cache."""
+        if self.cache is None:
+            return False, None
+        return self.cache.get(endpoint, params, self._resolve_account_id(None, account_id_override))
+
+    def _cache_generation(self, endpoint: str) -> Optional[int]:
+        """Return the response cache generation of a path, read before its GET is sent."""
+        if self.cache is None:
+            return None
+        return self.cache.generation(endpoint)
+
+    def _cache_store(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        account_id_override: Optional[str],
+        value: Any,
+        generation: Optional[int] = None,
+    ) -> None:
+        """Keep a GET response in the response cache, unless its endpoint is not cached or a write raced it."""
+        if self.cache is not None:
+            self.cache.put(endpoint, params, self._resolve_account_id(None, account_id_override), value, generation)
+
+    def _cache_invalidate(self, endpoint: str) -> None:
+        """Drop cached responses a write to endpoint may have changed."""
+        if self.cache is not None:
+            self.cache.invalidate(endpoint)
+
+    def _coalesce_key(
+        self, endpoint: str, params: Optional[Dict[str, Any]], account_id_override: Optional[str]
+    ) -> Tuple[Any, ...]:
+        """Return the identity under which concurrent identical GETs share one request."""
+        return request_key(endpoint, params, self._resolve_account_id(None, account_id_override))
+
+    def coalesce_stats(self) -> Dict[str, int]:
+        """
+        Return GET coalescing counters.
+
+        Returns:
+            Dict with requests sent through the coalescer ("calls"), callers
+            that joined one already in flight ("coalesced") and requests in flight
+        """
+        return self._singleflight.stats()
+
+    def job_batching_stats(self) -> Dict[str, Any]:
+        """
+        Return create_job batching counters.
+
+        Returns:
+            Dict with jobs submitted, batches sent, average batch size and
+            batches resent one job per request, or an empty dict without job_batching
+        """
+        return self._job_batcher.stats() if self._job_batcher is not None else {}
+
+
+class Client(BaseClient):
+    """
+    Scheduler0 API client.
+
+    Supports multiple authentication methods:
+    - API Key + Secret authentication (default)
+    - Basic authentication (for peer communication)
+
+    A single Client is safe to share between threads; size ``pool_maxsize``
+    to the number of threads issuing requests concurrently.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        version: str = "v1",
+        api_key: Optional[str] = None,
+        api_secret: Optional[str] = None,
+        account_id: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        node_urls: Optional[List[str]] = None,
+        json_codec: Union[str, JSONCodec, None] = None,
+        typed: bool = False,
+        coalesce_gets: bool = False,
+        job_batching: Optional[JobBatching] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        metrics: Optional[RequestMetrics] = None,
+        cache: Optional[ResponseCache] = None,
+    ):
+        """
+        Initialize a new Scheduler0 client.
+
+        Args:
+            base_url: Base URL of the Scheduler0 API (e.g., "http://localhost:7070")
+            version: API version (default: "v1")
+            api_key: API key for authentication
+            api_secret: API secret for authentication
+            account_id: Account ID for requests
+            username: Username for basic authentication
+            password: Password for basic authentication
+            pool_connections: Number of per-host connection pools to cache (default: 10)
+            pool_maxsize: Maximum connections kept open per host (default: 10)
+            pool_block: Wait for a free connection instead of opening a throwaway one
+                when the pool is exhausted (default: False)
+            keep_alive: Reuse connections between requests (default: True)
+            retry_policy: Retry failed requests with backoff; None disables retries
+            node_urls: Base URLs of all cluster nodes; when given, writes (POST/PUT/DELETE)
+                are sent straight to the raft leader discovered via /healthcheck
+            json_codec: JSON backend: "json" (stdlib, default), "orjson", "auto"
+                (orjson when installed) or a JSONCodec instance
+            typed: Decode responses into slotted models from scheduler0.models
+                instead of returning dicts (default: False)
+            coalesce_gets: Share one in-flight request between identical concurrent GETs (default: False)
+            job_batching: JobBatching window in which concurrent create_job calls are sent as one
+                batch_create_jobs request (optional)
+            rate_limiter: RateLimiter spacing out requests per account and endpoint class (optional)
+            circuit_breaker: CircuitBreaker failing requests fast while their endpoint is degraded (optional)
+            metrics: RequestMetrics recording latency, bytes and status of every attempt (optional)
+            cache: ResponseCache serving repeated single-resource GETs from memory (optional)
+        """
+        super().__init__(
+            base_url=base_url,
+            version=version,
+            api_key=api_key,
+            api_secret=api_secret,
+            account_id=account_id,
+            username=username,
+            password=password,
+            retry_policy=retry_policy,
+            node_urls=node_urls,
+            json_codec=json_codec,
+            typed=typed,
+            coalesce_gets=coalesce_gets,
+            job_batching=job_batching,
+            rate_limiter=rate_limiter,
+            circuit_breaker=circuit_breaker,
+            metrics=metrics,
+            cache=cache,
+        )
+        self.session = build_session(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+        )
+        self._singleflight = SingleFlight()
+        self._job_batcher = JobBatcher(self, job_batching) if job_batching is not None else None
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Return connection pool usage counters for the API host.
+
+        Returns:
+            Dict with requests sent, connections created and reused, idle and
+            in-flight connections, or an empty dict if the session has a custom adapter
+        """
+        adapter = self.session.get_adapter(self.base_url)
+        if isinstance(adapter, PoolingAdapter):
+            return adapter.stats()
+        return {}
+
     def _request(
         self,
         method: str,
@@ -106,7 +422,7 @@ class Client:
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             endpoint: API endpoint (e.g., "/jobs", "/projects/123")
-            body: Request body (will be JSON encoded)
+            body: Request body (serialized and encoded to JSON bytes by json_codec, unless already bytes)
             params: Query parameters
             account_id_override: Optional account ID override
 
@@ -114,104 +430,97 @@ class Client:
             Response object
 
         Raises:
-            requests.HTTPError: If the request fails
+            requests.HTTPError: If the request fails after any configured retries
         """
         url = self._build_url(endpoint)
         account_id = self._resolve_account_id(body, account_id_override)
         headers = self._prepare_headers(account_id)
 
-        # Prepare request data
-        json_data = None
-        if body is not None:
-            json_data = self._serialize_body(body)
-
-        response = self.session.request(
-            method=method,
-            url=url,
-            headers=headers,
-            json=json_data,
-            params=params,
-            auth=(self.username, self.password) if self.username and self.password else None,
-        )
-
-        # Raise exception for error status codes
-        if response.status_code >= 400:
-            error_msg = f"API error: {response.status_code}"
+        # Encode the body once; retries and redirects resend the same bytes
+        data = self._encode_body(body)
+
+        routed = self._routes_to_leader(method)
+        self._record_request_start()
+        attempt = 0
+        redirects = 0
+        while True:
+            if routed:
+                url = self._build_url(endpoint, self._leader_base_url())
+            wait = self._rate_limit_delay(method, endpoint, account_id)
+            if wait > 0:
+                time.sleep(wait)
+            ticket = self._breaker_acquire(endpoint)
+            started = time.perf_counter()
             try:
-                error_body = response.json()
-                if isinstance(error_body, dict) and "message" in error_body:
-                    error_msg = error_body["message"]
-                else:
-                    error_msg = response.text
-            except (ValueError, KeyError):
-                error_msg = response.text
-            raise requests.HTTPError(f"{error_msg} - {response.text}", response=response)
-
-        return response
-
-    def _to_camel_case(self, snake_str: str) -> str:
-        """Convert snake_case to camelCase."""
-        components = snake_str.split("_")
-        return components[0] + "".join(x.title() for x in components[1:])
-
-    def _serialize_body(self, body: Any) -> Any:
-        """Serialize request body to JSON-serializable format."""
-        if body is None:
-            return None
-
-        # Handle dataclasses
-        if hasattr(body, "__dataclass_fields__"):
-            result = {}
-            for key, value in body.__dict__.items():
-                if key != "account_id" and value is not None:
-                    camel_key = self._to_camel_case(key)
-                    result[camel_key] = self._serialize_value(value)
-            return result
-
-        # Handle regular objects with __dict__
-        if hasattr(body, "__dict__"):
-            result = {}
-            for key, value in body.__dict__.items():
-                if key != "account_id" and value is not None:
-                    camel_key = self._to_camel_case(key)
-                    result[camel_key] = self._serialize_value(value)
-            return result
-
-        # Handle dictionaries
-        if isinstance(body, dict):
-            result = {}
-            for key, value in body.items():
-                if key != "account_id" and value is not None:
-                    camel_key = self._to_camel_case(key) if isinstance(key, str) else key
-                    result[camel_key] = self._serialize_value(value)
-            return result
-
-        # Handle lists
-        if isinstance(body, list):
-            return [self._serialize_body(item) for item in body]
-
-        # Handle primitive types
-        return body
-
-    def _serialize_value(self, value: Any) -> Any:
-        """Recursively serialize a value."""
-        if value is None:
-            return None
-
-        # Handle dataclasses
-        if hasattr(value, "__dataclass_fields__"):
-            return self._serialize_body(value)
-
-        # Handle lists
-        if isinstance(value, list):
-            return [self._serialize_value(item) for item in value]
-
-        # Handle dictionaries
-        if isinstance(value, dict):
-            return {k: self._serialize_value(v) for k, v in value.items()}
-
-        # Handle primitive types
-        return value
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    data=data,
+                    params=params,
+                    auth=self._basic_auth(),
+                    allow_redirects=not routed,
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                self._breaker_release(ticket, failed=True)
+                self._record_attempt(method, endpoint, started, data)
+                if routed:
+                    self.leader_router.invalidate()
+                delay = self._retry_delay(method, attempt)
+                if delay is None:
+                    raise
+            except BaseException:
+                self._breaker_release(ticket, failed=None)
+                raise
+            else:
+                self._breaker_release(ticket, failed=response.status_code >= 500)
+                self._record_attempt(method, endpoint, started, data, response)
+                if routed and response.status_code in REDIRECT_STATUSES:
+                    if redirects < MAX_LEADER_REDIRECTS and self._follow_leader_redirect(response):
+                        redirects += 1
+                        continue
+                    # The write was not applied: too many redirects, or one back to the same leader
+                    self.leader_router.invalidate()
+                    raise requests.HTTPError(self._error_message(response), response=response)
+                if response.status_code < 400:
+                    return response
+                self._rate_limit_feedback(method, endpoint, account_id, response)
+                if routed and response.status_code >= 500:
+                    self.leader_router.invalidate()
+                delay = self._retry_delay(method, attempt, response)
+                if delay is None:
+                    # Raise exception for error status codes
+                    raise requests.HTTPError(self._error_message(response), response=response)
+
+            attempt += 1
+            time.sleep(delay)
+
+    def _leader_base_url(self) -> str:
+        """Return the leader's base URL, discovering it first if needed."""
+        router = self.leader_router
+        if router.needs_refresh():
+            with router.refresh_lock:
+                # Another thread may have refreshed while we waited
+                if router.needs_refresh():
+                    self._refresh_leader()
+        return router.write_base_url()
+
+    def _refresh_leader(self) -> None:
+        """Ask the cluster nodes' /healthcheck endpoint for the current leader."""
+        router = self.leader_router
+        for node_url in router.refresh_order():
+            try:
+                response = self.session.get(
+                    self._build_url("/healthcheck", node_url),
+                    headers=self._prepare_headers(self.account_id),
+                    auth=self._basic_auth(),
+                    timeout=5,
+                )
+                if response.status_code < 400 and router.update_from_healthcheck(self._decode_response(response)):
+                    return
+            except (requests.RequestException, ValueError):
+                continue
+        router.mark_unresolved()
 
     def _get(
         self,
@@ -219,9 +528,21 @@ class Client:
         params: Optional[Dict[str, Any]] = None,
         account_id_override: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Make a GET request."""
-        response = self._request("GET", endpoint, body=None, params=params, account_id_override=account_id_override)
-        return response.json()
+        """Make a GET request, served from the response cache or a concurrent identical GET when possible."""
+        found, cached = self._cache_lookup(endpoint, params, account_id_override)
+        if found:
+            return cached
+
+        def fetch() -> Any:
+            generation = self._cache_generation(endpoint)
+            response = self._request("GET", endpoint, body=None, params=params, account_id_override=account_id_override)
+            result = self._decode_typed("GET", endpoint, self._decode_response(response))
+            self._cache_store(endpoint, params, account_id_override, result, generation)
+            return result
+
+        if not self.coalesce_gets:
+            return fetch()
+        return self._singleflight.do(self._coalesce_key(endpoint, params, account_id_override), fetch)
 
     def _post(
         self,
@@ -231,10 +552,13 @@ class Client:
         account_id_override: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Make a POST request."""
-        response = self._request("POST", endpoint, body=body, params=params, account_id_override=account_id_override)
+        try:
+            response = self._request("POST", endpoint, body=body, params=params, account_id_override=account_id_override)
+        finally:
+            self._cache_invalidate(endpoint)
         if response.status_code == 204:
             return {}
-        return response.json()
+        return self._decode_typed("POST", endpoint, self._decode_response(response))
 
     def _put(
         self,
@@ -244,10 +568,13 @@ class Client:
         account_id_override: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Make a PUT request."""
-        response = self._request("PUT", endpoint, body=body, params=params, account_id_override=account_id_override)
+        try:
+            response = self._request("PUT", endpoint, body=body, params=params, account_id_override=account_id_override)
+        finally:
+            self._cache_invalidate(endpoint)
         if response.status_code == 204:
             return {}
-        return response.json()
+        return self._decode_typed("PUT", endpoint, self._decode_response(response))
 
     def _delete(
         self,
@@ -257,7 +584,41 @@ class Client:
         account_id_override: Optional[str] = None,
     ) -> None:
         """Make a DELETE request."""
-        self._request("DELETE", endpoint, body=body, params=params, account_id_override=account_id_override)
+        try:
+            self._request("DELETE", endpoint, body=body, params=params, account_id_override=account_id_override)
+        finally:
+            self._cache_invalidate(endpoint)
+
+    def _paginate(
+        self,
+        fetch: Callable[[int, int], Any],
+        key: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = True,
+    ) -> Iterator[Any]:
+        """Stream the items of a list endpoint, prefetching the next page on a thread."""
+        return iter_items(fetch, key, page_size=page_size, prefetch=prefetch)
+
+    def _scan(
+        self,
+        fetch: Callable[[int, int], Any],
+        key: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_workers: int = DEFAULT_SCAN_WORKERS,
+        ordered: bool = True,
+    ) -> Iterator[Any]:
+        """Stream the items of a list endpoint, fetching pages on a thread pool."""
+        return scan_items(fetch, key, page_size=page_size, max_workers=max_workers, ordered=ordered)
+
+    def _keyset(
+        self,
+        fetch: Callable[[Optional[str], int, int], Any],
+        key: str,
+        cursor: KeysetCursor,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[Any]:
+        """Stream the items of a list endpoint by keyset pagination."""
+        return iter_keyset(fetch, key, cursor, page_size=page_size)
 
 
 # Convenience factory functions
@@ -270,6 +631,20 @@ def NewClient(
     account_id: Optional[str] = None,
     username: Optional[str] = None,
     password: Optional[str] = None,
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    pool_block: bool = False,
+    keep_alive: bool = True,
+    retry_policy: Optional[RetryPolicy] = None,
+    node_urls: Optional[List[str]] = None,
+    json_codec: Union[str, JSONCodec, None] = None,
+    typed: bool = False,
+    coalesce_gets: bool = False,
+    job_batching: Optional[JobBatching] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    circuit_breaker: Optional[CircuitBreaker] = None,
+    metrics: Optional[RequestMetrics] = None,
+    cache: Optional[ResponseCache] = None,
 ) -> Client:
     """
     Create a new Scheduler0 client with flexible options.
@@ -282,6 +657,20 @@ def NewClient(
         account_id: Account ID for requests
         username: Username for basic authentication
         password: Password for basic authentication
+        pool_connections: Number of per-host connection pools to cache
+        pool_maxsize: Maximum connections kept open per host
+        pool_block: Wait for a free connection when the pool is exhausted
+        keep_alive: Reuse connections between requests
+        retry_policy: Retry failed requests with backoff; None disables retries
+        node_urls: Base URLs of all cluster nodes, to send writes straight to the leader
+        json_codec: JSON backend: "json" (default), "orjson", "auto" or a JSONCodec instance
+        typed: Decode responses into slotted models instead of dicts
+        coalesce_gets: Share one in-flight request between identical concurrent GETs
+        job_batching: JobBatching window for sending concurrent create_job calls as one batch (optional)
+        rate_limiter: RateLimiter spacing out requests per account and endpoint class (optional)
+        circuit_breaker: CircuitBreaker failing requests fast while their endpoint is degraded (optional)
+        metrics: RequestMetrics recording latency, bytes and status of every attempt (optional)
+        cache: ResponseCache for single-resource GETs (optional)
 
     Returns:
         Client instance
@@ -294,6 +683,20 @@ def NewClient(
         account_id=account_id,
         username=username,
         password=password,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        keep_alive=keep_alive,
+        retry_policy=retry_policy,
+        node_urls=node_urls,
+        json_codec=json_codec,
+        typed=typed,
+        coalesce_gets=coalesce_gets,
+        job_batching=job_batching,
+        rate_limiter=rate_limiter,
+        circuit_breaker=circuit_breaker,
+        metrics=metrics,
+        cache=cache,
     )
 
 
@@ -377,3 +780,36 @@ def NewBasicAuthClient(
         password=password,
     )
 
+
+def NewClusterClient(
+    node_urls: List[str],
+    version: str,
+    api_key: str,
+    api_secret: str,
+    account_id: Optional[str] = None,
+) -> Client:
+    """
+    Create a client for a multi-node cluster that sends writes to the raft leader.
+
+    Reads go to the first node; writes go to the leader discovered via /healthcheck.
+
+    Args:
+        node_urls: Base URLs of all cluster nodes
+        version: API version
+        api_key: API key
+        api_secret: API secret
+        account_id: Account ID
+
+    Returns:
+        Client instance
+    """
+    if not node_urls:
+        raise ValueError("node_urls must contain at least one URL")
+    return Client(
+        base_url=node_urls[0],
+        version=version,
+        api_key=api_key,
+        api_secret=api_secret,
+        account_id=account_id,
+        node_urls=node_urls,
+    )
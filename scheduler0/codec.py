@@ -0,0 +1,83 @@
+"""
+JSON encoding backends for Scheduler0 client.
+
+Request bodies are encoded once into bytes by the configured codec and sent
+as the raw request payload; responses are decoded by the same codec. The
+stdlib ``json`` module is the default; ``orjson`` is used when requested and
+installed:
+
+    client = Client(..., json_codec="auto")   # orjson if installed, else stdlib
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+class JSONCodec:
+    """
+    Stdlib JSON codec.
+
+    Subclass it to plug in another encoder: override ``dumps`` (returning
+    bytes), ``loads`` (accepting bytes) and ``decode_response``.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode a JSON-serializable object to compact UTF-8 bytes; NaN and infinity raise ValueError."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, allow_nan=False).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode JSON bytes or text."""
+        return json.loads(data)
+
+    def decode_response(self, response: Any) -> Any:
+        """Decode an HTTP response body."""
+        # requests and httpx both decode with the stdlib already
+        return response.json()
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec backed by orjson, decoding straight from the response bytes."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires orjson; install it with 'pip install orjson'")
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+    def decode_response(self, response: Any) -> Any:
+        return orjson.loads(response.content)
+
+
+def get_codec(codec: Union[str, JSONCodec, None] = None) -> JSONCodec:
+    """
+    Resolve a codec instance.
+
+    Args:
+        codec: A JSONCodec instance, or one of None / "json" (stdlib),
+            "orjson" (requires orjson) and "auto" (orjson when installed, else stdlib)
+
+    Returns:
+        JSONCodec instance
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec is None or codec == "json":
+        return JSONCodec()
+    if codec == "orjson":
+        return OrjsonCodec()
+    if codec == "auto":
+        return OrjsonCodec() if orjson is not None else JSONCodec()
+    raise ValueError(f"Unknown JSON codec: {codec!r}")
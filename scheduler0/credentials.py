@@ -2,8 +2,10 @@
 Credential management methods for Scheduler0 client.
 """
 
-from typing import Optional
+from typing import Any, Callable, Iterator, Optional
 from .client import Client
+from .async_client import AsyncClient
+from .pagination import DEFAULT_PAGE_SIZE, DEFAULT_SCAN_WORKERS
 from .types import (
     CredentialCreateRequestBody,
     CredentialUpdateRequestBody,
@@ -33,6 +35,77 @@ def list_credentials(
     return self._get("/credentials", params=params, account_id_override=account_id_override)
 
 
+def _credentials_fetcher(
+    self: Client,
+    order_by: Optional[str],
+    order_by_direction: Optional[str],
+    account_id_override: Optional[str],
+) -> Callable[[int, int], Any]:
+    """Return a fetch(offset, limit) function reading one page of list_credentials."""
+    def fetch(offset: int, limit: int) -> Any:
+        return self.list_credentials(
+            limit=limit,
+            offset=offset,
+            order_by=order_by,
+            order_by_direction=order_by_direction,
+            account_id_override=account_id_override,
+        )
+
+    return fetch
+
+
+def iter_credentials(
+    self: Client,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    order_by: Optional[str] = None,
+    order_by_direction: Optional[str] = None,
+    prefetch: bool = True,
+    account_id_override: Optional[str] = None,
+) -> Iterator[Any]:
+    """
+    Iterate over all credentials, fetching the next page while the current one is consumed.
+
+    Args:
+        page_size: Number of credentials requested per page
+        order_by: Field to order results by (optional)
+        order_by_direction: Direction to order results - "asc" or "desc" (optional)
+        prefetch: Fetch the next page in the background (default True)
+        account_id_override: Optional account ID override
+
+    Returns:
+        Iterator over the credentials (an async iterator on AsyncClient)
+    """
+    fetch = _credentials_fetcher(self, order_by, order_by_direction, account_id_override)
+    return self._paginate(fetch, "credentials", page_size=page_size, prefetch=prefetch)
+
+
+def scan_credentials(
+    self: Client,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    order_by: Optional[str] = None,
+    order_by_direction: Optional[str] = None,
+    max_workers: int = DEFAULT_SCAN_WORKERS,
+    ordered: bool = True,
+    account_id_override: Optional[str] = None,
+) -> Iterator[Any]:
+    """
+    Read all credentials, fetching pages concurrently after the first one reports the total.
+
+    Args:
+        page_size: Number of credentials requested per page
+        order_by: Field to order results by (optional)
+        order_by_direction: Direction to order results - "asc" or "desc" (optional)
+        max_workers: Maximum number of concurrent page requests
+        ordered: Yield credentials in server order (default True); if False, pages are yielded as they arrive
+        account_id_override: Optional account ID override
+
+    Returns:
+        Iterator over the credentials (an async iterator on AsyncClient)
+    """
+    fetch = _credentials_fetcher(self, order_by, order_by_direction, account_id_override)
+    return self._scan(fetch, "credentials", page_size=page_size, max_workers=max_workers, ordered=ordered)
+
+
 def create_credential(
     self: Client,
     body: CredentialCreateRequestBody,
@@ -68,7 +141,7 @@ def delete_credential(
     account_id_override: Optional[str] = None,
 ) -> None:
     """Delete a credential."""
-    self._delete(f"/credentials/{credential_id}", body, account_id_override=account_id_override)
+    return self._delete(f"/credentials/{credential_id}", body, account_id_override=account_id_override)
 
 
 def archive_credential(
@@ -81,11 +154,33 @@ def archive_credential(
     self._post(f"/credentials/{credential_id}/archive", body, account_id_override=account_id_override)
 
 
+async def archive_credential_async(
+    self: AsyncClient,
+    credential_id: str,
+    body: CredentialArchiveRequestBody,
+    account_id_override: Optional[str] = None,
+) -> None:
+    """Archive a credential (AsyncClient variant)."""
+    await self._post(f"/credentials/{credential_id}/archive", body, account_id_override=account_id_override)
+
+
 # Attach methods to Client class
 Client.list_credentials = list_credentials
+Client.iter_credentials = iter_credentials
+Client.scan_credentials = scan_credentials
 Client.create_credential = create_credential
 Client.get_credential = get_credential
 Client.update_credential = update_credential
 Client.delete_credential = delete_credential
 Client.archive_credential = archive_credential
 
+
+# Attach methods to AsyncClient class
+AsyncClient.list_credentials = list_credentials
+AsyncClient.iter_credentials = iter_credentials
+AsyncClient.scan_credentials = scan_credentials
+AsyncClient.create_credential = create_credential
+AsyncClient.get_credential = get_credential
+AsyncClient.update_credential = update_credential
+AsyncClient.delete_credential = delete_credential
+AsyncClient.archive_credential = archive_credential_async
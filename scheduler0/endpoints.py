@@ -0,0 +1,82 @@
+"""
+Endpoint templates for the Scheduler0 API.
+
+Maps concrete request paths such as ``/jobs/42`` to their template
+(``/jobs/{id}``) so per-endpoint behavior and statistics can be keyed by
+template rather than by every distinct ID.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+
+# Templates of every path used by the client, relative to /api/{version}
+ENDPOINT_TEMPLATES: Tuple[str, ...] = (
+    "/accounts",
+    "/accounts/{id}",
+    "/accounts/{id}/feature",
+    "/accounts/{id}/features/all",
+    "/async-tasks/{id}",
+    "/credentials",
+    "/credentials/{id}",
+    "/credentials/{id}/archive",
+    "/executions",
+    "/executions/analytics",
+    "/executions/cleanup-old-logs",
+    "/executions/totals",
+    "/executors",
+    "/executors/{id}",
+    "/features",
+    "/healthcheck",
+    "/jobs",
+    "/jobs/{id}",
+    "/projects",
+    "/projects/{id}",
+    "/prompt",
+)
+
+
+def _compile(template: str) -> "re.Pattern[str]":
+    pattern = re.escape(template).replace(re.escape("{id}"), "[^/]+")
+    return re.compile(f"^{pattern}$")
+
+
+# Static templates are listed before parameterized ones so that
+# "/executions/totals" is not mistaken for an ID under "/executions/{id}"
+_PATTERNS = sorted(
+    ((template, _compile(template)) for template in ENDPOINT_TEMPLATES),
+    key=lambda item: item[0].count("{"),
+)
+
+
+@lru_cache(maxsize=4096)
+def endpoint_template(endpoint: str) -> str:
+    """
+    Return the template for a request path.
+
+    Args:
+        endpoint: API path with or without a leading slash, without query string
+
+    Returns:
+        The matching template, or the path itself with numeric segments
+        replaced by ``{id}`` for paths outside ENDPOINT_TEMPLATES
+    """
+    path = "/" + endpoint.split("?", 1)[0].strip("/")
+    template = match_template(path)
+    if template is not None:
+        return template
+    return re.sub(r"/\d+(?=/|$)", "/{id}", path)
+
+
+def match_template(path: str) -> Optional[str]:
+    """Return the known template matching path, or None."""
+    for template, pattern in _PATTERNS:
+        if pattern.match(path):
+            return template
+    return None
+
+
+def request_key(endpoint: str, params: Optional[Dict[str, Any]], account_id: Optional[str]) -> Tuple[Any, ...]:
+    """Return a hashable key identifying a GET request by path, query and account."""
+    return ("/" + endpoint.strip("/"), tuple(sorted(params.items())) if params else (), account_id)
@@ -2,8 +2,10 @@
 Execution management methods for Scheduler0 client.
 """
 
-from typing import Optional, Literal
+from typing import Any, Callable, Iterator, Optional, Literal
 from .client import Client
+from .async_client import AsyncClient
+from .pagination import DEFAULT_PAGE_SIZE, DEFAULT_SCAN_WORKERS, KeysetCursor
 
 
 def list_executions(
@@ -57,6 +59,181 @@ def list_executions(
     return self._get("/executions", params=params, account_id_override=account_id_override)
 
 
+def _executions_fetcher(
+    self: Client,
+    start_date: Optional[str],
+    end_date: Optional[str],
+    project_id: Optional[int],
+    job_id: Optional[int],
+    state: Optional[str],
+    order_by: Optional[str],
+    order_direction: Optional[str],
+    account_id_override: Optional[str],
+) -> Callable[[int, int], Any]:
+    """Return a fetch(offset, limit) function reading one page of list_executions."""
+    def fetch(offset: int, limit: int) -> Any:
+        return self.list_executions(
+            limit=limit,
+            offset=offset,
+            start_date=start_date,
+            end_date=end_date,
+            project_id=project_id,
+            job_id=job_id,
+            state=state,
+            order_by=order_by,
+            order_direction=order_direction,
+            account_id_override=account_id_override,
+        )
+
+    return fetch
+
+
+def iter_executions(
+    self: Client,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    project_id: Optional[int] = None,
+    job_id: Optional[int] = None,
+    state: Optional[Literal["scheduled", "completed", "failed"]] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    order_by: Optional[Literal["dateCreated", "lastExecutionDateTime", "nextExecutionDateTime"]] = None,
+    order_direction: Optional[Literal["ASC", "DESC"]] = None,
+    prefetch: bool = True,
+    account_id_override: Optional[str] = None,
+) -> Iterator[Any]:
+    """
+    Iterate over all matching executions, fetching the next page while the current one is consumed.
+
+    Args:
+        start_date: Start date for filtering (RFC3339 format, optional)
+        end_date: End date for filtering (RFC3339 format, optional)
+        project_id: Project ID to filter by (optional)
+        job_id: Job ID to filter by (optional)
+        state: Execution state to filter by - "scheduled", "completed", or "failed" (optional)
+        page_size: Number of executions requested per page
+        order_by: Field to order results by - "dateCreated", "lastExecutionDateTime", or "nextExecutionDateTime" (optional)
+        order_direction: Direction to order results - "ASC" or "DESC" (optional)
+        prefetch: Fetch the next page in the background (default True)
+        account_id_override: Optional account ID override
+
+    Returns:
+        Iterator over the executions (an async iterator on AsyncClient)
+    """
+    fetch = _executions_fetcher(
+        self, start_date, end_date, project_id, job_id, state, order_by, order_direction, account_id_override
+    )
+    return self._paginate(fetch, "executions", page_size=page_size, prefetch=prefetch)
+
+
+def scan_executions(
+    self: Client,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    project_id: Optional[int] = None,
+    job_id: Optional[int] = None,
+    state: Optional[Literal["scheduled", "completed", "failed"]] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    order_by: Optional[Literal["dateCreated", "lastExecutionDateTime", "nextExecutionDateTime"]] = None,
+    order_direction: Optional[Literal["ASC", "DESC"]] = None,
+    max_workers: int = DEFAULT_SCAN_WORKERS,
+    ordered: bool = True,
+    account_id_override: Optional[str] = None,
+) -> Iterator[Any]:
+    """
+    Read all matching executions, fetching pages concurrently after the first one reports the total.
+
+    Args:
+        start_date: Start date for filtering (RFC3339 format, optional)
+        end_date: End date for filtering (RFC3339 format, optional)
+        project_id: Project ID to filter by (optional)
+        job_id: Job ID to filter by (optional)
+        state: Execution state to filter by - "scheduled", "completed", or "failed" (optional)
+        page_size: Number of executions requested per page
+        order_by: Field to order results by - "dateCreated", "lastExecutionDateTime", or "nextExecutionDateTime" (optional)
+        order_direction: Direction to order results - "ASC" or "DESC" (optional)
+        max_workers: Maximum number of concurrent page requests
+        ordered: Yield executions in server order (default True); if False, pages are yielded as they arrive
+        account_id_override: Optional account ID override
+
+    Returns:
+        Iterator over the executions (an async iterator on AsyncClient)
+    """
+    fetch = _executions_fetcher(
+        self, start_date, end_date, project_id, job_id, state, order_by, order_direction, account_id_override
+    )
+    return self._scan(fetch, "executions", page_size=page_size, max_workers=max_workers, ordered=ordered)
+
+
+# Timestamp field of an execution for each keyset order_by value
+KEYSET_ORDER_FIELDS = {
+    "dateCreated": "date_created",
+    "lastExecutionDateTime": "last_execution_datetime",
+}
+
+
+def iter_executions_keyset(
+    self: Client,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    project_id: Optional[int] = None,
+    job_id: Optional[int] = None,
+    state: Optional[Literal["scheduled", "completed", "failed"]] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    order_by: Literal["dateCreated", "lastExecutionDateTime"] = "dateCreated",
+    order_direction: Literal["ASC", "DESC"] = "ASC",
+    cursor: Optional[KeysetCursor] = None,
+    account_id_override: Optional[str] = None,
+) -> Iterator[Any]:
+    """
+    Iterate over all matching executions by keyset (seek) pagination.
+
+    Instead of a growing offset, each request narrows the date range to the
+    last timestamp seen: ascending scans move ``start_date`` forward,
+    descending scans move ``end_date`` back. Executions sharing the boundary
+    timestamp are deduplicated by ``uniqueId``. Every page costs the same
+    however deep the scan goes, and executions created during the scan do not
+    shift the pages.
+
+    Args:
+        start_date: Start date for filtering (RFC3339 format, optional)
+        end_date: End date for filtering (RFC3339 format, optional)
+        project_id: Project ID to filter by (optional)
+        job_id: Job ID to filter by (optional)
+        state: Execution state to filter by - "scheduled", "completed", or "failed" (optional)
+        page_size: Number of executions requested per page
+        order_by: Timestamp to seek on - "dateCreated" (default) or "lastExecutionDateTime"
+        order_direction: Direction of the scan - "ASC" (default) or "DESC"
+        cursor: KeysetCursor of an earlier scan to resume from (optional)
+        account_id_override: Optional account ID override
+
+    Returns:
+        Iterator over the executions (an async iterator on AsyncClient)
+    """
+    if order_by not in KEYSET_ORDER_FIELDS:
+        raise ValueError(f"keyset pagination supports order_by in {sorted(KEYSET_ORDER_FIELDS)}, got {order_by!r}")
+    if order_direction not in ("ASC", "DESC"):
+        raise ValueError(f"order_direction must be 'ASC' or 'DESC', got {order_direction!r}")
+    ascending = order_direction == "ASC"
+    if cursor is None:
+        cursor = KeysetCursor(KEYSET_ORDER_FIELDS[order_by], "unique_id", start_date if ascending else end_date)
+
+    def fetch(watermark: Optional[str], offset: int, limit: int) -> Any:
+        return self.list_executions(
+            limit=limit,
+            offset=offset,
+            start_date=watermark if ascending else start_date,
+            end_date=end_date if ascending else watermark,
+            project_id=project_id,
+            job_id=job_id,
+            state=state,
+            order_by=order_by,
+            order_direction=order_direction,
+            account_id_override=account_id_override,
+        )
+
+    return self._keyset(fetch, "executions", cursor, page_size=page_size)
+
+
 def get_date_range_analytics(
     self: Client,
     start_date: str,
@@ -123,7 +300,19 @@ def cleanup_old_execution_logs(
 
 # Attach methods to Client class
 Client.list_executions = list_executions
+Client.iter_executions = iter_executions
+Client.scan_executions = scan_executions
+Client.iter_executions_keyset = iter_executions_keyset
 Client.get_date_range_analytics = get_date_range_analytics
 Client.get_execution_totals = get_execution_totals
 Client.cleanup_old_execution_logs = cleanup_old_execution_logs
 
+
+# Attach methods to AsyncClient class
+AsyncClient.list_executions = list_executions
+AsyncClient.iter_executions = iter_executions
+AsyncClient.scan_executions = scan_executions
+AsyncClient.iter_executions_keyset = iter_executions_keyset
+AsyncClient.get_date_range_analytics = get_date_range_analytics
+AsyncClient.get_execution_totals = get_execution_totals
+AsyncClient.cleanup_old_execution_logs = cleanup_old_execution_logs
@@ -2,8 +2,10 @@
 Executor management methods for Scheduler0 client.
 """
 
-from typing import Optional
+from typing import Any, Callable, Iterator, Optional
 from .client import Client
+from .async_client import AsyncClient
+from .pagination import DEFAULT_PAGE_SIZE, DEFAULT_SCAN_WORKERS
 from .types import ExecutorRequestBody, ExecutorUpdateRequestBody, ExecutorDeleteRequestBody
 
 
@@ -28,6 +30,77 @@ def list_executors(
     return self._get("/executors", params=params, account_id_override=account_id_override)
 
 
+def _executors_fetcher(
+    self: Client,
+    order_by: Optional[str],
+    order_by_direction: Optional[str],
+    account_id_override: Optional[str],
+) -> Callable[[int, int], Any]:
+    """Return a fetch(offset, limit) function reading one page of list_executors."""
+    def fetch(offset: int, limit: int) -> Any:
+        return self.list_executors(
+            limit=limit,
+            offset=offset,
+            order_by=order_by,
+            order_by_direction=order_by_direction,
+            account_id_override=account_id_override,
+        )
+
+    return fetch
+
+
+def iter_executors(
+    self: Client,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    order_by: Optional[str] = None,
+    order_by_direction: Optional[str] = None,
+    prefetch: bool = True,
+    account_id_override: Optional[str] = None,
+) -> Iterator[Any]:
+    """
+    Iterate over all executors, fetching the next page while the current one is consumed.
+
+    Args:
+        page_size: Number of executors requested per page
+        order_by: Field to order results by (optional)
+        order_by_direction: Direction to order results - "asc" or "desc" (optional)
+        prefetch: Fetch the next page in the background (default True)
+        account_id_override: Optional account ID override
+
+    Returns:
+        Iterator over the executors (an async iterator on AsyncClient)
+    """
+    fetch = _executors_fetcher(self, order_by, order_by_direction, account_id_override)
+    return self._paginate(fetch, "executors", page_size=page_size, prefetch=prefetch)
+
+
+def scan_executors(
+    self: Client,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    order_by: Optional[str] = None,
+    order_by_direction: Optional[str] = None,
+    max_workers: int = DEFAULT_SCAN_WORKERS,
+    ordered: bool = True,
+    account_id_override: Optional[str] = None,
+) -> Iterator[Any]:
+    """
+    Read all executors, fetching pages concurrently after the first one reports the total.
+
+    Args:
+        page_size: Number of executors requested per page
+        order_by: Field to order results by (optional)
+        order_by_direction: Direction to order results - "asc" or "desc" (optional)
+        max_workers: Maximum number of concurrent page requests
+        ordered: Yield executors in server order (default True); if False, pages are yielded as they arrive
+        account_id_override: Optional account ID override
+
+    Returns:
+        Iterator over the executors (an async iterator on AsyncClient)
+    """
+    fetch = _executors_fetcher(self, order_by, order_by_direction, account_id_override)
+    return self._scan(fetch, "executors", page_size=page_size, max_workers=max_workers, ordered=ordered)
+
+
 def create_executor(
     self: Client,
     body: ExecutorRequestBody,
@@ -63,13 +136,24 @@ def delete_executor(
     account_id_override: Optional[str] = None,
 ) -> None:
     """Delete an executor."""
-    self._delete(f"/executors/{executor_id}", body, account_id_override=account_id_override)
+    return self._delete(f"/executors/{executor_id}", body, account_id_override=account_id_override)
 
 
 # Attach methods to Client class
 Client.list_executors = list_executors
+Client.iter_executors = iter_executors
+Client.scan_executors = scan_executors
 Client.create_executor = create_executor
 Client.get_executor = get_executor
 Client.update_executor = update_executor
 Client.delete_executor = delete_executor
 
+
+# Attach methods to AsyncClient class
+AsyncClient.list_executors = list_executors
+AsyncClient.iter_executors = iter_executors
+AsyncClient.scan_executors = scan_executors
+AsyncClient.create_executor = create_executor
+AsyncClient.get_executor = get_executor
+AsyncClient.update_executor = update_executor
+AsyncClient.delete_executor = delete_executor
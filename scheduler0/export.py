@@ -0,0 +1,273 @@
+"""
+Streaming export of executions for Scheduler0 client.
+
+``export_executions`` pages through ``list_executions`` and writes each
+execution to the destination as soon as it arrives, so memory stays constant
+whatever the size of the history. Supported formats:
+
+- ``ndjson``: one JSON object per line, encoded with the client's JSON codec
+- ``csv``: a header row followed by one row per execution
+- ``parquet``: columnar row groups, requires the optional ``pyarrow`` dependency
+
+    report = client.export_executions("executions.parquet", start_date="2025-01-01T00:00:00Z")
+    print(f"{report.rows} rows at {report.rows_per_second:,.0f} rows/s")
+"""
+
+import csv
+import io
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, IO, List, Literal, Optional, Sequence, Union
+
+from .client import Client
+from .async_client import AsyncClient
+from .codec import JSONCodec
+from .pagination import item_field
+from .serialization import to_camel_case
+from .types import Execution
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - depends on the environment
+    pyarrow = None
+
+
+# Columns exported by default, in types.Execution field order
+EXECUTION_FIELDS = tuple(Execution.__dataclass_fields__)
+
+# Fields exported as integers in Parquet; all others are strings
+INTEGER_FIELDS = frozenset({"id", "account_id", "state", "node_id", "job_id", "job_queue_version", "execution_version"})
+
+EXPORT_FORMATS = ("ndjson", "csv", "parquet")
+
+# File extensions recognized when the format is not given
+_EXTENSIONS = {".ndjson": "ndjson", ".jsonl": "ndjson", ".csv": "csv", ".parquet": "parquet"}
+
+Destination = Union[str, "os.PathLike[str]", IO[Any]]
+
+
+@dataclass
+class ExportReport:
+    """Summary of a finished export."""
+    destination: str
+    format: str
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """Export throughput."""
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+def resolve_format(destination: Destination, format: Optional[str]) -> str:
+    """Return the export format, inferring it from the destination's extension if not given."""
+    if format is None:
+        name = os.fspath(destination) if isinstance(destination, (str, os.PathLike)) else getattr(destination, "name", "")
+        format = _EXTENSIONS.get(os.path.splitext(str(name))[1].lower(), "ndjson")
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format {format!r}; expected one of {', '.join(EXPORT_FORMATS)}")
+    if format == "parquet" and pyarrow is None:
+        raise ImportError("Parquet export requires pyarrow; install it with: pip install 'scheduler0-python-client[parquet]'")
+    return format
+
+
+class ExportWriter:
+    """
+    Incremental writer for one export.
+
+    Rows are written as they are added; only Parquet buffers, up to one row
+    group. Call ``close()`` when done; files opened by the writer are closed,
+    file objects passed in are only flushed.
+
+    Args:
+        destination: File path, or an open file object (binary for Parquet,
+            text or binary otherwise)
+        format: One of "ndjson", "csv" and "parquet"
+        fields: snake_case execution fields to export, in column order
+        codec: JSON codec encoding NDJSON lines
+        row_group_size: Rows per Parquet row group
+    """
+
+    def __init__(
+        self,
+        destination: Destination,
+        format: str,
+        fields: Sequence[str] = EXECUTION_FIELDS,
+        codec: Optional[JSONCodec] = None,
+        row_group_size: int = 10000,
+    ):
+        self.format = format
+        self.fields = tuple(fields)
+        self.columns = tuple(to_camel_case(name) for name in self.fields)
+        self.codec = codec or JSONCodec()
+        self.row_group_size = row_group_size
+        self.rows = 0
+        self._owns_file = isinstance(destination, (str, os.PathLike))
+        self._file: IO[Any]
+        if self._owns_file:
+            self._file = open(destination, "w", newline="", encoding="utf-8") if format == "csv" else open(destination, "wb")
+        else:
+            self._file = destination
+        self._text = None
+        self._csv = None
+        self._parquet = None
+        self._batch: Dict[str, List[Any]] = {}
+        if format == "csv":
+            if not isinstance(self._file, io.TextIOBase):
+                self._text = io.TextIOWrapper(self._file, encoding="utf-8", newline="", write_through=True)
+            self._csv = csv.writer(self._text or self._file)
+            self._csv.writerow(self.columns)
+        elif format == "parquet":
+            self._schema = pyarrow.schema([
+                (column, pyarrow.int64() if name in INTEGER_FIELDS else pyarrow.string())
+                for name, column in zip(self.fields, self.columns)
+            ])
+            self._parquet = pyarrow.parquet.ParquetWriter(self._file, self._schema)
+            self._batch = {column: [] for column in self.columns}
+
+    def write(self, item: Any) -> None:
+        """Write one execution (a raw dict or a typed model)."""
+        values = [item_field(item, name) for name in self.fields]
+        if self._csv is not None:
+            self._csv.writerow(["" if value is None else value for value in values])
+        elif self._parquet is not None:
+            for column, value in zip(self.columns, values):
+                self._batch[column].append(value)
+            if len(self._batch[self.columns[0]]) >= self.row_group_size:
+                self._flush_row_group()
+        else:
+            line = self.codec.dumps(dict(zip(self.columns, values))) + b"\n"
+            self._file.write(line.decode("utf-8") if isinstance(self._file, io.TextIOBase) else line)
+        self.rows += 1
+
+    def _flush_row_group(self) -> None:
+        if self._batch and self._batch[self.columns[0]]:
+            self._parquet.write_table(pyarrow.Table.from_pydict(self._batch, schema=self._schema))
+            self._batch = {column: [] for column in self.columns}
+
+    def close(self) -> None:
+        """Flush buffered rows and close the destination if the writer opened it."""
+        if self._parquet is not None:
+            self._flush_row_group()
+            self._parquet.close()
+        if self._text is not None:
+            # Detach so closing the wrapper does not close the caller's file
+            self._text.flush()
+            self._text.detach()
+        if self._owns_file:
+            self._file.close()
+        elif hasattr(self._file, "flush"):
+            self._file.flush()
+
+
+def _destination_name(destination: Destination) -> str:
+    if isinstance(destination, (str, os.PathLike)):
+        return os.fspath(destination)
+    return str(getattr(destination, "name", "<stream>"))
+
+
+def _executions_source(self: Any, page_size: int, keyset: bool, filters: Dict[str, Any]) -> Any:
+    """Return the iterator of executions feeding an export."""
+    if keyset:
+        filters["order_by"] = filters["order_by"] or "dateCreated"
+        filters["order_direction"] = filters["order_direction"] or "ASC"
+        return self.iter_executions_keyset(page_size=page_size, **filters)
+    return self.iter_executions(page_size=page_size, **filters)
+
+
+def export_executions(
+    self: Client,
+    destination: Destination,
+    format: Optional[Literal["ndjson", "csv", "parquet"]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    project_id: Optional[int] = None,
+    job_id: Optional[int] = None,
+    state: Optional[Literal["scheduled", "completed", "failed"]] = None,
+    order_by: Optional[Literal["dateCreated", "lastExecutionDateTime", "nextExecutionDateTime"]] = None,
+    order_direction: Optional[Literal["ASC", "DESC"]] = None,
+    fields: Sequence[str] = EXECUTION_FIELDS,
+    page_size: int = 1000,
+    row_group_size: int = 10000,
+    keyset: bool = False,
+    account_id_override: Optional[str] = None,
+) -> ExportReport:
+    """
+    Export matching executions to a file, streaming page by page.
+
+    Args:
+        destination: File path or open file object
+        format: "ndjson", "csv" or "parquet"; inferred from the file extension if omitted
+        start_date: Start date for filtering (RFC3339 format, optional)
+        end_date: End date for filtering (RFC3339 format, optional)
+        project_id: Project ID to filter by (optional)
+        job_id: Job ID to filter by (optional)
+        state: Execution state to filter by - "scheduled", "completed", or "failed" (optional)
+        order_by: Field to order results by (optional)
+        order_direction: Direction to order results - "ASC" or "DESC" (optional)
+        fields: snake_case execution fields to export, in column order
+        page_size: Number of executions requested per page
+        row_group_size: Rows per Parquet row group
+        keyset: Page with iter_executions_keyset instead of offsets (for very large histories)
+        account_id_override: Optional account ID override
+
+    Returns:
+        ExportReport with the row count and throughput
+    """
+    format = resolve_format(destination, format)
+    filters = dict(
+        start_date=start_date, end_date=end_date, project_id=project_id, job_id=job_id, state=state,
+        order_by=order_by, order_direction=order_direction, account_id_override=account_id_override,
+    )
+    start = time.perf_counter()
+    writer = ExportWriter(destination, format, fields, codec=self.json_codec, row_group_size=row_group_size)
+    try:
+        for execution in _executions_source(self, page_size, keyset, filters):
+            writer.write(execution)
+    finally:
+        writer.close()
+    return ExportReport(_destination_name(destination), format, writer.rows, time.perf_counter() - start)
+
+
+async def export_executions_async(
+    self: AsyncClient,
+    destination: Destination,
+    format: Optional[Literal["ndjson", "csv", "parquet"]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    project_id: Optional[int] = None,
+    job_id: Optional[int] = None,
+    state: Optional[Literal["scheduled", "completed", "failed"]] = None,
+    order_by: Optional[Literal["dateCreated", "lastExecutionDateTime", "nextExecutionDateTime"]] = None,
+    order_direction: Optional[Literal["ASC", "DESC"]] = None,
+    fields: Sequence[str] = EXECUTION_FIELDS,
+    page_size: int = 1000,
+    row_group_size: int = 10000,
+    keyset: bool = False,
+    account_id_override: Optional[str] = None,
+) -> ExportReport:
+    """Export matching executions to a file (async version)."""
+    format = resolve_format(destination, format)
+    filters = dict(
+        start_date=start_date, end_date=end_date, project_id=project_id, job_id=job_id, state=state,
+        order_by=order_by, order_direction=order_direction, account_id_override=account_id_override,
+    )
+    start = time.perf_counter()
+    writer = ExportWriter(destination, format, fields, codec=self.json_codec, row_group_size=row_group_size)
+    try:
+        async for execution in _executions_source(self, page_size, keyset, filters):
+            writer.write(execution)
+    finally:
+        writer.close()
+    return ExportReport(_destination_name(destination), format, writer.rows, time.perf_counter() - start)
+
+
+# Attach methods to Client class
+Client.export_executions = export_executions
+
+
+# Attach methods to AsyncClient class
+AsyncClient.export_executions = export_executions_async
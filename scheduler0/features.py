@@ -3,6 +3,7 @@ Feature management methods for Scheduler0 client.
 """
 
 from .client import Client
+from .async_client import AsyncClient
 
 
 def list_features(self: Client) -> dict:
@@ -13,3 +14,6 @@ def list_features(self: Client) -> dict:
 # Attach methods to Client class
 Client.list_features = list_features
 
+
+# Attach methods to AsyncClient class
+AsyncClient.list_features = list_features
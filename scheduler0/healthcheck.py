@@ -3,6 +3,7 @@ Healthcheck methods for Scheduler0 client.
 """
 
 from .client import Client
+from .async_client import AsyncClient
 
 
 def healthcheck(self: Client) -> dict:
@@ -13,3 +14,6 @@ def healthcheck(self: Client) -> dict:
 # Attach methods to Client class
 Client.healthcheck = healthcheck
 
+
+# Attach methods to AsyncClient class
+AsyncClient.healthcheck = healthcheck
@@ -2,8 +2,10 @@
 Job management methods for Scheduler0 client.
 """
 
-from typing import Optional, List
+from typing import Any, Callable, Iterator, Optional, List
 from .client import Client
+from .async_client import AsyncClient
+from .pagination import DEFAULT_PAGE_SIZE, DEFAULT_SCAN_WORKERS
 from .types import JobRequestBody, JobUpdateRequestBody, JobDeleteRequestBody
 
 
@@ -31,12 +33,96 @@ def list_jobs(
     return self._get("/jobs", params=params, account_id_override=account_id_override)
 
 
+def _jobs_fetcher(
+    self: Client,
+    project_id: Optional[str],
+    order_by: Optional[str],
+    order_by_direction: Optional[str],
+    account_id_override: Optional[str],
+) -> Callable[[int, int], Any]:
+    """Return a fetch(offset, limit) function reading one page of list_jobs."""
+    def fetch(offset: int, limit: int) -> Any:
+        return self.list_jobs(
+            project_id=project_id,
+            limit=limit,
+            offset=offset,
+            order_by=order_by,
+            order_by_direction=order_by_direction,
+            account_id_override=account_id_override,
+        )
+
+    return fetch
+
+
+def iter_jobs(
+    self: Client,
+    project_id: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    order_by: Optional[str] = None,
+    order_by_direction: Optional[str] = None,
+    prefetch: bool = True,
+    account_id_override: Optional[str] = None,
+) -> Iterator[Any]:
+    """
+    Iterate over all jobs, fetching the next page while the current one is consumed.
+
+    Args:
+        project_id: Project ID to filter by (optional)
+        page_size: Number of jobs requested per page
+        order_by: Field to order results by (optional)
+        order_by_direction: Direction to order results - "asc" or "desc" (optional)
+        prefetch: Fetch the next page in the background (default True)
+        account_id_override: Optional account ID override
+
+    Returns:
+        Iterator over the jobs (an async iterator on AsyncClient)
+    """
+    fetch = _jobs_fetcher(self, project_id, order_by, order_by_direction, account_id_override)
+    return self._paginate(fetch, "jobs", page_size=page_size, prefetch=prefetch)
+
+
+def scan_jobs(
+    self: Client,
+    project_id: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    order_by: Optional[str] = None,
+    order_by_direction: Optional[str] = None,
+    max_workers: int = DEFAULT_SCAN_WORKERS,
+    ordered: bool = True,
+    account_id_override: Optional[str] = None,
+) -> Iterator[Any]:
+    """
+    Read all jobs, fetching pages concurrently after the first one reports the total.
+
+    Args:
+        project_id: Project ID to filter by (optional)
+        page_size: Number of jobs requested per page
+        order_by: Field to order results by (optional)
+        order_by_direction: Direction to order results - "asc" or "desc" (optional)
+        max_workers: Maximum number of concurrent page requests
+        ordered: Yield jobs in server order (default True); if False, pages are yielded as they arrive
+        account_id_override: Optional account ID override
+
+    Returns:
+        Iterator over the jobs (an async iterator on AsyncClient)
+    """
+    fetch = _jobs_fetcher(self, project_id, order_by, order_by_direction, account_id_override)
+    return self._scan(fetch, "jobs", page_size=page_size, max_workers=max_workers, ordered=ordered)
+
+
 def create_job(
     self: Client,
     body: JobRequestBody,
     account_id_override: Optional[str] = None,
 ) -> dict:
-    """Create a single job (convenience method that wraps batch creation)."""
+    """
+    Create a single job (convenience method that wraps batch creation).
+
+    On a client with job_batching, the job is sent together with those of
+    concurrent create_job calls in one batch_create_jobs request.
+    """
+    if self._job_batcher is not None:
+        return self._job_batcher.submit(body, account_id_override=account_id_override)
     return self.batch_create_jobs([body], account_id_override=account_id_override)
 
 
@@ -75,14 +161,26 @@ def delete_job(
     account_id_override: Optional[str] = None,
 ) -> None:
     """Delete a job."""
-    self._delete(f"/jobs/{job_id}", body, account_id_override=account_id_override)
+    return self._delete(f"/jobs/{job_id}", body, account_id_override=account_id_override)
 
 
 # Attach methods to Client class
 Client.list_jobs = list_jobs
+Client.iter_jobs = iter_jobs
+Client.scan_jobs = scan_jobs
 Client.create_job = create_job
 Client.batch_create_jobs = batch_create_jobs
 Client.get_job = get_job
 Client.update_job = update_job
 Client.delete_job = delete_job
 
+
+# Attach methods to AsyncClient class
+AsyncClient.list_jobs = list_jobs
+AsyncClient.iter_jobs = iter_jobs
+AsyncClient.scan_jobs = scan_jobs
+AsyncClient.create_job = create_job
+AsyncClient.batch_create_jobs = batch_create_jobs
+AsyncClient.get_job = get_job
+AsyncClient.update_job = update_job
+AsyncClient.delete_job = delete_job
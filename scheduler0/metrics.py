@@ -0,0 +1,251 @@
+"""
+Request metrics for Scheduler0 client.
+
+A RequestMetrics given to a client as ``metrics=`` records every request
+attempt by method and endpoint template (``GET /jobs/{id}``): the number of
+attempts by status class (``2xx`` ... ``5xx``, or ``error`` for connection
+errors and timeouts), request and response body bytes, and a latency
+histogram. Latencies go into HDR-style buckets, 16 per power of two, so
+quantiles are within about 6% from microseconds to minutes at a small,
+bounded memory cost:
+
+    metrics = RequestMetrics()
+    client = Client("http://localhost:7070", api_key=..., api_secret=..., metrics=metrics)
+    ...
+    print(metrics.snapshot()["GET /jobs/{id}"]["latency"]["p99"])
+    print(metrics.prometheus_text())
+
+Passing an OpenTelemetry meter (``RequestMetrics(meter=...)``) also records
+every attempt into the standard ``http.client.*`` instruments. A client
+without metrics records nothing.
+"""
+
+import math
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .endpoints import endpoint_template
+
+
+# Latency buckets per power of two; a bucket's width is at most 1 / _SUB_BUCKETS of its lower bound
+_SUB_BUCKETS = 16
+
+# Bucket bounds, in seconds, of the exported Prometheus histogram
+PROMETHEUS_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+def _bucket(seconds: float) -> int:
+    """Return the histogram bucket of a latency."""
+    micros = seconds * 1e6
+    if micros < 1:
+        return 0
+    mantissa, exponent = math.frexp(micros)
+    return exponent * _SUB_BUCKETS + int((mantissa - 0.5) * 2 * _SUB_BUCKETS)
+
+
+def _bucket_upper(index: int) -> float:
+    """Return the upper bound, in seconds, of a histogram bucket."""
+    if index == 0:
+        return 1e-6
+    exponent, sub = divmod(index, _SUB_BUCKETS)
+    return math.ldexp(0.5 + (sub + 1) / (2 * _SUB_BUCKETS), exponent) / 1e6
+
+
+def status_class(status_code: Optional[int]) -> str:
+    """Return the status class of an attempt: "2xx" ... "5xx", or "error" without a response."""
+    return "error" if status_code is None else f"{status_code // 100}xx"
+
+
+class _Series:
+    """Counters of one method and endpoint template."""
+
+    __slots__ = ("count", "statuses", "buckets", "total_seconds", "max_seconds", "request_bytes", "response_bytes")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.statuses: Dict[str, int] = {}
+        self.buckets: Dict[int, int] = {}
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def quantile(self, q: float) -> float:
+        rank = q * self.count
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(_bucket_upper(index), self.max_seconds)
+        return self.max_seconds
+
+    def cumulative(self, bounds: Iterable[float]) -> List[int]:
+        """Return the number of latencies at or below each bound."""
+        ordered = sorted(self.buckets.items())
+        counts = []
+        position = 0
+        seen = 0
+        for bound in bounds:
+            while position < len(ordered) and _bucket_upper(ordered[position][0]) <= bound:
+                seen += ordered[position][1]
+                position += 1
+            counts.append(seen)
+        return counts
+
+
+class _OpenTelemetry:
+    """Standard HTTP client instruments of an OpenTelemetry meter."""
+
+    def __init__(self, meter: Any):
+        self.duration = meter.create_histogram(
+            "http.client.request.duration", unit="s", description="Duration of Scheduler0 API requests",
+        )
+        self.request_size = meter.create_histogram(
+            "http.client.request.body.size", unit="By", description="Size of Scheduler0 API request bodies",
+        )
+        self.response_size = meter.create_histogram(
+            "http.client.response.body.size", unit="By", description="Size of Scheduler0 API response bodies",
+        )
+
+    def record(self, method: str, template: str, status_code: Optional[int], seconds: float,
+               request_bytes: int, response_bytes: int) -> None:
+        attributes: Dict[str, Any] = {"http.request.method": method, "url.template": template}
+        if status_code is None:
+            attributes["error.type"] = "connection"
+        else:
+            attributes["http.response.status_code"] = status_code
+        self.duration.record(seconds, attributes)
+        self.request_size.record(request_bytes, attributes)
+        self.response_size.record(response_bytes, attributes)
+
+
+class RequestMetrics:
+    """
+    Attempt counts, byte sizes and latency histograms by method and endpoint template.
+
+    Thread-safe; one instance may be shared between clients, whose attempts
+    are then aggregated.
+
+    Args:
+        meter: OpenTelemetry Meter (from opentelemetry.metrics.get_meter) to
+            also record attempts into (optional)
+    """
+
+    def __init__(self, meter: Optional[Any] = None):
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, str], _Series] = {}
+        self._otel = _OpenTelemetry(meter) if meter is not None else None
+
+    def record(
+        self,
+        method: str,
+        endpoint: str,
+        status_code: Optional[int],
+        seconds: float,
+        request_bytes: int = 0,
+        response_bytes: int = 0,
+    ) -> None:
+        """
+        Record one request attempt.
+
+        Args:
+            method: HTTP method
+            endpoint: Request path; it is reduced to its endpoint template
+            status_code: Response status, or None for a connection error or timeout
+            seconds: Time until the response (or error) was received
+            request_bytes: Size of the request body
+            response_bytes: Size of the response body
+        """
+        method = method.upper()
+        template = endpoint_template(endpoint.split("?", 1)[0])
+        status = status_class(status_code)
+        bucket = _bucket(seconds)
+        with self._lock:
+            series = self._series.get((method, template))
+            if series is None:
+                series = self._series[(method, template)] = _Series()
+            series.count += 1
+            series.statuses[status] = series.statuses.get(status, 0) + 1
+            series.buckets[bucket] = series.buckets.get(bucket, 0) + 1
+            series.total_seconds += seconds
+            if seconds > series.max_seconds:
+                series.max_seconds = seconds
+            series.request_bytes += request_bytes
+            series.response_bytes += response_bytes
+        if self._otel is not None:
+            self._otel.record(method, template, status_code, seconds, request_bytes, response_bytes)
+
+    def reset(self) -> None:
+        """Forget every recorded attempt."""
+        with self._lock:
+            self._series.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the recorded metrics.
+
+        Returns:
+            Dict keyed by "METHOD /template", each with the attempt count,
+            counts by status class, error_rate (share of 5xx and connection
+            errors), request_bytes, response_bytes, and latency in seconds
+            (mean, p50, p90, p99 and max)
+        """
+        with self._lock:
+            snapshot = {}
+            for (method, template), series in sorted(self._series.items(), key=lambda item: (item[0][1], item[0][0])):
+                errors = series.statuses.get("5xx", 0) + series.statuses.get("error", 0)
+                latency = {"mean": series.total_seconds / series.count}
+                latency.update({f"p{round(q * 100)}": series.quantile(q) for q in QUANTILES})
+                latency["max"] = series.max_seconds
+                snapshot[f"{method} {template}"] = {
+                    "count": series.count,
+                    "statuses": dict(series.statuses),
+                    "error_rate": errors / series.count,
+                    "request_bytes": series.request_bytes,
+                    "response_bytes": series.response_bytes,
+                    "latency": latency,
+                }
+            return snapshot
+
+    def prometheus_text(self, prefix: str = "scheduler0_client") -> str:
+        """
+        Return the metrics in the Prometheus text exposition format.
+
+        Exposes a request duration histogram with PROMETHEUS_BUCKETS, and
+        counters of attempts by status class and of body bytes, all labelled
+        by method and endpoint template.
+
+        Args:
+            prefix: Prefix of the metric names
+
+        Returns:
+            Exposition text, ending with a newline
+        """
+        with self._lock:
+            series = sorted(self._series.items(), key=lambda item: (item[0][1], item[0][0]))
+            duration = [f"# HELP {prefix}_request_duration_seconds Duration of API request attempts.",
+                        f"# TYPE {prefix}_request_duration_seconds histogram"]
+            requests_total = [f"# HELP {prefix}_requests_total API request attempts by status class.",
+                              f"# TYPE {prefix}_requests_total counter"]
+            sent = [f"# HELP {prefix}_request_bytes_total Request body bytes sent.",
+                    f"# TYPE {prefix}_request_bytes_total counter"]
+            received = [f"# HELP {prefix}_response_bytes_total Response body bytes received.",
+                        f"# TYPE {prefix}_response_bytes_total counter"]
+            for (method, template), entry in series:
+                labels = f'method="{_escape(method)}",endpoint="{_escape(template)}"'
+                for bound, count in zip(PROMETHEUS_BUCKETS, entry.cumulative(PROMETHEUS_BUCKETS)):
+                    duration.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="{bound:g}"}} {count}')
+                duration.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="+Inf"}} {entry.count}')
+                duration.append(f"{prefix}_request_duration_seconds_sum{{{labels}}} {entry.total_seconds!r}")
+                duration.append(f"{prefix}_request_duration_seconds_count{{{labels}}} {entry.count}")
+                for status, count in sorted(entry.statuses.items()):
+                    requests_total.append(f'{prefix}_requests_total{{{labels},status="{status}"}} {count}')
+                sent.append(f"{prefix}_request_bytes_total{{{labels}}} {entry.request_bytes}")
+                received.append(f"{prefix}_response_bytes_total{{{labels}}} {entry.response_bytes}")
+        return "\n".join(duration + requests_total + sent + received) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
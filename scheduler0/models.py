@@ -0,0 +1,385 @@
+"""
+Slotted models for Scheduler0 client.
+
+Each model mirrors a dataclass in ``types.py`` but stores its fields in
+``__slots__`` instead of a per-instance ``__dict__``, which makes instances
+about a quarter smaller (see ``benchmarks/bench_memory.py``). Models are immutable and hashable, so they can be
+kept in sets and used as dict keys; use ``replace()`` to derive a modified
+copy. They work on every supported Python version (``dataclass(slots=True)``
+needs 3.10).
+
+Models are built from camelCase API dicts by a ``from_dict`` converter
+generated once per type. Fields holding nested models (for example
+``HealthcheckData.raft_stats`` or ``Account.features``) are materialized
+lazily, on first access. Request body models (``JobRequestBody``, ...) can
+be passed to client methods in place of the dataclasses.
+
+Models are returned by clients created with ``typed=True``:
+
+    client = Client(..., typed=True)
+    job = client.get_job("42")          # models.Job
+    page = client.list_jobs(limit=100)  # models.Page of models.Job
+"""
+
+import dataclasses
+import typing
+from dataclasses import FrozenInstanceError
+from typing import Any, Callable, ClassVar, Dict, Iterator, List, Optional, Tuple, Type
+
+from . import types as _types
+from .serialization import to_camel_case, register_serializer
+
+
+class Model:
+    """Base class of the slotted, immutable models generated from ``types.py`` dataclasses."""
+
+    __slots__ = ()
+
+    # Field names, in declaration order
+    _fields: ClassVar[Tuple[str, ...]] = ()
+    # Converters for lazily materialized fields, keyed by field name
+    _lazy: ClassVar[Dict[str, Callable[[Any], Any]]] = {}
+    # The types.py dataclass this model mirrors
+    _source: ClassVar[Optional[type]] = None
+    # Builds a model from an API response dict (camelCase keys); compiled by model_for
+    # for each generated class, so Model itself has none
+    from_dict: ClassVar[Callable[[Dict[str, Any]], "Model"]]
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached when a slot is unset: materialize a pending lazy field
+        converter = type(self)._lazy.get(name)
+        if converter is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        pending = object.__getattribute__(self, "_pending")
+        value = converter(pending.get(name))
+        type(self).__dict__[name].__set__(self, value)
+        pending.pop(name, None)
+        return value
+
+    @classmethod
+    def from_dataclass(cls, obj: Any) -> "Model":
+        """Build a model from an instance of its ``types.py`` dataclass."""
+        return cls(**{name: _to_model(getattr(obj, name)) for name in cls._fields})
+
+    def to_dataclass(self) -> Any:
+        """Return an instance of the ``types.py`` dataclass this model mirrors."""
+        return self._source(**{name: _to_dataclass(getattr(self, name)) for name in self._fields})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the fields as a snake_case dict, converting nested models."""
+        return {name: _unwrap(getattr(self, name)) for name in self._fields}
+
+    def replace(self, **changes: Any) -> "Model":
+        """Return a copy with the given fields replaced."""
+        values = {name: getattr(self, name) for name in self._fields}
+        values.update(changes)
+        return type(self)(**values)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __reduce__(self) -> Any:
+        # Rebuild through __init__; slot state cannot be restored with setattr on a frozen model
+        return (_rebuild, (type(self), tuple(getattr(self, name) for name in self._fields)))
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._fields)
+
+    def __hash__(self) -> int:
+        return hash((type(self), tuple(_freeze(getattr(self, name)) for name in self._fields)))
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({values})"
+
+
+class Page:
+    """One page of a list endpoint: the decoded items plus paging counters."""
+
+    __slots__ = ("items", "total", "offset", "limit")
+
+    def __init__(self, items: List[Any], total: Optional[int] = None, offset: Optional[int] = None, limit: Optional[int] = None):
+        self.items = items
+        self.total = total
+        self.offset = offset
+        self.limit = limit
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __getitem__(self, index: int) -> Any:
+        return self.items[index]
+
+    def __repr__(self) -> str:
+        return f"Page(total={self.total}, offset={self.offset}, limit={self.limit}, items={len(self.items)})"
+
+
+def _unwrap(value: Any) -> Any:
+    if isinstance(value, Model):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_unwrap(item) for item in value]
+    return value
+
+
+def _to_model(value: Any) -> Any:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return model_for(type(value)).from_dataclass(value)
+    if isinstance(value, list):
+        return [_to_model(item) for item in value]
+    return value
+
+
+def _to_dataclass(value: Any) -> Any:
+    if isinstance(value, Model):
+        return value.to_dataclass()
+    if isinstance(value, list):
+        return [_to_dataclass(item) for item in value]
+    return value
+
+
+def _freeze(value: Any) -> Any:
+    """Return a hashable equivalent of a field value."""
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    return value
+
+
+def _rebuild(cls: Type[Model], values: Tuple[Any, ...]) -> Model:
+    return cls(*values)
+
+
+_models: Dict[type, Type[Model]] = {}
+
+
+def _nested_converter(hint: Any) -> Optional[Callable[[Any], Any]]:
+    """Return a converter for fields typed as a dataclass or a list of dataclasses."""
+    args = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+    if typing.get_origin(hint) is typing.Union and len(args) == 1:
+        hint = args[0]
+    if dataclasses.is_dataclass(hint):
+        model = model_for(hint)
+        return lambda raw: model.from_dict(raw) if isinstance(raw, dict) else raw
+    if typing.get_origin(hint) in (list, List) and typing.get_args(hint):
+        item = typing.get_args(hint)[0]
+        if dataclasses.is_dataclass(item):
+            model = model_for(item)
+            return lambda raw: [model.from_dict(v) if isinstance(v, dict) else v for v in raw] if isinstance(raw, list) else raw
+    return None
+
+
+def model_for(source: type) -> Type[Model]:
+    """
+    Return the slotted model class for a ``types.py`` dataclass, generating it on first use.
+
+    The generated class has the same name, field order and defaults as the
+    dataclass, an ``__init__`` accepting the same arguments, and a compiled
+    ``from_dict`` classmethod. It is registered with the request serializer.
+    """
+    model = _models.get(source)
+    if model is not None:
+        return model
+
+    fields = dataclasses.fields(source)
+    hints = typing.get_type_hints(source)
+    names = tuple(f.name for f in fields)
+    lazy = {}
+    for f in fields:
+        converter = _nested_converter(hints[f.name])
+        if converter is not None:
+            lazy[f.name] = converter
+
+    slots = names + (("_pending",) if lazy else ())
+    model = type(source.__name__, (Model,), {
+        "__slots__": slots,
+        "__module__": __name__,
+        "__doc__": f"Slotted counterpart of types.{source.__name__}.",
+        "_fields": names,
+        "_lazy": lazy,
+        "_source": source,
+    })
+    _models[source] = model
+
+    namespace: Dict[str, Any] = {"_MISSING": dataclasses.MISSING}
+    for name in slots:
+        namespace[f"_set_{name}"] = model.__dict__[name].__set__
+
+    # __init__ mirroring the dataclass signature
+    params, body = [], []
+    for f in fields:
+        if f.default is not dataclasses.MISSING:
+            namespace[f"_default_{f.name}"] = f.default
+            params.append(f"{f.name}=_default_{f.name}")
+            body.append(f"    _set_{f.name}(self, {f.name})")
+        elif f.default_factory is not dataclasses.MISSING:
+            namespace[f"_factory_{f.name}"] = f.default_factory
+            params.append(f"{f.name}=_MISSING")
+            body.append(f"    _set_{f.name}(self, _factory_{f.name}() if {f.name} is _MISSING else {f.name})")
+        else:
+            params.append(f.name)
+            body.append(f"    _set_{f.name}(self, {f.name})")
+    if lazy:
+        body.append("    _set__pending(self, {})")
+    init_source = f"def __init__(self, {', '.join(params)}):\n" + "\n".join(body or ["    pass"])
+
+    # from_dict reading camelCase keys, falling back to snake_case keys
+    # (the raft stats in /healthcheck, for example, are snake_case)
+    lines = ["def from_dict(cls, data):", "    self = _new(cls)", "    get = data.get"]
+    pending = []
+    for name in names:
+        key = to_camel_case(name)
+        if key == name:
+            lookup = f"get({key!r})"
+        else:
+            lookup = f"get({key!r}, _MISSING)"
+        if name in lazy:
+            lines.append(f"    raw_{name} = {lookup}")
+            if key != name:
+                lines.append(f"    if raw_{name} is _MISSING: raw_{name} = get({name!r})")
+            pending.append(f"{name!r}: raw_{name}")
+        else:
+            lines.append(f"    value = {lookup}")
+            if key != name:
+                lines.append(f"    if value is _MISSING: value = get({name!r})")
+            lines.append(f"    _set_{name}(self, value)")
+    if lazy:
+        lines.append(f"    _set__pending(self, {{{', '.join(pending)}}})")
+    lines.append("    return self")
+
+    namespace["_new"] = object.__new__
+    exec(init_source, namespace)
+    exec("\n".join(lines), namespace)
+    # Class attributes are set on the type, so the frozen __setattr__ is not involved
+    type.__setattr__(model, "__init__", namespace["__init__"])
+    type.__setattr__(model, "from_dict", classmethod(namespace["from_dict"]))
+    register_serializer(model, names)
+    return model
+
+
+# Account models
+AccountFeature = model_for(_types.AccountFeature)
+Account = model_for(_types.Account)
+AccountCreateRequestBody = model_for(_types.AccountCreateRequestBody)
+
+# Credential models
+Credential = model_for(_types.Credential)
+CredentialCreateRequestBody = model_for(_types.CredentialCreateRequestBody)
+CredentialUpdateRequestBody = model_for(_types.CredentialUpdateRequestBody)
+CredentialDeleteRequestBody = model_for(_types.CredentialDeleteRequestBody)
+CredentialArchiveRequestBody = model_for(_types.CredentialArchiveRequestBody)
+
+# Job models
+Job = model_for(_types.Job)
+JobRequestBody = model_for(_types.JobRequestBody)
+JobUpdateRequestBody = model_for(_types.JobUpdateRequestBody)
+JobDeleteRequestBody = model_for(_types.JobDeleteRequestBody)
+
+# Project models
+Project = model_for(_types.Project)
+ProjectRequestBody = model_for(_types.ProjectRequestBody)
+ProjectUpdateRequestBody = model_for(_types.ProjectUpdateRequestBody)
+ProjectDeleteRequestBody = model_for(_types.ProjectDeleteRequestBody)
+
+# Executor models
+Executor = model_for(_types.Executor)
+ExecutorRequestBody = model_for(_types.ExecutorRequestBody)
+ExecutorUpdateRequestBody = model_for(_types.ExecutorUpdateRequestBody)
+ExecutorDeleteRequestBody = model_for(_types.ExecutorDeleteRequestBody)
+
+# Execution models
+Execution = model_for(_types.Execution)
+DateRangeAnalyticsPoint = model_for(_types.DateRangeAnalyticsPoint)
+DateRangeAnalyticsResponse = model_for(_types.DateRangeAnalyticsResponse)
+ExecutionTotalsResponse = model_for(_types.ExecutionTotalsResponse)
+CleanupOldLogsRequestBody = model_for(_types.CleanupOldLogsRequestBody)
+CleanupOldLogsResponse = model_for(_types.CleanupOldLogsResponse)
+
+# Feature models
+Feature = model_for(_types.Feature)
+FeatureRequest = model_for(_types.FeatureRequest)
+
+# Async task models
+AsyncTask = model_for(_types.AsyncTask)
+
+# Healthcheck models
+RaftStats = model_for(_types.RaftStats)
+HealthcheckData = model_for(_types.HealthcheckData)
+
+# Prompt models
+PromptJobRequest = model_for(_types.PromptJobRequest)
+PromptJobResponse = model_for(_types.PromptJobResponse)
+
+
+# Models for the "data" member of typed responses, keyed by (method, endpoint template).
+# Tuples name the list key of paginated responses.
+RESPONSE_MODELS: Dict[Tuple[str, str], Any] = {
+    ("GET", "/accounts/{id}"): Account,
+    ("POST", "/accounts"): Account,
+    ("GET", "/async-tasks/{id}"): AsyncTask,
+    ("GET", "/credentials"): ("credentials", Credential),
+    ("POST", "/credentials"): Credential,
+    ("GET", "/credentials/{id}"): Credential,
+    ("PUT", "/credentials/{id}"): Credential,
+    ("GET", "/executions"): ("executions", Execution),
+    ("GET", "/executions/analytics"): DateRangeAnalyticsResponse,
+    ("GET", "/executions/totals"): ExecutionTotalsResponse,
+    ("GET", "/executors"): ("executors", Executor),
+    ("POST", "/executors"): Executor,
+    ("GET", "/executors/{id}"): Executor,
+    ("PUT", "/executors/{id}"): Executor,
+    ("GET", "/features"): ("features", Feature),
+    ("GET", "/healthcheck"): HealthcheckData,
+    ("GET", "/jobs"): ("jobs", Job),
+    ("GET", "/jobs/{id}"): Job,
+    ("PUT", "/jobs/{id}"): Job,
+    ("GET", "/projects"): ("projects", Project),
+    ("POST", "/projects"): Project,
+    ("GET", "/projects/{id}"): Project,
+    ("PUT", "/projects/{id}"): Project,
+    ("POST", "/prompt"): PromptJobResponse,
+}
+
+
+def decode_page(data: Any, key: str, model: Type[Model]) -> Any:
+    """Decode the ``data`` member of a list response into a Page."""
+    if isinstance(data, list):
+        return Page([model.from_dict(item) for item in data], total=len(data))
+    if not isinstance(data, dict):
+        return data
+    from_dict = model.from_dict
+    items = [from_dict(item) for item in data.get(key) or ()]
+    return Page(items, total=data.get("total"), offset=data.get("offset"), limit=data.get("limit"))
+
+
+def decode_typed(method: str, template: str, payload: Any) -> Any:
+    """
+    Decode a response payload into models for typed clients.
+
+    Responses wrapped as ``{"success": ..., "data": ...}`` are unwrapped to
+    the decoded ``data``; bare lists (``/prompt``) are decoded item by item.
+    Payloads of endpoints without a model are returned unchanged.
+    """
+    spec = RESPONSE_MODELS.get((method, template))
+    if spec is None:
+        return payload
+    if isinstance(payload, list):
+        model = spec[1] if isinstance(spec, tuple) else spec
+        return [model.from_dict(item) if isinstance(item, dict) else item for item in payload]
+    if not isinstance(payload, dict) or "data" not in payload:
+        return payload
+    data = payload["data"]
+    if isinstance(spec, tuple):
+        return decode_page(data, spec[0], spec[1])
+    if isinstance(data, dict):
+        return spec.from_dict(data)
+    return data
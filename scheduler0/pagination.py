@@ -0,0 +1,433 @@
+"""
+Streaming pagination for Scheduler0 list endpoints.
+
+The ``iter_*`` methods (``iter_jobs``, ``iter_executions``, ...) walk a list
+endpoint page by page with ``limit``/``offset`` and yield the items one at a
+time. While the caller consumes page N, page N+1 is already being fetched, so
+the network round trip overlaps with the caller's processing. At most two
+pages are held in memory at any time, whatever the size of the collection.
+
+The ``scan_*`` methods read a whole collection faster by fanning out: the
+first page reports the total, then the remaining pages are fetched
+concurrently by up to ``max_workers`` requests at a time. Items are yielded
+in server order (``ordered=True``) or page by page as requests complete.
+
+``iter_executions_keyset`` pages by a timestamp watermark instead of an
+offset (see KeysetCursor), so its cost per page stays constant however deep
+the scan goes and executions arriving meanwhile do not shift the pages.
+
+The functions here only drive a ``fetch`` callable; the resource modules
+bind it to the matching ``list_*`` method.
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Iterator, List, Optional, Set, Tuple
+
+from .models import Page
+from .serialization import to_camel_case
+
+
+# Default number of items requested per page by the iter_* and scan_* methods
+DEFAULT_PAGE_SIZE = 100
+
+# Default number of concurrent page requests made by the scan_* methods
+DEFAULT_SCAN_WORKERS = 8
+
+
+def page_items(result: Any, key: str) -> Tuple[List[Any], Optional[int]]:
+    """
+    Extract the items and total count from a list endpoint result.
+
+    Args:
+        result: A typed Page, or the raw ``{"success": ..., "data": {...}}`` payload
+        key: Name of the item list inside ``data`` (e.g. "jobs")
+
+    Returns:
+        Tuple of (items, total), where total is None if the response has none
+    """
+    if isinstance(result, Page):
+        return result.items, result.total
+    data = result.get("data", result) if isinstance(result, dict) else result
+    if isinstance(data, list):
+        return data, None
+    if not isinstance(data, dict):
+        return [], None
+    total = data.get("total")
+    return data.get(key) or [], int(total) if total is not None else None
+
+
+def _has_next(offset: int, limit: int, count: int, total: Optional[int]) -> bool:
+    """Return True if another page follows the one at offset holding count items."""
+    if count == 0:
+        return False
+    if total is not None:
+        return offset + count < total
+    return count >= limit
+
+
+def iter_items(
+    fetch: Callable[[int, int], Any],
+    key: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = True,
+) -> Iterator[Any]:
+    """
+    Yield every item of a paginated list endpoint.
+
+    Args:
+        fetch: Callable taking (offset, limit) and returning one page
+        key: Name of the item list inside the response ``data``
+        page_size: Items requested per page
+        prefetch: Fetch the next page on a background thread while the current one is consumed
+
+    Returns:
+        Iterator over the items, in server order
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scheduler0-prefetch") if prefetch else None
+    pending = None
+    try:
+        offset = 0
+        items, total = page_items(fetch(offset, page_size), key)
+        while True:
+            more = _has_next(offset, page_size, len(items), total)
+            next_offset = offset + len(items)
+            if more and executor is not None:
+                pending = executor.submit(fetch, next_offset, page_size)
+            yield from items
+            if not more:
+                return
+            if pending is not None:
+                result, pending = pending.result(), None
+            else:
+                result = fetch(next_offset, page_size)
+            offset = next_offset
+            items, total = page_items(result, key)
+    finally:
+        # Reached on exhaustion, on error and when the caller stops early
+        if pending is not None:
+            pending.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+async def aiter_items(
+    fetch: Callable[[int, int], Awaitable[Any]],
+    key: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: bool = True,
+) -> AsyncIterator[Any]:
+    """
+    Async counterpart of iter_items; the next page is fetched by a task on the running loop.
+
+    Args:
+        fetch: Coroutine function taking (offset, limit) and returning one page
+        key: Name of the item list inside the response ``data``
+        page_size: Items requested per page
+        prefetch: Fetch the next page concurrently while the current one is consumed
+
+    Returns:
+        Async iterator over the items, in server order
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    pending: Optional["asyncio.Task[Any]"] = None
+    try:
+        offset = 0
+        items, total = page_items(await fetch(offset, page_size), key)
+        while True:
+            more = _has_next(offset, page_size, len(items), total)
+            next_offset = offset + len(items)
+            if more and prefetch:
+                pending = asyncio.ensure_future(fetch(next_offset, page_size))
+            for item in items:
+                yield item
+            if not more:
+                return
+            if pending is not None:
+                result, pending = await pending, None
+            else:
+                result = await fetch(next_offset, page_size)
+            offset = next_offset
+            items, total = page_items(result, key)
+    finally:
+        # cancel() is False once the fetch has finished; retrieve its outcome
+        # so a failed prefetch is not reported as an unhandled task exception
+        if pending is not None and not pending.cancel() and not pending.cancelled():
+            pending.exception()
+
+
+def _scan_offsets(first_count: int, total: int, page_size: int) -> range:
+    """
+    Return the offsets of the pages following the first one; the step is their limit.
+
+    A first page shorter than page_size while more items remain means the
+    server caps the page size, so the following pages are planned at the
+    size it actually returned instead of leaving gaps.
+    """
+    step = first_count if 0 < first_count < page_size else page_size
+    return range(first_count, total, step)
+
+
+def scan_items(
+    fetch: Callable[[int, int], Any],
+    key: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_workers: int = DEFAULT_SCAN_WORKERS,
+    ordered: bool = True,
+) -> Iterator[Any]:
+    """
+    Yield every item of a paginated list endpoint, fetching pages concurrently.
+
+    The first page is fetched alone to learn the total (and whether the server
+    caps the page size); the remaining offsets are then requested by a pool of
+    max_workers threads. No more than
+    2 * max_workers pages are requested ahead of the consumer, so memory stays
+    bounded. Endpoints that do not report a total are read sequentially.
+
+    Args:
+        fetch: Callable taking (offset, limit) and returning one page
+        key: Name of the item list inside the response ``data``
+        page_size: Items requested per page
+        max_workers: Maximum number of concurrent page requests
+        ordered: Yield items in server order; if False, pages are yielded as they complete
+
+    Returns:
+        Iterator over the items
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    items, total = page_items(fetch(0, page_size), key)
+    yield from items
+    if total is None:
+        # Without a total the pages cannot be planned; continue sequentially
+        if _has_next(0, page_size, len(items), total):
+            skip = len(items)
+            yield from iter_items(lambda offset, limit: fetch(offset + skip, limit), key, page_size)
+        return
+
+    planned = _scan_offsets(len(items), total, page_size)
+    offsets, limit = iter(planned), planned.step
+    window = 2 * max_workers
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scheduler0-scan")
+    queue: Deque["Future[Any]"] = deque()
+    running: Set["Future[Any]"] = set()
+    try:
+        def submit() -> bool:
+            offset = next(offsets, None)
+            if offset is None:
+                return False
+            future = executor.submit(fetch, offset, limit)
+            if ordered:
+                queue.append(future)
+            else:
+                running.add(future)
+            return True
+
+        for _ in range(window):
+            if not submit():
+                break
+
+        if ordered:
+            while queue:
+                result = queue.popleft().result()
+                submit()
+                yield from page_items(result, key)[0]
+        else:
+            while running:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    submit()
+                    yield from page_items(result, key)[0]
+    finally:
+        for future in list(queue) + list(running):
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def ascan_items(
+    fetch: Callable[[int, int], Awaitable[Any]],
+    key: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_workers: int = DEFAULT_SCAN_WORKERS,
+    ordered: bool = True,
+) -> AsyncIterator[Any]:
+    """
+    Async counterpart of scan_items; pages are fetched by up to max_workers concurrent tasks.
+
+    Args:
+        fetch: Coroutine function taking (offset, limit) and returning one page
+        key: Name of the item list inside the response ``data``
+        page_size: Items requested per page
+        max_workers: Maximum number of concurrent page requests
+        ordered: Yield items in server order; if False, pages are yielded as they complete
+
+    Returns:
+        Async iterator over the items
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    items, total = page_items(await fetch(0, page_size), key)
+    for item in items:
+        yield item
+    if total is None:
+        # Without a total the pages cannot be planned; continue sequentially
+        if _has_next(0, page_size, len(items), total):
+            skip = len(items)
+            async for item in aiter_items(lambda offset, limit: fetch(offset + skip, limit), key, page_size):
+                yield item
+        return
+
+    planned = _scan_offsets(len(items), total, page_size)
+    offsets, limit = iter(planned), planned.step
+    queue: Deque["asyncio.Task[Any]"] = deque()
+    running: Set["asyncio.Task[Any]"] = set()
+    try:
+        def submit() -> bool:
+            offset = next(offsets, None)
+            if offset is None:
+                return False
+            task = asyncio.ensure_future(fetch(offset, limit))
+            if ordered:
+                queue.append(task)
+            else:
+                running.add(task)
+            return True
+
+        # Tasks start immediately, so the window is the concurrency limit
+        for _ in range(max_workers):
+            if not submit():
+                break
+
+        if ordered:
+            while queue:
+                result = await queue.popleft()
+                submit()
+                for item in page_items(result, key)[0]:
+                    yield item
+        else:
+            while running:
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    submit()
+                    for item in page_items(result, key)[0]:
+                        yield item
+    finally:
+        for task in list(queue) + list(running):
+            if not task.cancel() and not task.cancelled():
+                task.exception()
+
+
+def item_field(item: Any, name: str) -> Any:
+    """Read a snake_case field from a raw (camelCase dict) or typed item."""
+    if isinstance(item, dict):
+        return item.get(to_camel_case(name))
+    return getattr(item, name, None)
+
+
+class KeysetCursor:
+    """
+    Watermark state of a keyset (seek) scan.
+
+    The scan is ordered by a timestamp field. Each request filters on the
+    watermark, the greatest (or, descending, least) timestamp yielded so far,
+    instead of skipping a growing offset. Items sharing the watermark
+    timestamp are remembered by ID: the next request skips that many with a
+    small offset, and any that reappear are dropped.
+
+    Args:
+        cursor_field: snake_case name of the ordering timestamp field
+        id_field: snake_case name of the unique item ID used for deduplication
+        watermark: Initial watermark (the scan's start or end date), if any
+    """
+
+    def __init__(self, cursor_field: str, id_field: str, watermark: Optional[str] = None):
+        self.cursor_field = cursor_field
+        self.id_field = id_field
+        self.watermark = watermark
+        self.seen: Set[Any] = set()
+
+    @property
+    def offset(self) -> int:
+        """Offset skipping the items already yielded at the watermark."""
+        return len(self.seen)
+
+    def advance(self, items: List[Any]) -> List[Any]:
+        """Return the items not yet yielded, moving the watermark past them."""
+        fresh = []
+        for item in items:
+            item_id = item_field(item, self.id_field)
+            if item_id is not None and item_id in self.seen:
+                continue
+            fresh.append(item)
+            value = item_field(item, self.cursor_field)
+            if value is None:
+                raise ValueError(f"keyset pagination requires {self.cursor_field!r} on every item")
+            if value != self.watermark:
+                self.watermark = value
+                self.seen = set()
+            if item_id is not None:
+                self.seen.add(item_id)
+        return fresh
+
+
+def iter_keyset(
+    fetch: Callable[[Optional[str], int, int], Any],
+    key: str,
+    cursor: KeysetCursor,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[Any]:
+    """
+    Yield every item of a list endpoint by keyset pagination.
+
+    Args:
+        fetch: Callable taking (watermark, offset, limit) and returning one page
+            of items ordered by the cursor field, starting at the watermark (inclusive)
+        key: Name of the item list inside the response ``data``
+        cursor: Watermark state; it can be inspected after the scan to resume later
+        page_size: Items requested per page
+
+    Returns:
+        Iterator over the items
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    while True:
+        items, _ = page_items(fetch(cursor.watermark, cursor.offset, page_size), key)
+        fresh = cursor.advance(items)
+        yield from fresh
+        if len(items) < page_size:
+            return
+        if not fresh:
+            raise RuntimeError("keyset pagination made no progress; is the order_by field stable?")
+
+
+async def aiter_keyset(
+    fetch: Callable[[Optional[str], int, int], Awaitable[Any]],
+    key: str,
+    cursor: KeysetCursor,
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> AsyncIterator[Any]:
+    """Async counterpart of iter_keyset."""
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    while True:
+        items, _ = page_items(await fetch(cursor.watermark, cursor.offset, page_size), key)
+        fresh = cursor.advance(items)
+        for item in fresh:
+            yield item
+        if len(items) < page_size:
+            return
+        if not fresh:
+            raise RuntimeError("keyset pagination made no progress; is the order_by field stable?")
@@ -0,0 +1,125 @@
+"""
+Connection pool configuration for the Scheduler0 sync client.
+"""
+
+import socket
+import threading
+from typing import Dict, Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+
+class PoolingAdapter(HTTPAdapter):
+    """
+    HTTPAdapter with configurable pool sizing, TCP keep-alive and usage counters.
+
+    The adapter is shared by every thread using the client. urllib3 connection
+    pools are thread-safe, so the only requirement for heavy multi-threaded use
+    is a ``pool_maxsize`` at least as large as the number of worker threads;
+    otherwise connections are closed on release and re-handshaked later.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        tcp_keepalive: bool = True,
+    ):
+        self._tcp_keepalive = tcp_keepalive
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._requests = 0
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any) -> None:
+        if self._tcp_keepalive:
+            pool_kwargs.setdefault(
+                "socket_options",
+                HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)],
+            )
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        with self._lock:
+            self._requests += 1
+            self._in_flight += 1
+            if self._in_flight > self._peak_in_flight:
+                self._peak_in_flight = self._in_flight
+        try:
+            return super().send(request, **kwargs)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return connection pool usage counters.
+
+        ``connections_created`` much larger than ``pool_maxsize`` means
+        connections are being discarded and re-opened; raise ``pool_maxsize``.
+        """
+        connections_created = 0
+        idle_connections = 0
+        pools = self.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            connections_created += pool.num_connections
+            if pool.pool is not None:
+                idle_connections += sum(1 for conn in list(pool.pool.queue) if conn is not None)
+
+        with self._lock:
+            requests_sent = self._requests
+            in_flight = self._in_flight
+            peak_in_flight = self._peak_in_flight
+
+        return {
+            "pools": len(pools),
+            "pool_maxsize": self._pool_maxsize,
+            "pool_block": self._pool_block,
+            "requests": requests_sent,
+            "connections_created": connections_created,
+            "connections_reused": max(requests_sent - connections_created, 0),
+            "idle_connections": idle_connections,
+            "in_flight": in_flight,
+            "peak_in_flight": peak_in_flight,
+        }
+
+
+def build_session(
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    pool_block: bool = False,
+    keep_alive: bool = True,
+) -> requests.Session:
+    """
+    Create a requests.Session mounted with a PoolingAdapter for http and https.
+
+    Args:
+        pool_connections: Number of per-host pools to cache
+        pool_maxsize: Maximum connections kept per host
+        pool_block: Block when the pool is exhausted instead of opening extra connections
+        keep_alive: Reuse connections (HTTP keep-alive plus TCP SO_KEEPALIVE); if False
+            every request sends ``Connection: close``
+    """
+    session = requests.Session()
+    adapter = PoolingAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        tcp_keepalive=keep_alive,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    return session
@@ -2,8 +2,10 @@
 Project management methods for Scheduler0 client.
 """
 
-from typing import Optional
+from typing import Any, Callable, Iterator, Optional
 from .client import Client
+from .async_client import AsyncClient
+from .pagination import DEFAULT_PAGE_SIZE, DEFAULT_SCAN_WORKERS
 from .types import ProjectRequestBody, ProjectUpdateRequestBody, ProjectDeleteRequestBody
 
 
@@ -28,6 +30,77 @@ def list_projects(
     return self._get("/projects", params=params, account_id_override=account_id_override)
 
 
+def _projects_fetcher(
+    self: Client,
+    order_by: Optional[str],
+    order_by_direction: Optional[str],
+    account_id_override: Optional[str],
+) -> Callable[[int, int], Any]:
+    """Return a fetch(offset, limit) function reading one page of list_projects."""
+    def fetch(offset: int, limit: int) -> Any:
+        return self.list_projects(
+            limit=limit,
+            offset=offset,
+            order_by=order_by,
+            order_by_direction=order_by_direction,
+            account_id_override=account_id_override,
+        )
+
+    return fetch
+
+
+def iter_projects(
+    self: Client,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    order_by: Optional[str] = None,
+    order_by_direction: Optional[str] = None,
+    prefetch: bool = True,
+    account_id_override: Optional[str] = None,
+) -> Iterator[Any]:
+    """
+    Iterate over all projects, fetching the next page while the current one is consumed.
+
+    Args:
+        page_size: Number of projects requested per page
+        order_by: Field to order results by (optional)
+        order_by_direction: Direction to order results - "asc" or "desc" (optional)
+        prefetch: Fetch the next page in the background (default True)
+        account_id_override: Optional account ID override
+
+    Returns:
+        Iterator over the projects (an async iterator on AsyncClient)
+    """
+    fetch = _projects_fetcher(self, order_by, order_by_direction, account_id_override)
+    return self._paginate(fetch, "projects", page_size=page_size, prefetch=prefetch)
+
+
+def scan_projects(
+    self: Client,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    order_by: Optional[str] = None,
+    order_by_direction: Optional[str] = None,
+    max_workers: int = DEFAULT_SCAN_WORKERS,
+    ordered: bool = True,
+    account_id_override: Optional[str] = None,
+) -> Iterator[Any]:
+    """
+    Read all projects, fetching pages concurrently after the first one reports the total.
+
+    Args:
+        page_size: Number of projects requested per page
+        order_by: Field to order results by (optional)
+        order_by_direction: Direction to order results - "asc" or "desc" (optional)
+        max_workers: Maximum number of concurrent page requests
+        ordered: Yield projects in server order (default True); if False, pages are yielded as they arrive
+        account_id_override: Optional account ID override
+
+    Returns:
+        Iterator over the projects (an async iterator on AsyncClient)
+    """
+    fetch = _projects_fetcher(self, order_by, order_by_direction, account_id_override)
+    return self._scan(fetch, "projects", page_size=page_size, max_workers=max_workers, ordered=ordered)
+
+
 def create_project(
     self: Client,
     body: ProjectRequestBody,
@@ -63,13 +136,24 @@ def delete_project(
     account_id_override: Optional[str] = None,
 ) -> None:
     """Delete a project."""
-    self._delete(f"/projects/{project_id}", body, account_id_override=account_id_override)
+    return self._delete(f"/projects/{project_id}", body, account_id_override=account_id_override)
 
 
 # Attach methods to Client class
 Client.list_projects = list_projects
+Client.iter_projects = iter_projects
+Client.scan_projects = scan_projects
 Client.create_project = create_project
 Client.get_project = get_project
 Client.update_project = update_project
 Client.delete_project = delete_project
 
+
+# Attach methods to AsyncClient class
+AsyncClient.list_projects = list_projects
+AsyncClient.iter_projects = iter_projects
+AsyncClient.scan_projects = scan_projects
+AsyncClient.create_project = create_project
+AsyncClient.get_project = get_project
+AsyncClient.update_project = update_project
+AsyncClient.delete_project = delete_project
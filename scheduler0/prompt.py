@@ -4,6 +4,7 @@ AI-powered job creation methods for Scheduler0 client.
 
 from typing import Optional, List, Dict, Any
 from .client import Client
+from .async_client import AsyncClient
 from .types import PromptJobRequest
 
 
@@ -24,11 +25,26 @@ def create_job_from_prompt(
 
     Returns:
         List of PromptJobResponse dictionaries with generated configurations
+        (models.PromptJobResponse instances on typed clients)
     """
     response = self._request("POST", "/prompt", body=body, params=None, account_id_override=account_id_override)
-    return response.json()  # Returns a list directly, not wrapped in a dict
+    # Returns a list directly, not wrapped in a dict
+    return self._decode_typed("POST", "/prompt", self._decode_response(response))
+
+
+async def create_job_from_prompt_async(
+    self: AsyncClient,
+    body: PromptJobRequest,
+    account_id_override: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Create job configurations from natural language prompts (AsyncClient variant)."""
+    response = await self._request("POST", "/prompt", body=body, params=None, account_id_override=account_id_override)
+    return self._decode_typed("POST", "/prompt", self._decode_response(response))
 
 
 # Attach methods to Client class
 Client.create_job_from_prompt = create_job_from_prompt
 
+
+# Attach methods to AsyncClient class
+AsyncClient.create_job_from_prompt = create_job_from_prompt_async
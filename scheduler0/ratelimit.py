@@ -0,0 +1,230 @@
+"""
+Client-side rate limiting for Scheduler0 client.
+
+A RateLimiter given to a client as ``rate_limiter=`` spaces out requests
+with one token bucket per account ID and endpoint class (the first path
+segment and whether the method reads or writes, e.g. ``"jobs:write"``).
+Requests within the burst go out immediately; beyond it they wait for the
+bucket to refill. A 429 response halves the bucket's rate and, when it
+carries ``Retry-After``, holds the bucket back for that long; the rate then
+recovers gradually towards the configured one (additive increase,
+multiplicative decrease):
+
+    limiter = RateLimiter(default=RateLimit(rate=20, burst=40),
+                          limits={"jobs:write": RateLimit(rate=5, burst=10)})
+    client = Client("http://localhost:7070", api_key=..., api_secret=..., rate_limiter=limiter)
+
+A limiter is thread-safe and may be shared between clients. With
+``state_file``, the buckets live in a small JSON file guarded by an
+exclusive lock (POSIX only), so every process using the same path shares
+them. Every request then blocks on opening, locking, reading and rewriting
+that file; AsyncClient runs such a limiter on the event loop's default
+executor rather than on the loop itself.
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from .retry import parse_retry_after
+from .routing import WRITE_METHODS
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Sustained requests per second and burst size of one bucket."""
+    rate: float = 10.0
+    burst: float = 20.0
+
+
+def endpoint_class(method: str, endpoint: str) -> str:
+    """Return the rate limit class of a request, e.g. ``"jobs:read"``."""
+    resource = endpoint.split("?", 1)[0].strip("/").split("/", 1)[0] or "root"
+    return f"{resource}:{'write' if method.upper() in WRITE_METHODS else 'read'}"
+
+
+# Bucket state: [tokens, updated, rate]; tokens below zero are requests already waiting
+Bucket = List[float]
+
+
+class _MemoryStore:
+    """Buckets of one process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Bucket] = {}
+
+    def update(self, key: str, fn: Callable[[Optional[Bucket]], Tuple[Bucket, float]]) -> float:
+        with self._lock:
+            self._buckets[key], result = fn(self._buckets.get(key))
+        return result
+
+
+class _FileStore:
+    """Buckets shared by every process using the same file."""
+
+    def __init__(self, path: str):
+        try:
+            import fcntl
+        except ImportError:
+            raise ImportError("RateLimiter state_file requires fcntl, which is only available on POSIX systems") from None
+        self._fcntl = fcntl
+        self._path = path
+        # flock does not exclude threads sharing a process's open file description
+        self._lock = threading.Lock()
+
+    def update(self, key: str, fn: Callable[[Optional[Bucket]], Tuple[Bucket, float]]) -> float:
+        with self._lock:
+            fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                self._fcntl.flock(fd, self._fcntl.LOCK_EX)
+                with os.fdopen(os.dup(fd), "r+") as handle:
+                    try:
+                        buckets = json.loads(handle.read() or "{}")
+                    except ValueError:
+                        buckets = {}
+                    buckets[key], result = fn(buckets.get(key))
+                    handle.seek(0)
+                    handle.truncate()
+                    handle.write(json.dumps(buckets))
+            finally:
+                os.close(fd)
+        return result
+
+
+class RateLimiter:
+    """
+    Token buckets per account and endpoint class, slowed down by 429 responses.
+
+    Args:
+        default: RateLimit of classes without their own entry in limits
+        limits: RateLimit by endpoint class (see endpoint_class)
+        decrease: Factor applied to a bucket's rate on each 429 response
+        min_rate: Lowest rate a bucket is slowed down to, in requests per second
+        recovery: Fraction of the configured rate regained per second without 429s
+        state_file: Path of a file sharing the buckets between processes (optional,
+            POSIX only: it is locked with fcntl). Each request blocks on locking,
+            reading and rewriting it, so it is meant for multi-process use; see blocking
+        classify: Function of (method, endpoint) returning the endpoint class
+        clock: Function returning the current time in seconds; wall-clock time
+            by default so that processes sharing a state_file agree on it
+    """
+
+    def __init__(
+        self,
+        default: RateLimit = RateLimit(),
+        limits: Optional[Mapping[str, RateLimit]] = None,
+        decrease: float = 0.5,
+        min_rate: float = 0.1,
+        recovery: float = 0.05,
+        state_file: Optional[str] = None,
+        classify: Callable[[str, str], str] = endpoint_class,
+        clock: Callable[[], float] = time.time,
+    ):
+        if not 0 < decrease <= 1:
+            raise ValueError("decrease must be in (0, 1]")
+        for limit in [default, *(limits or {}).values()]:
+            if limit.rate <= 0 or limit.burst < 1:
+                raise ValueError("RateLimit rate must be positive and burst at least 1")
+        self.default = default
+        self.limits = dict(limits or {})
+        self.decrease = decrease
+        self.min_rate = min_rate
+        self.recovery = recovery
+        self.classify = classify
+        self._clock = clock
+        self._store = _FileStore(state_file) if state_file else _MemoryStore()
+        self._stats_lock = threading.Lock()
+        self.requests = 0
+        self.delayed = 0
+        self.waited = 0.0
+        self.throttled = 0
+
+    @property
+    def blocking(self) -> bool:
+        """Whether reserve and throttle block on file I/O (the limiter has a state_file)."""
+        return isinstance(self._store, _FileStore)
+
+    def _key(self, account_id: Optional[str], method: str, endpoint: str) -> Tuple[str, RateLimit]:
+        name = self.classify(method, endpoint)
+        return f"{account_id or ''}|{name}", self.limits.get(name, self.default)
+
+    def _refill(self, bucket: Optional[Bucket], limit: RateLimit, now: float) -> Bucket:
+        """Return the bucket brought forward to now."""
+        if bucket is None:
+            return [limit.burst, now, limit.rate]
+        tokens, updated, rate = bucket
+        elapsed = max(now - updated, 0.0)
+        if rate < limit.rate:
+            rate = min(limit.rate, rate + limit.rate * self.recovery * elapsed)
+        return [min(limit.burst, tokens + rate * elapsed), now, rate]
+
+    def reserve(self, account_id: Optional[str], method: str, endpoint: str) -> float:
+        """
+        Take a token for a request.
+
+        The token is taken even when it is not available yet, so concurrent
+        callers queue up behind each other instead of all waking at once.
+
+        Returns:
+            Seconds to wait before sending the request
+        """
+        key, limit = self._key(account_id, method, endpoint)
+        now = self._clock()
+
+        def take(bucket: Optional[Bucket]) -> Tuple[Bucket, float]:
+            tokens, updated, rate = self._refill(bucket, limit, now)
+            tokens -= 1
+            return [tokens, updated, rate], max(-tokens / rate, 0.0)
+
+        delay = self._store.update(key, take)
+        with self._stats_lock:
+            self.requests += 1
+            if delay > 0:
+                self.delayed += 1
+                self.waited += delay
+        return delay
+
+    def throttle(self, account_id: Optional[str], method: str, endpoint: str, retry_after: Optional[str] = None) -> None:
+        """
+        Slow a bucket down after a 429 response.
+
+        Args:
+            account_id: Account the request was sent for
+            method: HTTP method of the request
+            endpoint: Path of the request
+            retry_after: Value of the response's Retry-After header, if any
+        """
+        key, limit = self._key(account_id, method, endpoint)
+        now = self._clock()
+        pause = parse_retry_after(retry_after) if retry_after else None
+
+        def slow(bucket: Optional[Bucket]) -> Tuple[Bucket, float]:
+            tokens, updated, rate = self._refill(bucket, limit, now)
+            rate = max(rate * self.decrease, min(self.min_rate, limit.rate))
+            # No bursting until the server recovered; with Retry-After, none before it
+            tokens = min(tokens, -rate * pause if pause else 0.0)
+            return [tokens, updated, rate], rate
+
+        self._store.update(key, slow)
+        with self._stats_lock:
+            self.throttled += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return rate limiting counters of this process.
+
+        Returns:
+            Dict with requests admitted, requests delayed, total seconds of
+            delay and 429 responses seen ("throttled")
+        """
+        with self._stats_lock:
+            return {
+                "requests": self.requests,
+                "delayed": self.delayed,
+                "waited": self.waited,
+                "throttled": self.throttled,
+            }
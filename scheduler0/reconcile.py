@@ -0,0 +1,351 @@
+"""
+Declarative job reconciliation for Scheduler0 client.
+
+``reconcile_jobs`` makes a project's jobs match a desired set of
+JobRequestBody objects. Both sides are indexed by a stable key (by default
+the job's ``data``), and only the differences are sent: new keys are
+created in batches with ``import_jobs``, changed jobs are updated and, only
+with ``prune=True``, jobs whose key is no longer desired are deleted, both
+with bounded concurrency. Current jobs without a key, or sharing a key with
+another current job, are reported as conflicts and never changed. A sync
+costs work in proportion to the changes rather than to the number of jobs:
+
+    report = client.reconcile_jobs(42, desired_jobs, modified_by="deploy@example.com")
+    print(report.plan.summary())
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple, Union
+
+from .client import Client
+from .async_client import AsyncClient
+from .bulk import DEFAULT_BULK_CALLS, DEFAULT_CHUNK_JOBS, BulkReport, ImportReport
+from .models import Job as JobModel
+from .pagination import DEFAULT_PAGE_SIZE
+from .types import JobDeleteRequestBody, JobRequestBody, JobUpdateRequestBody
+
+
+# Fields compared between a desired job and the server's; a desired value of None is not compared
+RECONCILED_FIELDS = (
+    "executor_id",
+    "data",
+    "spec",
+    "start_date",
+    "end_date",
+    "timezone",
+    "timezone_offset",
+    "retry_max",
+    "status",
+)
+
+JobKey = Union[str, Callable[[Any], Hashable]]
+
+
+@dataclass
+class JobPlan:
+    """Changes that make a project's jobs match the desired set."""
+    project_id: int
+    creates: List[Any] = field(default_factory=list)
+    updates: List[Tuple[str, JobUpdateRequestBody]] = field(default_factory=list)
+    deletes: List[str] = field(default_factory=list)
+    unchanged: int = 0
+    # IDs of current jobs without a key, or whose key another current job already has
+    conflicts: List[str] = field(default_factory=list)
+
+    @property
+    def changes(self) -> int:
+        """Number of jobs to create, update or delete."""
+        return len(self.creates) + len(self.updates) + len(self.deletes)
+
+    def summary(self) -> str:
+        """Return a one-line description of the plan."""
+        return (
+            f"project {self.project_id}: {len(self.creates)} to create, {len(self.updates)} to update, "
+            f"{len(self.deletes)} to delete, {self.unchanged} unchanged, {len(self.conflicts)} in conflict"
+        )
+
+
+@dataclass
+class ReconcileReport:
+    """Plan of a reconciliation and the results of applying it (None for skipped steps)."""
+    plan: JobPlan
+    created: Optional[ImportReport] = None
+    updated: Optional[BulkReport] = None
+    deleted: Optional[BulkReport] = None
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether every applied change succeeded."""
+        return (
+            (self.created is None or not self.created.failures)
+            and (self.updated is None or self.updated.ok)
+            and (self.deleted is None or self.deleted.ok)
+        )
+
+
+def _key_function(key: JobKey) -> Callable[[Any], Hashable]:
+    if callable(key):
+        return key
+    return lambda job: getattr(job, key)
+
+
+def _as_job(item: Any) -> Any:
+    """Return a listed job with attribute access (raw dicts become models.Job)."""
+    return JobModel.from_dict(item) if isinstance(item, dict) else item
+
+
+def job_changes(desired: Any, current: Any) -> Dict[str, Any]:
+    """Return the reconciled fields whose desired value differs from the current one."""
+    changes = {}
+    for name in RECONCILED_FIELDS:
+        value = getattr(desired, name, None)
+        if value is not None and value != getattr(current, name, None):
+            changes[name] = value
+    return changes
+
+
+def plan_job_changes(
+    project_id: int,
+    desired: Iterable[Any],
+    current: Iterable[Any],
+    modified_by: str,
+    key: JobKey = "data",
+    prune: bool = False,
+) -> JobPlan:
+    """
+    Compute the changes that make the current jobs match the desired ones.
+
+    Args:
+        project_id: Project the jobs belong to
+        desired: Desired JobRequestBody objects
+        current: Jobs listed from the server (dicts or typed models)
+        modified_by: User recorded on updates
+        key: Field name, or function of a job, giving the key that pairs desired and current jobs
+        prune: Delete current jobs whose key is not desired (default False)
+
+    Returns:
+        JobPlan with the jobs to create, update and delete, and the current
+        jobs in conflict
+
+    Raises:
+        ValueError: If two desired jobs share a key, a desired job has no key,
+            or a desired job names another project
+    """
+    key_of = _key_function(key)
+    plan = JobPlan(project_id)
+    existing: Dict[Hashable, Any] = {}
+    for item in current:
+        job = _as_job(item)
+        job_key = key_of(job)
+        if job_key is None or job_key in existing:
+            # Unkeyed or duplicate jobs cannot be paired, so they are left alone
+            plan.conflicts.append(str(job.id))
+            continue
+        existing[job_key] = job
+
+    wanted = set()
+    for job in desired:
+        if job.project_id is not None and int(job.project_id) != int(project_id):
+            raise ValueError(f"Desired job {key_of(job)!r} belongs to project {job.project_id}, not {project_id}")
+        job_key = key_of(job)
+        if job_key is None:
+            raise ValueError("Desired jobs must all have a key")
+        if job_key in wanted:
+            raise ValueError(f"Duplicate desired job key {job_key!r}")
+        wanted.add(job_key)
+        current_job = existing.get(job_key)
+        if current_job is None:
+            plan.creates.append(job)
+            continue
+        changes = job_changes(job, current_job)
+        if changes:
+            plan.updates.append((str(current_job.id), JobUpdateRequestBody(modified_by=modified_by, **changes)))
+        else:
+            plan.unchanged += 1
+
+    if prune:
+        plan.deletes.extend(str(job.id) for job_key, job in existing.items() if job_key not in wanted)
+    return plan
+
+
+def plan_jobs(
+    self: Client,
+    project_id: int,
+    desired: Iterable[JobRequestBody],
+    modified_by: str,
+    key: JobKey = "data",
+    prune: bool = False,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    account_id_override: Optional[str] = None,
+) -> JobPlan:
+    """
+    Compare the desired jobs with a project's current jobs, without changing anything.
+
+    Args:
+        project_id: Project to reconcile
+        desired: Desired JobRequestBody objects
+        modified_by: User recorded on updates
+        key: Field name, or function of a job, pairing desired and current jobs (default "data")
+        prune: Plan deletes for current jobs whose key is not desired (default False)
+        page_size: Number of jobs requested per page when listing
+        account_id_override: Optional account ID override
+
+    Returns:
+        JobPlan with the jobs to create, update and delete
+    """
+    current = self.iter_jobs(project_id=str(project_id), page_size=page_size, account_id_override=account_id_override)
+    return plan_job_changes(project_id, desired, current, modified_by, key=key, prune=prune)
+
+
+async def plan_jobs_async(
+    self: AsyncClient,
+    project_id: int,
+    desired: Iterable[JobRequestBody],
+    modified_by: str,
+    key: JobKey = "data",
+    prune: bool = False,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    account_id_override: Optional[str] = None,
+) -> JobPlan:
+    """Compare the desired jobs with a project's current jobs (async version)."""
+    current = [
+        job async for job in self.iter_jobs(project_id=str(project_id), page_size=page_size, account_id_override=account_id_override)
+    ]
+    return plan_job_changes(project_id, desired, current, modified_by, key=key, prune=prune)
+
+
+def apply_job_plan(
+    self: Client,
+    plan: JobPlan,
+    deleted_by: str,
+    max_in_flight: int = DEFAULT_BULK_CALLS,
+    max_chunk_jobs: int = DEFAULT_CHUNK_JOBS,
+    track: bool = True,
+    account_id_override: Optional[str] = None,
+) -> ReconcileReport:
+    """
+    Apply a JobPlan: create in batches, then update, then delete.
+
+    Args:
+        plan: Plan from plan_jobs
+        deleted_by: User recorded on deletes
+        max_in_flight: Maximum number of concurrent requests
+        max_chunk_jobs: Maximum jobs per batch_create_jobs request
+        track: Wait for the async tasks of created batches (default True)
+        account_id_override: Optional account ID override
+
+    Returns:
+        ReconcileReport with the result of each step
+    """
+    start = time.perf_counter()
+    report = ReconcileReport(plan)
+    if plan.creates:
+        report.created = self.import_jobs(
+            plan.creates, max_chunk_jobs=max_chunk_jobs, max_in_flight=max_in_flight, track=track,
+            account_id_override=account_id_override,
+        )
+    if plan.updates:
+        report.updated = self.update_jobs(plan.updates, max_in_flight=max_in_flight, account_id_override=account_id_override)
+    if plan.deletes:
+        report.deleted = self.delete_jobs(
+            plan.deletes, JobDeleteRequestBody(deleted_by=deleted_by), max_in_flight=max_in_flight,
+            account_id_override=account_id_override,
+        )
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+async def apply_job_plan_async(
+    self: AsyncClient,
+    plan: JobPlan,
+    deleted_by: str,
+    max_in_flight: int = DEFAULT_BULK_CALLS,
+    max_chunk_jobs: int = DEFAULT_CHUNK_JOBS,
+    track: bool = True,
+    account_id_override: Optional[str] = None,
+) -> ReconcileReport:
+    """Apply a JobPlan (async version)."""
+    start = time.perf_counter()
+    report = ReconcileReport(plan)
+    if plan.creates:
+        report.created = await self.import_jobs(
+            plan.creates, max_chunk_jobs=max_chunk_jobs, max_in_flight=max_in_flight, track=track,
+            account_id_override=account_id_override,
+        )
+    if plan.updates:
+        report.updated = await self.update_jobs(plan.updates, max_in_flight=max_in_flight, account_id_override=account_id_override)
+    if plan.deletes:
+        report.deleted = await self.delete_jobs(
+            plan.deletes, JobDeleteRequestBody(deleted_by=deleted_by), max_in_flight=max_in_flight,
+            account_id_override=account_id_override,
+        )
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def reconcile_jobs(
+    self: Client,
+    project_id: int,
+    desired: Iterable[JobRequestBody],
+    modified_by: str,
+    key: JobKey = "data",
+    prune: bool = False,
+    dry_run: bool = False,
+    max_in_flight: int = DEFAULT_BULK_CALLS,
+    track: bool = True,
+    account_id_override: Optional[str] = None,
+) -> ReconcileReport:
+    """
+    Make a project's jobs match the desired set, changing only what differs.
+
+    Args:
+        project_id: Project to reconcile
+        desired: Desired JobRequestBody objects
+        modified_by: User recorded on updates and deletes
+        key: Field name, or function of a job, pairing desired and current jobs (default "data")
+        prune: Delete current jobs whose key is not desired (default False)
+        dry_run: Only compute the plan (default False)
+        max_in_flight: Maximum number of concurrent requests
+        track: Wait for the async tasks of created batches (default True)
+        account_id_override: Optional account ID override
+
+    Returns:
+        ReconcileReport with the plan and, unless dry_run, the result of each step
+    """
+    plan = self.plan_jobs(project_id, desired, modified_by, key=key, prune=prune, account_id_override=account_id_override)
+    if dry_run:
+        return ReconcileReport(plan)
+    return self.apply_job_plan(plan, modified_by, max_in_flight=max_in_flight, track=track, account_id_override=account_id_override)
+
+
+async def reconcile_jobs_async(
+    self: AsyncClient,
+    project_id: int,
+    desired: Iterable[JobRequestBody],
+    modified_by: str,
+    key: JobKey = "data",
+    prune: bool = False,
+    dry_run: bool = False,
+    max_in_flight: int = DEFAULT_BULK_CALLS,
+    track: bool = True,
+    account_id_override: Optional[str] = None,
+) -> ReconcileReport:
+    """Make a project's jobs match the desired set (async version)."""
+    plan = await self.plan_jobs(project_id, desired, modified_by, key=key, prune=prune, account_id_override=account_id_override)
+    if dry_run:
+        return ReconcileReport(plan)
+    return await self.apply_job_plan(plan, modified_by, max_in_flight=max_in_flight, track=track, account_id_override=account_id_override)
+
+
+# Attach methods to Client class
+Client.plan_jobs = plan_jobs
+Client.apply_job_plan = apply_job_plan
+Client.reconcile_jobs = reconcile_jobs
+
+
+# Attach methods to AsyncClient class
+AsyncClient.plan_jobs = plan_jobs_async
+AsyncClient.apply_job_plan = apply_job_plan_async
+AsyncClient.reconcile_jobs = reconcile_jobs_async
@@ -0,0 +1,173 @@
+"""
+Retry policy for Scheduler0 client requests.
+"""
+
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Optional, FrozenSet
+
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of regular traffic.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one, so
+    retries can add at most ``ratio`` extra load on top of the request rate.
+    A small time-based reserve of ``min_retries_per_second`` keeps retries
+    possible for low-traffic clients. When the budget is exhausted requests
+    fail immediately instead of joining a retry storm against a struggling
+    cluster.
+
+    A budget is thread-safe and may be shared between clients.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries_per_second: float = 1.0,
+        max_balance: float = 100.0,
+    ):
+        if ratio < 0:
+            raise ValueError("ratio must be non-negative")
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.max_balance = max_balance
+        self._lock = threading.Lock()
+        self._balance = 0.0
+        self._reserve = min_retries_per_second
+        self._reserve_updated = time.monotonic()
+
+    def record_request(self) -> None:
+        """Deposit tokens for a new (non-retry) request."""
+        with self._lock:
+            self._balance = min(self._balance + self.ratio, self.max_balance)
+
+    def try_spend(self) -> bool:
+        """Withdraw one retry; return False if the budget is exhausted."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._reserve_updated
+            self._reserve_updated = now
+            self._reserve = min(
+                self._reserve + elapsed * self.min_retries_per_second,
+                self.min_retries_per_second,
+            )
+            if self._reserve >= 1.0:
+                self._reserve -= 1.0
+                return True
+            if self._balance >= 1.0:
+                self._balance -= 1.0
+                return True
+            return False
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter for failed requests.
+
+    Attributes:
+        max_attempts: Total attempts per request, including the first one
+        backoff_base: Upper bound of the first backoff interval, in seconds
+        backoff_max: Upper bound of any backoff interval, in seconds
+        retry_statuses: HTTP status codes that are retried
+        retry_methods: HTTP methods retried automatically (idempotent reads by default)
+        retry_writes: Also retry POST/PUT/DELETE; only enable this when duplicate
+            writes are harmless for the calls you make
+        respect_retry_after: Wait for the server's Retry-After instead of the backoff
+        max_retry_after: Give up instead of waiting longer than this, in seconds
+        budget: Shared RetryBudget, or None to retry without a budget
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.1
+    backoff_max: float = 10.0
+    retry_statuses: FrozenSet[int] = DEFAULT_RETRY_STATUSES
+    retry_methods: FrozenSet[str] = IDEMPOTENT_READ_METHODS
+    retry_writes: bool = False
+    respect_retry_after: bool = True
+    max_retry_after: float = 60.0
+    budget: Optional[RetryBudget] = field(default_factory=RetryBudget)
+
+    def allows_method(self, method: str) -> bool:
+        """Return True if requests with this method may be retried."""
+        return self.retry_writes or method.upper() in self.retry_methods
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter backoff for the given zero-based retry attempt."""
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    def next_delay(
+        self,
+        method: str,
+        attempt: int,
+        status_code: Optional[int] = None,
+        retry_after: Optional[str] = None,
+    ) -> Optional[float]:
+        """
+        Decide whether to retry a failed attempt.
+
+        Args:
+            method: HTTP method of the request
+            attempt: Zero-based index of the attempt that just failed
+            status_code: Response status, or None for a connection error
+            retry_after: Value of the Retry-After response header, if any
+
+        Returns:
+            Seconds to wait before the next attempt, or None to give up
+        """
+        if attempt + 1 >= self.max_attempts or not self.allows_method(method):
+            return None
+        if status_code is not None and status_code not in self.retry_statuses:
+            return None
+
+        delay = self.backoff(attempt)
+        if retry_after and self.respect_retry_after:
+            server_delay = parse_retry_after(retry_after)
+            if server_delay is not None:
+                if server_delay > self.max_retry_after:
+                    return None
+                delay = server_delay
+
+        if self.budget is not None and not self.budget.try_spend():
+            return None
+        return delay
+
+
+def parse_retry_after(value: str, max_delay: Optional[float] = None) -> Optional[float]:
+    """
+    Parse a Retry-After header given as delta-seconds or an HTTP date.
+
+    Args:
+        value: Header value
+        max_delay: Upper bound of the returned delay, in seconds (optional)
+
+    Returns:
+        Seconds to wait, or None if the value is not a finite delay or a date
+    """
+    value = value.strip()
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at is None:
+            return None
+        delay = retry_at.timestamp() - time.time()
+    else:
+        # float() also accepts "nan" and "inf", which cannot be slept on
+        if not math.isfinite(delay):
+            return None
+    delay = max(delay, 0.0)
+    return delay if max_delay is None else min(delay, max_delay)
@@ -0,0 +1,140 @@
+"""
+Raft leader tracking for multi-node Scheduler0 clusters.
+"""
+
+import threading
+import time
+from typing import Optional, Dict, Any, List
+from urllib.parse import urlparse
+
+
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+
+class LeaderRouter:
+    """
+    Tracks which node of a Scheduler0 cluster is the raft leader.
+
+    The router performs no I/O itself: clients ask it where to send writes,
+    refresh it from ``/healthcheck`` responses when ``needs_refresh()`` is
+    True, and invalidate it when a write is redirected or fails. Followers
+    forward writes to the leader, so sending them there directly saves a
+    network hop.
+
+    Args:
+        node_urls: Base URLs of the cluster nodes (e.g. "http://node-1:7070")
+        default_url: URL used for writes while the leader is unknown
+        refresh_interval: Seconds a known leader is trusted before re-checking
+        retry_interval: Seconds to wait before re-checking after no leader was found
+        address_map: Optional mapping of raft leader address or leader ID to node URL,
+            for clusters where the raft address does not share a host with the API URL
+    """
+
+    def __init__(
+        self,
+        node_urls: List[str],
+        default_url: str,
+        refresh_interval: float = 30.0,
+        retry_interval: float = 1.0,
+        address_map: Optional[Dict[str, str]] = None,
+    ):
+        self.nodes = [url.rstrip("/") for url in node_urls]
+        for url in self.nodes:
+            if urlparse(url).scheme not in ("http", "https"):
+                raise ValueError("node URLs must include a scheme (http:// or https://)")
+        self.default_url = default_url.rstrip("/")
+        if self.default_url not in self.nodes:
+            self.nodes.insert(0, self.default_url)
+        self.refresh_interval = refresh_interval
+        self.retry_interval = retry_interval
+        self.address_map = {key: url.rstrip("/") for key, url in (address_map or {}).items()}
+        self.leader_url: Optional[str] = None
+        self.leader_id: Optional[str] = None
+        self.refresh_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._refresh_at = 0.0
+
+    def needs_refresh(self) -> bool:
+        """Return True if the leader should be (re)discovered."""
+        return time.monotonic() >= self._refresh_at
+
+    def write_base_url(self) -> str:
+        """Return the base URL writes should be sent to."""
+        return self.leader_url or self.default_url
+
+    def refresh_order(self) -> List[str]:
+        """Return the nodes to ask for the leader, last known leader first."""
+        leader = self.leader_url
+        if leader in self.nodes:
+            return [leader] + [url for url in self.nodes if url != leader]
+        return list(self.nodes)
+
+    def resolve_address(self, leader_address: str, leader_id: Optional[str] = None) -> Optional[str]:
+        """Map a raft leader address (``host:port`` or URL) to a node base URL."""
+        if leader_id and leader_id in self.address_map:
+            return self.address_map[leader_id]
+        if leader_address in self.address_map:
+            return self.address_map[leader_address]
+
+        parsed = urlparse(leader_address if "//" in leader_address else f"//{leader_address}")
+        for url in self.nodes:
+            if urlparse(url).netloc == parsed.netloc:
+                return url
+        # Raft usually listens on a different port than the API; match on host
+        host_matches = [url for url in self.nodes if urlparse(url).hostname == parsed.hostname]
+        if len(host_matches) == 1:
+            return host_matches[0]
+        return None
+
+    def update_from_healthcheck(self, payload: Any) -> bool:
+        """
+        Learn the leader from a ``/healthcheck`` response body.
+
+        Returns:
+            True if the leader was resolved to a known node
+        """
+        data = payload.get("data") if isinstance(payload, dict) else None
+        if not isinstance(data, dict) or not data.get("leaderAddress"):
+            return False
+        leader_id = data.get("leaderId")
+        url = self.resolve_address(str(data["leaderAddress"]), str(leader_id) if leader_id else None)
+        if url is None:
+            return False
+        with self._lock:
+            self.leader_url = url
+            self.leader_id = str(leader_id) if leader_id else None
+            self._refresh_at = time.monotonic() + self.refresh_interval
+        return True
+
+    def update_from_redirect(self, location: Optional[str]) -> bool:
+        """
+        Learn the leader from the Location header of a redirected write.
+
+        Returns:
+            True if the write should be re-sent to the new leader
+        """
+        if not location:
+            return False
+        parsed = urlparse(location)
+        if parsed.scheme not in ("http", "https") or not parsed.netloc:
+            return False
+        url = f"{parsed.scheme}://{parsed.netloc}"
+        with self._lock:
+            if url == self.leader_url:
+                return False
+            self.leader_url = url
+            self._refresh_at = time.monotonic() + self.refresh_interval
+        return True
+
+    def mark_unresolved(self) -> None:
+        """Record a failed discovery; writes go to the default URL until the next try."""
+        with self._lock:
+            self.leader_url = None
+            self.leader_id = None
+            self._refresh_at = time.monotonic() + self.retry_interval
+
+    def invalidate(self) -> None:
+        """Forget the current leader so the next write re-discovers it."""
+        with self._lock:
+            self._refresh_at = 0.0
@@ -0,0 +1,132 @@
+"""
+Request body serialization for Scheduler0 client.
+
+Request types are dataclasses with snake_case fields, sent as camelCase JSON
+without ``None`` values and without ``account_id`` (which travels in the
+``X-Account-ID`` header instead). Rather than reflecting over every object on
+every call, one serializer function is generated per dataclass type the first
+time it is seen, with the camelCase key table baked in. Other record types,
+such as the slotted models in ``models.py``, register their fields explicitly.
+"""
+
+import dataclasses
+import threading
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable
+
+
+# Field excluded from every request body
+EXCLUDED_FIELD = "account_id"
+
+# Values of these types are emitted as-is
+_PRIMITIVES = frozenset({str, int, float, bool})
+
+_serializers: Dict[type, Callable[[Any], Dict[str, Any]]] = {}
+_serializers_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1024)
+def to_camel_case(snake_str: str) -> str:
+    """Convert snake_case to camelCase."""
+    components = snake_str.split("_")
+    return components[0] + "".join(x.title() for x in components[1:])
+
+
+def compile_serializer(type_name: str, field_names: Iterable[str]) -> Callable[[Any], Dict[str, Any]]:
+    """Generate a serializer function reading the given attributes."""
+    lines = ["def serialize(obj):", "    result = {}"]
+    for name in field_names:
+        if name == EXCLUDED_FIELD:
+            continue
+        lines.append(f"    value = obj.{name}")
+        lines.append("    if value is not None:")
+        lines.append(
+            f"        result[{to_camel_case(name)!r}] = "
+            "value if value.__class__ in _PRIMITIVES else serialize_value(value)"
+        )
+    lines.append("    return result")
+
+    namespace: Dict[str, Any] = {"_PRIMITIVES": _PRIMITIVES, "serialize_value": serialize_value}
+    exec("\n".join(lines), namespace)
+    serialize = namespace["serialize"]
+    serialize.__qualname__ = f"serialize_{type_name}"
+    return serialize
+
+
+def register_serializer(cls: type, field_names: Iterable[str]) -> None:
+    """Register a non-dataclass record type (such as a slotted model) for serialization."""
+    with _serializers_lock:
+        _serializers[cls] = compile_serializer(cls.__name__, field_names)
+
+
+def serializer_for(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    """Return the cached serializer for a dataclass type, compiling it on first use."""
+    serialize = _serializers.get(cls)
+    if serialize is None:
+        with _serializers_lock:
+            serialize = _serializers.get(cls)
+            if serialize is None:
+                serialize = compile_serializer(cls.__name__, [f.name for f in dataclasses.fields(cls)])
+                _serializers[cls] = serialize
+    return serialize
+
+
+def serialize_body(body: Any) -> Any:
+    """Serialize request body to JSON-serializable format."""
+    if body is None:
+        return None
+
+    # Handle dataclasses and registered record types
+    serialize = _serializers.get(body.__class__)
+    if serialize is not None:
+        return serialize(body)
+    if hasattr(body, "__dataclass_fields__"):
+        return serializer_for(body.__class__)(body)
+
+    # Handle lists, typically a batch of one request type
+    if isinstance(body, list):
+        return [serialize_body(item) for item in body]
+
+    # Handle dictionaries
+    if isinstance(body, dict):
+        result = {}
+        for key, value in body.items():
+            if key != EXCLUDED_FIELD and value is not None:
+                camel_key = to_camel_case(key) if isinstance(key, str) else key
+                result[camel_key] = serialize_value(value)
+        return result
+
+    # Handle regular objects with __dict__
+    if hasattr(body, "__dict__"):
+        result = {}
+        for key, value in body.__dict__.items():
+            if key != EXCLUDED_FIELD and value is not None:
+                result[to_camel_case(key)] = serialize_value(value)
+        return result
+
+    # Handle primitive types
+    return body
+
+
+def serialize_value(value: Any) -> Any:
+    """Recursively serialize a value nested inside a request body."""
+    if value is None or value.__class__ in _PRIMITIVES:
+        return value
+
+    # Handle dataclasses and registered record types
+    serialize = _serializers.get(value.__class__)
+    if serialize is not None:
+        return serialize(value)
+    if hasattr(value, "__dataclass_fields__"):
+        return serializer_for(value.__class__)(value)
+
+    # Handle lists
+    if isinstance(value, list):
+        return [serialize_value(item) for item in value]
+
+    # Handle dictionaries
+    if isinstance(value, dict):
+        return {k: serialize_value(v) for k, v in value.items()}
+
+    # Handle primitive types
+    return value
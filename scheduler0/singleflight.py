@@ -0,0 +1,119 @@
+"""
+Coalescing of identical concurrent GET requests for Scheduler0 client.
+
+When many threads or coroutines ask for the same resource at once (for
+example right after a cache entry expires), only the first caller sends the
+request; the others wait for it and share its decoded result or error. A
+request is identified by path, query parameters and account ID. Callers that
+arrive after the request finished send a new one: nothing is cached here.
+"""
+
+import asyncio
+import copy
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+def _share(value: Any) -> Any:
+    # Followers get their own copy of plain containers; typed models are immutable
+    return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Any = None
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time across threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Call fn, or wait for the identical call already in flight.
+
+        Args:
+            key: Identity of the call
+            fn: Function performing the call
+
+        Returns:
+            fn's result (a copy for callers that joined an in-flight call)
+
+        Raises:
+            Whatever fn raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.coalesced += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return _share(call.result)
+        try:
+            call.result = fn()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of calls made and of callers that joined one."""
+        with self._lock:
+            return {"calls": self.calls, "coalesced": self.coalesced, "in_flight": len(self._calls)}
+
+
+class AsyncSingleFlight:
+    """Runs at most one call per key at a time on an event loop."""
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await fn(), or the identical call already in flight.
+
+        The call runs as its own task, so cancelling one caller does not
+        cancel it for the others.
+        """
+        task = self._calls.get(key)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            self.coalesced += 1
+            return _share(await asyncio.shield(task))
+        task = asyncio.ensure_future(fn())
+        self._calls[key] = task
+        self.calls += 1
+
+        def finished(_: Any) -> None:
+            if self._calls.get(key) is task:
+                del self._calls[key]
+            if not task.cancelled():
+                # Mark the error retrieved even if every caller was cancelled
+                task.exception()
+
+        task.add_done_callback(finished)
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of calls made and of callers that joined one."""
+        return {"calls": self.calls, "coalesced": self.coalesced, "in_flight": len(self._calls)}
@@ -30,9 +30,25 @@ setup(
         "requests>=2.28.0",
     ],
     extras_require={
+        "async": [
+            "httpx>=0.24.0",
+        ],
+        "orjson": [
+            "orjson>=3.6.0",
+        ],
+        "parquet": [
+            "pyarrow>=8.0.0",
+        ],
+        "analytics": [
+            "numpy>=1.20.0",
+        ],
+        "otel": [
+            "opentelemetry-api>=1.12.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
+            "httpx>=0.24.0",
         ],
     },
 )
@@ -54,6 +54,22 @@ def basic_auth_client(base_url):
     )
 
 
+class FakeClock:
+    """Time source for components taking a clock function; advance it by changing now."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Create a fake clock starting at 0."""
+    return FakeClock()
+
+
 @pytest.fixture
 def mock_response():
     """Create a mock response object."""
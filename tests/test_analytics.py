@@ -0,0 +1,212 @@
+"""
+Tests for NumPy analytics series.
+"""
+
+import asyncio
+import datetime
+import threading
+
+import pytest
+from unittest.mock import Mock, patch
+
+np = pytest.importorskip("numpy")
+
+from scheduler0 import AnalyticsSeries, Client
+from scheduler0.analytics import AnalyticsCollector
+
+
+START = datetime.datetime(2025, 1, 1)
+
+
+def counts(minute):
+    """Deterministic counters of one minute."""
+    return {"scheduled": minute % 7, "success": minute % 5, "failed": minute % 3}
+
+
+class FakeAnalyticsServer:
+    """Serves /executions/analytics, answering at most span_minutes per call."""
+
+    def __init__(self, span_minutes):
+        self.span = span_minutes
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def response(self, params):
+        with self.lock:
+            self.calls.append((params["startDate"], params["startTime"]))
+        first = datetime.datetime.fromisoformat(f"{params['startDate']}T{params['startTime']}")
+        points = []
+        for offset in range(self.span):
+            moment = first + datetime.timedelta(minutes=offset)
+            minute = int((moment - START).total_seconds() // 60)
+            points.append({"date": moment.strftime("%Y-%m-%d"), "time": moment.strftime("%H:%M:%S"), **counts(minute)})
+        last = first + datetime.timedelta(minutes=self.span - 1)
+        return {
+            "success": True,
+            "data": {
+                "accountId": 123,
+                "timezone": "UTC",
+                "startDate": params["startDate"],
+                "startTime": params["startTime"],
+                "endDate": last.strftime("%Y-%m-%d"),
+                "endTime": last.strftime("%H:%M:59"),
+                "points": points,
+            },
+        }
+
+    def get(self, endpoint, params, account_id_override):
+        assert endpoint == "/executions/analytics"
+        return self.response(params)
+
+
+class TestAnalyticsSeries:
+    """Test series operations."""
+
+    def make_series(self, minutes=3 * 24 * 60):
+        values = [counts(m) for m in range(minutes)]
+        return AnalyticsSeries(
+            np.datetime64("2025-01-01T00:00"),
+            np.array([v["scheduled"] for v in values]),
+            np.array([v["success"] for v in values]),
+            np.array([v["failed"] for v in values]),
+        )
+
+    def test_rollup_hour_and_day(self):
+        """Test rollups sum into calendar hours and days."""
+        series = self.make_series()
+        hourly = series.rollup("hour")
+        daily = series.rollup("day")
+        assert len(hourly) == 72
+        assert len(daily) == 3
+        assert hourly.scheduled[1] == sum(counts(m)["scheduled"] for m in range(60, 120))
+        assert daily.failed.sum() == series.failed.sum()
+        assert str(daily.timestamps[2]) == "2025-01-03"
+
+    def test_rollup_partial_bucket(self):
+        """Test a series starting mid-hour rolls up into calendar hours."""
+        series = AnalyticsSeries(np.datetime64("2025-01-01T00:30"), np.ones(60, dtype=np.int64), np.zeros(60, dtype=np.int64), np.zeros(60, dtype=np.int64))
+        hourly = series.rollup("hour")
+        assert list(hourly.scheduled) == [30, 30]
+        assert str(hourly.start) == "2025-01-01T00"
+
+    def test_failure_rate(self):
+        """Test failure rate is NaN where nothing finished."""
+        series = AnalyticsSeries(np.datetime64("2025-01-01T00:00"), np.array([1, 1]), np.array([3, 0]), np.array([1, 0]))
+        rate = series.failure_rate()
+        assert rate[0] == 0.25
+        assert np.isnan(rate[1])
+        assert series.percentile(50, "failure_rate") == 0.25
+
+    def test_percentiles_and_totals(self):
+        """Test percentiles and totals over the counters."""
+        series = self.make_series(minutes=100)
+        assert series.percentile(100, "scheduled") == 6
+        assert list(series.percentile([0, 100], "failed")) == [0, 2]
+        assert series.totals()["success"] == sum(counts(m)["success"] for m in range(100))
+        with pytest.raises(ValueError):
+            series.percentile(50, "unknown")
+
+    def test_invalid_rollup(self):
+        """Test unknown rollup units are rejected."""
+        with pytest.raises(ValueError):
+            self.make_series(10).rollup("week")
+
+
+class TestAnalyticsCollector:
+    """Test window planning and stitching."""
+
+    def test_windows(self):
+        """Test the range is split into windows, the last one truncated."""
+        collector = AnalyticsCollector("2025-01-01T00:00", "2025-01-01T05:00", window_minutes=120)
+        assert [(str(a), str(b)) for a, b in collector.windows()] == [
+            ("2025-01-01T00:00", "2025-01-01T02:00"),
+            ("2025-01-01T02:00", "2025-01-01T04:00"),
+            ("2025-01-01T04:00", "2025-01-01T05:00"),
+        ]
+
+    def test_ignores_points_outside_range(self):
+        """Test points before start or after end are dropped."""
+        collector = AnalyticsCollector("2025-01-01T00:10", "2025-01-01T00:20")
+        collector.add({"data": {"points": [
+            {"date": "2025-01-01", "time": "00:05:00", "scheduled": 9, "success": 0, "failed": 0},
+            {"date": "2025-01-01", "time": "00:10:00", "scheduled": 1, "success": 0, "failed": 0},
+            {"date": "2025-01-01", "time": "00:25:00", "scheduled": 9, "success": 0, "failed": 0},
+        ]}})
+        assert collector.series().scheduled.sum() == 1
+
+    def test_invalid_range(self):
+        """Test end must follow start."""
+        with pytest.raises(ValueError):
+            AnalyticsCollector("2025-01-02T00:00", "2025-01-01T00:00")
+
+
+class TestGetAnalyticsSeries:
+    """Test Client.get_analytics_series."""
+
+    @patch('scheduler0.client.Client._get')
+    def test_stitches_concurrent_windows(self, mock_get, client):
+        """Test windows are fetched and stitched into one contiguous series."""
+        server = FakeAnalyticsServer(span_minutes=24 * 60)
+        mock_get.side_effect = server.get
+
+        series = client.get_analytics_series("2025-01-01T00:00", "2025-01-08T00:00", max_workers=4)
+
+        assert len(series) == 7 * 24 * 60
+        assert series.timezone == "UTC"
+        assert len(server.calls) == 7
+        expected = np.array([counts(m)["scheduled"] for m in range(len(series))])
+        assert np.array_equal(series.scheduled, expected)
+
+    @patch('scheduler0.client.Client._get')
+    def test_follows_up_short_windows(self, mock_get, client):
+        """Test the rest of a window is requested when the server answers a shorter range."""
+        server = FakeAnalyticsServer(span_minutes=6 * 60)
+        mock_get.side_effect = server.get
+
+        series = client.get_analytics_series(START, START + datetime.timedelta(days=1))
+
+        assert len(server.calls) == 4
+        assert series.failed.sum() == sum(counts(m)["failed"] for m in range(24 * 60))
+
+    @patch('scheduler0.client.Client._get')
+    def test_passes_account(self, mock_get, client):
+        """Test the account ID is sent with every window."""
+        server = FakeAnalyticsServer(span_minutes=60)
+        mock_get.side_effect = server.get
+
+        client.get_analytics_series("2025-01-01T00:00", "2025-01-01T02:00", window_minutes=60, account_id=42)
+
+        assert {call[1]["account_id_override"] for call in mock_get.call_args_list} == {"42"}
+
+    def test_typed_client(self, base_url):
+        """Test typed responses are stitched like raw payloads."""
+        client = Client(base_url=base_url, typed=True)
+        server = FakeAnalyticsServer(span_minutes=60)
+
+        def request(method, endpoint, params=None, **kwargs):
+            response = Mock(status_code=200)
+            response.json.return_value = server.response(params)
+            return response
+
+        with patch.object(client, "_request", side_effect=request):
+            series = client.get_analytics_series("2025-01-01T00:00", "2025-01-01T01:00", window_minutes=60)
+        assert series.scheduled.sum() == sum(counts(m)["scheduled"] for m in range(60))
+
+    def test_async(self):
+        """Test AsyncClient.get_analytics_series."""
+        httpx = pytest.importorskip("httpx")
+        from scheduler0 import AsyncClient
+
+        server = FakeAnalyticsServer(span_minutes=12 * 60)
+
+        def handler(request):
+            return httpx.Response(200, json=server.response(dict(request.url.params)))
+
+        async def run():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncClient("http://localhost:7070", account_id="123", http_client=http_client) as client:
+                return await client.get_analytics_series("2025-01-01T00:00", "2025-01-03T00:00", max_workers=2)
+
+        series = asyncio.run(run())
+        assert len(server.calls) == 4
+        assert series.rollup("day").success.sum() == sum(counts(m)["success"] for m in range(2 * 24 * 60))
@@ -0,0 +1,162 @@
+"""
+Tests for the persistent analytics cache.
+"""
+
+import datetime
+
+import pytest
+from unittest.mock import patch
+
+np = pytest.importorskip("numpy")
+
+from scheduler0 import AnalyticsCache
+from .test_analytics import START, FakeAnalyticsServer, counts
+
+
+def minutes(start, count):
+    return np.datetime64(start, "m") + np.arange(count)
+
+
+def values(count, scale=1):
+    return {
+        "scheduled": np.arange(count, dtype=np.int64) * scale,
+        "success": np.ones(count, dtype=np.int64),
+        "failed": np.zeros(count, dtype=np.int64),
+    }
+
+
+class TestAnalyticsCache:
+    """Test storage, eviction and statistics."""
+
+    def test_store_and_load(self):
+        """Test stored minutes are loaded back within the requested range."""
+        cache = AnalyticsCache()
+        assert cache.store("a", "UTC", minutes("2025-01-01T00:00", 10), values(10)) == 10
+
+        loaded, counters = cache.load("a", "UTC", np.datetime64("2025-01-01T00:02"), np.datetime64("2025-01-01T00:05"))
+
+        assert [str(m) for m in loaded] == ["2025-01-01T00:02", "2025-01-01T00:03", "2025-01-01T00:04"]
+        assert list(counters["scheduled"]) == [2, 3, 4]
+
+    def test_keys_by_account_and_timezone(self):
+        """Test minutes of other accounts or timezones are not returned."""
+        cache = AnalyticsCache()
+        cache.store("a", "UTC", minutes("2025-01-01T00:00", 5), values(5))
+        start, end = np.datetime64("2025-01-01T00:00"), np.datetime64("2025-01-01T00:05")
+
+        assert len(cache.load("b", "UTC", start, end)[0]) == 0
+        assert len(cache.load("a", "Europe/Paris", start, end)[0]) == 0
+
+    def test_open_minutes_are_not_stored(self):
+        """Test minutes that may still change are skipped."""
+        cache = AnalyticsCache(settle_seconds=0)
+        now = np.datetime64(datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None), "m")
+
+        stored = cache.store("a", "UTC", now - 5 + np.arange(10), values(10))
+
+        assert stored == 5
+
+    def test_hits_and_misses(self):
+        """Test hits and misses are counted in minutes."""
+        cache = AnalyticsCache()
+        cache.store("a", "UTC", minutes("2025-01-01T00:00", 30), values(30))
+
+        cache.load("a", "UTC", np.datetime64("2025-01-01T00:00"), np.datetime64("2025-01-01T01:00"))
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["rows"]) == (30, 30, 30)
+        assert stats["hit_rate"] == 0.5
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used minutes are evicted past max_bytes."""
+        cache = AnalyticsCache(max_bytes=256 * 1024)
+        cache.store("old", "UTC", minutes("2025-01-01T00:00", 1000), values(1000))
+        cache.store("new", "UTC", minutes("2025-01-01T00:00", 1000), values(1000))
+        cache.load("old", "UTC", np.datetime64("2025-01-01T00:00"), np.datetime64("2025-01-01T00:01"))
+
+        for day in range(2, 6):
+            cache.store("bulk", "UTC", minutes(f"2025-01-{day:02d}T00:00", 1000), values(1000))
+
+        stats = cache.stats()
+        assert stats["evictions"] > 1000
+        assert stats["size_bytes"] <= cache.max_bytes
+        start, end = np.datetime64("2025-01-01T00:00"), np.datetime64("2025-01-02T00:00")
+        assert len(cache.load("old", "UTC", start, end)[0]) == 1
+        assert len(cache.load("new", "UTC", start, end)[0]) < 1000
+        assert len(cache.load("bulk", "UTC", np.datetime64("2025-01-05T00:00"), np.datetime64("2025-01-06T00:00"))[0]) == 1000
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test a file cache is reopened with its minutes and timezones."""
+        path = str(tmp_path / "cache" / "analytics.db")
+        with AnalyticsCache(path) as cache:
+            cache.set_timezone("a", "UTC")
+            cache.store("a", "UTC", minutes("2025-01-01T00:00", 3), values(3))
+
+        with AnalyticsCache(path) as cache:
+            assert cache.timezone("a") == "UTC"
+            loaded, _ = cache.load("a", "UTC", np.datetime64("2025-01-01T00:00"), np.datetime64("2025-01-02T00:00"))
+            assert len(loaded) == 3
+
+    def test_clear(self):
+        """Test clear removes minutes and resets counters."""
+        cache = AnalyticsCache()
+        cache.store("a", "UTC", minutes("2025-01-01T00:00", 3), values(3))
+        cache.load("a", "UTC", np.datetime64("2025-01-01T00:00"), np.datetime64("2025-01-01T00:03"))
+
+        cache.clear()
+
+        assert cache.stats() == {"hits": 0, "misses": 0, "hit_rate": 0.0, "rows": 0, "size_bytes": cache.stats()["size_bytes"], "evictions": 0}
+
+    def test_requires_numpy(self):
+        """Test a clear error is raised without numpy."""
+        with patch("scheduler0.analytics_cache.np", None):
+            with pytest.raises(ImportError, match="numpy"):
+                AnalyticsCache()
+
+
+class TestCachedAnalyticsSeries:
+    """Test get_analytics_series with a cache."""
+
+    @patch('scheduler0.client.Client._get')
+    def test_second_call_fetches_nothing(self, mock_get, client):
+        """Test closed minutes are served from the cache on the next call."""
+        server = FakeAnalyticsServer(span_minutes=24 * 60)
+        mock_get.side_effect = server.get
+        cache = AnalyticsCache()
+
+        first = client.get_analytics_series(START, START + datetime.timedelta(days=2), cache=cache)
+        calls = len(server.calls)
+        second = client.get_analytics_series(START, START + datetime.timedelta(days=2), cache=cache)
+
+        assert calls == 2
+        assert len(server.calls) == calls
+        assert np.array_equal(first.scheduled, second.scheduled)
+        assert second.timezone == "UTC"
+        assert cache.stats()["hits"] == 2 * 24 * 60
+
+    @patch('scheduler0.client.Client._get')
+    def test_fetches_only_missing_minutes(self, mock_get, client):
+        """Test only the minutes outside the cached range are requested."""
+        server = FakeAnalyticsServer(span_minutes=24 * 60)
+        mock_get.side_effect = server.get
+        cache = AnalyticsCache()
+        client.get_analytics_series(START, START + datetime.timedelta(days=1), cache=cache)
+        server.calls.clear()
+
+        series = client.get_analytics_series(START, START + datetime.timedelta(days=1, hours=6), cache=cache)
+
+        assert server.calls == [("2025-01-02", "00:00:00")]
+        expected = np.array([counts(m)["failed"] for m in range(30 * 60)])
+        assert np.array_equal(series.failed, expected)
+
+    @patch('scheduler0.client.Client._get')
+    def test_keys_by_account(self, mock_get, client):
+        """Test another account does not read the first account's minutes."""
+        server = FakeAnalyticsServer(span_minutes=60)
+        mock_get.side_effect = server.get
+        cache = AnalyticsCache()
+
+        client.get_analytics_series("2025-01-01T00:00", "2025-01-01T01:00", cache=cache)
+        client.get_analytics_series("2025-01-01T00:00", "2025-01-01T01:00", account_id=42, cache=cache)
+
+        assert len(server.calls) == 2
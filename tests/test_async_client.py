@@ -0,0 +1,272 @@
+"""
+Tests for the asyncio AsyncClient.
+"""
+
+import asyncio
+import json
+
+import pytest
+import requests
+
+httpx = pytest.importorskip("httpx")
+
+from scheduler0 import AsyncClient, Client, NewAsyncClient, RetryPolicy
+from scheduler0.types import (
+    CredentialArchiveRequestBody,
+    JobDeleteRequestBody,
+    JobRequestBody,
+    PromptJobRequest,
+)
+
+
+def make_client(handler, **kwargs):
+    """Create an AsyncClient whose requests are answered by handler."""
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncClient(
+        base_url="http://localhost:7070",
+        version="v1",
+        api_key="test-api-key",
+        api_secret="test-api-secret",
+        account_id="123",
+        http_client=http_client,
+        **kwargs,
+    )
+
+
+class TestAsyncClient:
+    """Test AsyncClient behavior."""
+
+    def test_exposes_same_methods_as_client(self):
+        """Test every public resource method on Client is available on AsyncClient."""
+        sync_methods = {
+            name for name, value in vars(Client).items()
+            if not name.startswith("_") and getattr(value, "__module__", None) != "scheduler0.client"
+        }
+        async_methods = {name for name in vars(AsyncClient) if not name.startswith("_")}
+        assert sync_methods <= async_methods
+
+    def test_new_async_client_factory(self):
+        """Test NewAsyncClient factory function."""
+        client = NewAsyncClient("http://localhost:7070", "v1", api_key="key", api_secret="secret")
+        assert isinstance(client, AsyncClient)
+        assert client.api_key == "key"
+        asyncio.run(client.aclose())
+
+    def test_invalid_url(self):
+        """Test AsyncClient validates the base URL like Client."""
+        with pytest.raises(ValueError, match="base_url must include a scheme"):
+            AsyncClient(base_url="localhost:7070")
+
+    def test_get_sends_auth_headers(self):
+        """Test GET requests carry authentication and account headers."""
+        seen = {}
+
+        def handler(request):
+            seen["url"] = str(request.url)
+            seen["headers"] = request.headers
+            return httpx.Response(200, json={"success": True, "data": {"id": 1}})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.get_job("1")
+
+        result = asyncio.run(run())
+        assert result["data"]["id"] == 1
+        assert seen["url"] == "http://localhost:7070/api/v1/jobs/1"
+        assert seen["headers"]["X-API-Key"] == "test-api-key"
+        assert seen["headers"]["X-Secret-Key"] == "test-api-secret"
+        assert seen["headers"]["X-Account-ID"] == "123"
+
+    def test_batch_create_serializes_body(self):
+        """Test request bodies use the shared camelCase serialization."""
+        seen = {}
+
+        def handler(request):
+            seen["body"] = json.loads(request.content)
+            seen["account"] = request.headers.get("X-Account-ID")
+            return httpx.Response(202, json={"success": True, "data": "request-id"})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.batch_create_jobs(
+                    [JobRequestBody(project_id=1, timezone="UTC", created_by="user")],
+                    account_id_override="456",
+                )
+
+        result = asyncio.run(run())
+        assert result["data"] == "request-id"
+        assert seen["body"] == [{"projectId": 1, "timezone": "UTC", "createdBy": "user"}]
+        assert seen["account"] == "456"
+
+    def test_list_params(self):
+        """Test list methods send pagination parameters."""
+        seen = {}
+
+        def handler(request):
+            seen["params"] = dict(request.url.params)
+            return httpx.Response(200, json={"success": True, "data": {"total": 0, "executions": []}})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.list_executions(limit=5, offset=10, state="failed")
+
+        asyncio.run(run())
+        assert seen["params"] == {"limit": "5", "offset": "10", "state": "failed"}
+
+    def test_iter_jobs(self):
+        """Test iter_jobs is an async iterator over every page."""
+        offsets = []
+
+        def handler(request):
+            offset = int(request.url.params["offset"])
+            offsets.append(offset)
+            jobs = [{"id": i} for i in range(offset, min(offset + 2, 5))]
+            return httpx.Response(200, json={"success": True, "data": {"total": 5, "jobs": jobs}})
+
+        async def run():
+            async with make_client(handler) as client:
+                return [job["id"] async for job in client.iter_jobs(page_size=2)]
+
+        assert asyncio.run(run()) == [0, 1, 2, 3, 4]
+        assert offsets == [0, 2, 4]
+
+    def test_delete_and_archive_return_none(self):
+        """Test methods without a response body resolve to None."""
+        def handler(request):
+            return httpx.Response(204)
+
+        async def run():
+            async with make_client(handler) as client:
+                deleted = await client.delete_job("1", JobDeleteRequestBody(deleted_by="user"))
+                archived = await client.archive_credential("1", CredentialArchiveRequestBody(archived_by="user"))
+                await client.add_all_features_to_account("1")
+                return deleted, archived
+
+        assert asyncio.run(run()) == (None, None)
+
+    def test_create_job_from_prompt(self):
+        """Test the prompt endpoint returns the raw list."""
+        def handler(request):
+            return httpx.Response(200, json=[{"kind": "email", "cronExpression": "0 9 * * 1"}])
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.create_job_from_prompt(PromptJobRequest(prompt="weekly"))
+
+        result = asyncio.run(run())
+        assert result[0]["cronExpression"] == "0 9 * * 1"
+
+    def test_http_error(self):
+        """Test API errors raise requests.HTTPError like the sync client."""
+        def handler(request):
+            return httpx.Response(400, json={"message": "Invalid request"})
+
+        async def run():
+            async with make_client(handler) as client:
+                await client.list_jobs()
+
+        with pytest.raises(requests.HTTPError) as exc_info:
+            asyncio.run(run())
+        assert "Invalid request" in str(exc_info.value)
+        assert exc_info.value.response.status_code == 400
+
+    def test_follows_redirects_like_client(self):
+        """Test a redirected GET is followed, as the requests Session of Client does."""
+        def handler(request):
+            if request.url.path == "/api/v1/jobs/1":
+                return httpx.Response(307, headers={"Location": "http://localhost:7070/api/v1/jobs/2"})
+            return httpx.Response(200, json={"data": {"id": 2}})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await client.get_job("1")
+
+        assert asyncio.run(run()) == {"data": {"id": 2}}
+
+    def test_concurrent_requests(self):
+        """Test many requests can be in flight on one event loop."""
+        in_flight = {"current": 0, "peak": 0}
+
+        async def handler(request):
+            in_flight["current"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+            await asyncio.sleep(0.01)
+            in_flight["current"] -= 1
+            return httpx.Response(200, json={"success": True})
+
+        async def run():
+            async with make_client(handler) as client:
+                return await asyncio.gather(*(client.healthcheck() for _ in range(50)))
+
+        results = asyncio.run(run())
+        assert len(results) == 50
+        assert in_flight["peak"] > 1
+
+    def test_retry_policy(self):
+        """Test the retry policy applies to async requests."""
+        statuses = [503, 200]
+
+        def handler(request):
+            return httpx.Response(statuses.pop(0), json={"success": True})
+
+        async def run():
+            policy = RetryPolicy(backoff_base=0.001, budget=None)
+            async with make_client(handler, retry_policy=policy) as client:
+                return await client.healthcheck()
+
+        assert asyncio.run(run()) == {"success": True}
+        assert statuses == []
+
+    def test_leader_routing(self):
+        """Test writes are sent to the raft leader in multi-node mode."""
+        seen = []
+
+        def handler(request):
+            if request.url.path == "/api/v1/healthcheck":
+                return httpx.Response(200, json={"data": {"leaderAddress": "node-2:7071", "leaderId": "2"}})
+            seen.append((request.method, request.url.host))
+            return httpx.Response(200, json={"success": True})
+
+        async def run():
+            nodes = ["http://localhost:7070", "http://node-2:7070"]
+            async with make_client(handler, node_urls=nodes) as client:
+                await client.list_jobs()
+                await client._put("/jobs/1", {"status": "inactive"})
+
+        asyncio.run(run())
+        assert seen == [("GET", "localhost"), ("PUT", "node-2")]
+
+    def test_leader_probe_is_authenticated(self):
+        """Test the /healthcheck probe sends the same credentials as other requests."""
+        probes = []
+
+        def handler(request):
+            if request.url.path == "/api/v1/healthcheck":
+                probes.append(request.headers)
+                return httpx.Response(200, json={"data": {"leaderAddress": "node-2:7071", "leaderId": "2"}})
+            return httpx.Response(204)
+
+        async def run():
+            nodes = ["http://localhost:7070", "http://node-2:7070"]
+            async with make_client(handler, node_urls=nodes) as client:
+                await client._delete("/jobs/1")
+
+        asyncio.run(run())
+        assert probes[0]["X-API-Key"] == "test-api-key"
+        assert probes[0]["X-Account-ID"] == "123"
+
+    def test_redirect_to_same_leader_raises(self):
+        """Test a write redirected back to the leader it was sent to raises HTTPError."""
+        def handler(request):
+            if request.url.path == "/api/v1/healthcheck":
+                return httpx.Response(200, json={"data": {"leaderAddress": "node-2:7071", "leaderId": "2"}})
+            return httpx.Response(307, headers={"Location": "http://node-2:7070/api/v1/jobs/1"})
+
+        async def run():
+            nodes = ["http://localhost:7070", "http://node-2:7070"]
+            async with make_client(handler, node_urls=nodes) as client:
+                await client._put("/jobs/1", {"status": "inactive"})
+
+        with pytest.raises(requests.HTTPError) as exc_info:
+            asyncio.run(run())
+        assert exc_info.value.response.status_code == 307
@@ -2,9 +2,17 @@
 Tests for async task management methods.
 """
 
+import asyncio
+import threading
+import time
+
 import pytest
+import requests
 from unittest.mock import patch
 
+from scheduler0 import AsyncTaskState, AsyncTaskTracker, models
+from scheduler0.async_tasks import PollSchedule, task_state
+
 
 class TestAsyncTasks:
     """Test async task management methods."""
@@ -27,3 +35,225 @@ class TestAsyncTasks:
             "/async-tasks/req-123", params=None, account_id_override=None
         )
 
+
+
+class FakeTaskServer:
+    """Serves /async-tasks/{id}; each task advances one state per poll until it reaches its outcome."""
+
+    def __init__(self, outcomes, polls_in_progress=1, delay=0.002):
+        self.outcomes = outcomes
+        self.polls_in_progress = polls_in_progress
+        self.delay = delay
+        self.polls = {request_id: 0 for request_id in outcomes}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def response(self, request_id):
+        with self.lock:
+            self.polls[request_id] += 1
+            count = self.polls[request_id]
+        state = 0 if count == 1 else 1 if count <= 1 + self.polls_in_progress else self.outcomes[request_id]
+        return {"success": True, "data": {"id": 1, "requestId": request_id, "state": state}}
+
+    def get(self, endpoint, params, account_id_override):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            return self.response(endpoint.rsplit("/", 1)[1])
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class TestPollSchedule:
+    """Test per-task poll scheduling."""
+
+    def test_backs_off_while_state_is_unchanged(self):
+        """Test the interval grows while the state repeats and resets when it changes."""
+        schedule = PollSchedule(min_interval=1.0, max_interval=5.0, backoff=2.0)
+        schedule.add("a", 0.0)
+        assert schedule.due(0.0, 10) == ["a"]
+
+        schedule.polled("a", AsyncTaskState.NOT_STARTED, 0.0)
+        assert schedule.next_time() == 1.0
+        schedule.due(1.0, 10)
+        schedule.polled("a", AsyncTaskState.NOT_STARTED, 1.0)
+        assert schedule.next_time() == 3.0
+        schedule.due(3.0, 10)
+        schedule.polled("a", AsyncTaskState.NOT_STARTED, 3.0)
+        schedule.due(7.0, 10)
+        schedule.polled("a", AsyncTaskState.NOT_STARTED, 7.0)
+        assert schedule.next_time() == 12.0
+
+        schedule.due(12.0, 10)
+        schedule.polled("a", AsyncTaskState.IN_PROGRESS, 12.0)
+        assert schedule.next_time() == 13.0
+
+    def test_due_respects_limit(self):
+        """Test no more than limit tasks are handed out at once."""
+        schedule = PollSchedule(1.0, 5.0, 2.0)
+        for request_id in "abc":
+            schedule.add(request_id, 0.0)
+        assert schedule.due(0.0, 2) == ["a", "b"]
+        assert schedule.due(0.0, 2) == ["c"]
+
+
+class TestAsyncTaskTracker:
+    """Test tracking request IDs to completion."""
+
+    @patch('scheduler0.client.Client._get')
+    def test_futures_resolve_to_finished_tasks(self, mock_get, client):
+        """Test each future resolves to its task once it succeeds or fails."""
+        outcomes = {f"req-{i}": 2 if i % 4 else 3 for i in range(50)}
+        server = FakeTaskServer(outcomes)
+        mock_get.side_effect = server.get
+
+        with AsyncTaskTracker(client, max_in_flight=4, min_interval=0.001) as tracker:
+            futures = tracker.track_many(outcomes)
+
+        assert {request_id: future.result()["state"] for request_id, future in futures.items()} == outcomes
+        assert server.max_in_flight <= 4
+        assert all(count == 3 for count in server.polls.values())
+        stats = tracker.stats()
+        assert (stats["succeeded"], stats["failed"], stats["pending"]) == (37, 13, 0)
+        assert stats["polls"] == 150
+
+    @patch('scheduler0.client.Client._get')
+    def test_callbacks(self, mock_get, client):
+        """Test callbacks receive the request ID and the done future."""
+        server = FakeTaskServer({"req-1": 2})
+        mock_get.side_effect = server.get
+        finished = []
+
+        with AsyncTaskTracker(client, min_interval=0.001) as tracker:
+            tracker.track("req-1", callback=lambda request_id, future: finished.append((request_id, future.result()["state"])))
+
+        assert finished == [("req-1", 2)]
+
+    @patch('scheduler0.client.Client._get')
+    def test_callbacks_run_outside_the_lock(self, mock_get, client):
+        """Test callbacks may use the tracker from other threads without deadlocking."""
+        server = FakeTaskServer({"req-1": 2, "req-2": 3})
+        mock_get.side_effect = server.get
+        blocked = []
+
+        def callback(request_id, future):
+            reader = threading.Thread(target=tracker.pending)
+            reader.start()
+            reader.join(timeout=1)
+            blocked.append(reader.is_alive())
+
+        with AsyncTaskTracker(client, min_interval=0.001) as tracker:
+            tracker.track_many(["req-1", "req-2"], callback=callback)
+
+        assert blocked == [False, False]
+
+    @patch('scheduler0.client.Client._get')
+    def test_many_timeouts(self, mock_get, client):
+        """Test deadlines of many tasks expire from the heap and wait() sees the pending count drop."""
+        server = FakeTaskServer({f"req-{i}": 2 for i in range(500)}, polls_in_progress=1000)
+        mock_get.side_effect = server.get
+
+        with AsyncTaskTracker(client, max_in_flight=4, min_interval=0.01, timeout=0.05) as tracker:
+            futures = tracker.track_many(server.outcomes)
+
+        assert tracker.pending() == 0
+        assert all(isinstance(future.exception(), TimeoutError) for future in futures.values())
+
+    @patch('scheduler0.client.Client._get')
+    def test_idle_while_saturated(self, mock_get, client):
+        """Test the loop sleeps rather than spins while every poll slot is taken."""
+        server = FakeTaskServer({f"req-{i}": 2 for i in range(10)}, polls_in_progress=0, delay=0.2)
+        mock_get.side_effect = server.get
+
+        started, cpu_started = time.monotonic(), time.process_time()
+        with AsyncTaskTracker(client, max_in_flight=2, min_interval=0.001) as tracker:
+            tracker.track_many(server.outcomes)
+        wall, cpu = time.monotonic() - started, time.process_time() - cpu_started
+
+        assert tracker.stats()["succeeded"] == 10
+        assert cpu < wall / 4
+
+    @patch('scheduler0.client.Client._get')
+    def test_poll_errors_fail_the_future(self, mock_get, client):
+        """Test a poll error is raised from the task's future."""
+        mock_get.side_effect = requests.HTTPError("404 Not Found")
+
+        with AsyncTaskTracker(client) as tracker:
+            future = tracker.track("missing")
+
+        with pytest.raises(requests.HTTPError):
+            future.result()
+
+    @patch('scheduler0.client.Client._get')
+    def test_timeout(self, mock_get, client):
+        """Test tasks not finished in time fail with TimeoutError."""
+        server = FakeTaskServer({"slow": 2}, polls_in_progress=1000)
+        mock_get.side_effect = server.get
+
+        with AsyncTaskTracker(client, min_interval=0.001, timeout=0.05) as tracker:
+            future = tracker.track("slow")
+
+        with pytest.raises(TimeoutError):
+            future.result()
+
+    @patch('scheduler0.client.Client._get')
+    def test_wait_for_async_tasks(self, mock_get, client):
+        """Test Client.wait_for_async_tasks returns tasks by request ID."""
+        server = FakeTaskServer({"a": 2, "b": 3}, polls_in_progress=0)
+        mock_get.side_effect = server.get
+
+        tasks = client.wait_for_async_tasks(["a", "b"])
+
+        assert {request_id: task["state"] for request_id, task in tasks.items()} == {"a": 2, "b": 3}
+        assert mock_get.call_args[0][0] in ("/async-tasks/a", "/async-tasks/b")
+
+    def test_typed_tasks(self):
+        """Test task states are read from typed models."""
+        assert task_state(models.AsyncTask(1, "req", "", "", "jobs", 2, "")) == AsyncTaskState.SUCCESS
+        assert task_state({"state": 3}) == AsyncTaskState.FAIL
+
+    def test_async(self):
+        """Test AsyncClient.wait_for_async_tasks polls from one asyncio loop."""
+        httpx = pytest.importorskip("httpx")
+        from scheduler0 import AsyncClient
+
+        server = FakeTaskServer({f"req-{i}": 2 for i in range(20)})
+
+        def handler(request):
+            return httpx.Response(200, json=server.response(request.url.path.rsplit("/", 1)[1]))
+
+        async def run():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncClient("http://localhost:7070", account_id="123", http_client=http_client) as client:
+                return await client.wait_for_async_tasks(list(server.outcomes), max_in_flight=3)
+
+        tasks = asyncio.run(run())
+        assert all(task["state"] == 2 for task in tasks.values())
+        assert all(count == 3 for count in server.polls.values())
+
+    def test_async_idle_while_saturated(self):
+        """Test the asyncio loop sleeps rather than spins while every poll slot is taken."""
+        httpx = pytest.importorskip("httpx")
+        from scheduler0 import AsyncClient
+
+        server = FakeTaskServer({f"req-{i}": 2 for i in range(10)}, polls_in_progress=0)
+
+        async def handler(request):
+            await asyncio.sleep(0.2)
+            return httpx.Response(200, json=server.response(request.url.path.rsplit("/", 1)[1]))
+
+        async def run():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncClient("http://localhost:7070", account_id="123", http_client=http_client) as client:
+                return await client.wait_for_async_tasks(list(server.outcomes), max_in_flight=2)
+
+        started, cpu_started = time.monotonic(), time.process_time()
+        tasks = asyncio.run(run())
+        wall, cpu = time.monotonic() - started, time.process_time() - cpu_started
+
+        assert all(task["state"] == 2 for task in tasks.values())
+        assert cpu < wall / 4
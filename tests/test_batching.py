@@ -0,0 +1,190 @@
+"""
+Tests for micro-batching of concurrent create_job calls.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+from unittest.mock import Mock
+
+from scheduler0 import Client, JobBatching
+from scheduler0.types import JobRequestBody
+
+
+def make_job(index, account_id=None):
+    return JobRequestBody(
+        project_id=1, timezone="UTC", executor_id=1, data=f"job-{index}", spec="0 * * * * *", account_id=account_id,
+    )
+
+
+def http_error(status):
+    return requests.HTTPError(f"{status} error", response=Mock(status_code=status))
+
+
+def make_client(base_url, send, **batching):
+    client = Client(base_url=base_url, api_key="k", api_secret="s", account_id="123",
+                    job_batching=JobBatching(**batching))
+    client.batch_create_jobs = Mock(side_effect=send)
+    return client
+
+
+def create_concurrently(client, jobs):
+    barrier = threading.Barrier(len(jobs))
+
+    def create(job):
+        barrier.wait(5)
+        try:
+            return client.create_job(job)
+        except Exception as error:
+            return error
+
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        return list(executor.map(create, jobs))
+
+
+class TestJobBatching:
+    """Test create_job batching on Client."""
+
+    def test_concurrent_calls_share_requests(self, base_url):
+        """Test concurrent create_job calls are sent in batches of at most max_jobs."""
+        client = make_client(base_url, lambda jobs, account_id_override: {"success": True, "data": f"req-{len(jobs)}"},
+                             max_jobs=5, max_delay=0.2)
+        results = create_concurrently(client, [make_job(i) for i in range(10)])
+
+        sizes = sorted(len(call.args[0]) for call in client.batch_create_jobs.call_args_list)
+        assert sizes == [5, 5]
+        assert all(result == {"success": True, "data": "req-5"} for result in results)
+        assert len({id(result) for result in results}) == 10
+        stats = client.job_batching_stats()
+        assert stats["jobs"] == 10
+        assert stats["batches"] == 2
+        assert stats["average_batch"] == 5
+
+    def test_lone_call_is_sent_after_delay(self, base_url):
+        """Test a batch that never fills is sent when its window closes."""
+        client = make_client(base_url, lambda jobs, account_id_override: {"data": "req"}, max_jobs=100, max_delay=0.01)
+
+        assert client.create_job(make_job(0)) == {"data": "req"}
+        assert client.batch_create_jobs.call_count == 1
+
+    def test_batches_per_account(self, base_url):
+        """Test jobs of different accounts are never sent together."""
+        client = make_client(base_url, lambda jobs, account_id_override: {"data": account_id_override},
+                             max_jobs=2, max_delay=0.2)
+        jobs = [make_job(0), make_job(1, account_id=7), make_job(2), make_job(3, account_id=7)]
+        results = create_concurrently(client, jobs)
+
+        assert [result["data"] for result in results] == ["123", "7", "123", "7"]
+        for call in client.batch_create_jobs.call_args_list:
+            assert {job.account_id for job in call.args[0]} in ({None}, {7})
+
+    def test_rejected_batch_is_resent_per_job(self, base_url):
+        """Test a 400 for a batch gives each caller the outcome of its own job."""
+        def send(jobs, account_id_override):
+            if len(jobs) > 1 or jobs[0].data == "job-1":
+                raise http_error(400)
+            return {"data": jobs[0].data}
+
+        client = make_client(base_url, send, max_jobs=3, max_delay=0.2)
+        results = create_concurrently(client, [make_job(i) for i in range(3)])
+
+        assert isinstance(results[1], requests.HTTPError)
+        assert [results[0], results[2]] == [{"data": "job-0"}, {"data": "job-2"}]
+        assert client.job_batching_stats()["fallbacks"] == 1
+
+    def test_server_error_is_raised_to_every_caller(self, base_url):
+        """Test a 5xx is not resent, as the batch may have been applied."""
+        client = make_client(base_url, Mock(side_effect=http_error(503)), max_jobs=3, max_delay=0.2)
+        results = create_concurrently(client, [make_job(i) for i in range(3)])
+
+        assert all(isinstance(result, requests.HTTPError) for result in results)
+        assert client.batch_create_jobs.call_count == 1
+
+    def test_base_exception_fails_every_caller(self, base_url):
+        """Test a BaseException while sending does not leave the other callers waiting."""
+        class Interrupted(BaseException):
+            pass
+
+        client = make_client(base_url, Mock(side_effect=Interrupted()), max_jobs=3, max_delay=0.2)
+        barrier = threading.Barrier(3)
+        errors = []
+
+        def create(job):
+            barrier.wait(5)
+            try:
+                client.create_job(job)
+            except BaseException as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=create, args=(make_job(i),), daemon=True) for i in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(errors) == 3
+        assert all(isinstance(error, Interrupted) for error in errors)
+        assert client.batch_create_jobs.call_count == 1
+
+    def test_disabled_by_default(self, client):
+        """Test create_job sends one request per call without job_batching."""
+        client.batch_create_jobs = Mock(return_value={"data": "req"})
+        client.create_job(make_job(0))
+        client.batch_create_jobs.assert_called_once()
+        assert client.job_batching_stats() == {}
+
+    def test_invalid_window(self, base_url):
+        """Test an empty batch size is rejected."""
+        with pytest.raises(ValueError):
+            make_client(base_url, None, max_jobs=0)
+
+    def test_async_concurrent_calls_share_requests(self):
+        """Test concurrent create_job coroutines are sent in one batch."""
+        httpx = pytest.importorskip("httpx")
+        from scheduler0 import AsyncClient
+
+        bodies = []
+
+        def handler(request):
+            bodies.append(request.content)
+            return httpx.Response(202, json={"success": True, "data": "req-1"})
+
+        async def run():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncClient("http://localhost:7070", account_id="1", http_client=http_client,
+                                   job_batching=JobBatching(max_jobs=50, max_delay=0.05)) as client:
+                results = await asyncio.gather(*(client.create_job(make_job(i)) for i in range(20)))
+                return results, client.job_batching_stats()
+
+        results, stats = asyncio.run(run())
+        assert len(bodies) == 1
+        assert all(result == {"success": True, "data": "req-1"} for result in results)
+        assert stats["batches"] == 1
+        assert stats["jobs"] == 20
+
+    def test_async_aclose_waits_for_pending_batch(self):
+        """Test a batch whose callers gave up is still sent, and awaited by aclose."""
+        httpx = pytest.importorskip("httpx")
+        from scheduler0 import AsyncClient
+
+        bodies = []
+
+        def handler(request):
+            bodies.append(request.content)
+            return httpx.Response(202, json={"success": True, "data": "req-1"})
+
+        async def run():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncClient("http://localhost:7070", account_id="1", http_client=http_client,
+                                   job_batching=JobBatching(max_jobs=50, max_delay=0.05)) as client:
+                with pytest.raises(asyncio.TimeoutError):
+                    await asyncio.wait_for(client.create_job(make_job(0)), 0.001)
+                assert len(client._job_batcher._tasks) == 1
+            return client._job_batcher._tasks
+
+        tasks = asyncio.run(run())
+        assert len(bodies) == 1
+        assert not tasks
@@ -0,0 +1,305 @@
+"""
+Tests for bulk operations.
+"""
+
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+import requests
+from unittest.mock import Mock, patch
+
+from scheduler0 import (
+    BulkReport,
+    CredentialDeleteRequestBody,
+    ExecutorDeleteRequestBody,
+    ImportReport,
+    JobDeleteRequestBody,
+    JobRequestBody,
+    JobUpdateRequestBody,
+    ProjectUpdateRequestBody,
+)
+from scheduler0.async_tasks import AsyncTaskState
+from scheduler0.bulk import JobChunk, plan_chunks
+
+
+def job(i, account_id=None):
+    return JobRequestBody(project_id=1, timezone="UTC", spec="@every 1m", data=f"job-{i}", account_id=account_id)
+
+
+class FakeJobServer:
+    """Accepts POST /jobs batches and serves their async tasks."""
+
+    def __init__(self, max_batch=None, fail_batches=(), task_state=2, poll_delay=0.0):
+        self.max_batch = max_batch
+        self.poll_delay = poll_delay
+        self.fail_batches = set(fail_batches)
+        self.task_state = task_state
+        self.batches = []
+        self.accounts = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def post(self, endpoint, body, account_id_override=None):
+        assert endpoint == "/jobs"
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(0.002)
+            body = json.loads(body)
+            if self.max_batch is not None and len(body) > self.max_batch:
+                raise requests.HTTPError("413 Payload Too Large", response=Mock(status_code=413))
+            with self.lock:
+                number = len(self.batches)
+                self.batches.append([item["data"] for item in body])
+                self.accounts.append(account_id_override)
+            if number in self.fail_batches:
+                raise requests.HTTPError("500 Server Error", response=Mock(status_code=500))
+            return {"success": True, "data": f"req-{number}"}
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def get(self, endpoint, params=None, account_id_override=None):
+        time.sleep(self.poll_delay)
+        request_id = endpoint.rsplit("/", 1)[1]
+        return {"success": True, "data": {"requestId": request_id, "state": self.task_state}}
+
+
+class TestPlanChunks:
+    """Test chunk planning."""
+
+    def test_limits_jobs_and_bytes(self):
+        """Test chunks respect both the job count and the byte limit."""
+        chunks = list(plan_chunks(range(10), max_jobs=4, max_bytes=1000, encode=lambda job: b"x" * 10))
+        assert [chunk.positions for chunk in chunks] == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+        chunks = list(plan_chunks(range(10), max_jobs=100, max_bytes=35, encode=lambda job: b"x" * 10))
+        assert [len(chunk.jobs) for chunk in chunks] == [3, 3, 3, 1]
+
+    def test_oversized_job_gets_own_chunk(self):
+        """Test a job larger than the byte limit is still sent, alone."""
+        chunks = list(plan_chunks([1, 100, 1], max_jobs=10, max_bytes=50, encode=lambda job: b"x" * job))
+        assert [chunk.jobs for chunk in chunks] == [[1], [100], [1]]
+
+    def test_groups_by_account(self):
+        """Test jobs of different accounts never share a chunk."""
+        jobs = [job(0, 1), job(1, 2), job(2, 1), job(3)]
+        chunks = list(plan_chunks(jobs, max_jobs=10, max_bytes=10000, encode=lambda job: b"x" * 10))
+        assert [(chunk.account_id, chunk.positions) for chunk in chunks] == [("1", [0, 2]), ("2", [1]), (None, [3])]
+
+    def test_split(self):
+        """Test a chunk splits into halves keeping positions."""
+        first, second = JobChunk([4, 5, 6], ["a", "b", "c"], encoded=[b'"a"', b'"b"', b'"c"']).split()
+        assert (first.positions, second.positions, second.jobs) == ([4], [5, 6], ["b", "c"])
+        assert second.body() == b'["b","c"]'
+
+    def test_encodes_each_job_once(self):
+        """Test the chunk body is joined from the encodings made while sizing."""
+        calls = []
+
+        def encode(job):
+            calls.append(job)
+            return json.dumps({"data": job}).encode()
+
+        [chunk] = plan_chunks(["a", "b"], max_jobs=10, max_bytes=1000, encode=encode)
+        assert calls == ["a", "b"]
+        assert json.loads(chunk.body()) == [{"data": "a"}, {"data": "b"}]
+
+
+class TestImportJobs:
+    """Test Client.import_jobs."""
+
+    def test_imports_in_bounded_concurrent_chunks(self, client):
+        """Test jobs are sent in chunks, no more than max_in_flight at once."""
+        server = FakeJobServer()
+        with patch.object(client, "_post", side_effect=server.post), patch.object(client, "_get", side_effect=server.get):
+            report = client.import_jobs((job(i) for i in range(1050)), max_chunk_jobs=100, max_in_flight=3)
+
+        assert isinstance(report, ImportReport)
+        assert (report.jobs, report.succeeded, len(report.chunks)) == (1050, 1050, 11)
+        assert report.failures == []
+        assert server.max_in_flight <= 3
+        assert sorted(data for batch in server.batches for data in batch) == sorted(f"job-{i}" for i in range(1050))
+        assert all(chunk.state == AsyncTaskState.SUCCESS for chunk in report.chunks)
+        assert report.jobs_per_second > 0
+
+    def test_more_tasks_than_max_in_flight(self, client):
+        """Test tracking more chunk tasks than poll slots completes without spinning the tracker."""
+        server = FakeJobServer(poll_delay=0.1)
+        with patch.object(client, "_post", side_effect=server.post), patch.object(client, "_get", side_effect=server.get):
+            started, cpu_started = time.monotonic(), time.process_time()
+            report = client.import_jobs([job(i) for i in range(80)], max_chunk_jobs=10, max_in_flight=2)
+            wall, cpu = time.monotonic() - started, time.process_time() - cpu_started
+
+        assert (report.succeeded, len(report.chunks)) == (80, 8)
+        assert all(chunk.state == AsyncTaskState.SUCCESS for chunk in report.chunks)
+        assert cpu < wall / 4
+
+    def test_splits_rejected_chunks(self, client):
+        """Test chunks rejected with 413 are split until they are accepted."""
+        server = FakeJobServer(max_batch=30)
+        with patch.object(client, "_post", side_effect=server.post), patch.object(client, "_get", side_effect=server.get):
+            report = client.import_jobs([job(i) for i in range(200)], max_chunk_jobs=100, track=False)
+
+        assert report.succeeded == 200
+        assert max(len(batch) for batch in server.batches) <= 30
+        assert [chunk.first for chunk in report.chunks] == sorted(chunk.first for chunk in report.chunks)
+
+    def test_records_failed_chunks(self, client):
+        """Test a failed chunk is reported and the others are still sent."""
+        server = FakeJobServer(fail_batches={1})
+        with patch.object(client, "_post", side_effect=server.post), patch.object(client, "_get", side_effect=server.get):
+            report = client.import_jobs([job(i) for i in range(30)], max_chunk_jobs=10, max_in_flight=1)
+
+        assert report.succeeded == 20
+        [failure] = report.failures
+        assert failure.positions == list(range(10, 20))
+        assert "500" in failure.error
+
+    def test_records_failed_tasks(self, client):
+        """Test chunks whose async task failed are reported."""
+        server = FakeJobServer(task_state=3)
+        with patch.object(client, "_post", side_effect=server.post), patch.object(client, "_get", side_effect=server.get):
+            report = client.import_jobs([job(i) for i in range(5)])
+
+        assert report.succeeded == 0
+        assert report.failures[0].state == AsyncTaskState.FAIL
+
+    def test_sends_chunks_per_account(self, client):
+        """Test each chunk is sent with its jobs' account."""
+        server = FakeJobServer()
+        with patch.object(client, "_post", side_effect=server.post), patch.object(client, "_get", side_effect=server.get):
+            client.import_jobs([job(0, 7), job(1, 8)], track=False)
+
+        assert sorted(server.accounts) == ["7", "8"]
+
+    def test_async(self):
+        """Test AsyncClient.import_jobs."""
+        httpx = pytest.importorskip("httpx")
+        from scheduler0 import AsyncClient
+
+        batches = []
+
+        def handler(request):
+            if request.method == "POST":
+                batches.append(len(request.read()))
+                return httpx.Response(202, json={"success": True, "data": f"req-{len(batches)}"})
+            return httpx.Response(200, json={"success": True, "data": {"state": 2}})
+
+        async def run():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncClient("http://localhost:7070", account_id="123", http_client=http_client) as client:
+                return await client.import_jobs([job(i) for i in range(25)], max_chunk_jobs=10, max_in_flight=2)
+
+        report = asyncio.run(run())
+        assert (report.jobs, report.succeeded, len(batches)) == (25, 25, 3)
+
+    def test_async_more_tasks_than_max_in_flight(self):
+        """Test AsyncClient.import_jobs tracks more chunk tasks than poll slots without spinning."""
+        httpx = pytest.importorskip("httpx")
+        from scheduler0 import AsyncClient
+
+        batches = []
+
+        async def handler(request):
+            if request.method == "POST":
+                batches.append(len(request.read()))
+                return httpx.Response(202, json={"success": True, "data": f"req-{len(batches)}"})
+            await asyncio.sleep(0.1)
+            return httpx.Response(200, json={"success": True, "data": {"state": 2}})
+
+        async def run():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncClient("http://localhost:7070", account_id="123", http_client=http_client) as client:
+                return await client.import_jobs([job(i) for i in range(80)], max_chunk_jobs=10, max_in_flight=2)
+
+        started, cpu_started = time.monotonic(), time.process_time()
+        report = asyncio.run(run())
+        wall, cpu = time.monotonic() - started, time.process_time() - cpu_started
+
+        assert (report.succeeded, len(batches)) == (80, 8)
+        assert cpu < wall / 4
+
+
+class TestBulkUpdateDelete:
+    """Test bulk update and delete methods."""
+
+    @patch('scheduler0.client.Client._put')
+    def test_update_jobs(self, mock_put, client):
+        """Test every job is updated and the results are keyed by ID."""
+        in_flight, peak, lock = [0], [0], threading.Lock()
+
+        def put(endpoint, body, account_id_override=None):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.002)
+            with lock:
+                in_flight[0] -= 1
+            return {"success": True, "data": {"id": int(endpoint.rsplit("/", 1)[1]), "status": body.status}}
+
+        mock_put.side_effect = put
+        pause = JobUpdateRequestBody(modified_by="ops", status="inactive")
+
+        report = client.update_jobs({str(i): pause for i in range(100)}, max_in_flight=5)
+
+        assert isinstance(report, BulkReport)
+        assert report.ok
+        assert (report.total, len(report.succeeded)) == (100, 100)
+        assert report.results["42"]["data"] == {"id": 42, "status": "inactive"}
+        assert peak[0] <= 5
+        assert report.operation == "update_job"
+
+    @patch('scheduler0.client.Client._delete')
+    def test_partial_failure(self, mock_delete, client):
+        """Test failures are reported without stopping the remaining calls."""
+        def delete(endpoint, body, account_id_override=None):
+            if endpoint.endswith("/3") or endpoint.endswith("/7"):
+                raise requests.HTTPError("404 Not Found", response=Mock(status_code=404))
+
+        mock_delete.side_effect = delete
+
+        report = client.delete_jobs((str(i) for i in range(10)), JobDeleteRequestBody(deleted_by="ops"))
+
+        assert not report.ok
+        assert sorted(report.succeeded) == [str(i) for i in range(10) if i not in (3, 7)]
+        assert sorted((f.id, f.status_code) for f in report.failures) == [("3", 404), ("7", 404)]
+        assert mock_delete.call_count == 10
+
+    @patch('scheduler0.client.Client._delete')
+    @patch('scheduler0.client.Client._put')
+    def test_other_resources(self, mock_put, mock_delete, client):
+        """Test projects, executors and credentials use their own endpoints."""
+        mock_put.return_value = {"success": True}
+        client.update_projects([("1", ProjectUpdateRequestBody(description="d", modified_by="ops"))])
+        client.delete_executors(["2"], ExecutorDeleteRequestBody(deleted_by="ops"))
+        client.delete_credentials(["3"], CredentialDeleteRequestBody(deleted_by="ops"), account_id_override="9")
+
+        assert mock_put.call_args[0][0] == "/projects/1"
+        assert [c[0][0] for c in mock_delete.call_args_list] == ["/executors/2", "/credentials/3"]
+        assert mock_delete.call_args[1]["account_id_override"] == "9"
+
+    def test_async(self):
+        """Test bulk methods are awaitable on AsyncClient."""
+        httpx = pytest.importorskip("httpx")
+        from scheduler0 import AsyncClient
+
+        def handler(request):
+            if request.url.path.endswith("/5"):
+                return httpx.Response(500, json={"success": False, "data": "boom"})
+            return httpx.Response(200, json={"success": True, "data": {}})
+
+        async def run():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncClient("http://localhost:7070", account_id="123", http_client=http_client) as client:
+                return await client.update_jobs([(str(i), JobUpdateRequestBody(modified_by="ops")) for i in range(10)], max_in_flight=3)
+
+        report = asyncio.run(run())
+        assert len(report.succeeded) == 9
+        assert report.failures[0].id == "5"
+        assert report.failures[0].status_code == 500
@@ -0,0 +1,185 @@
+"""
+Tests for the read-through response cache.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import Mock, patch
+
+from scheduler0 import CachePolicy, Client, ResponseCache
+from scheduler0.types import CredentialArchiveRequestBody, ExecutorDeleteRequestBody, JobDeleteRequestBody, ProjectUpdateRequestBody
+
+
+def ok(data):
+    response = Mock(status_code=200)
+    response.json.return_value = {"success": True, "data": data}
+    return response
+
+
+class TestResponseCache:
+    """Test TTL, LRU and invalidation."""
+
+    def test_hit_and_miss(self, clock):
+        """Test a stored response is found until its TTL passes."""
+        cache = ResponseCache(clock=clock)
+        cache.put("/projects/1", None, "123", {"id": 1})
+
+        assert cache.get("/projects/1", None, "123") == (True, {"id": 1})
+        assert cache.get("/projects/1", None, "456") == (False, None)
+        clock.now = 301
+        assert cache.get("/projects/1", None, "123") == (False, None)
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 2, 1 / 3)
+        assert stats["endpoints"]["/projects/{id}"]["expirations"] == 1
+
+    def test_only_policy_templates_are_cached(self):
+        """Test endpoints without a policy, or disabled ones, are not cached."""
+        cache = ResponseCache(policies={"/jobs/{id}": None})
+        cache.put("/jobs/1", None, None, {"id": 1})
+        cache.put("/projects", {"limit": "10"}, None, {})
+
+        assert not cache.caches("/jobs/1")
+        assert not cache.caches("/projects")
+        assert cache.caches("/executors/5")
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted past max_entries."""
+        cache = ResponseCache(policies={"/executors/{id}": CachePolicy(ttl=60, max_entries=2)})
+        cache.put("/executors/1", None, None, 1)
+        cache.put("/executors/2", None, None, 2)
+        cache.get("/executors/1", None, None)
+        cache.put("/executors/3", None, None, 3)
+
+        assert cache.get("/executors/2", None, None)[0] is False
+        assert cache.get("/executors/1", None, None) == (True, 1)
+        assert cache.stats()["endpoints"]["/executors/{id}"]["evictions"] == 1
+
+    def test_invalidate_path_and_parents(self):
+        """Test a write drops entries of its path and parent paths for every account."""
+        cache = ResponseCache()
+        cache.put("/credentials/7", None, "1", {"id": 7})
+        cache.put("/credentials/7", None, "2", {"id": 7})
+        cache.put("/credentials/8", None, "1", {"id": 8})
+
+        assert cache.invalidate("/credentials/7/archive") == 2
+        assert cache.get("/credentials/7", None, "1")[0] is False
+        assert cache.get("/credentials/8", None, "1")[0] is True
+
+    def test_returns_copies(self):
+        """Test callers cannot modify cached dicts."""
+        cache = ResponseCache()
+        value = {"data": {"id": 1}}
+        cache.put("/jobs/1", None, None, value)
+        value["data"]["id"] = 2
+        cache.get("/jobs/1", None, None)[1]["data"]["id"] = 3
+
+        assert cache.get("/jobs/1", None, None)[1] == {"data": {"id": 1}}
+
+    def test_put_drops_response_raced_by_write(self):
+        """Test a response is not stored when its path was invalidated after the GET started."""
+        cache = ResponseCache()
+        generation = cache.generation("/credentials/7")
+        other = cache.generation("/credentials/8")
+        cache.invalidate("/credentials/7/archive")
+        cache.put("/credentials/7", None, "1", {"id": 7}, generation)
+        cache.put("/credentials/8", None, "1", {"id": 8}, other)
+
+        assert cache.get("/credentials/7", None, "1")[0] is False
+        assert cache.get("/credentials/8", None, "1")[0] is True
+        assert cache.stats()["endpoints"]["/credentials/{id}"]["stale"] == 1
+
+    def test_forgotten_generations_still_drop_raced_responses(self, monkeypatch):
+        """Test clearing remembered generations does not let a raced response in."""
+        monkeypatch.setattr("scheduler0.cache.MAX_GENERATIONS", 4)
+        cache = ResponseCache()
+        generation = cache.generation("/jobs/1")
+        for index in range(1, 5):
+            cache.invalidate(f"/jobs/{index}")
+        cache.put("/jobs/1", None, None, {"id": 1}, generation)
+
+        assert cache.get("/jobs/1", None, None)[0] is False
+
+
+class TestClientCache:
+    """Test the cache in Client._get and the write methods."""
+
+    @pytest.fixture
+    def cached_client(self, base_url):
+        return Client(base_url=base_url, api_key="k", api_secret="s", account_id="123", cache=ResponseCache())
+
+    def test_get_project_is_served_from_cache(self, cached_client):
+        """Test repeated getters send one request."""
+        with patch.object(cached_client, "_request", return_value=ok({"id": 1})) as request:
+            first = cached_client.get_project("1")
+            second = cached_client.get_project("1")
+            cached_client.get_project("1", account_id_override="999")
+
+        assert first == second
+        assert request.call_count == 2
+
+    def test_update_and_delete_invalidate(self, cached_client):
+        """Test the client's own writes drop the cached resource."""
+        with patch.object(cached_client, "_request", return_value=ok({"id": 1})) as request:
+            cached_client.get_project("1")
+            cached_client.update_project("1", ProjectUpdateRequestBody(description="d", modified_by="u"))
+            cached_client.get_project("1")
+            cached_client.get_credential("5")
+            cached_client.archive_credential("5", CredentialArchiveRequestBody(archived_by="u"))
+            cached_client.get_credential("5")
+
+        methods = [call[0][0] for call in request.call_args_list]
+        assert methods == ["GET", "PUT", "GET", "GET", "POST", "GET"]
+
+    def test_failed_write_still_invalidates(self, cached_client):
+        """Test entries are dropped even when the write raises, as it may have been applied."""
+        with patch.object(cached_client, "_request", return_value=ok({"id": 1})):
+            cached_client.get_job("1")
+        with patch.object(cached_client, "_request", side_effect=TimeoutError):
+            with pytest.raises(TimeoutError):
+                cached_client.delete_job("1", JobDeleteRequestBody(deleted_by="u"))
+        assert cached_client.cache.stats()["endpoints"]["/jobs/{id}"]["invalidations"] == 1
+
+    def test_get_racing_a_write_is_not_cached(self, cached_client):
+        """Test a GET that completes after a concurrent write does not cache its stale response."""
+        def stale_get(method, endpoint, **kwargs):
+            # The update lands while the GET is in flight
+            cached_client.cache.invalidate("/projects/1")
+            return ok({"id": 1, "description": "old"})
+
+        with patch.object(cached_client, "_request", side_effect=stale_get):
+            cached_client.get_project("1")
+        with patch.object(cached_client, "_request", return_value=ok({"id": 1, "description": "new"})) as request:
+            assert cached_client.get_project("1")["data"]["description"] == "new"
+        assert request.call_count == 1
+
+    def test_lists_are_not_cached(self, cached_client):
+        """Test list endpoints always reach the server."""
+        with patch.object(cached_client, "_request", return_value=ok({"projects": []})) as request:
+            cached_client.list_projects()
+            cached_client.list_projects()
+        assert request.call_count == 2
+
+    def test_async(self):
+        """Test AsyncClient uses the cache too."""
+        httpx = pytest.importorskip("httpx")
+        from scheduler0 import AsyncClient
+
+        calls = []
+
+        def handler(request):
+            calls.append(request.method)
+            return httpx.Response(200, json={"success": True, "data": {"id": 3}})
+
+        async def run():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncClient("http://localhost:7070", account_id="1", http_client=http_client, cache=ResponseCache()) as client:
+                await client.get_executor("3")
+                await client.get_executor("3")
+                await client.delete_executor("3", ExecutorDeleteRequestBody(deleted_by="u"))
+                await client.get_executor("3")
+
+        asyncio.run(run())
+        assert calls == ["GET", "DELETE", "GET"]
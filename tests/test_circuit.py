@@ -0,0 +1,169 @@
+"""
+Tests for the per-endpoint circuit breaker.
+"""
+
+import asyncio
+
+import pytest
+import requests
+from unittest.mock import Mock
+
+from scheduler0 import BreakerPolicy, CircuitBreaker, CircuitOpenError, CircuitState, Client
+
+from .test_retry import make_response
+
+
+def run(breaker, endpoint, failed, seconds=0.0, clock=None):
+    ticket = breaker.acquire(endpoint)
+    if clock is not None:
+        clock.now += seconds
+    breaker.release(ticket, failed)
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(BreakerPolicy(min_calls=4, failure_rate=0.5, open_seconds=10, probes=2), clock=clock)
+
+
+class TestCircuitBreaker:
+    """Test opening, fast failure and half-open probing."""
+
+    def test_opens_on_failure_rate(self, breaker):
+        """Test the circuit opens once enough attempts failed, per template."""
+        for failed in (False, True, False):
+            run(breaker, "/jobs/1", failed)
+        assert breaker.state("/jobs/{id}") is CircuitState.CLOSED
+        run(breaker, "/jobs/2", True)
+        assert breaker.state("/jobs/3") is CircuitState.OPEN
+
+        with pytest.raises(CircuitOpenError) as error:
+            breaker.acquire("/jobs/9")
+        assert error.value.endpoint == "/jobs/{id}"
+        assert error.value.retry_in == 10
+        assert breaker.acquire("/jobs") is not None
+        assert breaker.stats()["/jobs/{id}"]["rejected"] == 1
+
+    def test_min_calls(self, breaker):
+        """Test a few failures alone do not open the circuit."""
+        for _ in range(3):
+            run(breaker, "/prompt", True)
+        assert breaker.state("/prompt") is CircuitState.CLOSED
+
+    def test_old_failures_leave_the_window(self, breaker, clock):
+        """Test only attempts within the window count."""
+        for _ in range(3):
+            run(breaker, "/prompt", True)
+        clock.now += 31
+        run(breaker, "/prompt", True)
+        assert breaker.state("/prompt") is CircuitState.CLOSED
+        assert breaker.stats()["/prompt"]["calls"] == 1
+
+    def test_opens_on_slow_calls(self, clock):
+        """Test slow attempts open the circuit when a latency threshold is set."""
+        breaker = CircuitBreaker(BreakerPolicy(min_calls=2, slow_call_seconds=1.0), clock=clock)
+        run(breaker, "/executions", False, seconds=2, clock=clock)
+        run(breaker, "/executions", False, seconds=0.1, clock=clock)
+        assert breaker.state("/executions") is CircuitState.OPEN
+
+    def test_half_open_probes_close_circuit(self, breaker, clock):
+        """Test limited probes are admitted after open_seconds and close the circuit on success."""
+        for _ in range(4):
+            run(breaker, "/prompt", True)
+        clock.now += 10
+
+        first = breaker.acquire("/prompt")
+        second = breaker.acquire("/prompt")
+        assert breaker.state("/prompt") is CircuitState.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire("/prompt")
+        breaker.release(first, False)
+        breaker.release(second, False)
+        assert breaker.state("/prompt") is CircuitState.CLOSED
+        assert breaker.stats()["/prompt"]["calls"] == 0
+
+    def test_failed_probe_reopens(self, breaker, clock):
+        """Test one failed probe opens the circuit again."""
+        for _ in range(4):
+            run(breaker, "/prompt", True)
+        clock.now += 10
+        run(breaker, "/prompt", True)
+
+        assert breaker.state("/prompt") is CircuitState.OPEN
+        assert breaker.stats()["/prompt"]["opened"] == 2
+
+    def test_uncounted_outcome_frees_probe(self, breaker, clock):
+        """Test an attempt ending without an outcome gives its probe slot back."""
+        for _ in range(4):
+            run(breaker, "/prompt", True)
+        clock.now += 10
+        for _ in range(3):
+            run(breaker, "/prompt", None)
+        assert breaker.state("/prompt") is CircuitState.HALF_OPEN
+
+    def test_disabled_template(self, clock):
+        """Test templates mapped to None are never broken."""
+        breaker = CircuitBreaker(BreakerPolicy(min_calls=1), policies={"/healthcheck": None}, clock=clock)
+        for _ in range(5):
+            run(breaker, "/healthcheck", True)
+        assert breaker.acquire("/healthcheck") is None
+
+
+class TestClientCircuitBreaking:
+    """Test the breaker in Client._request and AsyncClient._request."""
+
+    @pytest.fixture
+    def breaking_client(self, base_url, breaker):
+        return Client(base_url=base_url, api_key="k", api_secret="s", account_id="123", circuit_breaker=breaker)
+
+    def test_fails_fast_without_io(self, breaking_client):
+        """Test requests to an open circuit raise CircuitOpenError without being sent."""
+        breaking_client.session.request = Mock(return_value=make_response(503))
+        for _ in range(4):
+            with pytest.raises(requests.HTTPError):
+                breaking_client.get_job("1")
+
+        with pytest.raises(CircuitOpenError):
+            breaking_client.get_job("2")
+        assert breaking_client.session.request.call_count == 4
+
+        # Other endpoints still work
+        breaking_client.session.request = Mock(return_value=make_response(200, {"success": True}))
+        assert breaking_client.list_projects() == {"success": True}
+
+    def test_connection_errors_count(self, breaking_client, breaker):
+        """Test connection errors are failures and 4xx responses are not."""
+        breaking_client.session.request = Mock(side_effect=requests.ConnectionError)
+        for _ in range(2):
+            with pytest.raises(requests.ConnectionError):
+                breaking_client.get_job("1")
+        breaking_client.session.request = Mock(return_value=make_response(404))
+        for _ in range(2):
+            with pytest.raises(requests.HTTPError):
+                breaking_client.get_job("1")
+
+        assert breaker.stats()["/jobs/{id}"]["failures"] == 2
+        assert breaker.state("/jobs/{id}") is CircuitState.OPEN
+
+    def test_async_fails_fast(self, breaker):
+        """Test AsyncClient raises CircuitOpenError without sending."""
+        httpx = pytest.importorskip("httpx")
+        from scheduler0 import AsyncClient
+
+        sent = []
+
+        def handler(request):
+            sent.append(request)
+            return httpx.Response(500, json={"success": False})
+
+        async def go():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncClient("http://localhost:7070", account_id="1", http_client=http_client,
+                                   circuit_breaker=breaker) as client:
+                for _ in range(4):
+                    with pytest.raises(requests.HTTPError):
+                        await client.get_job("1")
+                with pytest.raises(CircuitOpenError):
+                    await client.get_job("1")
+
+        asyncio.run(go())
+        assert len(sent) == 4
@@ -251,3 +251,66 @@ class TestClientErrorHandling:
         with pytest.raises(requests.ConnectionError):
             client._request("GET", "/jobs")
 
+
+
+class TestClientConnectionPool:
+    """Test connection pool configuration."""
+
+    def test_default_pool_adapter(self, client):
+        """Test the session is mounted with a pooling adapter."""
+        from scheduler0.pool import PoolingAdapter
+        adapter = client.session.get_adapter(client.base_url)
+        assert isinstance(adapter, PoolingAdapter)
+        assert adapter._pool_maxsize == 10
+        assert adapter._pool_block is False
+
+    def test_pool_settings(self, base_url):
+        """Test pool sizing and blocking mode are applied."""
+        client = NewClient(base_url=base_url, pool_maxsize=64, pool_block=True)
+        stats = client.pool_stats()
+        assert stats["pool_maxsize"] == 64
+        assert stats["pool_block"] is True
+        assert stats["requests"] == 0
+
+    def test_keep_alive_disabled(self, base_url):
+        """Test disabling keep-alive closes connections after each request."""
+        client = Client(base_url=base_url, keep_alive=False)
+        assert client.session.headers["Connection"] == "close"
+
+    def test_connections_reused_across_threads(self):
+        """Test concurrent threads share a bounded set of pooled connections."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                body = b'{"success": true}'
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            with Client(f"http://127.0.0.1:{server.server_port}", pool_maxsize=4, pool_block=True) as client:
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    results = list(executor.map(lambda _: client.healthcheck(), range(40)))
+                stats = client.pool_stats()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert all(result == {"success": True} for result in results)
+        assert stats["requests"] == 40
+        assert stats["connections_created"] <= 4
+        assert stats["connections_reused"] >= 36
+        assert stats["in_flight"] == 0
@@ -0,0 +1,96 @@
+"""
+Tests for JSON codecs.
+"""
+
+import json
+
+import pytest
+from unittest.mock import Mock
+from scheduler0 import Client, JSONCodec, OrjsonCodec
+from scheduler0.codec import get_codec
+from scheduler0.types import JobRequestBody
+
+
+class TestCodecs:
+    """Test codec selection and behavior."""
+
+    def test_default_is_stdlib(self):
+        """Test the stdlib codec is used by default."""
+        assert type(get_codec()) is JSONCodec
+        assert type(get_codec("json")) is JSONCodec
+
+    def test_instance_passed_through(self):
+        """Test codec instances are used as given."""
+        codec = JSONCodec()
+        assert get_codec(codec) is codec
+
+    def test_unknown_codec(self):
+        """Test unknown codec names are rejected."""
+        with pytest.raises(ValueError):
+            get_codec("yaml")
+
+    def test_stdlib_round_trip(self):
+        """Test the stdlib codec produces compact UTF-8 bytes."""
+        codec = JSONCodec()
+        encoded = codec.dumps({"name": "café", "ids": [1, 2]})
+        assert encoded == '{"name":"café","ids":[1,2]}'.encode("utf-8")
+        assert codec.loads(encoded) == {"name": "café", "ids": [1, 2]}
+
+    def test_stdlib_rejects_non_finite_floats(self):
+        """Test NaN and infinity are rejected rather than sent as invalid JSON."""
+        codec = JSONCodec()
+        for value in (float("nan"), float("inf"), float("-inf")):
+            with pytest.raises(ValueError):
+                codec.dumps({"value": value})
+
+    def test_orjson_round_trip(self):
+        """Test the orjson codec encodes and decodes bytes."""
+        pytest.importorskip("orjson")
+        codec = get_codec("orjson")
+        assert isinstance(codec, OrjsonCodec)
+        assert codec.loads(codec.dumps({"a": [1, None]})) == {"a": [1, None]}
+
+    def test_auto_prefers_orjson(self):
+        """Test auto selects orjson when installed and stdlib otherwise."""
+        try:
+            import orjson  # noqa: F401
+            expected = OrjsonCodec
+        except ImportError:
+            expected = JSONCodec
+        assert type(get_codec("auto")) is expected
+
+
+class TestClientCodec:
+    """Test the client sends pre-encoded bodies and decodes with its codec."""
+
+    def test_body_sent_as_encoded_bytes(self, client):
+        """Test the request body is encoded once and sent as bytes."""
+        response = Mock(status_code=202)
+        response.json.return_value = {"success": True}
+        client.session.request = Mock(return_value=response)
+
+        client.batch_create_jobs([JobRequestBody(project_id=1, timezone="UTC")])
+
+        data = client.session.request.call_args[1]["data"]
+        assert isinstance(data, bytes)
+        assert json.loads(data) == [{"projectId": 1, "timezone": "UTC"}]
+
+    def test_bytes_body_sent_unchanged(self, client):
+        """Test an already encoded body is not encoded again."""
+        response = Mock(status_code=202)
+        response.json.return_value = {"success": True}
+        client.session.request = Mock(return_value=response)
+
+        client._post("/jobs", b'[{"projectId":1}]')
+
+        assert client.session.request.call_args[1]["data"] == b'[{"projectId":1}]'
+
+    def test_orjson_client_decodes_content(self, base_url):
+        """Test an orjson client decodes the raw response bytes."""
+        pytest.importorskip("orjson")
+        client = Client(base_url=base_url, json_codec="orjson")
+        response = Mock(status_code=200, content=b'{"data":{"total":2}}')
+        client.session.request = Mock(return_value=response)
+
+        assert client._get("/jobs") == {"data": {"total": 2}}
+        response.json.assert_not_called()
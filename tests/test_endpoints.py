@@ -0,0 +1,32 @@
+"""
+Tests for endpoint templates.
+"""
+
+from scheduler0.endpoints import endpoint_template, ENDPOINT_TEMPLATES
+
+
+class TestEndpointTemplates:
+    """Test path to template normalization."""
+
+    def test_known_templates_map_to_themselves(self):
+        """Test every template is its own template."""
+        for template in ENDPOINT_TEMPLATES:
+            assert endpoint_template(template) == template
+
+    def test_ids_replaced(self):
+        """Test resource IDs are replaced by {id}."""
+        assert endpoint_template("/jobs/42") == "/jobs/{id}"
+        assert endpoint_template("jobs/42") == "/jobs/{id}"
+        assert endpoint_template("/async-tasks/5e1f-ab") == "/async-tasks/{id}"
+        assert endpoint_template("/credentials/7/archive") == "/credentials/{id}/archive"
+        assert endpoint_template("/accounts/1/features/all") == "/accounts/{id}/features/all"
+
+    def test_static_paths_preferred(self):
+        """Test static sub-resources are not treated as IDs."""
+        assert endpoint_template("/executions/totals") == "/executions/totals"
+        assert endpoint_template("/executions/analytics") == "/executions/analytics"
+
+    def test_unknown_paths(self):
+        """Test unknown paths get numeric segments normalized."""
+        assert endpoint_template("/widgets/12/parts/7") == "/widgets/{id}/parts/{id}"
+        assert endpoint_template("/widgets?limit=1") == "/widgets"
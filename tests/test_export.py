@@ -0,0 +1,162 @@
+"""
+Tests for streaming execution export.
+"""
+
+import asyncio
+import csv
+import io
+import json
+
+import pytest
+from unittest.mock import patch
+from scheduler0 import Client, models
+from scheduler0.export import ExportReport, ExportWriter, resolve_format
+
+
+def execution(i):
+    return {
+        "id": i,
+        "accountId": 123,
+        "uniqueId": f"u-{i}",
+        "state": i % 3,
+        "nodeId": 1,
+        "jobId": 7,
+        "dateCreated": f"2025-01-01T00:00:{i % 60:02d}Z",
+    }
+
+
+def serve(total):
+    """Return a Client._get side effect serving total executions."""
+    def get(endpoint, params, account_id_override):
+        offset, limit = int(params["offset"]), int(params["limit"])
+        rows = [execution(i) for i in range(offset, min(offset + limit, total))]
+        return {"success": True, "data": {"total": total, "executions": rows}}
+    return get
+
+
+class TestResolveFormat:
+    """Test export format selection."""
+
+    def test_infers_from_extension(self):
+        """Test the format is inferred from the file name."""
+        assert resolve_format("out.csv", None) == "csv"
+        assert resolve_format("out.jsonl", None) == "ndjson"
+        assert resolve_format("out.unknown", None) == "ndjson"
+
+    def test_unknown_format(self):
+        """Test unknown formats are rejected."""
+        with pytest.raises(ValueError):
+            resolve_format("out.csv", "xlsx")
+
+
+class TestExportWriter:
+    """Test the incremental writers."""
+
+    def test_ndjson(self):
+        """Test NDJSON writes one compact object per line."""
+        buffer = io.BytesIO()
+        writer = ExportWriter(buffer, "ndjson", fields=("id", "unique_id", "date_modified"))
+        writer.write(execution(1))
+        writer.close()
+        assert buffer.getvalue() == b'{"id":1,"uniqueId":"u-1","dateModified":null}\n'
+
+    def test_csv_text_and_binary(self):
+        """Test CSV is written to text and binary file objects alike."""
+        text, binary = io.StringIO(), io.BytesIO()
+        for destination in (text, binary):
+            writer = ExportWriter(destination, "csv", fields=("id", "unique_id", "date_modified"))
+            writer.write(execution(2))
+            writer.close()
+        assert text.getvalue() == "id,uniqueId,dateModified\r\n2,u-2,\r\n"
+        assert binary.getvalue().decode() == text.getvalue()
+        assert not binary.closed
+
+    def test_typed_items(self):
+        """Test typed models are exported like raw dicts."""
+        buffer = io.BytesIO()
+        writer = ExportWriter(buffer, "ndjson", fields=("id", "unique_id"))
+        writer.write(models.Execution.from_dict(execution(3)))
+        writer.close()
+        assert json.loads(buffer.getvalue()) == {"id": 3, "uniqueId": "u-3"}
+
+
+class TestExportExecutions:
+    """Test Client.export_executions."""
+
+    @patch('scheduler0.client.Client._get')
+    def test_ndjson_file(self, mock_get, client, tmp_path):
+        """Test executions are streamed page by page into an NDJSON file."""
+        mock_get.side_effect = serve(25)
+        path = tmp_path / "executions.ndjson"
+
+        report = client.export_executions(path, page_size=10, state="completed")
+
+        assert isinstance(report, ExportReport)
+        assert report.rows == 25
+        assert report.format == "ndjson"
+        assert report.rows_per_second > 0
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)["uniqueId"] for line in lines] == [f"u-{i}" for i in range(25)]
+        assert mock_get.call_args[1]["params"]["state"] == "completed"
+
+    @patch('scheduler0.client.Client._get')
+    def test_csv_file(self, mock_get, client, tmp_path):
+        """Test the CSV header lists every execution field."""
+        mock_get.side_effect = serve(5)
+        path = tmp_path / "executions.csv"
+
+        report = client.export_executions(path)
+
+        rows = list(csv.DictReader(path.open()))
+        assert report.rows == len(rows) == 5
+        assert rows[0]["uniqueId"] == "u-0"
+        assert "lastExecutionDatetime" in rows[0]
+
+    @patch('scheduler0.client.Client._get')
+    def test_keyset_source(self, mock_get, client):
+        """Test keyset exports page by date."""
+        mock_get.side_effect = serve(3)
+
+        report = client.export_executions(io.BytesIO(), keyset=True, page_size=10)
+
+        assert report.rows == 3
+        assert mock_get.call_args[1]["params"]["orderBy"] == "dateCreated"
+
+    @patch('scheduler0.client.Client._get')
+    def test_parquet_row_groups(self, mock_get, client, tmp_path):
+        """Test Parquet exports are written in row groups."""
+        parquet = pytest.importorskip("pyarrow.parquet")
+        mock_get.side_effect = serve(25)
+        path = tmp_path / "executions.parquet"
+
+        report = client.export_executions(path, page_size=10, row_group_size=10)
+
+        table_file = parquet.ParquetFile(path)
+        assert report.rows == table_file.metadata.num_rows == 25
+        assert table_file.metadata.num_row_groups == 3
+        table = table_file.read()
+        assert table.column("uniqueId").to_pylist()[-1] == "u-24"
+        assert str(table.schema.field("id").type) == "int64"
+
+    def test_parquet_requires_pyarrow(self, client):
+        """Test a clear error is raised without pyarrow."""
+        with patch("scheduler0.export.pyarrow", None):
+            with pytest.raises(ImportError, match="pyarrow"):
+                client.export_executions("executions.parquet")
+
+    def test_async(self, tmp_path):
+        """Test AsyncClient.export_executions streams from the async iterator."""
+        httpx = pytest.importorskip("httpx")
+        from scheduler0 import AsyncClient
+
+        def handler(request):
+            return httpx.Response(200, json=serve(12)(None, dict(request.url.params), None))
+
+        async def run():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncClient("http://localhost:7070", account_id="123", http_client=http_client) as client:
+                return await client.export_executions(tmp_path / "executions.csv", page_size=5)
+
+        report = asyncio.run(run())
+        assert report.rows == 12
+        assert len((tmp_path / "executions.csv").read_text().splitlines()) == 13
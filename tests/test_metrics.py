@@ -0,0 +1,142 @@
+"""
+Tests for request metrics.
+"""
+
+import asyncio
+
+import pytest
+import requests
+from unittest.mock import Mock
+
+from scheduler0 import Client, RequestMetrics
+from scheduler0.metrics import _bucket, _bucket_upper, status_class
+from scheduler0.types import ProjectRequestBody
+
+from .test_retry import make_response
+
+
+def response_with(status_code, content):
+    response = make_response(status_code, {"success": True})
+    response.content = content
+    return response
+
+
+class TestRequestMetrics:
+    """Test recording, snapshots and exports."""
+
+    def test_buckets_bound_values(self):
+        """Test every latency lies below its bucket's upper bound, within 1/16 of it."""
+        for seconds in (0.0000005, 0.000001, 0.0013, 0.0042, 0.25, 1.0, 7.5, 120.0):
+            upper = _bucket_upper(_bucket(seconds))
+            assert seconds < upper
+            assert upper <= max(seconds * (1 + 1 / 16), 1e-6)
+
+    def test_status_class(self):
+        """Test status codes are grouped by class."""
+        assert status_class(204) == "2xx"
+        assert status_class(503) == "5xx"
+        assert status_class(None) == "error"
+
+    def test_snapshot(self):
+        """Test attempts are aggregated by method and endpoint template."""
+        metrics = RequestMetrics()
+        for index in range(100):
+            metrics.record("get", f"/jobs/{index}", 200, (index + 1) / 1000, 0, 50)
+        metrics.record("GET", "/jobs/7", 503, 0.5)
+        metrics.record("GET", "/jobs/8", None, 2.0)
+        metrics.record("POST", "/jobs", 202, 0.01, 300, 20)
+
+        snapshot = metrics.snapshot()
+        assert list(snapshot) == ["POST /jobs", "GET /jobs/{id}"]
+        jobs = snapshot["GET /jobs/{id}"]
+        assert jobs["count"] == 102
+        assert jobs["statuses"] == {"2xx": 100, "5xx": 1, "error": 1}
+        assert jobs["error_rate"] == pytest.approx(2 / 102)
+        assert jobs["response_bytes"] == 5000
+        assert jobs["latency"]["p50"] == pytest.approx(0.051, rel=0.07)
+        assert jobs["latency"]["p99"] == pytest.approx(0.5, rel=0.07)
+        assert jobs["latency"]["max"] == 2.0
+        assert snapshot["POST /jobs"]["request_bytes"] == 300
+
+        metrics.reset()
+        assert metrics.snapshot() == {}
+
+    def test_prometheus_text(self):
+        """Test the exposition format of histograms and counters."""
+        metrics = RequestMetrics()
+        metrics.record("GET", "/projects/1", 200, 0.003, 0, 10)
+        metrics.record("GET", "/projects/2", 404, 0.2, 0, 5)
+        text = metrics.prometheus_text()
+
+        labels = 'method="GET",endpoint="/projects/{id}"'
+        assert "# TYPE scheduler0_client_request_duration_seconds histogram" in text
+        assert f'scheduler0_client_request_duration_seconds_bucket{{{labels},le="0.005"}} 1' in text
+        assert f'scheduler0_client_request_duration_seconds_bucket{{{labels},le="0.25"}} 2' in text
+        assert f'scheduler0_client_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+        assert f"scheduler0_client_request_duration_seconds_count{{{labels}}} 2" in text
+        assert f'scheduler0_client_requests_total{{{labels},status="4xx"}} 1' in text
+        assert f"scheduler0_client_response_bytes_total{{{labels}}} 15" in text
+        assert text.endswith("\n")
+
+    def test_opentelemetry_meter(self):
+        """Test attempts are also recorded into the meter's instruments."""
+        meter = Mock()
+        histograms = {}
+        meter.create_histogram.side_effect = lambda name, **kwargs: histograms.setdefault(name, Mock())
+        metrics = RequestMetrics(meter=meter)
+        metrics.record("DELETE", "/executors/3", None, 0.1, 12, 0)
+
+        duration = histograms["http.client.request.duration"]
+        duration.record.assert_called_once_with(
+            0.1, {"http.request.method": "DELETE", "url.template": "/executors/{id}", "error.type": "connection"},
+        )
+        histograms["http.client.request.body.size"].record.assert_called_once()
+
+
+class TestClientMetrics:
+    """Test metrics recorded by Client._request and AsyncClient._request."""
+
+    @pytest.fixture
+    def metrics(self):
+        return RequestMetrics()
+
+    @pytest.fixture
+    def measured_client(self, base_url, metrics):
+        return Client(base_url=base_url, api_key="k", api_secret="s", account_id="123", metrics=metrics)
+
+    def test_records_attempts(self, measured_client, metrics):
+        """Test responses and connection errors are recorded with byte sizes."""
+        measured_client.session.request = Mock(return_value=response_with(200, b'{"success": true}'))
+        measured_client.create_project(ProjectRequestBody(name="p", description="d", created_by="u"))
+        measured_client.session.request = Mock(side_effect=requests.ConnectionError)
+        with pytest.raises(requests.ConnectionError):
+            measured_client.get_project("1")
+
+        snapshot = metrics.snapshot()
+        created = snapshot["POST /projects"]
+        assert created["statuses"] == {"2xx": 1}
+        assert created["request_bytes"] > 0
+        assert created["response_bytes"] == len(b'{"success": true}')
+        assert snapshot["GET /projects/{id}"]["statuses"] == {"error": 1}
+
+    def test_disabled_by_default(self, client):
+        """Test a client without metrics has nothing to record into."""
+        assert client.metrics is None
+
+    def test_async_client_records(self, metrics):
+        """Test AsyncClient records its attempts."""
+        httpx = pytest.importorskip("httpx")
+        from scheduler0 import AsyncClient
+
+        def handler(request):
+            return httpx.Response(500, json={"success": False})
+
+        async def run():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncClient("http://localhost:7070", account_id="1", http_client=http_client,
+                                   metrics=metrics) as client:
+                with pytest.raises(requests.HTTPError):
+                    await client.get_job("1")
+
+        asyncio.run(run())
+        assert metrics.snapshot()["GET /jobs/{id}"]["statuses"] == {"5xx": 1}
@@ -0,0 +1,189 @@
+"""
+Tests for slotted models and typed clients.
+"""
+
+import copy
+import dataclasses
+import json
+import pickle
+import pytest
+from dataclasses import FrozenInstanceError
+from unittest.mock import Mock
+from scheduler0 import Client, models, types
+
+
+HEALTHCHECK = {
+    "leaderAddress": "node-1:7071",
+    "leaderId": "1",
+    "raftStats": {"applied_index": "10", "state": "Leader"},
+}
+
+
+class TestModels:
+    """Test generated models."""
+
+    def test_from_dict_camel_case(self):
+        """Test camelCase keys populate snake_case fields."""
+        job = models.Job.from_dict({"id": 1, "projectId": 2, "retryMax": 3, "spec": "@daily"})
+        assert job.id == 1
+        assert job.project_id == 2
+        assert job.retry_max == 3
+        assert job.status is None
+
+    def test_from_dict_only_on_generated_models(self):
+        """Test the base class has no placeholder converter."""
+        assert not hasattr(models.Model, "from_dict")
+        assert "from_dict" in vars(models.Job)
+
+    def test_slotted(self):
+        """Test models have no per-instance __dict__."""
+        execution = models.Execution.from_dict({"id": 1, "uniqueId": "u-1"})
+        assert not hasattr(execution, "__dict__")
+        assert execution.unique_id == "u-1"
+
+    def test_lazy_nested_field(self):
+        """Test nested models are only built when accessed."""
+        data = models.HealthcheckData.from_dict(HEALTHCHECK)
+        assert "raft_stats" in data._pending
+        stats = data.raft_stats
+        assert isinstance(stats, models.RaftStats)
+        assert stats.applied_index == "10"
+        assert stats.state == "Leader"
+        assert data._pending == {}
+        assert data.raft_stats is stats
+
+    def test_lazy_list_field(self):
+        """Test lists of nested models are converted on access."""
+        account = models.Account.from_dict({"id": 1, "name": "a", "features": [{"accountId": 1, "featureId": 2, "feature": "ai"}]})
+        assert account.features[0].feature_id == 2
+
+    def test_init_matches_dataclass(self):
+        """Test constructors accept the dataclass arguments and defaults."""
+        account = models.Account(id=1, name="a")
+        assert account.features == []
+        assert account.date_created is None
+        with pytest.raises(TypeError):
+            models.Account(name="a")
+
+    def test_equality_and_to_dict(self):
+        """Test value equality and snake_case dict export."""
+        first = models.HealthcheckData.from_dict(HEALTHCHECK)
+        second = models.HealthcheckData.from_dict(HEALTHCHECK)
+        assert first == second
+        assert first.to_dict()["raft_stats"]["applied_index"] == "10"
+
+    def test_unknown_attribute(self):
+        """Test missing attributes raise AttributeError."""
+        with pytest.raises(AttributeError):
+            models.Job().unknown
+
+    def test_frozen(self):
+        """Test fields cannot be assigned or deleted."""
+        job = models.Job.from_dict({"id": 1})
+        with pytest.raises(FrozenInstanceError):
+            job.id = 2
+        with pytest.raises(FrozenInstanceError):
+            del job.id
+        with pytest.raises(FrozenInstanceError):
+            job.extra = 1
+        assert job.id == 1
+
+    def test_hashable(self):
+        """Test equal models hash equally, including list fields."""
+        first = models.Account.from_dict({"id": 1, "features": [{"featureId": 2}]})
+        second = models.Account.from_dict({"id": 1, "features": [{"featureId": 2}]})
+        assert hash(first) == hash(second)
+        assert len({first, second, models.Account(id=2, name="b")}) == 2
+
+    def test_replace(self):
+        """Test replace returns a modified copy."""
+        job = models.Job.from_dict({"id": 1, "spec": "@daily"})
+        changed = job.replace(spec="@hourly")
+        assert changed.spec == "@hourly"
+        assert changed.id == 1
+        assert job.spec == "@daily"
+
+    def test_pickle_and_copy(self):
+        """Test models survive pickling and deep copies."""
+        account = models.Account.from_dict({"id": 1, "features": [{"featureId": 2}]})
+        assert pickle.loads(pickle.dumps(account)) == account
+        assert copy.deepcopy(account) == account
+
+    def test_dataclass_round_trip(self):
+        """Test conversion to and from the types.py dataclasses."""
+        account = types.Account(id=1, name="a", features=[types.AccountFeature(account_id=1, feature_id=2, feature="ai")])
+        model = models.Account.from_dataclass(account)
+        assert isinstance(model.features[0], models.AccountFeature)
+        assert model.to_dataclass() == account
+
+    def test_every_type_has_a_model(self):
+        """Test each types.py dataclass has a model of the same name."""
+        for name, source in vars(types).items():
+            if dataclasses.is_dataclass(source) and source.__module__ == types.__name__:
+                assert getattr(models, name) is models.model_for(source)
+
+    def test_request_body_serialization(self, client):
+        """Test slotted request bodies are sent like the dataclasses."""
+        response = Mock(status_code=201)
+        response.json.return_value = {"success": True, "data": "request-id"}
+        client.session.request = Mock(return_value=response)
+
+        client.batch_create_jobs([models.JobRequestBody(project_id=1, timezone="UTC", spec="@daily", account_id=123)])
+
+        body = json.loads(client.session.request.call_args.kwargs["data"])
+        assert body == [{"projectId": 1, "timezone": "UTC", "spec": "@daily"}]
+
+
+class TestDecodeTyped:
+    """Test response decoding by endpoint."""
+
+    def test_single_resource(self):
+        """Test single resource responses unwrap to a model."""
+        job = models.decode_typed("GET", "/jobs/{id}", {"success": True, "data": {"id": 5}})
+        assert isinstance(job, models.Job)
+        assert job.id == 5
+
+    def test_page(self):
+        """Test list responses decode into a Page."""
+        page = models.decode_typed("GET", "/executions", {
+            "success": True,
+            "data": {"total": 3, "offset": 0, "limit": 2, "executions": [{"id": 1}, {"id": 2}]},
+        })
+        assert isinstance(page, models.Page)
+        assert page.total == 3
+        assert len(page) == 2
+        assert [e.id for e in page] == [1, 2]
+
+    def test_bare_list(self):
+        """Test bare list payloads decode item by item."""
+        result = models.decode_typed("POST", "/prompt", [{"cronExpression": "0 9 * * 1"}])
+        assert result[0].cron_expression == "0 9 * * 1"
+
+    def test_untyped_endpoint_unchanged(self):
+        """Test endpoints without a model are returned unchanged."""
+        payload = {"success": True, "data": "request-id"}
+        assert models.decode_typed("POST", "/jobs", payload) is payload
+
+
+class TestTypedClient:
+    """Test typed mode on the client."""
+
+    def test_typed_get(self, base_url):
+        """Test a typed client returns models."""
+        client = Client(base_url=base_url, typed=True)
+        response = Mock(status_code=200)
+        response.json.return_value = {"success": True, "data": HEALTHCHECK}
+        client.session.request = Mock(return_value=response)
+
+        health = client.healthcheck()
+
+        assert isinstance(health, models.HealthcheckData)
+        assert health.leader_id == "1"
+
+    def test_untyped_by_default(self, client):
+        """Test clients return dicts unless typed is enabled."""
+        response = Mock(status_code=200)
+        response.json.return_value = {"success": True, "data": {"id": 1}}
+        client.session.request = Mock(return_value=response)
+
+        assert client.get_job("1") == {"success": True, "data": {"id": 1}}
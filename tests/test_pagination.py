@@ -0,0 +1,440 @@
+"""
+Tests for streaming pagination (iter_* and scan_* methods).
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from unittest.mock import patch
+from scheduler0 import Client, models
+from scheduler0.pagination import KeysetCursor, aiter_items, aiter_keyset, ascan_items, iter_items, page_items, scan_items
+
+
+def make_fetch(total, key="jobs", calls=None, report_total=True, max_limit=None):
+    """Return a fetch(offset, limit) serving ``total`` items as raw payloads, at most max_limit per page."""
+    def fetch(offset, limit):
+        if calls is not None:
+            calls.append((offset, limit))
+        if max_limit is not None:
+            limit = min(limit, max_limit)
+        data = {key: [{"id": i} for i in range(offset, min(offset + limit, total))]}
+        if report_total:
+            data["total"] = total
+        return {"success": True, "data": data}
+    return fetch
+
+
+class TestPageItems:
+    """Test item extraction from list responses."""
+
+    def test_raw_payload(self):
+        """Test items and total are read from the data envelope."""
+        items, total = page_items({"success": True, "data": {"total": "3", "jobs": [{"id": 1}]}}, "jobs")
+        assert items == [{"id": 1}]
+        assert total == 3
+
+    def test_typed_page(self):
+        """Test typed pages are read directly."""
+        page = models.Page([models.Job(id=1)], total=1)
+        assert page_items(page, "jobs") == ([models.Job(id=1)], 1)
+
+    def test_missing_key(self):
+        """Test responses without items yield nothing."""
+        assert page_items({"success": True, "data": {"total": 0}}, "jobs") == ([], 0)
+
+
+class TestIterItems:
+    """Test the synchronous page iterator."""
+
+    def test_yields_all_items_in_order(self):
+        """Test every item is yielded once, in order."""
+        calls = []
+        items = list(iter_items(make_fetch(25, calls=calls), "jobs", page_size=10))
+        assert [item["id"] for item in items] == list(range(25))
+        assert calls == [(0, 10), (10, 10), (20, 10)]
+
+    def test_without_total(self):
+        """Test paging stops at the first short page when no total is reported."""
+        calls = []
+        items = list(iter_items(make_fetch(20, calls=calls, report_total=False), "jobs", page_size=10))
+        assert len(items) == 20
+        assert calls == [(0, 10), (10, 10), (20, 10)]
+
+    def test_empty(self):
+        """Test an empty collection makes a single request."""
+        calls = []
+        assert list(iter_items(make_fetch(0, calls=calls), "jobs", page_size=10)) == []
+        assert calls == [(0, 10)]
+
+    def test_prefetches_next_page(self):
+        """Test page N+1 is requested before page N has been consumed."""
+        fetched = threading.Event()
+        fetch = make_fetch(20)
+
+        def tracking_fetch(offset, limit):
+            result = fetch(offset, limit)
+            if offset == 10:
+                fetched.set()
+            return result
+
+        iterator = iter_items(tracking_fetch, "jobs", page_size=10)
+        assert next(iterator)["id"] == 0
+        assert fetched.wait(timeout=5)
+        iterator.close()
+
+    def test_no_prefetch(self):
+        """Test prefetch=False fetches pages on demand."""
+        calls = []
+        iterator = iter_items(make_fetch(20, calls=calls), "jobs", page_size=10, prefetch=False)
+        next(iterator)
+        assert calls == [(0, 10)]
+        assert len(list(iterator)) == 19
+
+    def test_error_propagates(self):
+        """Test a failed page fetch is raised to the consumer."""
+        fetch = make_fetch(20)
+
+        def failing_fetch(offset, limit):
+            if offset:
+                raise RuntimeError("boom")
+            return fetch(offset, limit)
+
+        iterator = iter_items(failing_fetch, "jobs", page_size=10)
+        assert len([next(iterator) for _ in range(10)]) == 10
+        with pytest.raises(RuntimeError, match="boom"):
+            next(iterator)
+
+    def test_invalid_page_size(self):
+        """Test page_size must be positive."""
+        with pytest.raises(ValueError):
+            list(iter_items(make_fetch(1), "jobs", page_size=0))
+
+
+class TestAiterItems:
+    """Test the asynchronous page iterator."""
+
+    def test_yields_all_items(self):
+        """Test every item is yielded once, in order."""
+        fetch = make_fetch(25, key="executions")
+
+        async def afetch(offset, limit):
+            return fetch(offset, limit)
+
+        async def collect():
+            return [item["id"] async for item in aiter_items(afetch, "executions", page_size=10)]
+
+        assert asyncio.run(collect()) == list(range(25))
+
+    def test_early_stop(self):
+        """Test stopping early cancels the prefetch cleanly."""
+        fetch = make_fetch(100)
+
+        async def afetch(offset, limit):
+            await asyncio.sleep(0)
+            return fetch(offset, limit)
+
+        async def first_item():
+            iterator = aiter_items(afetch, "jobs", page_size=10)
+            item = await iterator.__anext__()
+            await iterator.aclose()
+            return item
+
+        assert asyncio.run(first_item()) == {"id": 0}
+
+
+class TestScanItems:
+    """Test the concurrent page scan."""
+
+    def test_ordered(self):
+        """Test ordered scans yield every item in server order."""
+        calls = []
+        items = list(scan_items(make_fetch(95, calls=calls), "jobs", page_size=10, max_workers=4))
+        assert [item["id"] for item in items] == list(range(95))
+        assert sorted(calls) == [(offset, 10) for offset in range(0, 100, 10)]
+
+    def test_as_completed(self):
+        """Test unordered scans yield every item, slow pages last."""
+        fetch = make_fetch(30)
+
+        def slow_first_pages(offset, limit):
+            if offset == 10:
+                time.sleep(0.05)
+            return fetch(offset, limit)
+
+        items = [item["id"] for item in scan_items(slow_first_pages, "jobs", page_size=10, ordered=False)]
+        assert sorted(items) == list(range(30))
+        assert items[-10:] == list(range(10, 20))
+
+    def test_bounded_concurrency(self):
+        """Test no more than max_workers pages are fetched at once."""
+        fetch = make_fetch(200)
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def tracking_fetch(offset, limit):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.005)
+            with lock:
+                state["active"] -= 1
+            return fetch(offset, limit)
+
+        assert len(list(scan_items(tracking_fetch, "jobs", page_size=10, max_workers=3))) == 200
+        assert 1 < state["peak"] <= 3
+
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_server_capped_page_size(self, ordered):
+        """Test no items are skipped when the server returns fewer items per page than requested."""
+        calls = []
+        fetch = make_fetch(1000, calls=calls, max_limit=100)
+        items = [item["id"] for item in scan_items(fetch, "jobs", page_size=250, ordered=ordered)]
+        assert (items if ordered else sorted(items)) == list(range(1000))
+        assert sorted(calls)[1:] == [(offset, 100) for offset in range(100, 1000, 100)]
+
+    def test_async_server_capped_page_size(self):
+        """Test the async scan plans its pages at the server's capped size."""
+        fetch = make_fetch(1000, max_limit=100)
+
+        async def afetch(offset, limit):
+            return fetch(offset, limit)
+
+        async def collect():
+            return [item["id"] async for item in ascan_items(afetch, "jobs", page_size=250)]
+
+        assert asyncio.run(collect()) == list(range(1000))
+
+    def test_without_total(self):
+        """Test endpoints without a total are read sequentially."""
+        calls = []
+        items = list(scan_items(make_fetch(25, calls=calls, report_total=False), "jobs", page_size=10))
+        assert len(items) == 25
+        assert calls == [(0, 10), (10, 10), (20, 10)]
+
+    def test_error_propagates(self):
+        """Test a failed page aborts the scan."""
+        fetch = make_fetch(50)
+
+        def failing_fetch(offset, limit):
+            if offset == 30:
+                raise RuntimeError("boom")
+            return fetch(offset, limit)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            list(scan_items(failing_fetch, "jobs", page_size=10))
+
+    def test_invalid_workers(self):
+        """Test max_workers must be positive."""
+        with pytest.raises(ValueError):
+            list(scan_items(make_fetch(1), "jobs", max_workers=0))
+
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_async(self, ordered):
+        """Test the async scan yields every item with bounded concurrency."""
+        fetch = make_fetch(95)
+        state = {"active": 0, "peak": 0}
+
+        async def afetch(offset, limit):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.001)
+            state["active"] -= 1
+            return fetch(offset, limit)
+
+        async def collect():
+            return [item["id"] async for item in ascan_items(afetch, "jobs", page_size=10, max_workers=4, ordered=ordered)]
+
+        items = asyncio.run(collect())
+        assert (items if ordered else sorted(items)) == list(range(95))
+        assert state["peak"] <= 4
+
+
+class FakeExecutionStore:
+    """In-memory /executions endpoint honoring date filters, ordering, limit and offset."""
+
+    def __init__(self, timestamps):
+        self.rows = [
+            {"uniqueId": f"u-{i}", "dateCreated": ts}
+            for i, ts in enumerate(timestamps)
+        ]
+        self.requests = []
+
+    def get(self, endpoint, params, account_id_override):
+        self.requests.append(dict(params))
+        rows = [
+            row for row in self.rows
+            if ("startDate" not in params or row["dateCreated"] >= params["startDate"])
+            and ("endDate" not in params or row["dateCreated"] <= params["endDate"])
+        ]
+        rows.sort(key=lambda row: (row["dateCreated"], row["uniqueId"]), reverse=params.get("orderDirection") == "DESC")
+        offset, limit = int(params["offset"]), int(params["limit"])
+        return {"success": True, "data": {"total": len(rows), "executions": rows[offset:offset + limit]}}
+
+
+def timestamp(minute):
+    return f"2025-01-01T00:{minute:02d}:00Z"
+
+
+class TestKeysetPagination:
+    """Test keyset (seek) pagination of executions."""
+
+    def test_cursor_dedupes_boundary(self):
+        """Test items at the watermark are skipped by offset and deduplicated."""
+        cursor = KeysetCursor("date_created", "unique_id")
+        first = cursor.advance([{"uniqueId": "a", "dateCreated": "t1"}, {"uniqueId": "b", "dateCreated": "t2"}])
+        assert len(first) == 2
+        assert (cursor.watermark, cursor.offset) == ("t2", 1)
+        assert cursor.advance([{"uniqueId": "b", "dateCreated": "t2"}, {"uniqueId": "c", "dateCreated": "t2"}]) == [
+            {"uniqueId": "c", "dateCreated": "t2"}
+        ]
+        assert cursor.offset == 2
+
+    def test_cursor_reads_typed_items(self):
+        """Test typed models are read by attribute."""
+        cursor = KeysetCursor("date_created", "unique_id")
+        cursor.advance([models.Execution(id=1, account_id=1, unique_id="u", state=0, node_id=1, job_id=1, date_created="t")])
+        assert cursor.watermark == "t"
+
+    def test_cursor_requires_field(self):
+        """Test items without the ordering field are rejected."""
+        with pytest.raises(ValueError):
+            KeysetCursor("date_created", "unique_id").advance([{"uniqueId": "u"}])
+
+    @patch('scheduler0.client.Client._get')
+    def test_scans_everything_once(self, mock_get, client):
+        """Test every execution is yielded once, including runs of equal timestamps."""
+        store = FakeExecutionStore([timestamp(i // 3) for i in range(50)] + [timestamp(30)] * 7)
+        mock_get.side_effect = store.get
+
+        ids = [e["uniqueId"] for e in client.iter_executions_keyset(page_size=4)]
+
+        assert sorted(ids) == sorted(row["uniqueId"] for row in store.rows)
+        assert len(ids) == len(set(ids))
+        # Offsets stay bounded by the largest run of equal timestamps
+        assert max(int(params["offset"]) for params in store.requests) <= 7
+        assert store.requests[-1]["startDate"] == timestamp(30)
+
+    @patch('scheduler0.client.Client._get')
+    def test_stable_under_inserts(self, mock_get, client):
+        """Test executions created behind the watermark do not cause duplicates."""
+        store = FakeExecutionStore([timestamp(i) for i in range(20)])
+        calls = []
+
+        def get(endpoint, params, account_id_override):
+            calls.append(params)
+            if len(calls) == 2:
+                # New executions land before the watermark mid-scan
+                store.rows.extend({"uniqueId": f"late-{i}", "dateCreated": timestamp(0)} for i in range(5))
+            return store.get(endpoint, params, account_id_override)
+
+        mock_get.side_effect = get
+        ids = [e["uniqueId"] for e in client.iter_executions_keyset(page_size=5)]
+
+        assert ids == [f"u-{i}" for i in range(20)]
+
+    @patch('scheduler0.client.Client._get')
+    def test_descending(self, mock_get, client):
+        """Test descending scans move end_date back."""
+        store = FakeExecutionStore([timestamp(i) for i in range(12)])
+        mock_get.side_effect = store.get
+
+        ids = [e["uniqueId"] for e in client.iter_executions_keyset(
+            end_date=timestamp(9), order_direction="DESC", page_size=4, state="failed",
+        )]
+
+        assert ids == [f"u-{i}" for i in range(9, -1, -1)]
+        assert all(params["orderDirection"] == "DESC" and params["state"] == "failed" for params in store.requests)
+        assert "startDate" not in store.requests[-1]
+
+    @patch('scheduler0.client.Client._get')
+    def test_resume_from_cursor(self, mock_get, client):
+        """Test a scan can be resumed from its cursor."""
+        store = FakeExecutionStore([timestamp(i) for i in range(10)])
+        mock_get.side_effect = store.get
+        cursor = KeysetCursor("date_created", "unique_id")
+
+        iterator = client.iter_executions_keyset(page_size=3, cursor=cursor)
+        first = [next(iterator)["uniqueId"] for _ in range(3)]
+        rest = [e["uniqueId"] for e in client.iter_executions_keyset(page_size=3, cursor=cursor)]
+
+        assert first + rest == [f"u-{i}" for i in range(10)]
+
+    def test_async(self):
+        """Test the async keyset iterator."""
+        store = FakeExecutionStore([timestamp(i // 2) for i in range(9)])
+
+        async def fetch(watermark, offset, limit):
+            params = {"offset": str(offset), "limit": str(limit)}
+            if watermark:
+                params["startDate"] = watermark
+            return store.get("/executions", params, None)
+
+        async def collect():
+            cursor = KeysetCursor("date_created", "unique_id")
+            return [e["uniqueId"] async for e in aiter_keyset(fetch, "executions", cursor, page_size=2)]
+
+        assert asyncio.run(collect()) == [f"u-{i}" for i in range(9)]
+
+    def test_invalid_order_by(self, client):
+        """Test only timestamp orderings are accepted."""
+        with pytest.raises(ValueError):
+            client.iter_executions_keyset(order_by="nextExecutionDateTime")
+
+
+class TestClientIterators:
+    """Test the iter_* methods on Client."""
+
+    @patch('scheduler0.client.Client._get')
+    def test_iter_jobs(self, mock_get, client):
+        """Test iter_jobs pages through list_jobs with the filters applied."""
+        fetch = make_fetch(15)
+        mock_get.side_effect = lambda endpoint, params, account_id_override: fetch(int(params["offset"]), int(params["limit"]))
+
+        jobs = list(client.iter_jobs(project_id="7", page_size=10, order_by="id"))
+
+        assert len(jobs) == 15
+        params = [call[1]["params"] for call in mock_get.call_args_list]
+        assert sorted(p["offset"] for p in params) == ["0", "10"]
+        assert all(p["projectId"] == "7" and p["orderBy"] == "id" for p in params)
+
+    @patch('scheduler0.client.Client._get')
+    def test_iter_executions(self, mock_get, client):
+        """Test iter_executions reads the executions key."""
+        fetch = make_fetch(3, key="executions")
+        mock_get.side_effect = lambda endpoint, params, account_id_override: fetch(int(params["offset"]), int(params["limit"]))
+
+        executions = list(client.iter_executions(job_id=5, page_size=2))
+
+        assert [e["id"] for e in executions] == [0, 1, 2]
+        assert mock_get.call_args[1]["params"]["jobId"] == "5"
+
+    @patch('scheduler0.client.Client._get')
+    def test_scan_executions(self, mock_get, client):
+        """Test scan_executions fans out over list_executions with the filters applied."""
+        fetch = make_fetch(45, key="executions")
+        mock_get.side_effect = lambda endpoint, params, account_id_override: fetch(int(params["offset"]), int(params["limit"]))
+
+        executions = list(client.scan_executions(state="failed", page_size=10, max_workers=2))
+
+        assert [e["id"] for e in executions] == list(range(45))
+        params = [call[1]["params"] for call in mock_get.call_args_list]
+        assert sorted(int(p["offset"]) for p in params) == [0, 10, 20, 30, 40]
+        assert all(p["state"] == "failed" for p in params)
+
+    @pytest.mark.parametrize("resource", ["jobs", "projects", "executors", "credentials", "executions"])
+    def test_methods_attached(self, resource):
+        """Test every list endpoint has an iterator and a scan."""
+        assert callable(getattr(Client, f"iter_{resource}"))
+        assert callable(getattr(Client, f"scan_{resource}"))
+
+    def test_typed_client(self, base_url):
+        """Test typed clients stream models."""
+        client = Client(base_url=base_url, typed=True)
+        payload = {"success": True, "data": {"total": 1, "projects": [{"id": 4, "name": "p"}]}}
+        with patch.object(client, "_request") as mock_request:
+            mock_request.return_value.json.return_value = payload
+            projects = list(client.iter_projects())
+        assert isinstance(projects[0], models.Project)
+        assert projects[0].name == "p"
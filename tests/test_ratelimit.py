@@ -0,0 +1,170 @@
+"""
+Tests for the client-side rate limiter.
+"""
+
+import asyncio
+import multiprocessing
+import sys
+import threading
+
+import pytest
+import requests
+from unittest.mock import Mock, patch
+
+from scheduler0 import Client, RateLimit, RateLimiter
+from scheduler0.ratelimit import endpoint_class
+
+from .test_retry import make_response
+
+
+# state_file locks the file with fcntl, which Windows does not have
+posix_only = pytest.mark.skipif(sys.platform == "win32", reason="RateLimiter state_file requires fcntl")
+
+
+def reserve_from_file(path, count, queue):
+    limiter = RateLimiter(default=RateLimit(rate=0.01, burst=4), state_file=path)
+    queue.put([limiter.reserve("1", "GET", "/jobs") for _ in range(count)])
+
+
+class TestRateLimiter:
+    """Test token buckets and 429 feedback."""
+
+    def test_endpoint_class(self):
+        """Test requests are classed by resource and by reading or writing."""
+        assert endpoint_class("GET", "/jobs/5") == "jobs:read"
+        assert endpoint_class("post", "/jobs") == "jobs:write"
+        assert endpoint_class("DELETE", "projects/1?x=1") == "projects:write"
+
+    def test_burst_then_rate(self, clock):
+        """Test the burst is admitted at once and later requests are spaced by the rate."""
+        limiter = RateLimiter(default=RateLimit(rate=10, burst=3), clock=clock)
+
+        delays = [limiter.reserve("1", "GET", "/jobs") for _ in range(5)]
+        assert delays[:3] == [0, 0, 0]
+        assert delays[3:] == pytest.approx([0.1, 0.2])
+
+        clock.now += 1
+        assert limiter.reserve("1", "GET", "/jobs") == 0
+        assert limiter.stats()["delayed"] == 2
+
+    def test_buckets_per_account_and_class(self, clock):
+        """Test accounts and endpoint classes do not share tokens."""
+        limiter = RateLimiter(
+            default=RateLimit(rate=1, burst=1), limits={"jobs:write": RateLimit(rate=100, burst=1)}, clock=clock,
+        )
+        assert limiter.reserve("1", "GET", "/jobs") == 0
+        assert limiter.reserve("2", "GET", "/jobs") == 0
+        assert limiter.reserve("1", "GET", "/projects") == 0
+        assert limiter.reserve("1", "GET", "/jobs") == pytest.approx(1.0)
+        assert limiter.reserve("1", "POST", "/jobs") == 0
+        assert limiter.reserve("1", "POST", "/jobs") == pytest.approx(0.01)
+
+    def test_throttle_halves_rate_and_recovers(self, clock):
+        """Test a 429 halves the rate, which then recovers towards the configured one."""
+        limiter = RateLimiter(default=RateLimit(rate=10, burst=10), recovery=0.1, clock=clock)
+        limiter.reserve("1", "GET", "/jobs")
+        limiter.throttle("1", "GET", "/jobs")
+
+        # No burst left, one request every 1/5 s
+        assert limiter.reserve("1", "GET", "/jobs") == pytest.approx(0.2)
+        limiter.throttle("1", "GET", "/jobs")
+        clock.now += 1
+        # 2.5 req/s regained 1 req/s in one second
+        limiter.reserve("1", "GET", "/jobs")
+        assert limiter._store._buckets["1|jobs:read"][2] == pytest.approx(3.5)
+        clock.now += 100
+        limiter.reserve("1", "GET", "/jobs")
+        assert limiter._store._buckets["1|jobs:read"][2] == 10
+        assert limiter.stats()["throttled"] == 2
+
+    def test_retry_after_holds_bucket(self, clock):
+        """Test no request is admitted before Retry-After has passed."""
+        limiter = RateLimiter(default=RateLimit(rate=10, burst=10), clock=clock)
+        limiter.throttle("1", "GET", "/jobs", retry_after="3")
+
+        assert limiter.reserve("1", "GET", "/jobs") >= 3
+        assert limiter.reserve("2", "GET", "/jobs") == 0
+
+    def test_invalid_limits(self):
+        """Test unusable limits are rejected."""
+        with pytest.raises(ValueError):
+            RateLimiter(default=RateLimit(rate=0))
+        with pytest.raises(ValueError):
+            RateLimiter(limits={"jobs:read": RateLimit(burst=0)})
+
+    @posix_only
+    def test_state_file_is_shared_between_processes(self, tmp_path):
+        """Test processes using the same state file draw from one bucket."""
+        path = str(tmp_path / "buckets.json")
+        context = multiprocessing.get_context("spawn")
+        queue = context.Queue()
+        workers = [context.Process(target=reserve_from_file, args=(path, 4, queue)) for _ in range(2)]
+        for worker in workers:
+            worker.start()
+        delays = sorted(queue.get(timeout=30) + queue.get(timeout=30))
+        for worker in workers:
+            worker.join()
+
+        # 8 requests against a burst of 4: four go out at once, the others wait
+        assert delays[:4] == [0, 0, 0, 0]
+        assert all(delay > 0 for delay in delays[4:])
+
+
+class TestClientRateLimiting:
+    """Test the limiter in Client._request."""
+
+    @pytest.fixture
+    def limiter(self, clock):
+        return RateLimiter(default=RateLimit(rate=10, burst=1), clock=clock)
+
+    @pytest.fixture
+    def limited_client(self, base_url, limiter):
+        return Client(base_url=base_url, api_key="k", api_secret="s", account_id="123", rate_limiter=limiter)
+
+    @patch('scheduler0.client.time.sleep')
+    def test_waits_beyond_burst(self, mock_sleep, limited_client):
+        """Test requests beyond the burst sleep for their token."""
+        limited_client.session.request = Mock(return_value=make_response(200, {"success": True}))
+        limited_client.get_job("1")
+        limited_client.get_job("2", account_id_override="999")
+        mock_sleep.assert_not_called()
+        limited_client.get_job("3")
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(0.1)
+
+    def test_429_throttles_bucket(self, limited_client, limiter):
+        """Test a 429 response slows the bucket of the account and endpoint class."""
+        limited_client.session.request = Mock(return_value=make_response(429, headers={"Retry-After": "5"}))
+        with pytest.raises(requests.HTTPError):
+            limited_client.get_job("1")
+
+        assert limiter.stats()["throttled"] == 1
+        assert limiter.reserve("123", "GET", "/jobs/2") >= 5
+        assert limiter.reserve("123", "POST", "/jobs") == 0
+
+    @posix_only
+    def test_async_file_limiter_runs_off_the_loop(self, tmp_path):
+        """Test AsyncClient updates a file-backed limiter from the default executor, not the event loop."""
+        httpx = pytest.importorskip("httpx")
+        from scheduler0 import AsyncClient
+
+        limiter = RateLimiter(default=RateLimit(rate=10, burst=10), state_file=str(tmp_path / "buckets.json"))
+        assert limiter.blocking
+        assert not RateLimiter().blocking
+        threads = []
+        reserve = limiter.reserve
+
+        def record_thread(*args):
+            threads.append(threading.current_thread())
+            return reserve(*args)
+
+        limiter.reserve = record_thread
+
+        async def run():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={})))
+            async with AsyncClient("http://localhost:7070", account_id="1", http_client=http_client,
+                                   rate_limiter=limiter) as client:
+                await client.get_job("1")
+
+        asyncio.run(run())
+        assert threads and threads[0] is not threading.main_thread()
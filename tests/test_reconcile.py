@@ -0,0 +1,173 @@
+"""
+Tests for declarative job reconciliation.
+"""
+
+import asyncio
+import json
+
+import pytest
+from unittest.mock import patch
+
+from scheduler0 import JobPlan, JobRequestBody, ReconcileReport, models
+from scheduler0.reconcile import plan_job_changes
+
+
+def desired(name, spec="@every 1m", **fields):
+    return JobRequestBody(project_id=1, timezone="UTC", data=name, spec=spec, **fields)
+
+
+def listed(job_id, name, spec="@every 1m", **fields):
+    return {"id": job_id, "projectId": 1, "timezone": "UTC", "data": name, "spec": spec, "status": "active", **fields}
+
+
+class FakeJobStore:
+    """Serves list_jobs for one project and records writes."""
+
+    def __init__(self, jobs):
+        self.jobs = jobs
+        self.created, self.updated, self.deleted = [], {}, []
+
+    def get(self, endpoint, params=None, account_id_override=None):
+        if endpoint.startswith("/async-tasks/"):
+            return {"success": True, "data": {"state": 2}}
+        assert endpoint == "/jobs" and params["projectId"] == "1"
+        offset, limit = int(params["offset"]), int(params["limit"])
+        return {"success": True, "data": {"total": len(self.jobs), "jobs": self.jobs[offset:offset + limit]}}
+
+    def post(self, endpoint, body, account_id_override=None):
+        self.created.extend(job["data"] for job in json.loads(body))
+        return {"success": True, "data": f"req-{len(self.created)}"}
+
+    def put(self, endpoint, body, account_id_override=None):
+        self.updated[endpoint.rsplit("/", 1)[1]] = body
+        return {"success": True, "data": {}}
+
+    def delete(self, endpoint, body, account_id_override=None):
+        self.deleted.append(endpoint.rsplit("/", 1)[1])
+
+    def patch(self, client):
+        return patch.multiple(client, _get=self.get, _post=self.post, _put=self.put, _delete=self.delete)
+
+
+class TestPlanJobChanges:
+    """Test plan computation."""
+
+    def test_minimal_plan(self):
+        """Test only new, changed and removed jobs are planned."""
+        current = [listed(1, "keep"), listed(2, "change"), listed(3, "remove")]
+        plan = plan_job_changes(1, [desired("keep"), desired("change", spec="@every 5m"), desired("new")], current, "ops", prune=True)
+
+        assert [job.data for job in plan.creates] == ["new"]
+        [(job_id, update)] = plan.updates
+        assert (job_id, update.spec, update.modified_by, update.data) == ("2", "@every 5m", "ops", None)
+        assert plan.deletes == ["3"]
+        assert plan.unchanged == 1
+        assert plan.changes == 3
+        assert "1 to create" in plan.summary()
+
+    def test_unset_desired_fields_are_not_compared(self):
+        """Test fields left None in the desired job keep their server value."""
+        plan = plan_job_changes(1, [desired("a", retry_max=None)], [listed(1, "a", retryMax=5)], "ops")
+        assert plan.changes == 0
+
+    def test_no_prune_by_default(self):
+        """Test jobs missing from the desired set are kept unless prune is on."""
+        plan = plan_job_changes(1, [], [listed(1, "a")], "ops")
+        assert plan.deletes == []
+
+    def test_custom_key_and_typed_jobs(self):
+        """Test a key function applied to desired and typed current jobs alike."""
+        current = [models.Job.from_dict(listed(9, "payload-1", spec="@daily"))]
+        plan = plan_job_changes(1, [desired("payload-2", spec="@daily")], current, "ops", key=lambda job: job.spec)
+
+        [(job_id, update)] = plan.updates
+        assert (job_id, update.data) == ("9", "payload-2")
+
+    def test_duplicates(self):
+        """Test duplicate desired keys are rejected and unpairable current jobs reported, not deleted."""
+        with pytest.raises(ValueError, match="Duplicate"):
+            plan_job_changes(1, [desired("a"), desired("a")], [], "ops")
+        current = [listed(1, "a"), listed(2, "a"), listed(3, None)]
+        plan = plan_job_changes(1, [desired("a")], current, "ops", prune=True)
+        assert plan.deletes == []
+        assert plan.conflicts == ["2", "3"]
+        assert plan.unchanged == 1
+
+    def test_other_project(self):
+        """Test desired jobs of another project are rejected."""
+        job = desired("a")
+        job.project_id = 2
+        with pytest.raises(ValueError, match="project"):
+            plan_job_changes(1, [job], [], "ops")
+
+
+class TestReconcileJobs:
+    """Test Client.reconcile_jobs."""
+
+    def test_applies_only_changes(self, client):
+        """Test a sync sends one request per change and none for unchanged jobs."""
+        store = FakeJobStore([listed(i, f"job-{i}") for i in range(250)])
+        wanted = [desired(f"job-{i}") for i in range(1, 250)]
+        wanted[10] = desired("job-11", spec="@hourly")
+        wanted.append(desired("job-new"))
+
+        with store.patch(client):
+            report = client.reconcile_jobs(1, wanted, modified_by="deploy", prune=True)
+
+        assert isinstance(report, ReconcileReport)
+        assert report.ok
+        assert store.created == ["job-new"]
+        assert list(store.updated) == ["11"]
+        assert store.updated["11"].spec == "@hourly"
+        assert store.deleted == ["0"]
+        assert report.plan.unchanged == 248
+
+    def test_dry_run(self, client):
+        """Test a dry run only computes the plan."""
+        store = FakeJobStore([listed(1, "a")])
+
+        with store.patch(client):
+            report = client.reconcile_jobs(1, [desired("b")], modified_by="deploy", prune=True, dry_run=True)
+
+        assert isinstance(report.plan, JobPlan)
+        assert report.plan.changes == 2
+        assert report.created is None and report.deleted is None
+        assert store.created == store.deleted == []
+
+    def test_in_sync_sends_nothing(self, client):
+        """Test nothing is written when the project already matches."""
+        store = FakeJobStore([listed(1, "a")])
+
+        with store.patch(client):
+            report = client.reconcile_jobs(1, [desired("a")], modified_by="deploy")
+
+        assert (report.created, report.updated, report.deleted) == (None, None, None)
+
+    def test_async(self):
+        """Test AsyncClient.reconcile_jobs."""
+        httpx = pytest.importorskip("httpx")
+        from scheduler0 import AsyncClient
+
+        store = FakeJobStore([listed(1, "a"), listed(2, "b")])
+
+        def handler(request):
+            path = request.url.path.replace("/api/v1", "")
+            if request.method == "GET":
+                return httpx.Response(200, json=store.get(path, dict(request.url.params)))
+            if request.method == "POST":
+                store.created.append("posted")
+                return httpx.Response(202, json={"success": True, "data": "req-1"})
+            if request.method == "DELETE":
+                store.delete(path, None)
+                return httpx.Response(204)
+            return httpx.Response(200, json={"success": True, "data": {}})
+
+        async def run():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncClient("http://localhost:7070", account_id="123", http_client=http_client) as client:
+                return await client.reconcile_jobs(1, [desired("a"), desired("c")], modified_by="deploy", prune=True)
+
+        report = asyncio.run(run())
+        assert report.ok
+        assert store.created == ["posted"]
+        assert store.deleted == ["2"]
@@ -0,0 +1,165 @@
+"""
+Tests for the retry policy.
+"""
+
+import pytest
+import requests
+from unittest.mock import Mock, patch
+from scheduler0 import Client, RetryPolicy, RetryBudget
+from scheduler0.retry import parse_retry_after
+
+
+def make_response(status_code, json_data=None, headers=None):
+    """Create a mock response with real headers."""
+    response = Mock()
+    response.status_code = status_code
+    response.json.return_value = json_data or {}
+    response.text = ""
+    response.headers = headers or {}
+    return response
+
+
+@pytest.fixture
+def retry_client(base_url, api_key, api_secret, account_id):
+    """Create a client with a retry policy and no budget."""
+    return Client(
+        base_url=base_url,
+        api_key=api_key,
+        api_secret=api_secret,
+        account_id=account_id,
+        retry_policy=RetryPolicy(max_attempts=3, budget=None),
+    )
+
+
+class TestRetryPolicy:
+    """Test retry decisions."""
+
+    def test_backoff_full_jitter_bounds(self):
+        """Test backoff is drawn between zero and the capped exponential ceiling."""
+        policy = RetryPolicy(backoff_base=0.5, backoff_max=2.0)
+        for attempt in range(6):
+            delay = policy.backoff(attempt)
+            assert 0 <= delay <= min(2.0, 0.5 * 2 ** attempt)
+
+    def test_reads_retried_writes_not(self):
+        """Test only idempotent reads are retried by default."""
+        policy = RetryPolicy(budget=None)
+        assert policy.next_delay("GET", 0, 503) is not None
+        assert policy.next_delay("POST", 0, 503) is None
+        assert policy.next_delay("DELETE", 0, 503) is None
+
+    def test_writes_retried_when_allowed(self):
+        """Test writes are retried when explicitly enabled."""
+        policy = RetryPolicy(retry_writes=True, budget=None)
+        assert policy.next_delay("POST", 0, 503) is not None
+
+    def test_non_retryable_status(self):
+        """Test client errors are not retried."""
+        policy = RetryPolicy(budget=None)
+        assert policy.next_delay("GET", 0, 404) is None
+
+    def test_max_attempts(self):
+        """Test retries stop after max_attempts."""
+        policy = RetryPolicy(max_attempts=2, budget=None)
+        assert policy.next_delay("GET", 0, 503) is not None
+        assert policy.next_delay("GET", 1, 503) is None
+
+    def test_retry_after_seconds(self):
+        """Test Retry-After delta-seconds replaces the backoff."""
+        policy = RetryPolicy(budget=None)
+        assert policy.next_delay("GET", 0, 429, retry_after="7") == 7.0
+
+    def test_retry_after_too_long(self):
+        """Test giving up when Retry-After exceeds the maximum wait."""
+        policy = RetryPolicy(max_retry_after=5, budget=None)
+        assert policy.next_delay("GET", 0, 429, retry_after="30") is None
+
+    def test_parse_retry_after_http_date(self):
+        """Test Retry-After HTTP dates in the past resolve to zero."""
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("not a date") is None
+
+    def test_parse_retry_after_rejects_non_finite(self):
+        """Test nan and infinite delta-seconds are not accepted as delays."""
+        for value in ("nan", "inf", "-inf", "Infinity"):
+            assert parse_retry_after(value) is None
+
+    def test_parse_retry_after_max_delay(self):
+        """Test delays are clamped to max_delay."""
+        assert parse_retry_after("30", max_delay=5.0) == 5.0
+        assert parse_retry_after("3", max_delay=5.0) == 3.0
+
+    def test_non_finite_retry_after_uses_backoff(self):
+        """Test a nan or infinite Retry-After falls back to the backoff."""
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=2.0, budget=None)
+        for value in ("nan", "inf"):
+            assert 0 <= policy.next_delay("GET", 0, 429, retry_after=value) <= 2.0
+
+
+class TestRetryBudget:
+    """Test the retry budget."""
+
+    def test_budget_limits_retries(self):
+        """Test retries are capped by the deposit ratio."""
+        budget = RetryBudget(ratio=0.5, min_retries_per_second=0)
+        for _ in range(4):
+            budget.record_request()
+        assert budget.try_spend() is True
+        assert budget.try_spend() is True
+        assert budget.try_spend() is False
+
+    def test_policy_respects_budget(self):
+        """Test an exhausted budget stops retries."""
+        policy = RetryPolicy(budget=RetryBudget(ratio=0, min_retries_per_second=0))
+        assert policy.next_delay("GET", 0, 503) is None
+
+
+class TestClientRetries:
+    """Test retries in Client._request."""
+
+    @patch('scheduler0.client.time.sleep')
+    def test_retries_then_succeeds(self, mock_sleep, retry_client):
+        """Test a GET is retried after a 503."""
+        retry_client.session.request = Mock(side_effect=[
+            make_response(503),
+            make_response(200, {"success": True}),
+        ])
+        assert retry_client._get("/jobs") == {"success": True}
+        assert retry_client.session.request.call_count == 2
+        assert mock_sleep.call_count == 1
+
+    @patch('scheduler0.client.time.sleep')
+    def test_honors_retry_after(self, mock_sleep, retry_client):
+        """Test the Retry-After header sets the wait."""
+        retry_client.session.request = Mock(side_effect=[
+            make_response(429, headers={"Retry-After": "2"}),
+            make_response(200, {"success": True}),
+        ])
+        retry_client._get("/jobs")
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch('scheduler0.client.time.sleep')
+    def test_retries_connection_errors(self, mock_sleep, retry_client):
+        """Test connection resets are retried for reads."""
+        retry_client.session.request = Mock(side_effect=[
+            requests.ConnectionError("reset"),
+            make_response(200, {"success": True}),
+        ])
+        assert retry_client._get("/jobs") == {"success": True}
+
+    @patch('scheduler0.client.time.sleep')
+    def test_gives_up_after_max_attempts(self, mock_sleep, retry_client):
+        """Test the last error is raised once attempts are exhausted."""
+        retry_client.session.request = Mock(return_value=make_response(503))
+        with pytest.raises(requests.HTTPError):
+            retry_client._get("/jobs")
+        assert retry_client.session.request.call_count == 3
+
+    @patch('scheduler0.client.time.sleep')
+    def test_writes_not_retried(self, mock_sleep, retry_client):
+        """Test POST is not retried by default."""
+        retry_client.session.request = Mock(return_value=make_response(503))
+        with pytest.raises(requests.HTTPError):
+            retry_client._post("/jobs", [])
+        assert retry_client.session.request.call_count == 1
+        mock_sleep.assert_not_called()
@@ -0,0 +1,201 @@
+"""
+Tests for raft leader routing.
+"""
+
+import pytest
+import requests
+from unittest.mock import Mock
+from scheduler0 import Client, NewClusterClient, LeaderRouter
+from scheduler0.types import ProjectRequestBody
+
+
+NODES = ["http://node-1:7070", "http://node-2:7070", "http://node-3:7070"]
+
+
+def healthcheck_payload(leader_address, leader_id="2"):
+    """Build a /healthcheck response body."""
+    return {"success": True, "data": {"leaderAddress": leader_address, "leaderId": leader_id, "raftStats": {}}}
+
+
+def make_response(status_code=200, json_data=None, headers=None):
+    """Create a mock response."""
+    response = Mock()
+    response.status_code = status_code
+    response.json.return_value = json_data if json_data is not None else {}
+    response.text = ""
+    response.headers = headers or {}
+    return response
+
+
+@pytest.fixture
+def cluster_client():
+    """Create a client for a three node cluster."""
+    return NewClusterClient(NODES, "v1", "key", "secret", account_id="123")
+
+
+class TestLeaderRouter:
+    """Test leader resolution."""
+
+    def test_default_url_added_to_nodes(self):
+        """Test the default URL is always a candidate node."""
+        router = LeaderRouter(["http://node-2:7070"], "http://node-1:7070/")
+        assert router.nodes == ["http://node-1:7070", "http://node-2:7070"]
+        assert router.write_base_url() == "http://node-1:7070"
+        assert router.needs_refresh() is True
+
+    def test_resolve_exact_netloc(self):
+        """Test a leader address matching a node's host and port."""
+        router = LeaderRouter(NODES, NODES[0])
+        assert router.resolve_address("node-2:7070") == "http://node-2:7070"
+
+    def test_resolve_raft_port_by_host(self):
+        """Test a raft address on a different port resolves by host."""
+        router = LeaderRouter(NODES, NODES[0])
+        assert router.resolve_address("node-3:7071") == "http://node-3:7070"
+
+    def test_resolve_unknown(self):
+        """Test an unknown leader address is not resolved."""
+        router = LeaderRouter(NODES, NODES[0])
+        assert router.resolve_address("10.0.0.9:7071") is None
+
+    def test_resolve_address_map(self):
+        """Test explicit address mappings take precedence."""
+        router = LeaderRouter(NODES, NODES[0], address_map={"raft-2": "http://node-2:7070"})
+        assert router.resolve_address("10.0.0.9:7071", leader_id="raft-2") == "http://node-2:7070"
+
+    def test_update_from_healthcheck(self):
+        """Test the leader is learned from a healthcheck body."""
+        router = LeaderRouter(NODES, NODES[0])
+        assert router.update_from_healthcheck(healthcheck_payload("node-2:7071")) is True
+        assert router.write_base_url() == "http://node-2:7070"
+        assert router.leader_id == "2"
+        assert router.needs_refresh() is False
+        assert router.refresh_order()[0] == "http://node-2:7070"
+
+    def test_update_from_redirect(self):
+        """Test the leader is learned from a redirect Location."""
+        router = LeaderRouter(NODES, NODES[0])
+        assert router.update_from_redirect("http://node-3:7070/api/v1/jobs") is True
+        assert router.write_base_url() == "http://node-3:7070"
+        assert router.update_from_redirect("http://node-3:7070/api/v1/jobs") is False
+
+    def test_invalid_node_url(self):
+        """Test node URLs must include a scheme."""
+        with pytest.raises(ValueError):
+            LeaderRouter(["node-1:7070"], "http://node-1:7070")
+
+
+class TestClientLeaderRouting:
+    """Test write routing in Client._request."""
+
+    def test_writes_go_to_leader(self, cluster_client):
+        """Test POST requests are sent to the discovered leader."""
+        cluster_client.session.get = Mock(return_value=make_response(json_data=healthcheck_payload("node-2:7071")))
+        cluster_client.session.request = Mock(return_value=make_response(201, {"success": True}))
+
+        cluster_client.create_project(ProjectRequestBody(name="p", description="d", created_by="u"))
+
+        cluster_client.session.get.assert_called_once()
+        assert cluster_client.session.get.call_args[0] == ("http://node-1:7070/api/v1/healthcheck",)
+        kwargs = cluster_client.session.request.call_args[1]
+        assert kwargs["url"] == "http://node-2:7070/api/v1/projects"
+        assert kwargs["allow_redirects"] is False
+
+    def test_reads_go_to_base_url(self, cluster_client):
+        """Test GET requests are not routed and need no discovery."""
+        cluster_client.session.get = Mock()
+        cluster_client.session.request = Mock(return_value=make_response(200, {"success": True}))
+
+        cluster_client.list_projects()
+
+        cluster_client.session.get.assert_not_called()
+        assert cluster_client.session.request.call_args[1]["url"] == "http://node-1:7070/api/v1/projects"
+
+    def test_leader_cached_between_writes(self, cluster_client):
+        """Test the leader is discovered once and reused."""
+        cluster_client.session.get = Mock(return_value=make_response(json_data=healthcheck_payload("node-2:7071")))
+        cluster_client.session.request = Mock(return_value=make_response(204))
+
+        cluster_client._delete("/jobs/1")
+        cluster_client._delete("/jobs/2")
+
+        assert cluster_client.session.get.call_count == 1
+
+    def test_follows_leader_redirect(self, cluster_client):
+        """Test a redirected write is re-sent to the new leader."""
+        cluster_client.session.get = Mock(return_value=make_response(json_data=healthcheck_payload("node-2:7071")))
+        cluster_client.session.request = Mock(side_effect=[
+            make_response(307, headers={"Location": "http://node-3:7070/api/v1/jobs/1"}),
+            make_response(200, {"success": True}),
+        ])
+
+        assert cluster_client._put("/jobs/1", {"status": "inactive"}) == {"success": True}
+
+        urls = [c[1]["url"] for c in cluster_client.session.request.call_args_list]
+        assert urls == ["http://node-2:7070/api/v1/jobs/1", "http://node-3:7070/api/v1/jobs/1"]
+        assert cluster_client.leader_router.leader_url == "http://node-3:7070"
+
+    def test_leader_probe_is_authenticated(self, cluster_client):
+        """Test the /healthcheck probe sends the same credentials as other requests."""
+        cluster_client.session.get = Mock(return_value=make_response(json_data=healthcheck_payload("node-2:7071")))
+        cluster_client.session.request = Mock(return_value=make_response(204))
+
+        cluster_client._delete("/jobs/1")
+
+        kwargs = cluster_client.session.get.call_args[1]
+        assert kwargs["headers"] == cluster_client._prepare_headers("123")
+        assert kwargs["headers"]["X-API-Key"] == "key"
+        assert kwargs["auth"] is None
+        assert kwargs["timeout"] == 5
+
+    def test_redirect_to_same_leader_raises(self, cluster_client):
+        """Test a write redirected back to the leader it was sent to is an error, not a success."""
+        cluster_client.session.get = Mock(return_value=make_response(json_data=healthcheck_payload("node-2:7071")))
+        cluster_client.session.request = Mock(
+            return_value=make_response(307, headers={"Location": "http://node-2:7070/api/v1/jobs/1"})
+        )
+
+        with pytest.raises(requests.HTTPError) as exc_info:
+            cluster_client._put("/jobs/1", {"status": "inactive"})
+
+        assert exc_info.value.response.status_code == 307
+        assert cluster_client.session.request.call_count == 1
+        assert cluster_client.leader_router.needs_refresh() is True
+
+    def test_too_many_redirects_raise(self, cluster_client):
+        """Test a write still redirected after MAX_LEADER_REDIRECTS raises HTTPError."""
+        cluster_client.session.get = Mock(return_value=make_response(json_data=healthcheck_payload("node-2:7071")))
+        cluster_client.session.request = Mock(side_effect=[
+            make_response(307, headers={"Location": f"http://node-{i % 3 + 1}:7070/api/v1/jobs/1"})
+            for i in range(2, 6)
+        ])
+
+        with pytest.raises(requests.HTTPError):
+            cluster_client._put("/jobs/1", {"status": "inactive"})
+
+        assert cluster_client.session.request.call_count == 4
+
+    def test_connection_error_invalidates_leader(self, cluster_client):
+        """Test a failed write forces re-discovery on the next write."""
+        cluster_client.session.get = Mock(return_value=make_response(json_data=healthcheck_payload("node-2:7071")))
+        cluster_client.session.request = Mock(side_effect=requests.ConnectionError("refused"))
+
+        with pytest.raises(requests.ConnectionError):
+            cluster_client._delete("/jobs/1")
+
+        assert cluster_client.leader_router.needs_refresh() is True
+
+    def test_unreachable_cluster_falls_back_to_base_url(self, cluster_client):
+        """Test writes use the base URL when no node reports a leader."""
+        cluster_client.session.get = Mock(side_effect=requests.ConnectionError("down"))
+        cluster_client.session.request = Mock(return_value=make_response(204))
+
+        cluster_client._delete("/jobs/1")
+
+        assert cluster_client.session.get.call_count == len(NODES)
+        assert cluster_client.session.request.call_args[1]["url"] == "http://node-1:7070/api/v1/jobs/1"
+
+    def test_single_node_client_not_routed(self, client):
+        """Test clients without node_urls keep using base_url."""
+        assert client.leader_router is None
+        assert client._routes_to_leader("POST") is False
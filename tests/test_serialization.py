@@ -0,0 +1,89 @@
+"""
+Tests for compiled request body serialization.
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Dict, Any
+
+from scheduler0.serialization import serializer_for, serialize_body, to_camel_case
+from scheduler0.types import JobRequestBody, ExecutorUpdateRequestBody, PromptJobRequest
+
+
+@dataclass
+class Inner:
+    field_name: str
+    account_id: Optional[int] = None
+
+
+@dataclass
+class Outer:
+    display_name: str
+    inner: Optional[Inner] = None
+    inner_list: List[Inner] = field(default_factory=list)
+    extra_data: Optional[Dict[str, Any]] = None
+    account_id: Optional[int] = None
+
+
+class TestSerialization:
+    """Test request body serialization."""
+
+    def test_serializer_cached_per_type(self):
+        """Test one serializer is compiled and reused per dataclass type."""
+        assert serializer_for(JobRequestBody) is serializer_for(JobRequestBody)
+        assert serializer_for(JobRequestBody) is not serializer_for(ExecutorUpdateRequestBody)
+
+    def test_camel_case_keys_and_exclusions(self):
+        """Test keys are camelCased and None values and account_id dropped."""
+        body = JobRequestBody(
+            project_id=1,
+            timezone="UTC",
+            timezone_offset=0,
+            retry_max=3,
+            created_by="user",
+            account_id=99,
+        )
+        assert serialize_body(body) == {
+            "projectId": 1,
+            "timezone": "UTC",
+            "timezoneOffset": 0,
+            "retryMax": 3,
+            "createdBy": "user",
+        }
+
+    def test_list_values_kept(self):
+        """Test list fields are copied."""
+        body = PromptJobRequest(prompt="daily", channels=["email", "sms"])
+        assert serialize_body(body) == {"prompt": "daily", "channels": ["email", "sms"]}
+
+    def test_nested_dataclasses(self):
+        """Test nested dataclasses are serialized and nested dict keys kept verbatim."""
+        body = Outer(
+            display_name="outer",
+            inner=Inner(field_name="a", account_id=1),
+            inner_list=[Inner(field_name="b")],
+            extra_data={"snake_key": Inner(field_name="c")},
+        )
+        assert serialize_body(body) == {
+            "displayName": "outer",
+            "inner": {"fieldName": "a"},
+            "innerList": [{"fieldName": "b"}],
+            "extraData": {"snake_key": {"fieldName": "c"}},
+        }
+
+    def test_top_level_dict_and_list(self):
+        """Test top-level dicts are camelCased, including dicts inside a top-level list."""
+        assert serialize_body({"retention_months": 6, "account_id": "1"}) == {"retentionMonths": 6}
+        assert serialize_body([{"project_id": 1}, JobRequestBody(project_id=2, timezone="UTC")]) == [
+            {"projectId": 1},
+            {"projectId": 2, "timezone": "UTC"},
+        ]
+
+    def test_primitives_pass_through(self):
+        """Test non-container bodies are returned unchanged."""
+        assert serialize_body(None) is None
+        assert serialize_body("raw") == "raw"
+
+    def test_to_camel_case(self):
+        """Test snake_case to camelCase conversion."""
+        assert to_camel_case("last_execution_datetime") == "lastExecutionDatetime"
+        assert to_camel_case("simple") == "simple"
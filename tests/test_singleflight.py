@@ -0,0 +1,181 @@
+"""
+Tests for coalescing of identical concurrent GET requests.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+from unittest.mock import Mock, patch
+
+from scheduler0 import Client
+from scheduler0.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def ok(data):
+    response = Mock(status_code=200)
+    response.json.return_value = {"success": True, "data": data}
+    return response
+
+
+class TestSingleFlight:
+    """Test the thread coalescer."""
+
+    def test_concurrent_calls_share_one(self):
+        """Test callers arriving while a call is in flight wait for it."""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def fn():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {"id": 1}
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            leader = executor.submit(flight.do, "k", fn)
+            started.wait(5)
+            followers = [executor.submit(flight.do, "k", fn) for _ in range(4)]
+            while flight.stats()["coalesced"] < 4:
+                time.sleep(0.001)
+            release.set()
+            results = [leader.result()] + [future.result() for future in followers]
+
+        assert calls == [1]
+        assert all(result == {"id": 1} for result in results)
+        # Followers get copies they may modify
+        assert len({id(result) for result in results}) == 5
+        assert flight.stats() == {"calls": 1, "coalesced": 4, "in_flight": 0}
+
+    def test_error_is_shared(self):
+        """Test followers see the leader's error."""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def fn():
+            started.set()
+            release.wait(5)
+            raise requests.HTTPError("boom")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(flight.do, "k", fn)
+            started.wait(5)
+            follower = executor.submit(flight.do, "k", fn)
+            while flight.stats()["coalesced"] < 1:
+                time.sleep(0.001)
+            release.set()
+            for future in (leader, follower):
+                with pytest.raises(requests.HTTPError):
+                    future.result()
+
+        assert flight.stats()["in_flight"] == 0
+
+    def test_sequential_calls_are_not_coalesced(self):
+        """Test nothing is reused once a call finished."""
+        flight = SingleFlight()
+        counter = iter(range(10))
+
+        assert flight.do("k", lambda: next(counter)) == 0
+        assert flight.do("k", lambda: next(counter)) == 1
+        assert flight.stats()["calls"] == 2
+
+    def test_async_concurrent_calls_share_one(self):
+        """Test coroutines awaiting the same key share one task, even if one is cancelled."""
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return [1, 2]
+
+        async def run():
+            first = asyncio.ensure_future(flight.do("k", fn))
+            await asyncio.sleep(0)
+            others = [asyncio.ensure_future(flight.do("k", fn)) for _ in range(3)]
+            await asyncio.sleep(0)
+            first.cancel()
+            return await asyncio.gather(*others)
+
+        results = asyncio.run(run())
+        assert calls == [1]
+        assert results == [[1, 2]] * 3
+        assert flight.stats() == {"calls": 1, "coalesced": 3, "in_flight": 0}
+
+
+class TestClientCoalescing:
+    """Test coalescing in Client._get and AsyncClient._get."""
+
+    def make_client(self, base_url, **kwargs):
+        return Client(base_url=base_url, api_key="k", api_secret="s", account_id="123", **kwargs)
+
+    def concurrent_gets(self, client, calls):
+        barrier = threading.Barrier(len(calls))
+
+        def slow_request(*args, **kwargs):
+            time.sleep(0.05)
+            return ok({"id": 1})
+
+        def get(call):
+            barrier.wait(5)
+            return call(client)
+
+        with patch.object(client, "_request", side_effect=slow_request) as request:
+            with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+                results = list(executor.map(get, calls))
+        return results, request.call_count
+
+    def test_identical_gets_send_one_request(self, base_url):
+        """Test concurrent identical GETs are sent once."""
+        client = self.make_client(base_url, coalesce_gets=True)
+        results, sent = self.concurrent_gets(client, [lambda c: c.get_project("1")] * 8)
+
+        assert sent == 1
+        assert all(result == {"success": True, "data": {"id": 1}} for result in results)
+        assert client.coalesce_stats()["coalesced"] == 7
+
+    def test_different_requests_are_not_coalesced(self, base_url):
+        """Test the path, query and account all identify a request."""
+        client = self.make_client(base_url, coalesce_gets=True)
+        calls = [
+            lambda c: c.get_project("1"),
+            lambda c: c.get_project("2"),
+            lambda c: c.get_project("1", account_id_override="999"),
+            lambda c: c.list_projects(limit=10, offset=0),
+            lambda c: c.list_projects(limit=10, offset=10),
+        ]
+        _, sent = self.concurrent_gets(client, calls)
+        assert sent == 5
+
+    def test_disabled_by_default(self, base_url):
+        """Test every GET is sent unless coalescing is enabled."""
+        client = self.make_client(base_url)
+        _, sent = self.concurrent_gets(client, [lambda c: c.get_project("1")] * 4)
+        assert sent == 4
+
+    def test_async_identical_gets_send_one_request(self):
+        """Test concurrent identical GETs on an AsyncClient are sent once."""
+        httpx = pytest.importorskip("httpx")
+        from scheduler0 import AsyncClient
+
+        sent = []
+
+        async def handler(request):
+            sent.append(request.url.path)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"success": True, "data": {"id": 1}})
+
+        async def run():
+            http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            async with AsyncClient("http://localhost:7070", account_id="1", http_client=http_client, coalesce_gets=True) as client:
+                return await asyncio.gather(*(client.get_job("7") for _ in range(10)))
+
+        results = asyncio.run(run())
+        assert sent == ["/api/v1/jobs/7"]
+        assert len(results) == 10